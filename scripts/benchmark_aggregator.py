@@ -0,0 +1,132 @@
+"""
+Benchmark del agregador de trades a barras.
+
+Mide el throughput de ``TickAggregator`` construyendo todos los
+timeframes intradía a la vez a partir de un flujo sintético de trades
+(con un porcentaje de trades desordenados), frente a un bucle Python
+con un ``PartialBar`` por símbolo para un único timeframe. También mide
+lotes del tamaño que entrega el stream en tiempo real (1, 10 y 100 trades).
+
+Uso:
+    python scripts/benchmark_aggregator.py [n_trades] [n_symbols] [batch_size]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Añadir src al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from src.data.aggregator import DEFAULT_TIMEFRAMES, TickAggregator
+from src.data.resampler import PartialBar
+
+
+# Throughput mínimo exigido (trades/s en un núcleo)
+TARGET_RATE = 100_000
+
+# Tamaños de lote típicos del stream en tiempo real y trades medidos con ellos
+STREAMING_BATCHES = (1, 10, 100)
+STREAMING_TRADES = 100_000
+
+SECOND = 1_000_000_000
+
+
+def build_trades(n: int, n_symbols: int):
+    """Genera una sesión de trades con un 1% desordenados hasta 3 segundos."""
+    rng = np.random.default_rng(42)
+    universe = np.array([f"SYM{i:04d}" for i in range(n_symbols)], dtype=object)
+    timestamps = np.sort(rng.integers(0, 6 * 3600 * SECOND, n)) + 1_709_562_600 * SECOND
+    late = rng.random(n) < 0.01
+    timestamps[late] -= rng.integers(0, 3 * SECOND, int(late.sum()))
+    symbols = universe[rng.zipf(1.3, n) % n_symbols].tolist()
+    return symbols, rng.uniform(10, 500, n), rng.integers(1, 1000, n).astype(float), timestamps
+
+
+def run_aggregator(trades, batch_size: int, timeframes=DEFAULT_TIMEFRAMES):
+    """Procesa los trades por lotes y devuelve (agregador, barras cerradas)."""
+    symbols, prices, sizes, timestamps = trades
+    aggregator = TickAggregator(timeframes, late_tolerance=2.0)
+    bars = 0
+    
+    for start in range(0, len(prices), batch_size):
+        stop = start + batch_size
+        closed = aggregator.update(symbols[start:stop], prices[start:stop], sizes[start:stop], timestamps[start:stop])
+        bars += sum(len(batch) for batch in closed.values())
+    
+    bars += sum(len(batch) for batch in aggregator.flush().values())
+    return aggregator, bars
+
+
+def run_python_loop(trades, step: int) -> int:
+    """Referencia: un ``PartialBar`` por símbolo actualizado trade a trade."""
+    symbols, prices, sizes, timestamps = trades
+    partials = {}
+    bars = 0
+    
+    for symbol, price, size, ts in zip(symbols, prices.tolist(), sizes.tolist(), timestamps.tolist()):
+        start = ts - ts % step
+        partial = partials.get(symbol)
+        if partial is not None and start >= partial.end:
+            bars += 1
+            partial = None
+        if partial is None:
+            partials[symbol] = PartialBar(start, start + step, price, price, price, price, size)
+        elif start >= partial.start:
+            partial.merge(price, price, price, size)
+    
+    return bars + len(partials)
+
+
+def timed(func, *args):
+    """Ejecuta una función y devuelve (resultado, segundos)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Ejecuta el benchmark."""
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    n_symbols = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    batch_size = int(sys.argv[3]) if len(sys.argv) > 3 else 5_000
+    
+    print("=" * 60)
+    print("🚀 Benchmark Tick Aggregator - trades -> barras")
+    print("=" * 60)
+    print(f"  Trades: {n:,}  Símbolos: {n_symbols:,}  Lote: {batch_size:,}\n")
+    
+    trades = build_trades(n, n_symbols)
+    
+    (aggregator, bars), elapsed = timed(run_aggregator, trades, batch_size)
+    rate = n / elapsed
+    print(f"  TickAggregator ({len(DEFAULT_TIMEFRAMES)} timeframes) {elapsed:8.3f}s  {rate:>12,.0f} trades/s  barras={bars:,}")
+    print(f"      tardíos descartados: {aggregator.stats.late}")
+    
+    (_, bars_1min), elapsed_1min = timed(run_aggregator, trades, batch_size, ('1Min',))
+    print(f"  TickAggregator (1Min)              {elapsed_1min:8.3f}s  {n / elapsed_1min:>12,.0f} trades/s  barras={bars_1min:,}")
+    
+    loop_bars, loop_elapsed = timed(run_python_loop, trades, 60 * SECOND)
+    print(f"  Bucle PartialBar (1Min)            {loop_elapsed:8.3f}s  {n / loop_elapsed:>12,.0f} trades/s  barras={loop_bars:,}")
+    print(f"  📊 TickAggregator (1Min) es {loop_elapsed / elapsed_1min:.1f}x respecto al bucle")
+    
+    print(f"\n  Lotes de streaming ({len(DEFAULT_TIMEFRAMES)} timeframes, {min(n, STREAMING_TRADES):,} trades):")
+    streaming = tuple(column[:STREAMING_TRADES] for column in trades)
+    for size in STREAMING_BATCHES:
+        _, elapsed_stream = timed(run_aggregator, streaming, size)
+        calls = -(-len(streaming[1]) // size)
+        print(f"    Lote {size:>5,}  {len(streaming[1]) / elapsed_stream:>12,.0f} trades/s  {elapsed_stream / calls * 1e6:8.1f} µs/lote")
+    
+    print()
+    if rate < TARGET_RATE:
+        print(f"⚠️  {rate:,.0f} trades/s por debajo del objetivo de {TARGET_RATE:,}")
+        return 1
+    
+    print(f"🎉 {rate:,.0f} trades/s con todos los timeframes (objetivo {TARGET_RATE:,})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Benchmark de arranque de la configuración.
+
+Lanza procesos cortos (como los workers y backtests) que solo cargan la
+configuración y compara el arranque en frío (snapshot desactivado: parseo
+del YAML y validación Pydantic completa) con el arranque en caliente
+(desde el snapshot validado).
+
+Uso:
+    python scripts/benchmark_config_startup.py [n_procesos]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Añadir src al path
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.utils.config import CONFIG_SNAPSHOT_PATH, ConfigManager, SNAPSHOT_ENV_VAR
+
+
+# Proceso hijo: mide la carga de configuración sin contar los imports
+CHILD_CODE = """
+import sys, time
+start = time.perf_counter()
+from src.utils import config
+imported = time.perf_counter()
+config.get_config()
+loaded = time.perf_counter()
+print(f"{imported - start:.6f} {loaded - imported:.6f} {int('yaml' in sys.modules)}")
+"""
+
+
+def run_child(env: dict) -> tuple:
+    """Ejecuta un proceso hijo y devuelve (total, import, carga, yaml_importado)."""
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD_CODE],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout.split()
+    total = time.perf_counter() - start
+    return total, float(output[0]), float(output[1]), output[2] == "1"
+
+
+def run_series(name: str, runs: int, env: dict) -> float:
+    """Ejecuta varios procesos y muestra las medianas."""
+    samples = [run_child(env) for _ in range(runs)]
+    
+    total = statistics.median(s[0] for s in samples)
+    imported = statistics.median(s[1] for s in samples)
+    loaded = statistics.median(s[2] for s in samples)
+    yaml_loaded = any(s[3] for s in samples)
+    
+    print(
+        f"  {name:<10} proceso={total * 1000:8.1f}ms  imports={imported * 1000:7.1f}ms  "
+        f"get_config={loaded * 1000:7.2f}ms  yaml={'sí' if yaml_loaded else 'no'}"
+    )
+    return loaded
+
+
+def main():
+    """Ejecuta el benchmark."""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    
+    print("=" * 60)
+    print("🚀 Benchmark Config - arranque en frío vs snapshot")
+    print("=" * 60)
+    print(f"  Procesos por serie: {runs}")
+    print(f"  Snapshot: {CONFIG_SNAPSHOT_PATH}\n")
+    
+    warm_env = dict(os.environ)
+    warm_env.pop(SNAPSHOT_ENV_VAR, None)
+    cold_env = dict(warm_env, **{SNAPSHOT_ENV_VAR: "0"})
+    
+    cold = run_series("frío", runs, cold_env)
+    
+    # El primer proceso en caliente regenera el snapshot
+    ConfigManager.clear_snapshot()
+    run_child(warm_env)
+    warm = run_series("caliente", runs, warm_env)
+    
+    print()
+    print(f"  📊 get_config con snapshot es {cold / warm:.1f}x más rápido")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
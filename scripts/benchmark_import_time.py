@@ -0,0 +1,145 @@
+"""
+Benchmark de tiempo de importación de ``src.utils``.
+
+Mide con ``python -X importtime`` lo que cuesta importar cada punto de
+entrada típico (validadores, logger, configuración, validación vectorizada)
+en un proceso nuevo, y comprueba que las importaciones ligeras no arrastran
+dependencias pesadas (Pydantic, PyYAML, dotenv, numpy, pandas).
+
+Sirve como guarda de regresión: termina con código 1 si algún punto de
+entrada importa un módulo prohibido o supera su presupuesto de tiempo.
+
+Uso:
+    python scripts/benchmark_import_time.py [n_procesos]
+"""
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Dependencias que los imports ligeros no deben cargar
+HEAVY_MODULES = ('pydantic', 'yaml', 'dotenv', 'numpy', 'pandas')
+
+# (nombre, sentencia, módulos prohibidos, presupuesto en ms)
+TARGETS = [
+    ("paquete", "import src.utils", HEAVY_MODULES, 10),
+    ("validador", "from src.utils import validate_symbol", HEAVY_MODULES, 40),
+    (
+        "escalares",
+        "from src.utils import check_symbol, SymbolUniverse, parse_timeframe",
+        HEAVY_MODULES,
+        60,
+    ),
+    ("logger", "from src.utils import get_logger", HEAVY_MODULES, 60),
+    ("config", "from src.utils import get_config", ('numpy', 'pandas'), 600),
+    ("batch", "from src.utils import validate_orders_batch", ('pydantic', 'yaml', 'dotenv'), 2000),
+]
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Parsea la salida de ``-X importtime``.
+    
+    Args:
+        stderr: Salida de error del proceso
+    
+    Returns:
+        Diccionario módulo -> (profundidad, tiempo acumulado en µs)
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # Cabecera
+        # El nombre va precedido de un espacio y dos más por nivel de anidamiento
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules[name.strip()] = (depth, int(cumulative))
+    return modules
+
+
+def run_importtime(statement: str) -> Dict[str, Tuple[int, int]]:
+    """Ejecuta una sentencia en un proceso nuevo con ``-X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return parse_importtime(result.stderr)
+
+
+def measure(statement: str, startup: Set[str], runs: int) -> Tuple[float, Set[str], List[Tuple[str, int]]]:
+    """
+    Mide el coste de importación de una sentencia.
+    
+    Args:
+        statement: Sentencia de import a medir
+        startup: Módulos que carga el intérprete antes de la sentencia
+        runs: Número de procesos
+    
+    Returns:
+        Tupla (mediana en ms, módulos importados, imports de primer nivel
+        más costosos de la última ejecución)
+    """
+    totals = []
+    imported = set()
+    top_level = []
+    
+    for _ in range(runs):
+        modules = run_importtime(statement)
+        top_level = [
+            (name, cumulative) for name, (depth, cumulative) in modules.items()
+            if depth == 0 and name not in startup
+        ]
+        totals.append(sum(cumulative for _, cumulative in top_level) / 1000)
+        imported.update(modules)
+    
+    top_level.sort(key=lambda item: item[1], reverse=True)
+    return statistics.median(totals), imported, top_level[:3]
+
+
+def main():
+    """Ejecuta el benchmark."""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    
+    print("=" * 60)
+    print("🚀 Benchmark de imports - src.utils")
+    print("=" * 60)
+    print(f"  Procesos por sentencia: {runs}\n")
+    
+    startup = set(run_importtime("pass"))
+    failures = []
+    
+    for name, statement, forbidden, budget_ms in TARGETS:
+        elapsed, imported, heaviest = measure(statement, startup, runs)
+        leaked = [module for module in forbidden if module in imported]
+        ok = not leaked and elapsed <= budget_ms
+        
+        print(f"  {'✅' if ok else '❌'} {name:<10} {elapsed:8.1f}ms (presupuesto {budget_ms}ms)  {statement}")
+        print("      " + ", ".join(f"{module}={us / 1000:.1f}ms" for module, us in heaviest))
+        
+        if leaked:
+            failures.append(f"{name}: importa {', '.join(leaked)}")
+        if elapsed > budget_ms:
+            failures.append(f"{name}: {elapsed:.1f}ms > {budget_ms}ms")
+    
+    print()
+    if failures:
+        print("⚠️  Regresiones de import:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    
+    print("🎉 Todos los imports dentro de presupuesto")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
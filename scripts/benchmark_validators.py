@@ -0,0 +1,154 @@
+"""
+Benchmark de los validadores.
+
+Compara la API que lanza excepciones (validate_*) con la API que
+devuelve resultados (check_*) sobre un millón de entradas con un
+porcentaje configurable de valores inválidos, y mide el validador
+vectorizado de DataFrames OHLCV sobre millones de barras y el parseo
+masivo de fechas frente a ``validate_date`` fila por fila.
+
+Uso:
+    python scripts/benchmark_validators.py [n_inputs] [invalid_ratio]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Añadir src al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from src.utils.batch_validators import validate_dates_bulk
+from src.utils.ohlcv_validators import validate_ohlcv_frame
+from src.utils.validators import (
+    ValidationError,
+    check_quantity,
+    check_symbol,
+    collect_errors,
+    validate_date,
+    validate_quantity,
+    validate_symbol,
+)
+
+
+def build_inputs(n: int, invalid_ratio: float):
+    """Genera cantidades y símbolos con una fracción de valores inválidos."""
+    rng = random.Random(42)
+    quantities = [
+        0 if rng.random() < invalid_ratio else rng.randint(1, 1000)
+        for _ in range(n)
+    ]
+    universe = ["AAPL", "MSFT", "TSLA", "AMZN", "NVDA", "META", "GOOG", "SPY"]
+    symbols = [
+        "AAPL123" if rng.random() < invalid_ratio else rng.choice(universe)
+        for _ in range(n)
+    ]
+    return quantities, symbols
+
+
+def run_raising(validator, values) -> int:
+    """Valida con la API que lanza excepciones y cuenta los errores."""
+    errors = 0
+    for value in values:
+        try:
+            validator(value)
+        except ValidationError:
+            errors += 1
+    return errors
+
+
+def run_checking(check, values) -> int:
+    """Valida con la API sin excepciones y cuenta los errores."""
+    errors = 0
+    for value in values:
+        if check(value)[1]:
+            errors += 1
+    return errors
+
+
+def build_bars(n: int) -> pd.DataFrame:
+    """Genera n barras de 1 minuto coherentes."""
+    rng = np.random.default_rng(42)
+    index = pd.date_range("2010-01-01", periods=n, freq="1min", tz="UTC")
+    open_ = rng.uniform(10, 500, n)
+    close = open_ + rng.normal(0, 1, n)
+    return pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) + 0.5,
+        'low': np.minimum(open_, close) - 0.5,
+        'close': close,
+        'volume': rng.integers(1, 10_000, n),
+    }, index=index)
+
+
+def build_dates(n: int):
+    """Genera fechas diarias repetidas y timestamps ISO-8601 únicos."""
+    rng = np.random.default_rng(42)
+    days = pd.date_range("2000-01-01", periods=6000).strftime("%Y-%m-%d").to_numpy()
+    daily = days[rng.integers(0, len(days), n)].tolist()
+    stamps = pd.date_range("2020-01-01", periods=n, freq="1min").strftime("%Y-%m-%dT%H:%M:%SZ").tolist()
+    return daily, stamps
+
+
+def timed(func, *args):
+    """Ejecuta una función y devuelve (resultado, segundos)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Ejecuta el benchmark."""
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    invalid_ratio = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    
+    print("=" * 60)
+    print("🚀 Benchmark Validators - raise vs check")
+    print("=" * 60)
+    print(f"  Entradas: {n:,} ({invalid_ratio:.0%} inválidas)\n")
+    
+    quantities, symbols = build_inputs(n, invalid_ratio)
+    
+    cases = [
+        ("validate_quantity", run_raising, validate_quantity, quantities),
+        ("check_quantity", run_checking, check_quantity, quantities),
+        ("validate_symbol", run_raising, validate_symbol, symbols),
+        ("check_symbol", run_checking, check_symbol, symbols),
+        ("collect_errors(check_symbol)", lambda c, v: len(collect_errors(c, v)), check_symbol, symbols),
+    ]
+    
+    timings = {}
+    for name, runner, validator, values in cases:
+        errors, elapsed = timed(runner, validator, values)
+        timings[name] = elapsed
+        print(f"  {name:<30} {elapsed:8.3f}s  {n / elapsed:>12,.0f} val/s  errores={errors:,}")
+    
+    print()
+    for kind in ("quantity", "symbol"):
+        speedup = timings[f"validate_{kind}"] / timings[f"check_{kind}"]
+        print(f"  📊 check_{kind} es {speedup:.2f}x respecto a validate_{kind}")
+    
+    print()
+    bars = build_bars(5 * n)
+    report, elapsed = timed(validate_ohlcv_frame, bars, "1Min", "2010-01-01", "2030-12-31")
+    print(f"  validate_ohlcv_frame           {elapsed:8.3f}s  {len(bars):>12,} barras  inválidas={report.invalid_count:,}")
+    
+    print()
+    daily, stamps = build_dates(n)
+    _, loop_elapsed = timed(lambda values: [validate_date(v) for v in values], daily)
+    print(f"  validate_date (bucle)          {loop_elapsed:8.3f}s  {n / loop_elapsed:>12,.0f} fechas/s")
+    result, bulk_elapsed = timed(validate_dates_bulk, daily)
+    print(f"  validate_dates_bulk            {bulk_elapsed:8.3f}s  {n / bulk_elapsed:>12,.0f} fechas/s  inválidas={result.invalid_count:,}")
+    result, elapsed = timed(validate_dates_bulk, stamps, None)
+    print(f"  validate_dates_bulk (ISO)      {elapsed:8.3f}s  {n / elapsed:>12,.0f} fechas/s  (timestamps únicos)")
+    print(f"  📊 validate_dates_bulk es {loop_elapsed / bulk_elapsed:.1f}x respecto al bucle")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
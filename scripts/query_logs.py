@@ -0,0 +1,54 @@
+"""
+Consulta los logs JSON de un logger usando los índices sidecar.
+
+Uso:
+    python scripts/query_logs.py <logger> [--level ERROR] [--symbol AAPL]
+        [--start 2024-03-08T14:30] [--end 2024-03-08T14:35] [--log-dir logs]
+        [--limit 100]
+
+Los límites de tiempo se interpretan en UTC si no incluyen zona horaria.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Añadir src al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.log_query import query_logs
+
+
+def main():
+    """Ejecuta la consulta e imprime un registro JSON por línea."""
+    parser = argparse.ArgumentParser(description="Consulta indexada de logs JSON")
+    parser.add_argument("logger", help="Nombre del logger (ej. trading.engine)")
+    parser.add_argument("--level", action="append", help="Nivel exacto (repetible)")
+    parser.add_argument("--symbol", help="Valor de 'symbol' en extra_fields")
+    parser.add_argument("--start", help="Inicio ISO 8601 (inclusive)")
+    parser.add_argument("--end", help="Fin ISO 8601 (inclusive)")
+    parser.add_argument("--log-dir", default="logs", help="Directorio de logs")
+    parser.add_argument("--limit", type=int, default=0, help="Máximo de registros (0 = todos)")
+    args = parser.parse_args()
+    
+    count = 0
+    for record in query_logs(
+        args.logger,
+        start=args.start,
+        end=args.end,
+        level=args.level,
+        symbol=args.symbol,
+        log_dir=args.log_dir
+    ):
+        print(json.dumps(record, ensure_ascii=False))
+        count += 1
+        if args.limit and count >= args.limit:
+            break
+    
+    print(f"📊 {count} registros", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+"""
+Script de prueba para verificar el agregador de trades a barras.
+
+Este script valida que:
+1. Las barras de todos los timeframes coinciden con un groupby de pandas,
+   también con lotes pequeños procesados trade a trade
+2. Las barras se cierran al pasar el fin de barra más la tolerancia
+3. Los trades tardíos dentro de la tolerancia se incorporan y el resto se descarta
+4. Los arrays crecen con nuevos símbolos y la configuración se valida
+"""
+
+import sys
+from pathlib import Path
+
+# Añadir src al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from src.data.aggregator import SMALL_BATCH, TickAggregator
+from src.utils.timeframes import parse_timeframe
+from src.utils.validators import MarketDataValidationError
+
+
+SECOND = 1_000_000_000
+ORIGIN = pd.Timestamp('2024-03-04 14:30', tz='UTC').value
+COLUMNS = ['symbol', 'timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+
+def build_trades(n: int, n_symbols: int, jitter: float = 0.0, seed: int = 7):
+    """Genera trades de 6 horas con timestamps desordenados hasta ``jitter`` segundos."""
+    rng = np.random.default_rng(seed)
+    symbols = np.array([f"SYM{i}" for i in range(n_symbols)], dtype=object)
+    timestamps = np.sort(rng.integers(0, 6 * 3600 * SECOND, n)) + ORIGIN
+    timestamps -= rng.integers(0, int(jitter * SECOND) + 1, n)
+    return (
+        symbols[rng.integers(0, n_symbols, n)],
+        rng.uniform(10, 20, n).round(2),
+        rng.integers(1, 100, n).astype(float),
+        timestamps,
+    )
+
+
+def run_batches(aggregator: TickAggregator, trades, seed: int = 11, max_batch: int = 3000) -> dict:
+    """Procesa los trades en lotes de tamaño aleatorio y devuelve las barras por timeframe."""
+    rng = np.random.default_rng(seed)
+    symbols, prices, sizes, timestamps = trades
+    frames = {timeframe: [] for timeframe in aggregator.timeframes}
+    
+    position = 0
+    while position < len(prices):
+        stop = position + int(rng.integers(1, max_batch))
+        batch = slice(position, stop)
+        closed = aggregator.update(symbols[batch].tolist(), prices[batch], sizes[batch], timestamps[batch])
+        for timeframe, bars in closed.items():
+            frames[timeframe].append(bars.to_frame())
+        position = stop
+    
+    for timeframe, bars in aggregator.flush().items():
+        frames[timeframe].append(bars.to_frame())
+    
+    return {
+        timeframe: pd.concat(chunks).reset_index()[COLUMNS].sort_values(COLUMNS[:2]).reset_index(drop=True)
+        for timeframe, chunks in frames.items()
+    }
+
+
+def reference_bars(trades, timeframe: str, tolerance: float = 0.0) -> pd.DataFrame:
+    """Barras esperadas: groupby de pandas sobre los trades que no llegan tarde."""
+    symbols, prices, sizes, timestamps = trades
+    step = parse_timeframe(timeframe).duration_ns
+    buckets = timestamps - timestamps % step
+    
+    # Tiempo del stream antes de cada trade
+    before = np.concatenate(([np.iinfo(np.int64).min], np.maximum.accumulate(timestamps)[:-1]))
+    on_time = buckets + step + int(tolerance * SECOND) > before
+    
+    frame = pd.DataFrame({
+        'symbol': symbols[on_time],
+        'timestamp': pd.DatetimeIndex(buckets[on_time].view('datetime64[ns]')).tz_localize('UTC'),
+        'price': prices[on_time],
+        'size': sizes[on_time],
+    })
+    bars = frame.groupby(['symbol', 'timestamp'], sort=True).agg(
+        open=('price', 'first'), high=('price', 'max'), low=('price', 'min'),
+        close=('price', 'last'), volume=('size', 'sum'),
+    )
+    return bars.reset_index(), int((~on_time).sum())
+
+
+def test_reference():
+    """Compara las barras de todos los timeframes con pandas."""
+    print("🧪 Probando barras frente a groupby de pandas...\n")
+    
+    try:
+        # Test 1: Trades ordenados, sin tolerancia
+        trades = build_trades(100_000, 40)
+        aggregator = TickAggregator(late_tolerance=0)
+        bars = run_batches(aggregator, trades)
+        for timeframe in aggregator.timeframes:
+            expected, _ = reference_bars(trades, timeframe)
+            pd.testing.assert_frame_equal(bars[timeframe], expected, check_dtype=False)
+        print(f"  ✅ {', '.join(aggregator.timeframes)} idénticos a pandas")
+        
+        # Test 2: Trades desordenados hasta 5s, tolerancia de 3s
+        trades = build_trades(100_000, 40, jitter=5.0, seed=3)
+        aggregator = TickAggregator(('1Min', '5Min'), late_tolerance=3.0)
+        bars = run_batches(aggregator, trades)
+        for timeframe in aggregator.timeframes:
+            expected, late = reference_bars(trades, timeframe, tolerance=3.0)
+            pd.testing.assert_frame_equal(bars[timeframe], expected, check_dtype=False)
+            assert aggregator.stats.late[timeframe] == late, (timeframe, aggregator.stats.late, late)
+        assert aggregator.stats.late['1Min'] > aggregator.stats.late['5Min'] > 0
+        print(f"  ✅ Con trades desordenados: tardíos descartados {aggregator.stats.late}")
+        
+        # Test 3: Lotes pequeños (trade a trade) mezclados con lotes vectorizados
+        trades = build_trades(30_000, 40, jitter=5.0, seed=5)
+        aggregator = TickAggregator(late_tolerance=3.0)
+        bars = run_batches(aggregator, trades, max_batch=2 * SMALL_BATCH)
+        for timeframe in aggregator.timeframes:
+            expected, late = reference_bars(trades, timeframe, tolerance=3.0)
+            pd.testing.assert_frame_equal(bars[timeframe], expected, check_dtype=False)
+            assert aggregator.stats.late[timeframe] == late, (timeframe, aggregator.stats.late, late)
+        print(f"  ✅ Lotes de 1 a {2 * SMALL_BATCH} trades idénticos a pandas")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Barras coinciden con pandas\n")
+    return True
+
+
+def test_boundaries():
+    """Prueba el cierre de barras y los trades tardíos."""
+    print("🧪 Probando cierre de barras y trades tardíos...\n")
+    
+    aggregator = TickAggregator(('1Min', '5Min'), late_tolerance=2.0)
+    
+    def at(seconds: float) -> int:
+        return ORIGIN + int(seconds * SECOND)
+    
+    try:
+        # Test 1: Sin cierre hasta pasar fin + tolerancia
+        closed = aggregator.update(['AAPL', 'MSFT'], [100.0, 400.0], [10, 1], [at(5), at(30)])
+        assert closed == {}
+        closed = aggregator.update(['AAPL'], [101.0], [5], [at(61)])
+        assert closed == {} and len(aggregator.partial('1Min')) == 3
+        print("  ✅ A 1s del fin de barra (tolerancia 2s) sigue abierta")
+        
+        # Test 2: Trade tardío dentro de la tolerancia
+        aggregator.update(['AAPL'], [98.0], [2], [at(59)])
+        closed = aggregator.update(['AAPL'], [102.0], [1], [at(62)])
+        bars = closed['1Min'].to_frame()
+        assert list(bars['symbol']) == ['AAPL', 'MSFT']
+        assert bars.iloc[0][['open', 'high', 'low', 'close', 'volume']].tolist() == [100.0, 100.0, 98.0, 98.0, 12.0]
+        assert bars.index[0] == pd.Timestamp(ORIGIN, tz='UTC')
+        print("  ✅ Trade tardío incorporado y barra cerrada a fin + 2s")
+        
+        # Test 3: Trade tardío fuera de la tolerancia
+        aggregator.update(['AAPL'], [50.0], [1], [at(58)])
+        assert aggregator.stats.late == {'1Min': 1, '5Min': 0}
+        partial = aggregator.partial('5Min').set_index('symbol')
+        assert partial.loc['AAPL', 'low'] == 50.0 and partial.loc['AAPL', 'volume'] == 19.0
+        print("  ✅ Fuera de tolerancia: descartado en 1Min, incorporado en 5Min")
+        
+        # Test 4: advance cierra por reloj; flush cierra el resto
+        closed = aggregator.advance(pd.Timestamp(at(122)))
+        assert list(closed) == ['1Min'] and closed['1Min'].symbols.tolist() == ['AAPL']
+        closed = aggregator.flush()
+        assert list(closed) == ['5Min'] and len(closed['5Min']) == 2
+        assert aggregator.partial('1Min').empty and aggregator.stats.bars == {'1Min': 3, '5Min': 2}
+        print("  ✅ advance cierra por reloj y flush cierra las barras abiertas")
+        
+        # Test 5: Un lote pequeño que cruza varias barras del mismo símbolo
+        aggregator = TickAggregator(('1Min',), late_tolerance=2.0)
+        closed = aggregator.update(['AAPL'] * 4, [10.0, 11.0, 12.0, 13.0], [1, 2, 3, 4], [at(5), at(65), at(125), at(190)])
+        bars = closed['1Min'].to_frame()
+        assert bars.index.tolist() == [pd.Timestamp(at(s), tz='UTC') for s in (0, 60, 120)]
+        assert bars['close'].tolist() == [10.0, 11.0, 12.0] and bars['volume'].tolist() == [1.0, 2.0, 3.0]
+        assert aggregator.partial('1Min')['close'].tolist() == [13.0]
+        print("  ✅ Lote que cruza barras: las vencidas se cierran en el mismo lote")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Cierre de barras funciona correctamente\n")
+    return True
+
+
+def test_capacity_and_config():
+    """Prueba el crecimiento de arrays, los trades inválidos y la configuración."""
+    print("🧪 Probando capacidad y configuración...\n")
+    
+    try:
+        # Test 1: Los arrays crecen al registrar símbolos
+        aggregator = TickAggregator(('1Min',), late_tolerance=0, capacity=2)
+        symbols = [f"SYM{i}" for i in range(10)]
+        aggregator.update(symbols, np.arange(1, 11, dtype=float), np.ones(10), np.full(10, ORIGIN))
+        closed = aggregator.update(symbols[:1], [5.0], [1.0], [ORIGIN + 60 * SECOND])
+        assert closed['1Min'].symbols.tolist() == symbols
+        assert closed['1Min'].values[3].tolist() == list(range(1, 11))
+        print("  ✅ Capacidad 2 -> 16 con 10 símbolos")
+        
+        # Test 2: Precios y cantidades inválidos
+        aggregator.update(['SYM0'] * 4, [np.nan, -1.0, 5.0, np.inf], [1.0, 1.0, 0.0, 1.0], np.full(4, ORIGIN))
+        assert aggregator.stats.rejected == 4 and aggregator.stats.late['1Min'] == 0
+        print("  ✅ 4 trades inválidos rechazados")
+        
+        # Test 3: Configuración inválida
+        for kwargs in ({'timeframes': ('1Day',)}, {'late_tolerance': 61}, {'timeframes': ()}):
+            try:
+                TickAggregator(**kwargs)
+                print(f"  ❌ Aceptó {kwargs}")
+                return False
+            except MarketDataValidationError:
+                pass
+        print("  ✅ Timeframes no intradía y tolerancia excesiva rechazados")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Capacidad y configuración funcionan correctamente\n")
+    return True
+
+
+def main():
+    """Ejecuta todas las pruebas."""
+    print("=" * 60)
+    print("🚀 Testing Tick Aggregator - Trading Bot")
+    print("=" * 60)
+    print()
+    
+    results = []
+    
+    results.append(("Referencia pandas", test_reference()))
+    results.append(("Cierre y trades tardíos", test_boundaries()))
+    results.append(("Capacidad y configuración", test_capacity_and_config()))
+    
+    print("=" * 60)
+    print("📊 Resumen de Pruebas")
+    print("=" * 60)
+    
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+    
+    for test_name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{status} - {test_name}")
+    
+    print()
+    print(f"Resultado: {passed}/{total} pruebas pasaron")
+    
+    if passed == total:
+        print("\n🎉 ¡Todas las pruebas pasaron!")
+        return 0
+    else:
+        print(f"\n⚠️  {total - passed} prueba(s) fallaron")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
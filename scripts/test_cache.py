@@ -0,0 +1,238 @@
+"""
+Script de prueba para verificar el cache de datos de mercado.
+
+Este script valida que:
+1. Las peticiones solapadas solo descargan los huecos
+2. Los rangos cubiertos se sirven desde memoria
+3. El TTL caduca segmentos y el nivel de disco los recupera
+4. El presupuesto de memoria expulsa los segmentos menos usados
+5. Las claves se validan con los validadores del proyecto
+6. Una lectura lenta de disco no bloquea las consultas de otras series
+"""
+
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Añadir src al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from src.data.cache import MarketDataCache
+from src.utils.validators import DateValidationError, SymbolValidationError
+
+
+# Barras de 1 minuto de referencia (la "API")
+MINUTES = pd.date_range("2024-03-04", "2024-03-09", freq="1min", tz="UTC", inclusive="left")
+SOURCE = pd.DataFrame(
+    {'close': np.arange(len(MINUTES), dtype=np.float64), 'volume': 100.0},
+    index=MINUTES
+)
+
+
+class FakeSource:
+    """Fuente de barras que cuenta las descargas."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def __call__(self, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        self.calls.append((start, end))
+        return SOURCE[(SOURCE.index >= start) & (SOURCE.index < end)]
+
+
+def expected(start: str, end: str) -> pd.DataFrame:
+    """Barras de referencia para un rango de días inclusivo."""
+    return SOURCE[start:end]
+
+
+def test_overlapping_ranges():
+    """Prueba que las peticiones solapadas solo descargan los huecos."""
+    print("🧪 Probando rangos solapados...\n")
+    
+    cache = MarketDataCache(ttl=300)
+    source = FakeSource()
+    
+    try:
+        # Test 1: Primera petición completa
+        first = cache.get_or_fetch("aapl", "1Min", "2024-03-04", "2024-03-05", source)
+        assert first.equals(expected("2024-03-04", "2024-03-05")) and len(source.calls) == 1
+        
+        # Test 2: Petición solapada: solo se descarga el hueco
+        second = cache.get_or_fetch("AAPL", "1Min", "2024-03-05", "2024-03-07", source)
+        assert second.equals(expected("2024-03-05", "2024-03-07")), len(second)
+        assert len(source.calls) == 2
+        gap_start, gap_end = source.calls[-1]
+        assert gap_start == pd.Timestamp("2024-03-06", tz="UTC") and gap_end == pd.Timestamp("2024-03-08", tz="UTC")
+        print("  ✅ Solo se descargó el hueco 2024-03-06 -> 2024-03-08")
+        
+        # Test 3: Rango cubierto por dos segmentos
+        inner = cache.get("AAPL", "1Min", pd.Timestamp("2024-03-05 20:00", tz="UTC"),
+                          pd.Timestamp("2024-03-06 04:00", tz="UTC"))
+        assert inner is not None and len(inner) == 8 * 60
+        assert cache.get("AAPL", "1Min", "2024-03-08", "2024-03-08") is None
+        print("  ✅ Rangos cubiertos se sirven combinando segmentos")
+        
+        stats = cache.stats
+        assert (stats.hits, stats.partial_hits, stats.misses) == (1, 1, 2), stats
+        print(f"  📊 Estadísticas: {stats.to_dict()}")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Rangos solapados funcionan\n")
+    return True
+
+
+def test_ttl_and_disk():
+    """Prueba el TTL en memoria y la recuperación desde disco."""
+    print("🧪 Probando TTL y nivel de disco...\n")
+    
+    tmp_dir = Path(tempfile.mkdtemp())
+    source = FakeSource()
+    
+    try:
+        # Test 1: El segmento caduca en memoria
+        cache = MarketDataCache(tmp_dir, ttl=0.2, disk_ttl=60)
+        cache.get_or_fetch("MSFT", "1Min", "2024-03-04", "2024-03-05", source)
+        time.sleep(0.3)
+        lookup = cache.lookup("MSFT", "1Min", "2024-03-04", "2024-03-05")
+        assert lookup.complete and cache.stats.ttl_evictions == 1 and cache.stats.disk_hits == 1
+        print("  ✅ Segmento caducado en memoria y recuperado de disco")
+        
+        # Test 2: Otro proceso (otra instancia) reutiliza el disco
+        other = MarketDataCache(tmp_dir, ttl=300, disk_ttl=60)
+        frame = other.get_or_fetch("MSFT", "1Min", "2024-03-04", "2024-03-05", source)
+        assert frame.equals(expected("2024-03-04", "2024-03-05")) and len(source.calls) == 1
+        print(f"  ✅ Nueva instancia servida desde disco ({len(frame)} barras, sin descargar)")
+        
+        # Test 3: Caducidad en disco
+        expired = MarketDataCache(tmp_dir, ttl=300, disk_ttl=0.1)
+        time.sleep(0.2)
+        assert not expired.lookup("MSFT", "1Min", "2024-03-04", "2024-03-05").complete
+        assert not list(tmp_dir.rglob("*.parquet"))
+        print("  ✅ Segmentos caducados en disco se eliminan")
+        
+        # Test 4: Una lectura lenta de disco no bloquea al resto de series
+        MarketDataCache(tmp_dir, ttl=300, disk_ttl=60).get_or_fetch("MSFT", "1Min", "2024-03-04", "2024-03-05", source)
+        reader = MarketDataCache(tmp_dir, ttl=300, disk_ttl=60)
+        reader.put("AAPL", "1Min", "2024-03-04", "2024-03-05", expected("2024-03-04", "2024-03-05"))
+        
+        started, release = threading.Event(), threading.Event()
+        read_parquet = pd.read_parquet
+        
+        def slow_read(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return read_parquet(*args, **kwargs)
+        
+        pd.read_parquet = slow_read
+        try:
+            slow = threading.Thread(target=reader.lookup, args=("MSFT", "1Min", "2024-03-04", "2024-03-05"))
+            slow.start()
+            started.wait(5)
+            fast = threading.Thread(target=reader.lookup, args=("AAPL", "1Min", "2024-03-04", "2024-03-05"))
+            fast.start()
+            fast.join(1)
+            blocked = fast.is_alive()
+        finally:
+            release.set()
+            pd.read_parquet = read_parquet
+        slow.join()
+        fast.join()
+        assert not blocked, "la consulta en memoria esperó a la lectura de disco"
+        assert reader.stats.disk_hits == 1 and reader.lookup("MSFT", "1Min", "2024-03-04", "2024-03-05").complete
+        print("  ✅ Lectura de disco fuera del lock: otras series se sirven mientras tanto")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    print("✅ TTL y disco funcionan\n")
+    return True
+
+
+def test_memory_budget():
+    """Prueba el presupuesto de memoria y la validación de claves."""
+    print("🧪 Probando presupuesto de memoria...\n")
+    
+    # Un día de barras (1440 filas x 2 columnas + índice) ocupa ~34 KB
+    cache = MarketDataCache(ttl=300, memory_mb=0.08)
+    source = FakeSource()
+    
+    try:
+        for day in ("2024-03-04", "2024-03-05", "2024-03-06"):
+            cache.get_or_fetch("TSLA", "1Min", day, day, source)
+        cache.get("TSLA", "1Min", "2024-03-05", "2024-03-05")  # Más reciente que el 06
+        cache.get_or_fetch("TSLA", "1Min", "2024-03-07", "2024-03-07", source)
+        
+        assert cache.memory_used <= cache.memory_budget
+        assert cache.stats.memory_evictions == 2, cache.stats
+        assert cache.get("TSLA", "1Min", "2024-03-05", "2024-03-05") is not None
+        assert cache.get("TSLA", "1Min", "2024-03-06", "2024-03-06") is None
+        print(f"  ✅ Expulsados los menos usados: {cache.memory_used / 1024:.1f} KB en uso")
+        
+        # Validación de claves
+        for args, error in (
+            (("TSLA1", "1Min", "2024-03-04", "2024-03-05"), SymbolValidationError),
+            (("TSLA", "2Min", "2024-03-04", "2024-03-05"), DateValidationError),
+            (("TSLA", "1Min", "2024-03-05", "2024-03-04"), DateValidationError),
+        ):
+            try:
+                cache.lookup(*args)
+                print(f"  ❌ Debería rechazar {args}")
+                return False
+            except error:
+                pass
+        print("  ✅ Símbolo, timeframe y rango validados")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Presupuesto de memoria funciona\n")
+    return True
+
+
+def main():
+    """Ejecuta todas las pruebas."""
+    print("=" * 60)
+    print("🚀 Testing Cache de Datos - Trading Bot")
+    print("=" * 60)
+    print()
+    
+    results = []
+    
+    results.append(("Rangos solapados", test_overlapping_ranges()))
+    results.append(("TTL y disco", test_ttl_and_disk()))
+    results.append(("Presupuesto de memoria", test_memory_budget()))
+    
+    print("=" * 60)
+    print("📊 Resumen de Pruebas")
+    print("=" * 60)
+    
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+    
+    for test_name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{status} - {test_name}")
+    
+    print()
+    print(f"Resultado: {passed}/{total} pruebas pasaron")
+    
+    if passed == total:
+        print("\n🎉 ¡Todas las pruebas pasaron!")
+        return 0
+    else:
+        print(f"\n⚠️  {total - passed} prueba(s) fallaron")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,15 +6,30 @@ Este script valida que:
 2. La validación de Pydantic funciona
 3. Los valores por defecto son correctos
 4. Las variables de entorno se cargan
+5. El snapshot de configuración se reutiliza e invalida correctamente
+6. La recarga en caliente publica y notifica solo las secciones cambiadas
+7. Los workers leen la configuración compartida y sus recargas
 """
 
+import multiprocessing
+import os
+import shutil
 import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Añadir src al path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.utils.config import get_config, ConfigManager
+import src.utils.config as config_module
+from src.utils.config import (
+    get_config, ConfigManager, ConfigWatcher, CONFIG_SNAPSHOT_PATH, SNAPSHOT_ENV_VAR
+)
+from src.utils.shared_config import (
+    SharedConfigPublisher, SharedConfigReader, attach_shared_config
+)
 
 
 def test_config_loading():
@@ -127,6 +142,175 @@ def test_validation():
         return False
 
 
+def test_snapshot():
+    """Prueba el snapshot de configuración validada."""
+    print("🧪 Probando snapshot de configuración...\n")
+    
+    manager = ConfigManager.get_instance()
+    original_host = os.environ.get('DB_HOST')
+    
+    try:
+        # Test 1: La carga en frío genera el snapshot
+        ConfigManager.clear_snapshot()
+        cold = manager._load_config()
+        assert CONFIG_SNAPSHOT_PATH.exists(), "No se generó el snapshot"
+        print("✅ Carga en frío genera el snapshot")
+        
+        # Test 2: La carga en caliente devuelve la misma configuración
+        warm = manager._load_config()
+        assert warm == cold
+        print("✅ Carga en caliente desde el snapshot")
+        
+        # Test 3: Cambiar una variable de entorno invalida el snapshot
+        os.environ['DB_HOST'] = 'snapshot-test-host'
+        changed = manager._load_config()
+        assert changed.database.host == 'snapshot-test-host'
+        print("✅ El snapshot se invalida al cambiar las fuentes")
+        print()
+        return True
+    except Exception as e:
+        print(f"❌ Error en snapshot: {e}")
+        return False
+    finally:
+        if original_host is None:
+            os.environ.pop('DB_HOST', None)
+        else:
+            os.environ['DB_HOST'] = original_host
+        ConfigManager.clear_snapshot()
+
+
+def test_hot_reload():
+    """Prueba la recarga en caliente con watcher y suscriptores."""
+    print("🧪 Probando recarga en caliente...\n")
+    
+    import yaml
+    
+    manager = ConfigManager.get_instance()
+    original_dir = config_module.CONFIG_DIR
+    saved_env = {name: os.environ.get(name) for name in ('DB_HOST', SNAPSHOT_ENV_VAR)}
+    tmp_dir = Path(tempfile.mkdtemp())
+    unsubscribes = []
+    
+    def write_yaml(risk_pct):
+        data = yaml.safe_load((original_dir / 'config.yaml').read_text(encoding='utf-8'))
+        data.setdefault('risk', {})['max_daily_loss_pct'] = risk_pct
+        (tmp_dir / 'config.yaml').write_text(yaml.safe_dump(data), encoding='utf-8')
+    
+    try:
+        # Fuentes en un directorio temporal, sin snapshot
+        os.environ[SNAPSHOT_ENV_VAR] = '0'
+        os.environ.pop('DB_HOST', None)
+        write_yaml(0.05)
+        config_module.CONFIG_DIR = tmp_dir
+        manager.reload()
+        
+        risk_events, all_events = [], []
+        unsubscribes.append(manager.subscribe(
+            lambda old, new, changed: risk_events.append(changed), sections=['risk']
+        ))
+        unsubscribes.append(manager.subscribe(
+            lambda old, new, changed: all_events.append(changed)
+        ))
+        watcher = ConfigWatcher(manager, interval=0.05)
+        
+        # Test 1: Sin cambios no se recarga
+        assert not watcher.check()
+        print("✅ Sin cambios en los archivos no se recarga")
+        
+        # Test 2: Cambio en .env solo notifica la sección database
+        generation = manager.generation
+        (tmp_dir / '.env').write_text("DB_HOST=hot-reload-host\n", encoding='utf-8')
+        assert watcher.check()
+        assert manager.config.database.host == 'hot-reload-host'
+        assert all_events == [frozenset({'database'})] and risk_events == []
+        assert manager.generation == generation + 1
+        print("✅ Cambio en .env recargado (solo 'database' notificada)")
+        
+        # Test 3: Cambio en YAML publica un snapshot nuevo; el anterior no cambia
+        before = manager.config
+        write_yaml(0.07)
+        assert watcher.check()
+        assert manager.config.risk.max_daily_loss_pct == 0.07
+        assert before.risk.max_daily_loss_pct == 0.05
+        assert risk_events == [frozenset({'risk'})]
+        print("✅ Cambio en YAML notificado a los suscriptores de 'risk'")
+        
+        # Test 4: Configuración inválida mantiene la vigente
+        current = manager.config
+        write_yaml(0.9)
+        assert not watcher.check()
+        assert watcher.last_error is not None and manager.config is current
+        print("✅ Configuración inválida ignorada, se mantiene la anterior")
+        
+        # Test 5: El hilo del watcher recarga solo
+        watcher.start()
+        write_yaml(0.03)
+        deadline = time.monotonic() + 5
+        while manager.config.risk.max_daily_loss_pct != 0.03 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        watcher.stop()
+        assert manager.config.risk.max_daily_loss_pct == 0.03 and not watcher.is_running
+        print("✅ El watcher en segundo plano publica la nueva configuración")
+        print()
+        return True
+    except Exception as e:
+        print(f"❌ Error en recarga en caliente: {e}")
+        return False
+    finally:
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+        (tmp_dir / '.env').unlink(missing_ok=True)
+        config_module.CONFIG_DIR = original_dir
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        manager.reload()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def test_shared_config():
+    """Prueba la configuración compartida entre procesos."""
+    print("🧪 Probando configuración compartida...\n")
+    
+    manager = ConfigManager.get_instance()
+    original_host = os.environ.get('DB_HOST')
+    
+    try:
+        with SharedConfigPublisher(manager) as publisher:
+            # Test 1: Un worker (spawn) recibe la configuración sin validarla
+            with ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=attach_shared_config,
+                initargs=(publisher.name,)
+            ) as pool:
+                assert pool.submit(get_config).result() == manager.config
+                print("✅ El worker lee la configuración publicada")
+                
+                # Test 2: Las recargas del padre llegan al worker
+                reader = SharedConfigReader(publisher.name)
+                os.environ['DB_HOST'] = 'shared-config-host'
+                assert manager.reload()
+                assert publisher.generation == 2 and reader.generation == 2
+                assert reader.config.database.host == 'shared-config-host'
+                assert pool.submit(get_config).result().database.host == 'shared-config-host'
+                reader.close()
+                print("✅ La recarga se propaga con un contador de generación")
+        print()
+        return True
+    except Exception as e:
+        print(f"❌ Error en configuración compartida: {e}")
+        return False
+    finally:
+        if original_host is None:
+            os.environ.pop('DB_HOST', None)
+        else:
+            os.environ['DB_HOST'] = original_host
+        manager.reload()
+
+
 def main():
     """Ejecuta todas las pruebas."""
     print("=" * 60)
@@ -145,6 +329,15 @@ def main():
     # Test 3: Validación
     results.append(("Validación Pydantic", test_validation()))
     
+    # Test 4: Snapshot
+    results.append(("Snapshot de configuración", test_snapshot()))
+    
+    # Test 5: Recarga en caliente
+    results.append(("Recarga en caliente", test_hot_reload()))
+    
+    # Test 6: Configuración compartida
+    results.append(("Configuración compartida", test_shared_config()))
+    
     # Resumen
     print("=" * 60)
     print("📊 Resumen de Pruebas")
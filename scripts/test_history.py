@@ -0,0 +1,337 @@
+"""
+Script de prueba para verificar la sincronización incremental del histórico.
+
+Usa un servidor HTTP local que imita el endpoint de barras de Alpaca
+(``/v2/stocks/{symbol}/bars`` con paginación), sin acceso a la red.
+
+Este script valida que:
+1. El mapa de cobertura fusiona intervalos y calcula huecos
+2. La primera sincronización descarga el rango en trozos paralelos
+3. Las siguientes solo descargan los huecos (también hacia atrás)
+4. Un trozo fallido queda sin cubrir y se reintenta después
+5. Las barras de hoy se descargan pero no se cubren: se vuelven a pedir
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlencode, urlparse
+
+# Añadir src al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from src.data.history import CoverageMap, HistorySync
+from src.data.store import BarStore
+from src.utils.validators import DateValidationError
+
+
+def session_bars(start: str, end: str) -> pd.DataFrame:
+    """Barras de 1 minuto de sesión regular (14:30-21:00 UTC) en días hábiles."""
+    days = pd.bdate_range(start, end, tz="UTC")
+    minutes = [pd.date_range(day + pd.Timedelta("14h30min"), periods=390, freq="1min") for day in days]
+    index = minutes[0].append(minutes[1:])
+    close = 100 + (index.asi8 // 60_000_000_000 % 1000) / 100
+    return pd.DataFrame({
+        'open': close - 0.01,
+        'high': close + 0.02,
+        'low': close - 0.02,
+        'close': close,
+        'volume': np.full(len(index), 500.0),
+    }, index=index)
+
+
+# Histórico completo que sirve la API falsa
+HISTORY = session_bars("2024-02-01", "2024-03-29")
+
+
+class FakeBarsServer:
+    """Servidor local con el formato de ``GET /v2/stocks/{symbol}/bars``."""
+    
+    page_size = 1000
+    
+    def __init__(self):
+        self.requests = []
+        self.fail_starts = set()
+        self._lock = threading.Lock()
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                symbol = url.path.split('/')[3]
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                start, end = pd.Timestamp(params['start']), pd.Timestamp(params['end'])
+                
+                if 'page_token' not in params:
+                    with server._lock:
+                        server.requests.append((symbol, start, end))
+                if start in server.fail_starts:
+                    self.send_response(500)
+                    self.end_headers()
+                    return
+                
+                rows = HISTORY[(HISTORY.index >= start) & (HISTORY.index < end)]
+                offset = int(params.get('page_token', 0))
+                page = rows.iloc[offset:offset + server.page_size]
+                more = offset + server.page_size < len(rows)
+                body = json.dumps({
+                    'symbol': symbol,
+                    'bars': [
+                        {'t': t.strftime('%Y-%m-%dT%H:%M:%SZ'), 'o': r.open, 'h': r.high,
+                         'l': r.low, 'c': r.close, 'v': r.volume}
+                        for t, r in zip(page.index, page.itertuples())
+                    ],
+                    'next_page_token': str(offset + server.page_size) if more else None,
+                }).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+    
+    def fetch(self, symbol: str, timeframe: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        """Descarga un rango paginando como un cliente de Alpaca."""
+        bars = []
+        token = None
+        while True:
+            params = {'timeframe': timeframe, 'start': start.isoformat(), 'end': end.isoformat()}
+            if token:
+                params['page_token'] = token
+            with urllib.request.urlopen(f"{self.url}/v2/stocks/{symbol}/bars?{urlencode(params)}") as response:
+                payload = json.load(response)
+            bars.extend(payload['bars'])
+            token = payload['next_page_token']
+            if not token:
+                break
+        
+        frame = pd.DataFrame(bars, columns=['t', 'o', 'h', 'l', 'c', 'v'])
+        frame.index = pd.to_datetime(frame.pop('t'), utc=True)
+        return frame.rename(columns={'o': 'open', 'h': 'high', 'l': 'low', 'c': 'close', 'v': 'volume'})
+    
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def test_coverage_map():
+    """Prueba el mapa de cobertura."""
+    print("🧪 Probando mapa de cobertura...\n")
+    
+    try:
+        coverage = CoverageMap([(20, 30), (0, 10)])
+        assert coverage.missing(5, 25) == [(10, 20)]
+        coverage.add(10, 20)
+        assert coverage.intervals == [(0, 30)] and coverage.covers(0, 30)
+        coverage.add(40, 50)
+        coverage.add(35, 45)
+        assert coverage.intervals == [(0, 30), (35, 50)]
+        assert coverage.missing(-5, 60) == [(-5, 0), (30, 35), (50, 60)]
+        print("  ✅ Intervalos fusionados y huecos calculados")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Mapa de cobertura funciona\n")
+    return True
+
+
+def test_incremental_sync():
+    """Prueba que solo se descargan los huecos."""
+    print("🧪 Probando sincronización incremental...\n")
+    
+    tmp_dir = Path(tempfile.mkdtemp())
+    server = FakeBarsServer()
+    
+    try:
+        store = BarStore(tmp_dir)
+        sync = HistorySync(store, server.fetch, chunk_days=2, max_workers=4)
+        
+        # Test 1: Primera sincronización en trozos paralelos y paginados
+        report = sync.sync("aapl", "1Min", "2024-03-04", "2024-03-15")
+        assert report.complete and report.chunks == 6 and len(server.requests) == 6
+        assert report.bars_added == 10 * 390
+        assert store.read("AAPL", "1Min").to_frame().equals(HISTORY.loc["2024-03-04":"2024-03-15"])
+        print(f"  ✅ {report.bars_added} barras en {report.chunks} trozos")
+        
+        # Test 2: Repetir la petición no descarga nada
+        server.requests.clear()
+        report = sync.sync("AAPL", "1Min", "2024-03-06", "2024-03-12")
+        assert not report.missing and not server.requests and report.bars_added == 0
+        print("  ✅ Rango cubierto: sin descargas")
+        
+        # Test 3: Ampliar el rango solo descarga los extremos
+        assert sync.missing("AAPL", "1Min", "2024-02-26", "2024-03-22") == [
+            (pd.Timestamp("2024-02-26", tz="UTC"), pd.Timestamp("2024-03-04", tz="UTC")),
+            (pd.Timestamp("2024-03-16", tz="UTC"), pd.Timestamp("2024-03-23", tz="UTC")),
+        ]
+        report = sync.sync("AAPL", "1Min", "2024-02-26", "2024-03-22")
+        assert report.bars_added == 10 * 390
+        assert all(start < pd.Timestamp("2024-03-04", tz="UTC") or start >= pd.Timestamp("2024-03-16", tz="UTC")
+                   for _, start, _ in server.requests)
+        assert store.read("AAPL", "1Min").to_frame().equals(HISTORY.loc["2024-02-26":"2024-03-22"])
+        assert sync.coverage("AAPL", "1Min").intervals == [
+            (pd.Timestamp("2024-02-26", tz="UTC").value, pd.Timestamp("2024-03-23", tz="UTC").value)
+        ]
+        print(f"  ✅ Solo huecos descargados ({len(server.requests)} peticiones), incluido hacia atrás")
+        
+        # Test 4: Validación del rango
+        try:
+            sync.sync("AAPL", "1Min", "2024-03-10", "2024-03-01")
+            print("  ❌ Debería rechazar un rango invertido")
+            return False
+        except DateValidationError:
+            print("  ✅ Rango validado con validate_date_range")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    finally:
+        server.close()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    print("✅ Sincronización incremental funciona\n")
+    return True
+
+
+def test_failed_chunks():
+    """Prueba que los trozos fallidos se reintentan en la siguiente sincronización."""
+    print("🧪 Probando trozos fallidos...\n")
+    
+    tmp_dir = Path(tempfile.mkdtemp())
+    server = FakeBarsServer()
+    
+    try:
+        sync = HistorySync(BarStore(tmp_dir), server.fetch, chunk_days=1, max_workers=3)
+        server.fail_starts.add(pd.Timestamp("2024-03-06", tz="UTC"))
+        
+        # Test 1: Varios símbolos; un trozo de cada uno falla
+        reports = sync.sync_many(["AAPL", "MSFT"], "1Min", "2024-03-04", "2024-03-08")
+        for report in reports.values():
+            assert not report.complete and len(report.failed) == 1 and report.chunks == 4
+            assert report.bars_added == 4 * 390
+        assert sync.missing("MSFT", "1Min", "2024-03-04", "2024-03-08") == [
+            (pd.Timestamp("2024-03-06", tz="UTC"), pd.Timestamp("2024-03-07", tz="UTC"))
+        ]
+        print("  ✅ Trozo fallido sin cubrir; el resto guardado")
+        
+        # Test 2: El reintento solo pide el trozo que falló
+        server.fail_starts.clear()
+        server.requests.clear()
+        report = sync.sync("MSFT", "1Min", "2024-03-04", "2024-03-08")
+        assert report.complete and len(server.requests) == 1 and report.bars_added == 390
+        assert sync.store.read("MSFT", "1Min").to_frame().equals(HISTORY.loc["2024-03-04":"2024-03-08"])
+        print("  ✅ Reintento descarga solo el hueco pendiente")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    finally:
+        server.close()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    print("✅ Trozos fallidos se reintentan\n")
+    return True
+
+
+def test_open_day():
+    """Prueba que las barras del día actual se vuelven a pedir y se sustituyen."""
+    print("🧪 Probando barras del día en curso...\n")
+    
+    tmp_dir = Path(tempfile.mkdtemp())
+    today = pd.Timestamp.now(tz="UTC").normalize()
+    start_date = (today - pd.Timedelta(days=2)).strftime("%Y-%m-%d")
+    end_date = today.strftime("%Y-%m-%d")
+    requests = []
+    
+    def fetch(symbol, timeframe, start, end):
+        # Cada sincronización publica un volumen distinto (barras revisadas)
+        requests.append((start, end))
+        index = pd.date_range(start, end, freq="1min", inclusive="left")
+        return pd.DataFrame({
+            'open': 100.0, 'high': 101.0, 'low': 99.0, 'close': 100.5,
+            'volume': np.full(len(index), 100.0 * sync_round),
+        }, index=index)
+    
+    try:
+        sync = HistorySync(BarStore(tmp_dir), fetch, chunk_days=1, max_workers=2)
+        
+        # Test 1: La cobertura se detiene al inicio de hoy aunque se descargue hasta ahora
+        sync_round = 1
+        report = sync.sync("AAPL", "1Min", start_date, end_date)
+        assert report.complete and report.end > today
+        assert sync.coverage("AAPL", "1Min").intervals == [
+            (pd.Timestamp(start_date, tz="UTC").value, today.value)
+        ]
+        print("  ✅ Cobertura hasta el inicio de hoy; el resto queda pendiente")
+        
+        # Test 2: La siguiente sincronización solo pide hoy y sustituye las barras
+        sync_round = 2
+        requests.clear()
+        report = sync.sync("AAPL", "1Min", start_date, end_date)
+        assert [start for start, _ in requests] == [today], requests
+        assert report.missing[0][0] == today and len(report.missing) == 1
+        volume = sync.store.read("AAPL", "1Min").to_frame()['volume']
+        assert (volume[volume.index < today] == 100.0).all()
+        assert (volume[volume.index >= today] == 200.0).all()
+        print("  ✅ Barras de hoy descargadas de nuevo y sustituidas")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    print("✅ Día en curso se vuelve a sincronizar\n")
+    return True
+
+
+def main():
+    """Ejecuta todas las pruebas."""
+    print("=" * 60)
+    print("🚀 Testing Sincronización de Histórico - Trading Bot")
+    print("=" * 60)
+    print()
+    
+    results = []
+    
+    results.append(("Mapa de cobertura", test_coverage_map()))
+    results.append(("Sincronización incremental", test_incremental_sync()))
+    results.append(("Trozos fallidos", test_failed_chunks()))
+    results.append(("Día en curso", test_open_day()))
+    
+    print("=" * 60)
+    print("📊 Resumen de Pruebas")
+    print("=" * 60)
+    
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+    
+    for test_name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{status} - {test_name}")
+    
+    print()
+    print(f"Resultado: {passed}/{total} pruebas pasaron")
+    
+    if passed == total:
+        print("\n🎉 ¡Todas las pruebas pasaron!")
+        return 0
+    else:
+        print(f"\n⚠️  {total - passed} prueba(s) fallaron")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
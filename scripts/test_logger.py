@@ -7,9 +7,29 @@ Este script valida que:
 3. El formato JSON funciona
 4. La rotación de archivos funciona
 5. Los diferentes niveles de logging funcionan
+6. El modo asíncrono escribe por lotes y respeta la política de desbordamiento
+7. FastJsonFormatter produce el mismo JSON que JsonFormatter, más rápido
+8. El muestreo y la limitación descartan mensajes repetidos antes de formatear
+9. Las consultas indexadas sobre logs rotados devuelven lo mismo que un escaneo
+10. El sink columnar de eventos particiona por día y carga más rápido que el JSON
+11. El buffer circular conserva los últimos registros y se vuelca ante crash
+12. La rotación por sesión comprime y aplica la retención en segundo plano
+13. El contexto ligado con contextvars se aísla por tarea y llega al JSON
 """
 
+import asyncio
+import gzip
+import io
+import logging
+import logging.handlers
+import os
+import shutil
+import signal
 import sys
+import tempfile
+import threading
+from datetime import date, datetime, timedelta, timezone
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 import time
 import json
@@ -17,7 +37,21 @@ import json
 # Añadir src al path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.utils.logger import get_logger, log_with_context, StructuredLogger
+from src.utils.logger import (
+    get_logger, log_with_context, StructuredLogger,
+    JsonFormatter, FastJsonFormatter, JSON_BACKEND
+)
+from src.utils.async_logging import (
+    AsyncLogQueue, AsyncQueueHandler, BatchQueueListener, OverflowPolicy
+)
+from src.utils.log_sampling import FirstKFilter, RateLimitFilter, SampleFilter, create_sampling_filters
+from src.utils.log_query import build_index, index_maintainer, indexing_rotator, log_files, query_logs
+from src.utils.log_context import (
+    ContextFilter, bind_context, clear_context, get_context, log_context, submit_with_context
+)
+from src.utils.log_rotation import RotatedLogMaintainer, SessionRotatingFileHandler
+from src.utils.log_ring import RingBufferHandler, install_crash_handlers
+from src.utils.event_sink import ColumnarEventSink, ORDER_EVENT_SCHEMA, read_events
 
 
 def test_basic_logging():
@@ -192,6 +226,717 @@ def test_logger_shutdown():
     return True
 
 
+def test_async_logging():
+    """Prueba el pipeline de logging asíncrono."""
+    print("🧪 Probando logging asíncrono...\n")
+    
+    tmp_dir = Path(tempfile.mkdtemp())
+    logger = logging.getLogger("async_test")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    
+    try:
+        # Test 1: Los registros se escriben en orden, con rotación por tamaño
+        file_handler = logging.handlers.RotatingFileHandler(
+            tmp_dir / "async.log", maxBytes=4096, backupCount=20, encoding='utf-8'
+        )
+        file_handler.setFormatter(logging.Formatter('%(message)s'))
+        queue = AsyncLogQueue(maxsize=1000)
+        listener = BatchQueueListener(queue, batch_size=64)
+        queue_handler = AsyncQueueHandler(queue, [file_handler])
+        logger.addHandler(queue_handler)
+        listener.start()
+        
+        start = time.perf_counter()
+        for i in range(500):
+            logger.info("registro %05d %s", i, "x" * 40)
+        per_call_us = (time.perf_counter() - start) / 500 * 1e6
+        
+        listener.stop()
+        queue_handler.close()
+        logger.removeHandler(queue_handler)
+        
+        # Del backup más antiguo (async.log.N) al actual (async.log)
+        files = sorted(
+            tmp_dir.glob("async.log*"),
+            key=lambda p: int(p.suffix[1:]) if p.suffix != '.log' else 0,
+            reverse=True
+        )
+        lines = [line for f in files for line in f.read_text(encoding='utf-8').splitlines()]
+        assert len(files) > 1, "No hubo rotación"
+        assert lines == [f"registro {i:05d} {'x' * 40}" for i in range(500)]
+        assert all(f.stat().st_size <= 4096 for f in files)
+        print(f"  ✅ 500 registros escritos en orden con rotación ({len(files)} archivos, {per_call_us:.1f}µs/log)")
+        
+        # Test 2: drop-oldest conserva los más recientes y avisa
+        records = []
+        target = logging.Handler()
+        target.emit = records.append
+        queue = AsyncLogQueue(maxsize=3, overflow_policy='drop-oldest')
+        logger.addHandler(AsyncQueueHandler(queue, [target]))
+        for i in range(5):
+            logger.info("mensaje %d", i)
+        assert queue.dropped == 2
+        BatchQueueListener(queue).stop()
+        messages = [r.getMessage() for r in records]
+        assert messages[:3] == ["mensaje 2", "mensaje 3", "mensaje 4"]
+        assert "se descartaron 2 registros" in messages[3]
+        logger.handlers.clear()
+        print("  ✅ drop-oldest descarta los más antiguos y lo notifica")
+        
+        # Test 3: drop-debug descarta solo DEBUG con la cola llena
+        queue = AsyncLogQueue(maxsize=2, overflow_policy=OverflowPolicy.DROP_DEBUG)
+        logger.addHandler(AsyncQueueHandler(queue, [target]))
+        logger.info("a")
+        logger.info("b")
+        logger.debug("descartado")
+        assert queue.dropped == 1 and len(queue) == 2
+        logger.handlers.clear()
+        print("  ✅ drop-debug descarta DEBUG sin bloquear")
+        
+        # Test 4: Política inválida
+        try:
+            AsyncLogQueue(overflow_policy='drop-all')
+            print("  ❌ Debería rechazar una política inválida")
+            return False
+        except ValueError:
+            print("  ✅ Rechaza políticas inválidas")
+        
+        print("✅ Logging asíncrono funciona\n")
+        return True
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    finally:
+        logger.handlers.clear()
+        for path in tmp_dir.glob("*"):
+            path.unlink()
+        tmp_dir.rmdir()
+
+
+def test_fast_json_formatter():
+    """Prueba FastJsonFormatter y mide registros por segundo."""
+    print("🧪 Probando FastJsonFormatter...\n")
+    
+    def make_record(i, **kwargs):
+        record = logging.LogRecord(
+            "trading.engine", logging.INFO, __file__, 42,
+            "Orden ejecutada %s x%d", ("AAPL", i), None, func="execute"
+        )
+        record.__dict__.update(kwargs)
+        return record
+    
+    standard = JsonFormatter()
+    fast = FastJsonFormatter()
+    
+    # Test 1: Mismos campos que JsonFormatter
+    try:
+        record = make_record(7, extra_fields={'symbol': 'AAPL', 'price': 150.5, 'nota': 'ñ'})
+        expected = json.loads(standard.format(record))
+        result = json.loads(fast.format(record))
+        assert result.pop('timestamp').startswith(
+            time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created))
+        )
+        expected.pop('timestamp')
+        assert result == expected, (result, expected)
+        
+        try:
+            raise ValueError("fallo")
+        except ValueError:
+            record = make_record(1, exc_info=sys.exc_info())
+        assert "ValueError: fallo" in json.loads(fast.format(record))['exception']
+        
+        # Campos extra que sobrescriben campos base
+        record = make_record(1, extra_fields={'level': 'custom'})
+        assert json.loads(fast.format(record))['level'] == 'custom'
+        print(f"  ✅ JSON equivalente a JsonFormatter (backend: {JSON_BACKEND})")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 2: Microbenchmark (registros por segundo)
+    records = [
+        make_record(i, extra_fields={'symbol': 'AAPL', 'qty': i}) for i in range(20000)
+    ]
+    rates = {}
+    for name, formatter in (("JsonFormatter", standard), ("FastJsonFormatter", fast)):
+        start = time.perf_counter()
+        for record in records:
+            formatter.format(record)
+        rates[name] = len(records) / (time.perf_counter() - start)
+        print(f"  📊 {name:<18} {rates[name]:>12,.0f} registros/s")
+    print(f"  📊 Aceleración: {rates['FastJsonFormatter'] / rates['JsonFormatter']:.1f}x")
+    
+    print("✅ FastJsonFormatter funciona\n")
+    return True
+
+
+def test_log_sampling():
+    """Prueba los filtros de muestreo y limitación."""
+    print("🧪 Probando muestreo de logs...\n")
+    
+    logger = logging.getLogger("sampling_test")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger.addHandler(handler)
+    
+    def run(log_filter, count=100, level=logging.INFO):
+        records.clear()
+        logger.addFilter(log_filter)
+        for i in range(count):
+            logger.log(level, "Tick %s #%d", "AAPL", i)
+        logger.removeFilter(log_filter)
+        return [r.getMessage() for r in records]
+    
+    def suppressed():
+        return [getattr(r, 'suppressed', 0) for r in records]
+    
+    try:
+        # Test 1: 1 de cada N
+        messages = run(SampleFilter(10))
+        assert len(messages) == 10 and messages[0] == "Tick AAPL #0"
+        assert messages[1] == "Tick AAPL #10" and suppressed()[:2] == [0, 9]
+        assert json.loads(FastJsonFormatter().format(records[1]))['suppressed'] == 9
+        print("  ✅ SampleFilter registra 1 de cada N con conteo de suprimidos")
+        
+        # Test 2: Token bucket (ráfaga sin reposición apreciable)
+        messages = run(RateLimitFilter(rate=0.001, burst=5))
+        assert len(messages) == 5
+        print("  ✅ RateLimitFilter limita a la ráfaga configurada")
+        
+        # Test 3: Primeras K y resumen en la siguiente ventana
+        first_k = FirstKFilter(k=3, window=0.05)
+        messages = run(first_k, count=50)
+        assert len(messages) == 3
+        assert sum(first_k.suppressed_counts().values()) == 47
+        time.sleep(0.06)
+        messages = run(first_k, count=1)
+        assert messages == ["Tick AAPL #0"] and suppressed() == [47]
+        print("  ✅ FirstKFilter registra K y resume los suprimidos")
+        
+        # Test 3b: Filtros apilados comparten la clave de la plantilla
+        stacked = create_sampling_filters(rate_limit_per_sec=10, rate_limit_burst=1, first_k=1)
+        records.clear()
+        for log_filter in stacked:
+            logger.addFilter(log_filter)
+        for i in range(5):
+            for _ in range(3):
+                logger.info("Tick %s #%d", "AAPL", i)
+            time.sleep(0.1)
+        for log_filter in stacked:
+            logger.removeFilter(log_filter)
+        assert [r.getMessage() for r in records] == ["Tick AAPL #0"], [r.getMessage() for r in records]
+        print("  ✅ RateLimitFilter + FirstKFilter apilados: 1 de 15 registros")
+        
+        # Test 4: WARNING o superior nunca se descarta
+        assert len(run(RateLimitFilter(rate=0.001, burst=1), level=logging.WARNING)) == 100
+        print("  ✅ WARNING y superiores exentos")
+        
+        # Test 5: Coste de un registro descartado
+        logger.addFilter(RateLimitFilter(rate=0.001, burst=1))
+        start = time.perf_counter()
+        for i in range(20000):
+            logger.info("Tick %s #%d", "AAPL", i)
+        dropped_us = (time.perf_counter() - start) / 20000 * 1e6
+        print(f"  📊 Registro descartado: {dropped_us:.2f}µs/llamada")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    finally:
+        logger.filters.clear()
+        logger.handlers.clear()
+    
+    print("✅ Muestreo de logs funciona\n")
+    return True
+
+
+def test_log_query():
+    """Prueba las consultas indexadas sobre logs rotados."""
+    print("🧪 Probando consultas indexadas de logs...\n")
+    
+    tmp_dir = Path(tempfile.mkdtemp())
+    handler = logging.handlers.RotatingFileHandler(
+        tmp_dir / "query_test.log", maxBytes=64 * 1024, backupCount=50, encoding='utf-8'
+    )
+    handler.setFormatter(FastJsonFormatter())
+    handler.rotator = indexing_rotator
+    
+    try:
+        # Registros sintéticos: uno por segundo desde las 14:00 UTC
+        base = datetime(2024, 3, 8, 14, 0)
+        symbols = ["AAPL", "MSFT", "TSLA", "NVDA"]
+        levels = [logging.INFO] * 8 + [logging.WARNING, logging.ERROR]
+        for i in range(6000):
+            record = logging.LogRecord(
+                "query_test", levels[i % 10], __file__, 1, "Orden %d", (i,), None
+            )
+            record.created = (base + timedelta(seconds=i) - datetime(1970, 1, 1)).total_seconds()
+            record.extra_fields = {'symbol': symbols[i % 4 if i % 7 else 0], 'i': i}
+            handler.handle(record)
+        handler.close()
+        index_maintainer().wait()
+        
+        files = log_files("query_test", tmp_dir)
+        assert len(files) > 5, "No hubo rotación"
+        
+        # Test 1: Mismo resultado que un escaneo completo
+        start, end = datetime(2024, 3, 8, 14, 30), datetime(2024, 3, 8, 14, 35)
+        expected = [
+            record for path in files
+            for record in map(json.loads, path.read_text(encoding='utf-8').splitlines())
+            if record['level'] == 'ERROR' and record['symbol'] == 'AAPL'
+            and "2024-03-08T14:30:00" <= record['timestamp'] <= "2024-03-08T14:35:00.000000"
+        ]
+        result = list(query_logs(
+            "query_test", start=start, end=end, level="ERROR", symbol="AAPL", log_dir=tmp_dir
+        ))
+        assert result == expected and len(result) > 0, (len(result), len(expected))
+        print(f"  ✅ ERROR de AAPL entre 14:30 y 14:35: {len(result)} registros (igual que escaneo)")
+        
+        # Test 2: Solo se leen los bloques candidatos
+        indexes = [build_index(path) for path in files]
+        total = sum(len(index.blocks) for index in indexes)
+        candidates = sum(
+            len(index.candidate_blocks("2024-03-08T14:30:00.000000", "2024-03-08T14:35:00.000000", {"ERROR"}, "AAPL"))
+            for index in indexes
+        )
+        assert candidates < total / 3, (candidates, total)
+        print(f"  ✅ Bloques leídos: {candidates} de {total}")
+        
+        # Test 3: Índices persistidos (uno por archivo)
+        assert len(list((tmp_dir / ".index").glob("*.json"))) == len(files)
+        print("  ✅ Índices sidecar creados al rotar")
+        
+        # Test 4: Un único hilo indexa y sobrevive a rotados que no se pueden leer
+        workers = [thread for thread in threading.enumerate() if thread.name == 'LogMaintainer']
+        assert len(workers) == 1, workers
+        broken = tmp_dir / "query_test.log.999"
+        broken.mkdir()
+        indexing_rotator(str(tmp_dir / "query_test.log"), str(tmp_dir / "query_test.log.1000"))
+        index_maintainer().wait()
+        assert index_maintainer().is_running and isinstance(index_maintainer().last_error, OSError)
+        assert len(list((tmp_dir / ".index").glob("*.json"))) == len(files)
+        print("  ✅ Rotado ilegible registrado sin detener el indexador")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    finally:
+        handler.close()
+        for path in sorted(tmp_dir.rglob("*"), reverse=True):
+            path.rmdir() if path.is_dir() else path.unlink()
+        tmp_dir.rmdir()
+    
+    print("✅ Consultas indexadas funcionan\n")
+    return True
+
+
+def test_event_sink():
+    """Prueba el sink columnar de eventos (Parquet y Arrow IPC)."""
+    print("🧪 Probando sink columnar de eventos...\n")
+    
+    tmp_dir = Path(tempfile.mkdtemp())
+    
+    try:
+        # Órdenes sintéticas: una cada 2 segundos desde el 7 de marzo a las 23:00 UTC
+        base = datetime(2024, 3, 7, 23, 0, tzinfo=timezone.utc)
+        symbols = ["AAPL", "MSFT", "TSLA", "NVDA"]
+        orders = [
+            {
+                'timestamp': base + timedelta(seconds=2 * i),
+                'symbol': symbols[i % 4],
+                'side': 'buy' if i % 2 else 'sell',
+                'qty': float(i % 100 + 1),
+                'price': 100.0 + i / 1000,
+                'order_id': f"ord-{i}",
+            }
+            for i in range(50000)
+        ]
+        
+        sink = ColumnarEventSink("orders", ORDER_EVENT_SCHEMA, base_path=tmp_dir, batch_size=20000)
+        for order in orders:
+            sink.append(**order)
+        assert sink.rows_written == 40000 and len(sink) == 10000, (sink.rows_written, len(sink))
+        sink.close()
+        
+        # Test 1: Particiones por día (UTC)
+        partitions = sorted(p.name for p in (tmp_dir / "events" / "orders").iterdir())
+        assert partitions == ["date=2024-03-07", "date=2024-03-08", "date=2024-03-09"], partitions
+        print(f"  ✅ Particiones: {', '.join(partitions)}")
+        
+        # Test 2: Tipos y valores conservados
+        frame = read_events("orders", base_path=tmp_dir)
+        assert len(frame) == len(orders)
+        assert str(frame['timestamp'].dt.tz) == "UTC" and frame['qty'].dtype == 'float64'
+        assert frame['order_id'].iloc[-1] == "ord-49999" and frame['strategy'].isna().all()
+        print(f"  ✅ {len(frame)} eventos con tipos conservados")
+        
+        # Test 3: Filtro por fecha y hora
+        day = read_events("orders", start=date(2024, 3, 8), end=date(2024, 3, 8), base_path=tmp_dir)
+        assert len(day) == 43200 and day['timestamp'].dt.day.eq(8).all(), len(day)
+        window = read_events(
+            "orders", start=datetime(2024, 3, 8, 9, 0), end=datetime(2024, 3, 8, 9, 59, 59),
+            base_path=tmp_dir, columns=['symbol', 'price']
+        )
+        assert len(window) == 1800 and list(window.columns) == ['symbol', 'price'], len(window)
+        print(f"  ✅ Filtro por día: {len(day)} eventos, por hora: {len(window)}")
+        
+        # Test 4: Carga frente a re-parsear líneas JSON
+        json_path = tmp_dir / "orders.jsonl"
+        json_path.write_text("\n".join(
+            json.dumps({**order, 'timestamp': order['timestamp'].isoformat()}) for order in orders
+        ), encoding='utf-8')
+        
+        start_time = time.perf_counter()
+        parsed = [json.loads(line) for line in json_path.read_text(encoding='utf-8').splitlines()]
+        for record in parsed:
+            record['timestamp'] = datetime.fromisoformat(record['timestamp'])
+        json_time = time.perf_counter() - start_time
+        
+        start_time = time.perf_counter()
+        read_events("orders", base_path=tmp_dir)
+        columnar_time = time.perf_counter() - start_time
+        print(f"  📈 Carga de {len(orders)} órdenes: JSON {json_time * 1000:.1f} ms, "
+              f"Parquet {columnar_time * 1000:.1f} ms")
+        
+        # Test 5: Arrow IPC y validación de campos
+        ipc_sink = ColumnarEventSink("fills", ORDER_EVENT_SCHEMA, base_path=tmp_dir, format='arrow')
+        ipc_sink.append(timestamp=None, symbol="AAPL", side="buy", qty=1, price=150.5)
+        ipc_sink.close()
+        fills = read_events("fills", base_path=tmp_dir, format='arrow')
+        assert fills['symbol'].tolist() == ["AAPL"] and fills['price'].tolist() == [150.5]
+        try:
+            ipc_sink.append(symbol="AAPL", quantity=1)
+            assert False, "Se aceptó un campo desconocido"
+        except ValueError:
+            pass
+        print("  ✅ Arrow IPC y validación de campos")
+        
+        # Test 6: Un evento inválido no bloquea el sink
+        bad_sink = ColumnarEventSink("rejects", ORDER_EVENT_SCHEMA, base_path=tmp_dir)
+        bad_sink.append(timestamp=base, symbol="AAPL", side="buy", qty=1, price=150.0)
+        bad_sink.append(timestamp=base, symbol="AAPL", side="buy", qty='ten', price=150.0)
+        assert bad_sink.flush() == 1 and bad_sink.rows_dropped == 1 and len(bad_sink) == 0
+        bad_sink.append(timestamp=base, symbol="MSFT", side="sell", qty=2, price=400.0)
+        assert bad_sink.flush() == 1
+        bad_sink.close()
+        rejects = read_events("rejects", base_path=tmp_dir)
+        assert rejects['symbol'].tolist() == ["AAPL", "MSFT"], rejects
+        print("  ✅ Evento inválido descartado; el resto del lote y los siguientes se escriben")
+        
+        # Test 7: Dos sinks del mismo flujo en el mismo segundo no se sobrescriben
+        twins = [ColumnarEventSink("twins", ORDER_EVENT_SCHEMA, base_path=tmp_dir) for _ in range(2)]
+        for twin in twins:
+            twin.append(timestamp=base, symbol="AAPL", side="buy", qty=1, price=150.0)
+        for twin in twins:
+            twin.close()
+        assert len(read_events("twins", base_path=tmp_dir)) == 2
+        print("  ✅ Nombres de archivo únicos por sink")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    print("✅ Sink columnar de eventos funciona\n")
+    return True
+
+
+def test_ring_buffer():
+    """Prueba el buffer circular de registros recientes y sus volcados."""
+    print("🧪 Probando buffer circular de logs...\n")
+    
+    tmp_dir = Path(tempfile.mkdtemp())
+    ring = RingBufferHandler(capacity=1000)
+    logger = logging.getLogger("ring_test")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.addHandler(ring)
+    uninstall = install_crash_handlers(ring, tmp_dir)
+    
+    try:
+        # Test 1: Conserva los últimos N registros en orden
+        for i in range(2500):
+            logger.debug("Tick %d", i)
+        records = ring.records()
+        assert len(records) == 1000 and len(ring) == 1000
+        assert [r.args[0] for r in records] == list(range(1500, 2500))
+        print("  ✅ Últimos 1000 de 2500 registros, en orden")
+        
+        # Test 2: Volcado explícito en JSON con el timestamp original
+        path = ring.dump(tmp_dir, reason="manual")
+        lines = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+        assert len(lines) == 1000 and lines[-1]['message'] == "Tick 2499"
+        assert lines[0]['level'] == "DEBUG" and lines[0]['logger'] == "ring_test"
+        print(f"  ✅ Volcado explícito: {path.name}")
+        
+        # Test 3: Excepción no capturada en un hilo
+        def crash():
+            logger.debug("Antes del fallo")
+            raise RuntimeError("fallo simulado")
+        
+        original_stderr, sys.stderr = sys.stderr, open(os.devnull, 'w')
+        try:
+            thread = threading.Thread(target=crash)
+            thread.start()
+            thread.join()
+        finally:
+            sys.stderr.close()
+            sys.stderr = original_stderr
+        dumps = list(tmp_dir.glob("crash-*-thread-exception.log"))
+        assert len(dumps) == 1 and "Antes del fallo" in dumps[0].read_text(encoding='utf-8')
+        print("  ✅ Volcado ante excepción en un hilo")
+        
+        # Test 4: Señal SIGUSR1 (vuelca y sigue)
+        if hasattr(signal, 'SIGUSR1'):
+            original_stderr, sys.stderr = sys.stderr, open(os.devnull, 'w')
+            try:
+                signal.raise_signal(signal.SIGUSR1)
+            finally:
+                sys.stderr.close()
+                sys.stderr = original_stderr
+            assert len(list(tmp_dir.glob("crash-*-sigusr1.log"))) == 1
+            print("  ✅ Volcado ante SIGUSR1")
+        
+        # Test 5: Coste por registro frente a un FileHandler a nivel DEBUG
+        file_handler = logging.FileHandler(tmp_dir / "debug.log", encoding='utf-8')
+        file_handler.setFormatter(JsonFormatter())
+        bench_logger = logging.getLogger("ring_bench")
+        bench_logger.setLevel(logging.DEBUG)
+        bench_logger.propagate = False
+        
+        timings = {}
+        for name, handler in (("ring", ring), ("archivo", file_handler)):
+            bench_logger.handlers = [handler]
+            start_time = time.perf_counter()
+            for i in range(20000):
+                bench_logger.debug("Precio %s: %.2f", "AAPL", 150.0 + i)
+            timings[name] = (time.perf_counter() - start_time) / 20000 * 1e6
+        bench_logger.handlers = []
+        file_handler.close()
+        print(f"  📈 Por registro: buffer {timings['ring']:.2f} µs, archivo JSON {timings['archivo']:.2f} µs")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    finally:
+        uninstall()
+        logger.removeHandler(ring)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    print("✅ Buffer circular funciona\n")
+    return True
+
+
+def test_rotation_policy():
+    """Prueba la rotación por sesión con compresión y retención en fondo."""
+    print("🧪 Probando rotación por sesión con compresión...\n")
+    
+    tmp_dir = Path(tempfile.mkdtemp())
+    maintainer = RotatedLogMaintainer(compression='gzip', max_files=4)
+    handler = SessionRotatingFileHandler(
+        tmp_dir / "session_test.log", max_bytes=32 * 1024,
+        rotate_at="09:30", timezone="America/New_York", maintainer=maintainer
+    )
+    handler.setFormatter(FastJsonFormatter())
+    
+    try:
+        # Test 1: Siguiente rotación en la apertura del siguiente día laborable (con DST)
+        friday = datetime(2024, 3, 8, 22, 0, tzinfo=timezone.utc).timestamp()
+        monday = datetime(2024, 3, 11, 13, 30, tzinfo=timezone.utc).timestamp()
+        assert handler.next_rollover(friday) == monday
+        print("  ✅ Viernes 17:00 ET -> lunes 09:30 ET (13:30 UTC tras el cambio de hora)")
+        
+        # Test 2: Rotación por tamaño sin esperar por la compresión
+        handler.rollover_at = float('inf')
+        base = datetime(2024, 3, 8, 14, 0)
+        slowest = 0.0
+        for i in range(3000):
+            record = logging.LogRecord(
+                "session_test", logging.ERROR if i % 10 == 0 else logging.INFO,
+                __file__, 1, "Orden %d", (i,), None
+            )
+            record.created = (base + timedelta(seconds=i) - datetime(1970, 1, 1)).total_seconds()
+            record.extra_fields = {'symbol': "AAPL" if i % 2 else "MSFT"}
+            start_time = time.perf_counter()
+            handler.handle(record)
+            slowest = max(slowest, time.perf_counter() - start_time)
+        maintainer.wait()
+        
+        rotated = log_files("session_test", tmp_dir)[:-1]
+        assert rotated and all(path.suffix == ".gz" for path in rotated), rotated
+        assert len(rotated) == 4, len(rotated)
+        print(f"  ✅ {len(rotated)} archivos rotados comprimidos (máx. 4); log más lento: {slowest * 1000:.2f} ms")
+        
+        # Test 3: Las consultas leen los archivos comprimidos (índice trasladado)
+        expected = [
+            record for path in rotated + [tmp_dir / "session_test.log"]
+            for record in map(json.loads, (gzip.decompress(path.read_bytes()) if path.suffix == ".gz"
+                                           else path.read_bytes()).decode('utf-8').splitlines())
+            if record['level'] == 'ERROR'
+        ]
+        result = list(query_logs("session_test", level="ERROR", log_dir=tmp_dir))
+        assert result == expected and len(result) > 0, (len(result), len(expected))
+        assert len(list((tmp_dir / ".index").glob("*.json"))) >= len(rotated)
+        print(f"  ✅ Consulta sobre archivos comprimidos: {len(result)} errores")
+        
+        # Test 4: Rotación por hora de sesión
+        before = len(log_files("session_test", tmp_dir))
+        handler.rollover_at = record.created
+        handler.handle(record)
+        maintainer.wait()
+        assert handler.rollover_at > time.time()
+        assert len(list(tmp_dir.glob("session_test.log.*.gz"))) == 4 and before == 5
+        print("  ✅ Rotación al llegar la hora de sesión")
+        
+        # Test 5: Retención por antigüedad
+        old = time.time() - 10 * 86400
+        for path in log_files("session_test", tmp_dir)[:2]:
+            os.utime(path, (old, old))
+        aged = RotatedLogMaintainer(compression='gzip', max_age_days=7)
+        removed = aged.process(tmp_dir / "session_test.log")
+        assert len(removed) == 2, removed
+        print("  ✅ Retención por antigüedad: 2 archivos eliminados")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    finally:
+        handler.close()
+        maintainer.stop()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    print("✅ Rotación por sesión funciona\n")
+    return True
+
+
+def context_snapshot() -> dict:
+    """Contexto ligado en el proceso que ejecuta la función (para pools de procesos)."""
+    return dict(get_context())
+
+
+def test_log_context():
+    """Prueba el contexto ligado con contextvars (asyncio, hilos y modo asíncrono)."""
+    print("🧪 Probando contexto de logging con contextvars...\n")
+    
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setLevel(logging.INFO)
+    handler.setFormatter(FastJsonFormatter())
+    handler.addFilter(ContextFilter())
+    logger = logging.getLogger("context_test")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.handlers = [handler]
+    
+    def lines():
+        output = [json.loads(line) for line in stream.getvalue().splitlines()]
+        stream.seek(0)
+        stream.truncate()
+        return output
+    
+    try:
+        # Test 1: Campos ligados en el JSON; extra_fields tiene prioridad
+        with log_context(cycle_id=7, strategy="momentum", symbol="AAPL"):
+            logger.info("Señal")
+            log_with_context(logger, 'INFO', 'Orden', symbol="MSFT", qty=5)
+        logger.info("Fuera del contexto")
+        first, second, outside = lines()
+        assert first['cycle_id'] == 7 and first['strategy'] == "momentum" and first['symbol'] == "AAPL"
+        assert second['symbol'] == "MSFT" and second['qty'] == 5 and second['cycle_id'] == 7
+        assert 'cycle_id' not in outside
+        assert JsonFormatter().format(logging.makeLogRecord({
+            'msg': "x", 'log_context': {'cycle_id': 1}, 'extra_fields': {'qty': 2}
+        })).count('"cycle_id": 1') == 1
+        print("  ✅ Contexto en el JSON (FastJsonFormatter y JsonFormatter)")
+        
+        # Test 2: Solo se captura en los registros que pasan el nivel
+        captured = []
+        probe = logging.Handler(logging.DEBUG)
+        probe.emit = lambda record: captured.append('log_context' in record.__dict__)
+        logger.handlers = [handler, probe]
+        with log_context(cycle_id=8):
+            logger.debug("Descartado por el handler INFO")
+        logger.handlers = [handler]
+        assert captured == [False] and not lines()
+        print("  ✅ Registros DEBUG descartados no capturan el contexto")
+        
+        # Test 3: Aislamiento entre tareas asyncio
+        async def worker(symbol):
+            bind_context(symbol=symbol)
+            for i in range(3):
+                await asyncio.sleep(0)
+                logger.info("Tick %s %d", symbol, i)
+        
+        async def run_tasks():
+            await asyncio.gather(*(worker(s) for s in ["AAPL", "MSFT", "TSLA"]))
+        
+        asyncio.run(run_tasks())
+        records = lines()
+        assert len(records) == 9
+        assert all(record['message'].split()[1] == record['symbol'] for record in records)
+        print("  ✅ Tareas asyncio concurrentes con contextos independientes")
+        
+        # Test 4: Pools de hilos
+        with ThreadPoolExecutor(max_workers=2) as pool, log_context(cycle_id=9):
+            submit_with_context(pool, logger.info, "Con contexto").result()
+            pool.submit(logger.info, "Sin contexto").result()
+        with_context, without_context = lines()
+        assert with_context['cycle_id'] == 9 and 'cycle_id' not in without_context
+        print("  ✅ submit_with_context propaga el contexto al pool")
+        
+        # Test 4b: Pools de procesos (se envían los campos, no el Context)
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            with log_context(cycle_id=11, symbol="AAPL"):
+                fields = submit_with_context(pool, context_snapshot).result()
+            assert submit_with_context(pool, context_snapshot).result() == {}
+        assert fields == {'cycle_id': 11, 'symbol': "AAPL"}, fields
+        print("  ✅ submit_with_context liga el contexto en un pool de procesos")
+        
+        # Test 5: Modo asíncrono: se captura al encolar, no en el listener
+        queue = AsyncLogQueue(maxsize=100)
+        listener = BatchQueueListener(queue)
+        queue_handler = AsyncQueueHandler(queue, [handler])
+        queue_handler.addFilter(ContextFilter())
+        logger.handlers = [queue_handler]
+        listener.start()
+        with log_context(cycle_id=10):
+            logger.info("Encolado")
+        listener.stop()
+        assert lines()[0]['cycle_id'] == 10
+        print("  ✅ Modo asíncrono conserva el contexto del llamador")
+        
+        # Test 6: Coste por registro con contexto ligado frente a log_with_context
+        null_stream = open(os.devnull, 'w')
+        handler.setStream(null_stream)
+        logger.handlers = [handler]
+        timings = {}
+        for i in range(2000):
+            logger.info("Calentamiento")
+        start_time = time.perf_counter()
+        for i in range(20000):
+            log_with_context(logger, 'INFO', 'Tick', cycle_id=1, strategy="momentum", symbol="AAPL")
+        timings['explícito'] = time.perf_counter() - start_time
+        with log_context(cycle_id=1, strategy="momentum", symbol="AAPL"):
+            start_time = time.perf_counter()
+            for i in range(20000):
+                logger.info("Tick")
+            timings['ligado'] = time.perf_counter() - start_time
+        handler.setStream(stream)
+        null_stream.close()
+        print(f"  📈 20000 logs: contexto explícito {timings['explícito'] * 1000:.0f} ms, "
+              f"ligado {timings['ligado'] * 1000:.0f} ms")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    finally:
+        clear_context()
+        logger.handlers = []
+    
+    print("✅ Contexto de logging funciona\n")
+    return True
+
+
 def main():
     """Ejecuta todas las pruebas."""
     print("=" * 60)
@@ -210,6 +955,14 @@ def main():
     results.append(("Múltiples loggers", test_multiple_loggers()))
     results.append(("Rotación de logs", test_log_rotation()))
     results.append(("Cierre de logger", test_logger_shutdown()))
+    results.append(("Logging asíncrono", test_async_logging()))
+    results.append(("FastJsonFormatter", test_fast_json_formatter()))
+    results.append(("Muestreo de logs", test_log_sampling()))
+    results.append(("Consultas indexadas", test_log_query()))
+    results.append(("Sink columnar de eventos", test_event_sink()))
+    results.append(("Buffer circular", test_ring_buffer()))
+    results.append(("Rotación por sesión", test_rotation_policy()))
+    results.append(("Contexto con contextvars", test_log_context()))
     
     # Resumen
     print("=" * 60)
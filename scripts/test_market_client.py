@@ -0,0 +1,308 @@
+"""
+Script de prueba para verificar el cliente de datos de mercado.
+
+Usa un servidor HTTP local (HTTP/1.1 keep-alive) que imita los endpoints
+de barras de Alpaca, sin acceso a la red.
+
+Este script valida que:
+1. El limitador de tokens respeta la tasa y reporta la espera
+2. Las peticiones reutilizan las conexiones de la sesión compartida
+3. Las peticiones multi-símbolo se agrupan en lotes paralelos y paginados
+4. Las respuestas 429 se reintentan y los errores se reportan
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Añadir src al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+from src.data import client as client_module
+from src.data.client import MarketDataClient, MarketDataRequestError, TokenBucket, close_sessions
+
+
+KEY_ID, SECRET = "PKTEST1234567890", "SECRETTEST1234567890"
+
+# Una sesión de barras de 1 minuto
+MINUTES = pd.date_range("2024-03-04 14:30", periods=390, freq="1min", tz="UTC")
+
+
+def symbol_bars(symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> list:
+    """Barras deterministas de un símbolo en [start, end)."""
+    base = 10.0 + sum(map(ord, symbol)) % 100
+    return [
+        {'t': t.strftime('%Y-%m-%dT%H:%M:%SZ'), 'o': base, 'h': base + 1, 'l': base - 1,
+         'c': base + i / 1000, 'v': 100 + i, 'n': 5, 'vw': base}
+        for i, t in enumerate(MINUTES) if start <= t < end
+    ]
+
+
+class StubDataServer:
+    """Servidor local con ``/v2/stocks/{symbol}/bars`` y ``/v2/stocks/bars``."""
+    
+    page_size = 150
+    
+    def __init__(self):
+        self.requests = []
+        self.connections = set()
+        self.throttle_next = 0
+        self._lock = threading.Lock()
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                with server._lock:
+                    server.requests.append((url.path, params))
+                    server.connections.add(self.client_address)
+                    throttled = server.throttle_next > 0
+                    server.throttle_next -= throttled
+                
+                if self.headers.get('APCA-API-KEY-ID') != KEY_ID:
+                    return self.reply(403, {'message': 'forbidden'})
+                if throttled:
+                    return self.reply(429, {'message': 'too many requests'}, {'Retry-After': '0'})
+                
+                start, end = pd.Timestamp(params['start']), pd.Timestamp(params['end'])
+                offset = int(params.get('page_token', 0))
+                parts = url.path.strip('/').split('/')
+                
+                if parts[-2] == 'stocks':
+                    # Multi-símbolo: la paginación recorre los símbolos en orden
+                    rows = [(s, bar) for s in params['symbols'].split(',') for bar in symbol_bars(s, start, end)]
+                    page = rows[offset:offset + server.page_size]
+                    bars = {}
+                    for symbol, bar in page:
+                        bars.setdefault(symbol, []).append(bar)
+                else:
+                    rows = symbol_bars(parts[2], start, end)
+                    bars = page = rows[offset:offset + server.page_size]
+                
+                more = offset + server.page_size < len(rows)
+                self.reply(200, {'bars': bars, 'next_page_token': str(offset + server.page_size) if more else None})
+            
+            def reply(self, status, payload, headers=None):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                for name, value in {'Content-Type': 'application/json', **(headers or {})}.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+    
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class FakeClock:
+    """Reloj simulado para ``TokenBucket`` (``monotonic`` y ``sleep``)."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def monotonic(self) -> float:
+        return self.now
+    
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_token_bucket():
+    """Prueba el limitador de tasa."""
+    print("🧪 Probando limitador de tokens...\n")
+    
+    try:
+        # Test 1: Ráfaga inicial sin espera, después 20 por segundo
+        bucket = TokenBucket(rate_per_minute=1200, burst=5)
+        start = time.perf_counter()
+        waits = [bucket.acquire() for _ in range(25)]
+        elapsed = time.perf_counter() - start
+        assert waits[:5] == [0.0] * 5 and all(w > 0 for w in waits[5:])
+        assert 0.9 <= elapsed <= 1.3, elapsed
+        print(f"  ✅ 25 tokens en {elapsed:.2f}s (ráfaga 5, 20/s)")
+        
+        # Test 2: Compartido entre hilos sin superar la tasa
+        bucket = TokenBucket(rate_per_minute=1200, burst=1)
+        start = time.perf_counter()
+        threads = [threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        assert elapsed >= 0.9, elapsed
+        print(f"  ✅ 4 hilos x 5 tokens en {elapsed:.2f}s")
+        
+        # Test 3: Ninguna ventana de 60s supera la tasa (reloj simulado, también tras estar inactivo)
+        clock = FakeClock()
+        client_module.time = clock
+        try:
+            bucket = TokenBucket(rate_per_minute=200)
+            for _ in range(2):
+                window_start = clock.now
+                granted = 0
+                while True:
+                    bucket.acquire()
+                    if clock.now >= window_start + 60:
+                        break
+                    granted += 1
+                assert granted <= 200, granted
+                clock.sleep(600)
+        finally:
+            client_module.time = time
+        print(f"  ✅ {granted} tokens en una ventana completa de 60s (límite 200)")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Limitador de tokens funciona\n")
+    return True
+
+
+def test_session_reuse():
+    """Prueba la paginación y la reutilización de conexiones."""
+    print("🧪 Probando sesión keep-alive...\n")
+    
+    server = StubDataServer()
+    
+    try:
+        client = MarketDataClient(server.url, KEY_ID, SECRET, rate_limit=6000)
+        start, end = MINUTES[0], MINUTES[-1] + pd.Timedelta("1min")
+        
+        # Test 1: Un símbolo paginado
+        bars = client.get_bars("aapl", "1Min", start, end)
+        assert len(bars) == 390 and len(server.requests) == 3
+        assert list(bars.columns) == ['open', 'high', 'low', 'close', 'volume', 'trade_count', 'vwap']
+        assert bars.index.tz is not None and bars.index[0] == MINUTES[0]
+        print(f"  ✅ {len(bars)} barras en {len(server.requests)} páginas")
+        
+        # Test 2: Peticiones sucesivas (y de otro cliente) por la misma conexión
+        for _ in range(5):
+            client.get_bars("MSFT", "1Min", start, start + pd.Timedelta("10min"))
+        MarketDataClient(server.url, KEY_ID, SECRET).get_bars("TSLA", "1Min", start, end)
+        assert len(server.connections) == 1, server.connections
+        print(f"  ✅ {len(server.requests)} peticiones sobre {len(server.connections)} conexión")
+        
+        # Test 3: Errores de autenticación
+        try:
+            MarketDataClient(server.url, "PKWRONG", SECRET).get_bars("AAPL", "1Min", start, end)
+            print("  ❌ Debería fallar sin credenciales válidas")
+            return False
+        except MarketDataRequestError as e:
+            assert e.status == 403
+            print("  ✅ HTTP 403 reportado como MarketDataRequestError")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    finally:
+        server.close()
+        close_sessions()
+    
+    print("✅ Sesión keep-alive funciona\n")
+    return True
+
+
+def test_multi_symbol():
+    """Prueba los lotes multi-símbolo concurrentes con límite de tasa."""
+    print("🧪 Probando lotes multi-símbolo...\n")
+    
+    server = StubDataServer()
+    server.page_size = 30
+    symbols = [f"S{chr(65 + i // 26)}{chr(65 + i % 26)}" for i in range(60)]
+    start, end = MINUTES[0], MINUTES[0] + pd.Timedelta("10min")
+    
+    try:
+        # Test 1: 60 símbolos en lotes de 10, 4 páginas por lote, a 20 peticiones/s
+        client = MarketDataClient(server.url, KEY_ID, SECRET, rate_limit=1200, burst=4,
+                                  max_workers=4, batch_size=10)
+        began = time.perf_counter()
+        bars = client.get_multi_bars(symbols, "1Min", start, end)
+        elapsed = time.perf_counter() - began
+        
+        batches = {params['symbols'] for path, params in server.requests}
+        assert len(batches) == 6 and all(len(b.split(',')) == 10 for b in batches)
+        assert len(server.requests) == 6 * 4 and client.stats.requests == 24
+        assert set(bars) == set(symbols) and all(len(frame) == 10 for frame in bars.values())
+        assert bars["SAA"]['close'].iloc[3] == symbol_bars("SAA", start, end)[3]['c']
+        assert elapsed >= 0.9 and client.stats.limiter_wait_total > 0
+        stats = client.stats.to_dict()
+        print(f"  ✅ {len(symbols)} símbolos en {len(batches)} lotes ({stats['requests']} peticiones, {elapsed:.2f}s)")
+        print(f"  📊 Retardo de cola: medio {stats['queue_delay_mean_ms']:.1f} ms, "
+              f"máximo {stats['queue_delay_max_ms']:.1f} ms")
+        
+        # Test 2: 429 con Retry-After se reintenta
+        server.throttle_next = 2
+        frame = client.get_bars("AAPL", "1Min", start, end)
+        assert len(frame) == 10 and client.stats.rate_limited == 2
+        print("  ✅ Respuestas 429 reintentadas")
+        
+        # Test 3: Rango sin barras devuelve DataFrame vacío con columnas OHLCV
+        empty = client.get_multi_bars(["AAPL"], "1Min", "2024-03-09", "2024-03-10")["AAPL"]
+        assert empty.empty and list(empty.columns) == ['open', 'high', 'low', 'close', 'volume']
+        print("  ✅ Rango sin barras -> DataFrame vacío")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    finally:
+        server.close()
+        close_sessions()
+    
+    print("✅ Lotes multi-símbolo funcionan\n")
+    return True
+
+
+def main():
+    """Ejecuta todas las pruebas."""
+    print("=" * 60)
+    print("🚀 Testing Cliente de Datos de Mercado - Trading Bot")
+    print("=" * 60)
+    print()
+    
+    results = []
+    
+    results.append(("Limitador de tokens", test_token_bucket()))
+    results.append(("Sesión keep-alive", test_session_reuse()))
+    results.append(("Lotes multi-símbolo", test_multi_symbol()))
+    
+    print("=" * 60)
+    print("📊 Resumen de Pruebas")
+    print("=" * 60)
+    
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+    
+    for test_name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{status} - {test_name}")
+    
+    print()
+    print(f"Resultado: {passed}/{total} pruebas pasaron")
+    
+    if passed == total:
+        print("\n🎉 ¡Todas las pruebas pasaron!")
+        return 0
+    else:
+        print(f"\n⚠️  {total - passed} prueba(s) fallaron")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
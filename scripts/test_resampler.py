@@ -0,0 +1,254 @@
+"""
+Script de prueba para verificar timeframes y el resampler incremental.
+
+Este script valida que:
+1. Los timeframes se parsean a objetos cacheados con duración y alias
+2. Los límites de barra respetan zona horaria y DST
+3. El resampler incremental coincide con el resampling completo
+4. Las barras en formación y el flush funcionan
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Añadir src al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from src.data.resampler import IncrementalResampler, resample_bars
+from src.utils.timeframes import Timeframe, TimeframeUnit, parse_timeframe
+from src.utils.validators import DateValidationError, MarketDataValidationError
+
+
+def build_session_bars(days: int = 5, tz: str = "America/New_York") -> pd.DataFrame:
+    """Genera barras de 1 minuto de sesiones regulares (09:30-16:00)."""
+    rng = np.random.default_rng(7)
+    sessions = [
+        pd.date_range(day + pd.Timedelta("9h30min"), periods=390, freq="1min", tz=tz)
+        for day in pd.bdate_range("2024-03-06", periods=days)
+    ]
+    index = sessions[0].append(sessions[1:])
+    open_ = rng.uniform(100, 101, len(index))
+    close = open_ + rng.normal(0, 0.1, len(index))
+    return pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) + 0.1,
+        'low': np.minimum(open_, close) - 0.1,
+        'close': close,
+        'volume': rng.integers(1, 100, len(index)),
+    }, index=index)
+
+
+def test_timeframes():
+    """Prueba el parseo y el álgebra de timeframes."""
+    print("🧪 Probando timeframes...\n")
+    
+    # Test 1: Parseo cacheado
+    try:
+        tf = parse_timeframe("15Min")
+        assert tf == Timeframe(15, TimeframeUnit.MINUTE)
+        assert tf is parse_timeframe("15Min")
+        assert tf.duration == timedelta(minutes=15)
+        assert tf.pandas_alias == "15min"
+        assert parse_timeframe("1Month").duration is None
+        print("  ✅ Timeframes parseados y cacheados")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 2: Timeframe inválido
+    try:
+        parse_timeframe("2Min")
+        print("  ❌ Debería rechazar '2Min'")
+        return False
+    except DateValidationError:
+        print("  ✅ Rechaza timeframes no soportados")
+    
+    # Test 3: Límites de barra
+    try:
+        ts = datetime(2024, 3, 9, 14, 37)  # sábado
+        assert parse_timeframe("5Min").bar_bounds(ts) == (
+            datetime(2024, 3, 9, 14, 35), datetime(2024, 3, 9, 14, 40)
+        )
+        assert parse_timeframe("4Hour").floor(ts) == datetime(2024, 3, 9, 12, 0)
+        assert parse_timeframe("1Week").floor(ts) == datetime(2024, 3, 4)
+        assert parse_timeframe("1Month").next_boundary(ts) == datetime(2024, 4, 1)
+        print("  ✅ Límites de barra correctos")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 4: Medianoche local a través del cambio de horario (DST)
+    try:
+        day = parse_timeframe("1Day")
+        ts = pd.Timestamp("2024-03-09 10:00", tz="America/New_York")
+        assert day.next_boundary(ts) == pd.Timestamp("2024-03-10", tz="America/New_York")
+        index = pd.DatetimeIndex([ts, ts + pd.Timedelta(days=2)])
+        assert list(parse_timeframe("1Week").floor_index(index).day) == [4, 11]
+        assert parse_timeframe("5Min").divides(parse_timeframe("1Hour"))
+        assert not parse_timeframe("1Hour").divides(parse_timeframe("30Min"))
+        print("  ✅ Límites diarios/semanales respetan el DST")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Timeframes funcionan\n")
+    return True
+
+
+def test_incremental_resampler():
+    """Prueba que el resampler incremental coincide con el resampling completo."""
+    print("🧪 Probando resampler incremental...\n")
+    
+    bars = build_session_bars()
+    
+    # Test 1: Coincide con pandas.resample
+    try:
+        for timeframe, alias in (("5Min", "5min"), ("1Hour", "1h"), ("1Day", "D")):
+            expected = bars.resample(alias).agg({
+                'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'
+            }).dropna()
+            result = resample_bars(bars, timeframe)
+            assert result.index.equals(expected.index), timeframe
+            assert np.allclose(result.to_numpy(), expected.to_numpy(dtype=float)), timeframe
+        print("  ✅ resample_bars coincide con pandas.resample")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 2: Actualizaciones incrementales con ventanas solapadas
+    try:
+        resampler = IncrementalResampler()
+        rng = np.random.default_rng(3)
+        position = 0
+        while position < len(bars):
+            size = int(rng.integers(1, 40))
+            resampler.update(bars.iloc[max(0, position - 3):position + size])
+            position += size
+        resampler.flush()
+        
+        for timeframe in ("5Min", "15Min", "1Hour", "1Day"):
+            expected = resample_bars(bars, timeframe)
+            result = resampler.bars(timeframe)
+            assert result.index.equals(expected.index), timeframe
+            assert np.allclose(result.to_numpy(), expected.to_numpy()), timeframe
+        print("  ✅ Resultado incremental idéntico al resampling completo")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 3: Barras cerradas y en formación
+    try:
+        resampler = IncrementalResampler(targets=("5Min",))
+        completed = resampler.update(bars.iloc[:7])
+        assert len(completed["5Min"]) == 1
+        partial = resampler.partial("5Min")
+        assert partial.name == bars.index[5]
+        assert partial['volume'] == bars['volume'].iloc[5:7].sum()
+        completed = resampler.update(bars.iloc[7:10])
+        assert len(completed["5Min"]) == 1 and resampler.partial("5Min") is None
+        print("  ✅ Cierra barras al completar su ventana")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 4: Configuración inválida
+    try:
+        IncrementalResampler(targets=("1Min",))
+        print("  ❌ Debería rechazar un destino igual al base")
+        return False
+    except MarketDataValidationError:
+        print("  ✅ Rechaza destinos que no son múltiplos del base")
+    
+    print("✅ Resampler incremental funciona\n")
+    return True
+
+
+def test_dst_transitions():
+    """Prueba el resampling a través del cambio de horario (barras de 24h en UTC)."""
+    print("🧪 Probando resampling en cambios de horario...\n")
+    
+    def around(day: str) -> pd.DataFrame:
+        """Barras de 1 minuto de 02:00 a 08:00 UTC (cubren el cambio en Nueva York)."""
+        index = pd.date_range(f"{day} 02:00", periods=360, freq="1min", tz="UTC").tz_convert("America/New_York")
+        return pd.DataFrame({
+            'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': 1.5, 'volume': 1.0,
+        }, index=index)
+    
+    # Fall back: 01:00-02:00 se repite; spring forward: 02:00-03:00 no existe
+    cases = (
+        ("2024-11-03", {"5Min": 72, "1Hour": 6}, [120.0, 240.0]),
+        ("2024-03-10", {"5Min": 72, "1Hour": 6}, [180.0, 180.0]),
+    )
+    
+    try:
+        for day, counts, four_hour in cases:
+            bars = around(day)
+            
+            for timeframe, count in counts.items():
+                result = resample_bars(bars, timeframe)
+                assert len(result) == count and result.index.is_monotonic_increasing, (day, timeframe)
+                assert (result['volume'] == result['volume'].iloc[0]).all(), (day, timeframe)
+            
+            # 4Hour alineado a la hora local: 20:00 y 00:00
+            result = resample_bars(bars, "4Hour")
+            assert result['volume'].tolist() == four_hour, (day, result['volume'].tolist())
+            assert [ts.hour for ts in result.index] == [20, 0], (day, result.index)
+            
+            # El resampler incremental llega al mismo resultado
+            resampler = IncrementalResampler(targets=("5Min", "1Hour", "4Hour"))
+            for start in range(0, len(bars), 37):
+                resampler.update(bars.iloc[start:start + 37])
+            resampler.flush()
+            for timeframe in ("5Min", "1Hour", "4Hour"):
+                expected = resample_bars(bars, timeframe)
+                assert resampler.bars(timeframe).index.equals(expected.index), (day, timeframe)
+        print("  ✅ Fall back (hora repetida) y spring forward (hora inexistente)")
+    except Exception as e:
+        print(f"  ❌ Error: {e!r}")
+        return False
+    
+    print("✅ Cambios de horario funcionan\n")
+    return True
+
+
+def main():
+    """Ejecuta todas las pruebas."""
+    print("=" * 60)
+    print("🚀 Testing Resampler - Trading Bot")
+    print("=" * 60)
+    print()
+    
+    results = []
+    
+    results.append(("Timeframes", test_timeframes()))
+    results.append(("Resampler incremental", test_incremental_resampler()))
+    results.append(("Cambios de horario", test_dst_transitions()))
+    
+    print("=" * 60)
+    print("📊 Resumen de Pruebas")
+    print("=" * 60)
+    
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+    
+    for test_name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{status} - {test_name}")
+    
+    print()
+    print(f"Resultado: {passed}/{total} pruebas pasaron")
+    
+    if passed == total:
+        print("\n🎉 ¡Todas las pruebas pasaron!")
+        return 0
+    else:
+        print(f"\n⚠️  {total - passed} prueba(s) fallaron")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""
+Script de prueba para verificar la coalescencia de peticiones (single-flight).
+
+Este script valida que:
+1. Las llamadas concurrentes (hilos) con la misma clave ejecutan una vez
+2. Las corrutinas concurrentes con la misma clave ejecutan una vez
+3. Las excepciones llegan a todos los llamadores y la clave se libera
+4. El cache no provoca una estampida al caducar un segmento por TTL
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Añadir src al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from src.data.cache import MarketDataCache
+from src.data.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def run_threads(count: int, target) -> list:
+    """Lanza ``count`` hilos que arrancan a la vez y devuelve sus resultados."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+    
+    def worker(i):
+        barrier.wait()
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+    
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_threads():
+    """Prueba la coalescencia entre hilos."""
+    print("🧪 Probando coalescencia entre hilos...\n")
+    
+    flights = SingleFlight()
+    calls = []
+    
+    def fetch(symbol, timeframe):
+        calls.append((symbol, timeframe))
+        time.sleep(0.1)
+        return {'symbol': symbol, 'bars': list(range(5))}
+    
+    try:
+        # Test 1: 20 hilos, una ejecución, el mismo objeto para todos
+        fetch_bars = flights.wrap(fetch)
+        results = run_threads(20, lambda: fetch_bars("AAPL", "1Min"))
+        assert len(calls) == 1 and all(r is results[0] for r in results)
+        assert flights.executions == 1 and flights.coalesced == 19
+        print("  ✅ 20 llamadas concurrentes -> 1 ejecución")
+        
+        # Test 2: Claves distintas no se coalescen
+        run_threads(4, lambda: fetch_bars("MSFT", timeframe="1Day"))
+        fetch_bars("AAPL", "1Min")
+        assert calls[1:] == [("MSFT", "1Day"), ("AAPL", "1Min")], calls
+        print("  ✅ La clave se libera al terminar y distingue argumentos")
+        
+        # Test 3: La excepción llega a todos los que esperaban
+        def failing():
+            time.sleep(0.1)
+            raise ConnectionError("API caída")
+        
+        errors = run_threads(8, lambda: flights.do("fail", failing))
+        assert all(isinstance(e, ConnectionError) for e in errors)
+        assert not flights.in_flight("fail")
+        print("  ✅ Excepción propagada a los 8 llamadores")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Coalescencia entre hilos funciona\n")
+    return True
+
+
+def test_asyncio():
+    """Prueba la coalescencia entre corrutinas."""
+    print("🧪 Probando coalescencia asyncio...\n")
+    
+    flights = AsyncSingleFlight()
+    calls = []
+    
+    async def fetch(symbol):
+        calls.append(symbol)
+        await asyncio.sleep(0.05)
+        return f"bars:{symbol}"
+    
+    async def scenario():
+        fetch_bars = flights.wrap(fetch)
+        
+        # Test 1: 50 corrutinas con la misma clave
+        results = await asyncio.gather(*(fetch_bars("AAPL") for _ in range(50)), fetch_bars("MSFT"))
+        assert results[:50] == ["bars:AAPL"] * 50 and results[50] == "bars:MSFT"
+        assert calls == ["AAPL", "MSFT"] and flights.coalesced == 49
+        print("  ✅ 51 corrutinas -> 2 ejecuciones")
+        
+        # Test 2: Cancelar a un llamador no cancela a los demás
+        first = asyncio.ensure_future(fetch_bars("TSLA"))
+        second = asyncio.ensure_future(fetch_bars("TSLA"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert await second == "bars:TSLA" and first.cancelled()
+        assert calls.count("TSLA") == 1 and not flights.in_flight(((("TSLA",), ())))
+        print("  ✅ La cancelación de un llamador no afecta al resto")
+    
+    try:
+        asyncio.run(scenario())
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Coalescencia asyncio funciona\n")
+    return True
+
+
+def test_cache_stampede():
+    """Prueba que el cache no repite la descarga al caducar un segmento."""
+    print("🧪 Probando estampida al caducar el TTL...\n")
+    
+    index = pd.date_range("2024-03-04", periods=1440, freq="1min", tz="UTC")
+    source = pd.DataFrame({'close': np.arange(1440.0)}, index=index)
+    calls = []
+    
+    def fetch(start, end):
+        calls.append((start, end))
+        time.sleep(0.1)
+        return source[(source.index >= start) & (source.index < end)]
+    
+    try:
+        cache = MarketDataCache(ttl=0.2)
+        cache.get_or_fetch("AAPL", "1Min", "2024-03-04", "2024-03-04", fetch)
+        time.sleep(0.3)
+        
+        # Test 1: 16 estrategias piden el mismo rango justo tras caducar
+        results = run_threads(16, lambda: cache.get_or_fetch("AAPL", "1Min", "2024-03-04", "2024-03-04", fetch))
+        assert len(calls) == 2, len(calls)
+        assert all(isinstance(r, pd.DataFrame) and r.equals(source) for r in results)
+        stats = cache.stats
+        assert stats.fetches == 2 and stats.coalesced + stats.hits == 15, stats
+        print(f"  ✅ 16 peticiones tras caducar -> 1 descarga ({stats.coalesced} coalescidas)")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Sin estampida al caducar el TTL\n")
+    return True
+
+
+def main():
+    """Ejecuta todas las pruebas."""
+    print("=" * 60)
+    print("🚀 Testing Single-Flight - Trading Bot")
+    print("=" * 60)
+    print()
+    
+    results = []
+    
+    results.append(("Hilos", test_threads()))
+    results.append(("Asyncio", test_asyncio()))
+    results.append(("Estampida de cache", test_cache_stampede()))
+    
+    print("=" * 60)
+    print("📊 Resumen de Pruebas")
+    print("=" * 60)
+    
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+    
+    for test_name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{status} - {test_name}")
+    
+    print()
+    print(f"Resultado: {passed}/{total} pruebas pasaron")
+    
+    if passed == total:
+        print("\n🎉 ¡Todas las pruebas pasaron!")
+        return 0
+    else:
+        print(f"\n⚠️  {total - passed} prueba(s) fallaron")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
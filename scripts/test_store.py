@@ -0,0 +1,235 @@
+"""
+Script de prueba para verificar el almacén columnar de barras.
+
+Este script valida que:
+1. Las barras se guardan y se leen por rango con búsqueda binaria
+2. Las lecturas son vistas del memmap, sin copiar datos
+3. La escritura solo añade al final y descarta barras repetidas
+4. Una escritura interrumpida no corrompe la serie
+5. Las claves se validan con los validadores del proyecto
+6. Otra instancia ve las barras que ``merge`` sobrescribe
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Añadir src al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from src.data.store import BarStore
+from src.utils.validators import DateValidationError, MarketDataValidationError, SymbolValidationError
+
+
+def build_bars(start: str, periods: int, seed: int = 3) -> pd.DataFrame:
+    """Genera barras de 1 minuto consecutivas."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start, periods=periods, freq="1min", tz="UTC")
+    close = 100 + rng.normal(0, 0.1, periods).cumsum()
+    return pd.DataFrame({
+        'open': close - 0.05,
+        'high': close + 0.1,
+        'low': close - 0.1,
+        'close': close,
+        'volume': rng.integers(1, 1000, periods).astype(float),
+    }, index=index)
+
+
+def test_append_and_read():
+    """Prueba la escritura y la lectura por rango."""
+    print("🧪 Probando escritura y lectura por rango...\n")
+    
+    tmp_dir = Path(tempfile.mkdtemp())
+    bars = build_bars("2024-03-04", 3 * 1440)
+    
+    try:
+        store = BarStore(tmp_dir)
+        
+        # Test 1: Escritura en dos tandas
+        assert store.append("aapl", "1Min", bars.iloc[:2000]) == 2000
+        assert store.append("AAPL", "1Min", bars.iloc[2000:]) == len(bars) - 2000
+        assert store.length("AAPL", "1Min") == len(bars)
+        assert (tmp_dir / "bars" / "AAPL" / "1Min" / "close.f8").stat().st_size == len(bars) * 8
+        print(f"  ✅ {len(bars)} barras guardadas en una columna por archivo")
+        
+        # Test 2: Rango de días (fin inclusivo) e instantes (fin exclusivo)
+        day = store.read("AAPL", "1Min", "2024-03-05", "2024-03-05")
+        assert day.to_frame().equals(bars.loc["2024-03-05"])
+        window = store.read("AAPL", "1Min", pd.Timestamp("2024-03-04 10:00", tz="UTC"),
+                            pd.Timestamp("2024-03-04 10:30", tz="UTC"))
+        assert len(window) == 30 and window.index[0] == pd.Timestamp("2024-03-04 10:00", tz="UTC")
+        assert len(store.read("AAPL", "1Min", end="2024-03-04")) == 1440
+        assert len(store.read("AAPL", "1Min", start="2024-03-06")) == 1440
+        assert len(store.read("AAPL", "1Min", "2024-03-10", "2024-03-11")) == 0
+        print("  ✅ Rangos por fecha e instante resueltos con búsqueda binaria")
+        
+        # Test 3: Otra instancia (otro proceso) lee lo confirmado
+        other = BarStore(tmp_dir)
+        assert other.bounds("AAPL", "1Min") == (bars.index[0], bars.index[-1])
+        assert other.symbols("1Min") == ["AAPL"] and other.symbols("1Day") == []
+        print("  ✅ Nueva instancia ve la serie confirmada")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    print("✅ Escritura y lectura funcionan\n")
+    return True
+
+
+def test_zero_copy():
+    """Prueba que las lecturas no copian datos."""
+    print("🧪 Probando lecturas sin copia...\n")
+    
+    tmp_dir = Path(tempfile.mkdtemp())
+    
+    try:
+        store = BarStore(tmp_dir)
+        symbols = [f"S{chr(65 + i // 26)}{chr(65 + i % 26)}" for i in range(200)]
+        bars = build_bars("2024-03-04", 5000)
+        for symbol in symbols:
+            store.append(symbol, "1Min", bars)
+        
+        # Test 1: Las columnas son vistas de solo lectura del memmap
+        view = store.read("SAA", "1Min", "2024-03-05", "2024-03-05")
+        assert isinstance(view["close"].base, np.memmap) or isinstance(view["close"], np.memmap)
+        assert not view["close"].flags.owndata and not view["close"].flags.writeable
+        assert np.array_equal(view["close"], bars.loc["2024-03-05"]["close"].to_numpy())
+        print("  ✅ Columnas servidas como vistas de solo lectura")
+        
+        # Test 2: Leer muchos símbolos no copia los datos
+        start = time.perf_counter()
+        views = store.read_many(symbols, "1Min", "2024-03-04", "2024-03-06")
+        elapsed = time.perf_counter() - start
+        owned = sum(column.nbytes for v in views.values() for column in v.columns.values()
+                    if column.flags.owndata)
+        assert len(views) == 200 and owned == 0
+        mapped = sum(v["close"].nbytes for v in views.values())
+        print(f"  ✅ {len(views)} símbolos leídos en {elapsed * 1000:.1f} ms "
+              f"({mapped / 1e6:.1f} MB por columna mapeados, 0 copiados)")
+        
+        # Test 3: Las vistas entregadas siguen siendo válidas tras añadir datos
+        store.append("SAA", "1Min", build_bars("2024-03-08", 10))
+        assert np.array_equal(view["close"], bars.loc["2024-03-05"]["close"].to_numpy())
+        assert len(store.read("SAA", "1Min")) == 5010
+        print("  ✅ Vistas previas válidas tras añadir barras")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    print("✅ Lecturas sin copia funcionan\n")
+    return True
+
+
+def test_append_only():
+    """Prueba el descarte de solapes y la recuperación de escrituras interrumpidas."""
+    print("🧪 Probando escritura append-only...\n")
+    
+    tmp_dir = Path(tempfile.mkdtemp())
+    bars = build_bars("2024-03-04", 100)
+    
+    try:
+        store = BarStore(tmp_dir)
+        store.append("MSFT", "1Min", bars.iloc[:60])
+        
+        # Test 1: Solapes y desorden
+        shuffled = bars.iloc[40:].sample(frac=1, random_state=1)
+        assert store.append("MSFT", "1Min", shuffled) == 40
+        assert store.append("MSFT", "1Min", bars.iloc[:50]) == 0
+        assert store.read("MSFT", "1Min").to_frame().equals(bars)
+        print("  ✅ Solapes descartados y barras ordenadas")
+        
+        # Test 2: Bytes de una escritura interrumpida se ignoran y se truncan
+        series_dir = tmp_dir / "bars" / "MSFT" / "1Min"
+        with open(series_dir / "close.f8", "ab") as f:
+            f.write(b"\x00" * 24)
+        reopened = BarStore(tmp_dir)
+        assert len(reopened.read("MSFT", "1Min")) == 100
+        more = build_bars("2024-03-04 01:40", 5)
+        assert reopened.append("MSFT", "1Min", more) == 5
+        assert (series_dir / "close.f8").stat().st_size == 105 * 8
+        assert json.loads((series_dir / "meta.json").read_text())['length'] == 105
+        print("  ✅ Escritura interrumpida recuperada")
+        
+        # Test 3: Otro BarStore ve las barras sobrescritas por merge (misma longitud)
+        writer, reader = BarStore(tmp_dir), BarStore(tmp_dir)
+        assert len(reader.read("MSFT", "1Min")) == len(writer.read("MSFT", "1Min")) == 105
+        revised = bars.iloc[:2].copy()
+        revised['close'] = 99.0
+        assert writer.merge("MSFT", "1Min", revised) == 0
+        for instance in (writer, reader):
+            view = instance.read("MSFT", "1Min")
+            assert len(view) == 105 and view['close'][:2].tolist() == [99.0, 99.0]
+            assert view['close'][2:100].tolist() == bars['close'].iloc[2:].tolist()
+        print("  ✅ Barras revisadas por merge visibles desde otra instancia")
+        
+        # Test 4: Validación
+        for call, error in (
+            (lambda: store.append("MSFT1", "1Min", bars), SymbolValidationError),
+            (lambda: store.append("MSFT", "2Min", bars), DateValidationError),
+            (lambda: store.append("MSFT", "1Min", bars[['close']]), MarketDataValidationError),
+            (lambda: store.read("MSFT", "1Min", "2024-03-05", "2024-03-04"), DateValidationError),
+        ):
+            try:
+                call()
+                print("  ❌ Debería rechazar la operación")
+                return False
+            except error:
+                pass
+        print("  ✅ Símbolo, timeframe, columnas y rango validados")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    print("✅ Escritura append-only funciona\n")
+    return True
+
+
+def main():
+    """Ejecuta todas las pruebas."""
+    print("=" * 60)
+    print("🚀 Testing Almacén Columnar - Trading Bot")
+    print("=" * 60)
+    print()
+    
+    results = []
+    
+    results.append(("Escritura y lectura", test_append_and_read()))
+    results.append(("Lecturas sin copia", test_zero_copy()))
+    results.append(("Append-only", test_append_only()))
+    
+    print("=" * 60)
+    print("📊 Resumen de Pruebas")
+    print("=" * 60)
+    
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+    
+    for test_name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{status} - {test_name}")
+    
+    print()
+    print(f"Resultado: {passed}/{total} pruebas pasaron")
+    
+    if passed == total:
+        print("\n🎉 ¡Todas las pruebas pasaron!")
+        return 0
+    else:
+        print(f"\n⚠️  {total - passed} prueba(s) fallaron")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
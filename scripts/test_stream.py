@@ -0,0 +1,325 @@
+"""
+Script de prueba para verificar la pipeline de streaming.
+
+Este script valida que:
+1. Los trades se agregan en barras OHLCV y los mensajes inválidos se descartan
+2. Las políticas de las colas (block, drop_oldest, conflate) se respetan
+3. ``stop`` y los errores de una etapa terminan la pipeline sin dejar tareas
+4. La pipeline consume un websocket local que reproduce frames grabados
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Añadir src al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.stream import ConsumerQueue, StreamPipeline, Trade, parse_time_ns, replay_source, websocket_source
+
+
+MINUTE_NS = 60_000_000_000
+
+
+def trade(symbol: str, price, size: float, ts: str) -> dict:
+    """Mensaje de trade con el formato del stream de Alpaca."""
+    return {'T': 't', 'S': symbol, 'p': price, 's': size, 't': ts, 'i': 1, 'x': 'V'}
+
+
+def recorded_frames() -> list:
+    """Sesión grabada: control, trades de dos símbolos y mensajes inválidos."""
+    return [
+        json.dumps([{'T': 'success', 'msg': 'connected'}]),
+        json.dumps([{'T': 'success', 'msg': 'authenticated'}]),
+        json.dumps([{'T': 'subscription', 'trades': ['AAPL', 'MSFT']}]),
+        json.dumps([
+            trade('AAPL', 150.0, 10, '2024-03-04T14:30:01.5Z'),
+            trade('AAPL', 151.0, 5, '2024-03-04T14:30:20.123456789Z'),
+            trade('MSFT', 400.0, 1, '2024-03-04T14:30:30Z'),
+        ]),
+        json.dumps([
+            trade('AAPL', 149.5, 2, '2024-03-04T14:30:59.999Z'),
+            trade('aapl', 150.5, 3, '2024-03-04T14:31:00Z'),
+            trade('AAPL', -1, 3, '2024-03-04T14:31:10Z'),
+            trade('123', 10.0, 3, '2024-03-04T14:31:10Z'),
+            trade('AAPL', 150.0, 0, '2024-03-04T14:31:10Z'),
+            {'T': 't', 'S': 'AAPL', 'p': 150.0},
+        ]),
+        'no es json',
+        json.dumps([trade('AAPL', 140.0, 1, '2024-03-04T14:30:45Z')]),
+        json.dumps([trade('AAPL', 152.0, 4, '2024-03-04T14:31:30Z')]),
+    ]
+
+
+def test_pipeline():
+    """Prueba la agregación y la validación de la pipeline."""
+    print("🧪 Probando pipeline de streaming...\n")
+    
+    async def scenario():
+        pipeline = StreamPipeline(replay_source(recorded_frames()), timeframe='1Min', close_after=None)
+        bars = pipeline.subscribe('bars', kinds=('bar',))
+        trades = []
+        
+        async def on_trade(event):
+            trades.append(event)
+        
+        pipeline.subscribe('trades', on_trade, kinds=('trade',), symbols=['AAPL'])
+        collector = asyncio.create_task(collect(bars))
+        stats = await pipeline.run()
+        return stats, await collector, trades
+    
+    try:
+        stats, bars, trades = asyncio.run(scenario())
+        
+        # Test 1: Barras OHLCV por símbolo y minuto
+        start = parse_time_ns('2024-03-04T14:30:00Z')
+        by_key = {(bar.symbol, bar.timestamp): bar for bar in bars}
+        aapl = by_key[('AAPL', start)]
+        assert (aapl.open, aapl.high, aapl.low, aapl.close, aapl.volume) == (150.0, 151.0, 149.5, 149.5, 17.0), aapl
+        aapl_next = by_key[('AAPL', start + MINUTE_NS)]
+        assert (aapl_next.open, aapl_next.close, aapl_next.volume) == (150.5, 152.0, 7.0), aapl_next
+        assert by_key[('MSFT', start)].volume == 1.0
+        assert len(bars) == 3 and stats.bars_built == 3
+        print("  ✅ Trades agregados en 3 barras de 1Min")
+        
+        # Test 2: Inválidos, tardíos y mensajes de control
+        assert stats.rejected == 4, stats.to_dict()
+        assert stats.decode_errors == 1 and stats.control == 3
+        assert stats.late_trades == 1
+        print("  ✅ 4 rechazados, 1 frame inválido, 1 trade tardío, 3 de control")
+        
+        # Test 3: Filtro por tipo y símbolo del handler
+        assert all(isinstance(t, Trade) and t.symbol == 'AAPL' for t in trades)
+        assert len(trades) == 5 and stats.consumers['trades'].delivered == 5
+        assert trades[1].timestamp == start + 20_123_456_789
+        print("  ✅ Handler recibe solo trades de AAPL con precisión de ns")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Pipeline funciona correctamente\n")
+    return True
+
+
+async def collect(subscription, delay: float = 0.0) -> list:
+    """Consume una suscripción hasta que se cierra."""
+    events = []
+    async for event in subscription:
+        events.append(event)
+        await asyncio.sleep(delay)
+    return events
+
+
+def test_policies():
+    """Prueba las políticas de las colas de consumidores."""
+    print("🧪 Probando políticas de colas...\n")
+    
+    symbols = ['AAPL', 'MSFT', 'NVDA']
+    frames = [
+        json.dumps([trade(symbols[i % 3], 100.0 + i, 1, f'2024-03-04T14:30:{i // 10:02d}.{i % 10}Z')])
+        for i in range(300)
+    ]
+    
+    async def scenario():
+        pipeline = StreamPipeline(replay_source(frames), queue_size=8, close_after=None)
+        subscriptions = {
+            'block': pipeline.subscribe('block', maxsize=4, policy='block', kinds=('trade',)),
+            'drop_oldest': pipeline.subscribe('drop_oldest', maxsize=4, policy='drop_oldest', kinds=('trade',)),
+            'conflate': pipeline.subscribe('conflate', maxsize=4, policy='conflate', kinds=('trade',)),
+        }
+        # El consumidor bloqueante es lento: frena a toda la pipeline
+        tasks = {
+            name: asyncio.create_task(collect(sub, 0.001 if name == 'block' else 0.01))
+            for name, sub in subscriptions.items()
+        }
+        stats = await pipeline.run()
+        return stats, {name: await task for name, task in tasks.items()}
+    
+    try:
+        stats, received = asyncio.run(scenario())
+        
+        # Test 1: block no pierde nada y conserva el orden
+        prices = [event.price for event in received['block']]
+        assert prices == [100.0 + i for i in range(300)], len(prices)
+        assert stats.consumers['block'].max_depth <= 4
+        print("  ✅ block: 300/300 eventos en orden, cola acotada a 4")
+        
+        # Test 2: drop_oldest descarta y entrega los más recientes
+        dropped = stats.consumers['drop_oldest'].dropped
+        assert dropped > 0 and len(received['drop_oldest']) + dropped == 300
+        assert received['drop_oldest'][-1].price == 399.0
+        print(f"  ✅ drop_oldest: {dropped} descartados, último evento entregado")
+        
+        # Test 3: conflate entrega el último trade de cada símbolo
+        last = {}
+        for event in received['conflate']:
+            last[event.symbol] = event.price
+        assert last == {'AAPL': 397.0, 'MSFT': 398.0, 'NVDA': 399.0}, last
+        assert stats.consumers['conflate'].conflated > 0
+        print(f"  ✅ conflate: {stats.consumers['conflate'].conflated} sustituidos, último precio por símbolo")
+        
+        # Test 4: Política inválida
+        try:
+            ConsumerQueue(policy='lifo')
+            return False
+        except ValueError:
+            print("  ✅ Política inválida rechazada")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Políticas de colas funcionan correctamente\n")
+    return True
+
+
+async def idle_source(frames: list):
+    """Fuente que envía unos frames y después queda a la espera sin actividad."""
+    for frame in frames:
+        yield frame
+    await asyncio.Event().wait()
+
+
+def stream_tasks() -> list:
+    """Tareas de la pipeline que siguen vivas."""
+    return [task for task in asyncio.all_tasks() if task.get_name().startswith('stream-') and not task.done()]
+
+
+def test_shutdown():
+    """Prueba que stop y los errores de una etapa terminan la pipeline."""
+    print("🧪 Probando parada de la pipeline...\n")
+    
+    async def stop_when_idle():
+        pipeline = StreamPipeline(idle_source(recorded_frames()[:4]), close_after=5.0)
+        bars = pipeline.subscribe('bars', kinds=('bar',))
+        collector = asyncio.create_task(collect(bars))
+        runner = asyncio.create_task(pipeline.run())
+        while pipeline.stats.trades < 3:
+            await asyncio.sleep(0.01)
+        pipeline.stop()
+        stats = await asyncio.wait_for(runner, timeout=2.0)
+        return stats, await collector, stream_tasks()
+    
+    async def failing_stage():
+        pipeline = StreamPipeline(idle_source(recorded_frames()), close_after=5.0)
+        
+        def decode(message):
+            raise RuntimeError("decode roto")
+        
+        pipeline._decode = decode
+        try:
+            await asyncio.wait_for(pipeline.run(), timeout=2.0)
+        except RuntimeError as e:
+            return str(e), stream_tasks()
+        return None, stream_tasks()
+    
+    try:
+        # Test 1: stop con la fuente sin actividad
+        stats, bars, alive = asyncio.run(stop_when_idle())
+        assert stats.messages == 4 and not alive, (stats.messages, alive)
+        assert [(bar.symbol, bar.volume) for bar in bars] == [('AAPL', 15.0), ('MSFT', 1.0)], bars
+        print("  ✅ stop con la fuente inactiva: barras en formación entregadas")
+        
+        # Test 2: Un error en una etapa cancela las demás
+        error, alive = asyncio.run(failing_stage())
+        assert error == "decode roto" and not alive, (error, alive)
+        print("  ✅ Error en decode propagado; lectura y resto de etapas canceladas")
+    except (AssertionError, asyncio.TimeoutError) as e:
+        print(f"  ❌ Error: {e!r}")
+        return False
+    
+    print("✅ Parada de la pipeline funciona correctamente\n")
+    return True
+
+
+def test_websocket_replay():
+    """Prueba la pipeline contra un servidor websocket local de replay."""
+    print("🧪 Probando websocket local de replay...\n")
+    
+    try:
+        import websockets
+    except ImportError:
+        print("  ⏭️  websockets no instalado: prueba omitida\n")
+        return None
+    
+    received_actions = []
+    
+    async def handler(socket, *args):
+        received_actions.append(json.loads(await socket.recv()))
+        received_actions.append(json.loads(await socket.recv()))
+        for frame in recorded_frames():
+            await socket.send(frame)
+    
+    async def scenario():
+        async with websockets.serve(handler, '127.0.0.1', 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            source = websocket_source(
+                f'ws://127.0.0.1:{port}', 'PKTEST', 'SECRET', trades=['aapl', 'MSFT'], reconnect_delay=None
+            )
+            pipeline = StreamPipeline(source, close_after=None)
+            bars = pipeline.subscribe('bars', kinds=('bar',))
+            collector = asyncio.create_task(collect(bars))
+            stats = await pipeline.run()
+            return stats, await collector
+    
+    try:
+        stats, bars = asyncio.run(scenario())
+        
+        # Test 1: Autenticación y suscripción
+        assert received_actions[0] == {'action': 'auth', 'key': 'PKTEST', 'secret': 'SECRET'}
+        assert received_actions[1] == {'action': 'subscribe', 'trades': ['AAPL', 'MSFT']}
+        print("  ✅ auth y subscribe enviados")
+        
+        # Test 2: Mismo resultado que el replay en memoria
+        assert len(bars) == 3 and stats.rejected == 4 and stats.late_trades == 1
+        print("  ✅ 3 barras desde el websocket")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Websocket de replay funciona correctamente\n")
+    return True
+
+
+def main():
+    """Ejecuta todas las pruebas."""
+    print("=" * 60)
+    print("🚀 Testing Streaming Pipeline - Trading Bot")
+    print("=" * 60)
+    print()
+    
+    results = []
+    
+    results.append(("Pipeline", test_pipeline()))
+    results.append(("Políticas de colas", test_policies()))
+    results.append(("Parada", test_shutdown()))
+    results.append(("Websocket de replay", test_websocket_replay()))
+    
+    print("=" * 60)
+    print("📊 Resumen de Pruebas")
+    print("=" * 60)
+    
+    # None = prueba omitida (dependencia opcional no instalada)
+    passed = sum(1 for _, result in results if result)
+    total = sum(1 for _, result in results if result is not None)
+    
+    for test_name, result in results:
+        status = "⏭️  SKIP" if result is None else "✅ PASS" if result else "❌ FAIL"
+        print(f"{status} - {test_name}")
+    
+    print()
+    print(f"Resultado: {passed}/{total} pruebas pasaron")
+    skipped = len(results) - total
+    if skipped:
+        print(f"{skipped} prueba(s) omitida(s)")
+    
+    if passed == total:
+        print("\n🎉 ¡Todas las pruebas pasaron!")
+        return 0
+    else:
+        print(f"\n⚠️  {total - passed} prueba(s) fallaron")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
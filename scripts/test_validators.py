@@ -8,8 +8,10 @@ Este script valida que:
 4. Los validadores de porcentajes funcionan
 5. Los validadores de configuración funcionan
 6. Las excepciones se lanzan correctamente
+7. Importar los validadores no carga dependencias pesadas
 """
 
+import subprocess
 import sys
 from pathlib import Path
 
@@ -24,6 +26,7 @@ from src.utils.validators import (
     DateValidationError,
     PercentageValidationError,
     ConfigValidationError,
+    MarketDataValidationError,
     # Validadores
     validate_symbol,
     validate_symbols_list,
@@ -39,7 +42,28 @@ from src.utils.validators import (
     validate_api_key,
     validate_url,
     validate_positive_integer,
+    # Modo sin excepciones
+    OrderErrorCode,
+    SymbolErrorCode,
+    DateErrorCode,
+    check_symbol,
+    check_quantity,
+    check_price,
+    check_date,
+    check_date_range,
+    check_url,
+    collect_errors,
+    raise_for_code,
 )
+from src.utils.batch_validators import (
+    validate_date_ranges_bulk,
+    validate_dates_bulk,
+    validate_orders_batch,
+)
+from src.utils.symbols import SymbolUniverse, SymbolFormat
+from src.utils.ohlcv_validators import validate_ohlcv_frame
+
+import pandas as pd
 
 
 def test_symbol_validators():
@@ -76,6 +100,42 @@ def test_symbol_validators():
     return True
 
 
+def test_symbol_universe():
+    """Prueba el universo indexado de símbolos."""
+    print("🧪 Probando universo de símbolos...\n")
+    
+    formats = (SymbolFormat.US, SymbolFormat.CLASS_SHARE, SymbolFormat.BVL)
+    
+    # Test 1: Pertenencia con normalización
+    try:
+        universe = SymbolUniverse(["AAPL", "AMZN", "BRK.B", "ALICORC1"], formats=formats)
+        assert "brk.b" in universe and "MSFT" not in universe
+        print("  ✅ Pertenencia O(1) con normalización")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 2: Búsqueda por prefijo
+    try:
+        result = universe.with_prefix("a")
+        assert result == ["AAPL", "ALICORC1", "AMZN"], f"Resultado inesperado: {result}"
+        print("  ✅ with_prefix('a') devuelve símbolos ordenados")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 3: Símbolo fuera del universo
+    try:
+        universe.validate("MSFT")
+        print("  ❌ Debería rechazar símbolos fuera del universo")
+        return False
+    except SymbolValidationError:
+        print("  ✅ Rechaza símbolos fuera del universo")
+    
+    print("✅ Universo de símbolos funciona\n")
+    return True
+
+
 def test_order_validators():
     """Prueba validadores de órdenes."""
     print("🧪 Probando validadores de órdenes...\n")
@@ -270,6 +330,226 @@ def test_config_validators():
     return True
 
 
+def test_check_validators():
+    """Prueba el modo sin excepciones (check_*)."""
+    print("🧪 Probando validadores sin excepciones...\n")
+    
+    # Test 1: Resultado válido
+    try:
+        value, code = check_symbol("aapl")
+        assert value == "AAPL" and code == SymbolErrorCode.OK
+        print("  ✅ check_symbol('aapl') = ('AAPL', OK)")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 2: Códigos de error sin excepciones
+    try:
+        assert check_quantity(0)[1] == OrderErrorCode.QTY_BELOW_MIN
+        assert check_date_range("2024-12-31", "2024-01-01")[1] == DateErrorCode.INVERTED_RANGE
+        errors = collect_errors(check_symbol, ["AAPL", "AAPL123", "MSFT"])
+        assert list(errors) == [1], f"Resultado inesperado: {errors}"
+        print("  ✅ Los errores se reportan como códigos")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 3: Conversión a la excepción correspondiente
+    try:
+        raise_for_code(OrderErrorCode.QTY_BELOW_MIN, 0)
+        print("  ❌ Debería lanzar OrderValidationError")
+        return False
+    except OrderValidationError:
+        print("  ✅ raise_for_code lanza la excepción de la familia del código")
+    
+    # Test 4: validate_* lanza exactamente cuando check_* devuelve un código
+    cases = [
+        (validate_url, check_url, ["https://api.alpaca.markets", "", "api.alpaca.markets", "https://", "http://x.com"]),
+        (validate_date, check_date, ["2024-12-07", "", "2024-13-01", "07/12/2024"]),
+        (lambda r: validate_date_range(*r), lambda r: check_date_range(*r),
+         [("2024-01-01", "2024-12-31"), ("2024-12-31", "2024-01-01"), ("", "2024-01-01"), ("2024-01-01", "x")]),
+    ]
+    try:
+        for validate, check, values in cases:
+            for value in values:
+                expected, code = check(value)
+                try:
+                    result = validate(value)
+                except ValidationError:
+                    assert code, value
+                else:
+                    assert not code and result == expected, value
+        print("  ✅ validate_url/validate_date/validate_date_range envuelven a check_*")
+    except AssertionError as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Validadores sin excepciones funcionan\n")
+    return True
+
+
+def test_batch_validators():
+    """Prueba la validación vectorizada de lotes de órdenes."""
+    print("🧪 Probando validación por lotes...\n")
+    
+    orders = {
+        'side': ['BUY', 'sell', 'hold', ''],
+        'qty': [100, 0, 10, 5],
+        'price': [150.555, 20.0, 10.0, 0.0],
+        'order_type': ['MARKET', 'limit', 'limit', 'stop'],
+    }
+    
+    # Test 1: Máscara por fila sin lanzar excepciones
+    try:
+        result = validate_orders_batch(orders)
+        assert result.valid.tolist() == [True, False, False, False]
+        print("  ✅ validate_orders_batch devuelve máscara por fila")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 2: Códigos de error decodificados
+    try:
+        assert result.reasons(1) == ['QTY_BELOW_MIN']
+        assert result.reasons(3) == ['EMPTY_SIDE', 'PRICE_BELOW_MIN']
+        print("  ✅ Los códigos de error se decodifican correctamente")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 3: Normalización igual a los validadores escalares
+    try:
+        row = result.normalized.iloc[0]
+        assert row['side'] == validate_order_side('BUY')
+        assert row['order_type'] == validate_order_type('MARKET')
+        assert row['price'] == validate_price(150.555)
+        print("  ✅ Normalización consistente con validadores escalares")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 4: Valores ausentes (qty float64 por el NaN, precio NaN/None)
+    try:
+        result = validate_orders_batch({'qty': [10, None, 5], 'price': [10.0, 20.0, float('nan')]})
+        assert result.reasons(0) == []
+        assert result.reasons(1) == ['MISSING_QTY']
+        assert result.reasons(2) == ['MISSING_PRICE']
+
+        result = validate_orders_batch({'qty': [10.0, 2.5, float('inf')], 'price': [None, 'x', 1.0]})
+        assert result.reasons(0) == ['MISSING_PRICE']
+        assert result.reasons(1) == ['INVALID_QTY_TYPE', 'INVALID_PRICE_TYPE']
+        assert result.reasons(2) == ['INVALID_QTY_TYPE']
+
+        assert check_quantity(None)[1] == OrderErrorCode.MISSING_QTY
+        assert check_price(float('nan'))[1] == OrderErrorCode.MISSING_PRICE
+        print("  ✅ NaN/None con código propio; enteros en columnas float aceptados")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+
+    print("✅ Validación por lotes funciona\n")
+    return True
+
+
+def test_bulk_date_validators():
+    """Prueba el parseo y validación vectorizada de fechas."""
+    print("🧪 Probando validación masiva de fechas...\n")
+    
+    dates = ["2024-01-02", "2024-13-01", "", None, "2024-1-5", "2024-01-02", "2023-02-29"]
+    
+    # Test 1: Mismos resultados que check_date
+    try:
+        result = validate_dates_bulk(dates)
+        for i, value in enumerate(dates):
+            parsed, code = check_date(value)
+            assert int(result.codes[i]) == int(code), f"Fila {i}: {result.reasons(i)}"
+            if not code:
+                assert result.normalized['date'].iloc[i] == parsed
+        print("  ✅ Coincide con check_date fila por fila")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 2: Detección ISO-8601 (ruta numpy y fallback de pandas)
+    try:
+        result = validate_dates_bulk(["2024-01-02T14:30:00Z", "2024-01-02T15:30:00Z"], date_format=None)
+        assert result.all_valid
+        assert str(result.normalized['date'].dt.tz) == 'UTC'
+        result = validate_dates_bulk(["2024-01-02T09:30:00-05:00", "2024-02-30T00:00:00Z"], date_format=None)
+        assert result.normalized['date'].iloc[0].hour == 14
+        assert result.reasons(1) == ['INVALID_DATE']
+        print("  ✅ Detecta ISO-8601 con y sin offset")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 3: Rangos vectorizados
+    try:
+        result = validate_date_ranges_bulk(
+            ["2024-01-01", "2024-06-01", "2024-01-01"],
+            ["2024-12-31", "2024-01-01", "bad"]
+        )
+        assert result.reasons(0) == []
+        assert result.reasons(1) == ['INVERTED_RANGE']
+        assert result.reasons(2) == ['INVALID_DATE']
+        print("  ✅ Detecta rangos invertidos y fechas inválidas")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Validación masiva de fechas funciona\n")
+    return True
+
+
+def test_ohlcv_validator():
+    """Prueba el validador vectorizado de DataFrames OHLCV."""
+    print("🧪 Probando validador OHLCV...\n")
+    
+    index = pd.date_range("2024-01-02 14:30", periods=6, freq="1min", tz="UTC")
+    bars = pd.DataFrame({
+        'open': [10.0, 10.5, 10.2, 10.1, 10.3, 10.4],
+        'high': [11.0, 11.0, 10.0, 10.5, 10.6, 10.8],  # fila 2: high < open
+        'low': [9.5, 10.0, 9.8, 9.9, 10.0, 10.1],
+        'close': [10.5, 10.2, 10.1, 10.3, 10.4, 10.6],
+        'volume': [100, 200, 150, 0, 120, 130],  # fila 3: volumen 0
+    }, index=index)
+    
+    # Test 1: Errores de precio y volumen por fila
+    try:
+        report = validate_ohlcv_frame(bars, "1Min")
+        assert report.reasons(2) == ['HIGH_BELOW_OPEN_CLOSE']
+        assert report.reasons(3) == ['NON_POSITIVE_VOLUME']
+        assert report.invalid_count == 2
+        print("  ✅ Detecta barras incoherentes y volumen no positivo")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 2: Duplicados, desalineación y huecos
+    try:
+        shifted = bars.set_axis(index[[0, 0, 1, 2, 4, 5]] + pd.to_timedelta([0, 0, 0, 30, 0, 0], unit="s"))
+        report = validate_ohlcv_frame(shifted, "1Min")
+        assert report.reasons(1)[0] == 'DUPLICATE_TIMESTAMP'
+        assert 'MISALIGNED_TIMESTAMP' in report.reasons(3)
+        assert len(report.gaps) == 2, f"Huecos inesperados: {report.gaps}"
+        print("  ✅ Detecta duplicados, desalineación y huecos")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    # Test 3: Rango de fechas
+    try:
+        report = validate_ohlcv_frame(bars, "1Min", "2024-01-03", "2024-01-31")
+        assert report.counts()['OUT_OF_RANGE'] == len(bars)
+        print("  ✅ Marca barras fuera del rango de fechas")
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return False
+    
+    print("✅ Validador OHLCV funciona\n")
+    return True
+
+
 def test_exception_hierarchy():
     """Prueba la jerarquía de excepciones."""
     print("🧪 Probando jerarquía de excepciones...\n")
@@ -281,6 +561,7 @@ def test_exception_hierarchy():
         DateValidationError,
         PercentageValidationError,
         ConfigValidationError,
+        MarketDataValidationError,
     ]
     
     for exc_class in exceptions:
@@ -293,6 +574,49 @@ def test_exception_hierarchy():
     return True
 
 
+def test_lazy_imports():
+    """Prueba que src.utils importa los submódulos de forma diferida."""
+    print("🧪 Probando imports diferidos...\n")
+    
+    code = (
+        "import sys\n"
+        "from src.utils import validate_symbol, check_symbol, SymbolUniverse, parse_timeframe, get_logger\n"
+        "heavy = ('pydantic', 'yaml', 'dotenv', 'numpy', 'pandas')\n"
+        "print(','.join(m for m in heavy if m in sys.modules))\n"
+        "import src.utils\n"
+        "assert 'ValidationError' in dir(src.utils)\n"
+        "from src.utils import validate_orders_batch\n"
+        "assert 'numpy' in sys.modules and 'pydantic' not in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True
+    )
+    
+    if result.returncode != 0:
+        print(f"  ❌ Error: {result.stderr.strip().splitlines()[-1]}")
+        return False
+    
+    leaked = result.stdout.strip()
+    if leaked:
+        print(f"  ❌ Imports ligeros cargan: {leaked}")
+        return False
+    
+    try:
+        import src.utils
+        src.utils.no_existe
+        print("  ❌ Debería lanzar AttributeError")
+        return False
+    except AttributeError:
+        pass
+    
+    print("  ✅ Validadores y logger sin Pydantic, PyYAML, dotenv, numpy ni pandas")
+    print("✅ Imports diferidos funcionan\n")
+    return True
+
+
 def main():
     """Ejecuta todas las pruebas."""
     print("=" * 60)
@@ -304,11 +628,17 @@ def main():
     
     # Ejecutar tests
     results.append(("Validadores de símbolos", test_symbol_validators()))
+    results.append(("Universo de símbolos", test_symbol_universe()))
     results.append(("Validadores de órdenes", test_order_validators()))
     results.append(("Validadores de fechas", test_date_validators()))
     results.append(("Validadores de porcentajes", test_percentage_validators()))
     results.append(("Validadores de configuración", test_config_validators()))
+    results.append(("Validadores sin excepciones", test_check_validators()))
+    results.append(("Validación por lotes", test_batch_validators()))
+    results.append(("Validación masiva de fechas", test_bulk_date_validators()))
+    results.append(("Validador OHLCV", test_ohlcv_validator()))
     results.append(("Jerarquía de excepciones", test_exception_hierarchy()))
+    results.append(("Imports diferidos", test_lazy_imports()))
     
     # Resumen
     print("=" * 60)
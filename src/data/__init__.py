@@ -0,0 +1,77 @@
+"""Módulo de datos de mercado del Trading Bot."""
+
+from .aggregator import (
+    BarBatch,
+    TickAggregator,
+)
+from .cache import (
+    CacheLookup,
+    CacheStats,
+    MarketDataCache,
+)
+from .client import (
+    MarketDataClient,
+    MarketDataRequestError,
+    TokenBucket,
+)
+from .history import (
+    CoverageMap,
+    HistorySync,
+    SyncReport,
+)
+from .resampler import (
+    DEFAULT_TARGETS,
+    IncrementalResampler,
+    PartialBar,
+    resample_bars,
+)
+from .singleflight import (
+    AsyncSingleFlight,
+    SingleFlight,
+)
+from .store import (
+    BarStore,
+    BarView,
+)
+from .stream import (
+    ConsumerQueue,
+    StreamPipeline,
+    Subscription,
+    replay_source,
+    websocket_source,
+)
+
+__all__ = [
+    # Cache
+    'CacheLookup',
+    'CacheStats',
+    'MarketDataCache',
+    # Cliente de datos
+    'MarketDataClient',
+    'MarketDataRequestError',
+    'TokenBucket',
+    # Histórico
+    'CoverageMap',
+    'HistorySync',
+    'SyncReport',
+    # Resampling
+    'DEFAULT_TARGETS',
+    'IncrementalResampler',
+    'PartialBar',
+    'resample_bars',
+    # Coalescencia de peticiones
+    'AsyncSingleFlight',
+    'SingleFlight',
+    # Almacén columnar
+    'BarStore',
+    'BarView',
+    # Agregación de trades
+    'BarBatch',
+    'TickAggregator',
+    # Streaming
+    'ConsumerQueue',
+    'StreamPipeline',
+    'Subscription',
+    'replay_source',
+    'websocket_source',
+]
@@ -0,0 +1,622 @@
+"""
+Agregador de trades a barras OHLCV en streaming, para varios timeframes.
+
+Construye las barras intradía (1Min, 5Min, ..., 4Hour) de todos los
+símbolos a partir del flujo de trades, sin pedir al broker un histórico
+por timeframe. Los trades se procesan por lotes con NumPy:
+
+- Cada símbolo tiene una fila en arrays preasignados por timeframe
+  (inicio de barra y OHLCV), que crecen al doble si hacen falta más filas
+- Los trades del lote se agrupan por (símbolo, barra) con un único
+  ``argsort`` y ``reduceat``, y los grupos se combinan con las barras en
+  formación
+- Los lotes pequeños del stream en tiempo real (hasta ``SMALL_BATCH``
+  trades) se combinan trade a trade con las ranuras, sin ese coste fijo
+- Una barra se cierra cuando el tiempo del stream (el mayor timestamp
+  visto, o ``advance``) supera su fin más la tolerancia
+
+Trades tardíos: mientras la barra siga abierta (hasta ``late_tolerance``
+segundos después de su fin) se incorporan a ella; después se descartan y
+se cuentan en ``stats.late``. Con tolerancia menor o igual que la
+duración del timeframe solo puede haber dos barras abiertas por símbolo,
+la actual y la anterior, que ocupan dos ranuras alternas.
+
+Example:
+    >>> aggregator = TickAggregator(("1Min", "5Min", "1Hour"), late_tolerance=2.0)
+    >>> closed = aggregator.update(symbols, prices, sizes, timestamps_ns)
+    >>> if "5Min" in closed:
+    ...     strategy.on_bars(closed["5Min"].to_frame())
+    >>> closed = aggregator.flush()  # Fin de la sesión
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..utils.ohlcv_validators import OHLCV_COLUMNS
+from ..utils.timeframes import Timeframe, TimeframeUnit, parse_timeframe
+from ..utils.validators import MarketDataValidationError
+
+
+# Timeframes intradía soportados por ``validate_timeframe``
+DEFAULT_TIMEFRAMES = ('1Min', '5Min', '15Min', '30Min', '1Hour', '4Hour')
+
+# Posición de cada columna en los arrays OHLCV
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(5)
+
+# Ranura vacía / tiempo del stream antes del primer trade
+_EMPTY = np.iinfo(np.int64).min
+
+# Columnas de los DataFrames generados
+_COLUMNS = pd.Index(OHLCV_COLUMNS)
+
+# Lotes de hasta este tamaño se procesan trade a trade: con pocos trades el
+# coste fijo de las operaciones NumPy de cada timeframe domina
+SMALL_BATCH = 48
+
+# Grupos de un lote: (fila del símbolo, inicio de barra en ns, OHLCV (5, n))
+Groups = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+# ============================================================================
+# Resultados
+# ============================================================================
+
+@dataclass(frozen=True)
+class BarBatch:
+    """
+    Barras cerradas de un timeframe, ordenadas por inicio y símbolo.
+    
+    Attributes:
+        timeframe: Timeframe de las barras
+        symbols: Símbolo de cada barra (array de objetos)
+        timestamps: Inicio de cada barra en ns desde epoch (UTC)
+        values: OHLCV con forma (5, n) en el orden de ``OHLCV_COLUMNS``
+    """
+    
+    timeframe: str
+    symbols: np.ndarray
+    timestamps: np.ndarray
+    values: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Convierte las barras a DataFrame.
+        
+        Returns:
+            DataFrame indexado por el inicio de barra (UTC) con la columna
+            'symbol' y las columnas OHLCV
+        """
+        index = pd.DatetimeIndex(self.timestamps.view('datetime64[ns]'), name='timestamp').tz_localize('UTC')
+        frame = pd.DataFrame(self.values.T, index=index, columns=_COLUMNS, copy=False)
+        frame.insert(0, 'symbol', self.symbols)
+        return frame
+
+
+@dataclass
+class AggregatorStats:
+    """
+    Estadísticas del agregador.
+    
+    Attributes:
+        trades: Trades válidos recibidos
+        rejected: Trades con precio o cantidad no positivos o no finitos
+        late: Trades descartados por llegar tarde, por timeframe
+        bars: Barras cerradas, por timeframe
+    """
+    
+    trades: int = 0
+    rejected: int = 0
+    late: Dict[str, int] = field(default_factory=dict)
+    bars: Dict[str, int] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, object]:
+        """Convierte las estadísticas a diccionario (para logs)."""
+        return {
+            'trades': self.trades,
+            'rejected': self.rejected,
+            'late': dict(self.late),
+            'bars': dict(self.bars),
+        }
+
+
+# ============================================================================
+# Barras en formación
+# ============================================================================
+
+class _Accumulators:
+    """Barras en formación de un timeframe: dos ranuras por símbolo."""
+    
+    __slots__ = ('timeframe', 'step', 'start', 'values', 'closed_through')
+    
+    def __init__(self, timeframe: Timeframe, capacity: int):
+        self.timeframe = timeframe
+        self.step = timeframe.duration_ns
+        # La ranura de una barra es la paridad de su número de barra
+        self.start = np.full((2, capacity), _EMPTY, dtype=np.int64)
+        self.values = np.zeros((5, 2, capacity))
+        # Inicio de barra más reciente que ya se cerró en las ranuras
+        self.closed_through = int(_EMPTY)
+    
+    def grow(self, capacity: int) -> None:
+        """Amplía los arrays a ``capacity`` símbolos conservando el contenido."""
+        used = self.start.shape[1]
+        start = np.full((2, capacity), _EMPTY, dtype=np.int64)
+        start[:, :used] = self.start
+        values = np.zeros((5, 2, capacity))
+        values[:, :, :used] = self.values
+        self.start, self.values = start, values
+
+
+def _group(rows: np.ndarray, buckets: np.ndarray, prices: np.ndarray, sizes: np.ndarray, step: int) -> Groups:
+    """
+    Agrega los trades de un lote por (símbolo, barra).
+    
+    Args:
+        rows: Fila del símbolo de cada trade
+        buckets: Inicio de barra de cada trade (ns)
+        prices: Precios
+        sizes: Cantidades
+        step: Duración de la barra (ns)
+    
+    Returns:
+        Grupos ordenados por símbolo y barra; open/close respetan el orden
+        de llegada dentro de cada grupo
+    """
+    first_bucket = buckets.min()
+    numbers = (buckets - first_bucket) // step
+    keys = rows * (int(numbers.max()) + 1) + numbers
+    
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    prices = prices[order]
+    
+    boundaries = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+    first = np.concatenate(([0], boundaries))
+    last = np.concatenate((boundaries - 1, [len(keys) - 1]))
+    
+    values = np.empty((5, len(first)))
+    values[OPEN] = prices[first]
+    values[HIGH] = np.maximum.reduceat(prices, first)
+    values[LOW] = np.minimum.reduceat(prices, first)
+    values[CLOSE] = prices[last]
+    values[VOLUME] = np.add.reduceat(sizes[order], first)
+    
+    leaders = order[first]
+    return rows[leaders], buckets[leaders], values
+
+
+def _as_ns(timestamps) -> np.ndarray:
+    """Convierte timestamps (ns enteros, datetime64 o DatetimeIndex) a int64 ns."""
+    if isinstance(timestamps, pd.DatetimeIndex):
+        return timestamps.as_unit('ns').asi8
+    
+    values = np.asarray(timestamps)
+    if values.dtype.kind == 'M':
+        return values.astype('datetime64[ns]').view(np.int64)
+    return values.astype(np.int64, copy=False)
+
+
+# ============================================================================
+# Agregador
+# ============================================================================
+
+class TickAggregator:
+    """
+    Agregador de trades a barras de varios timeframes para muchos símbolos.
+    
+    Example:
+        >>> aggregator = TickAggregator(late_tolerance=2.0)
+        >>> for batch in trade_batches:
+        ...     for timeframe, bars in aggregator.update(*batch).items():
+        ...         store.append(bars.to_frame())
+    """
+    
+    def __init__(
+        self,
+        timeframes: Sequence[str] = DEFAULT_TIMEFRAMES,
+        late_tolerance: float = 2.0,
+        capacity: int = 256
+    ):
+        """
+        Inicializa el agregador.
+        
+        Args:
+            timeframes: Timeframes intradía a construir
+            late_tolerance: Segundos tras el fin de una barra durante los que
+                sigue abierta a trades tardíos
+            capacity: Símbolos preasignados (los arrays crecen si hacen falta)
+        
+        Raises:
+            DateValidationError: Si algún timeframe es inválido
+            MarketDataValidationError: Si algún timeframe no es intradía o la
+                tolerancia no es menor o igual que su duración
+        """
+        targets: List[Timeframe] = [parse_timeframe(t) for t in dict.fromkeys(timeframes)]
+        
+        if not targets:
+            raise MarketDataValidationError("Se necesita al menos un timeframe")
+        
+        for target in targets:
+            if target.unit not in (TimeframeUnit.MINUTE, TimeframeUnit.HOUR):
+                raise MarketDataValidationError(
+                    f"El agregador de trades solo construye barras intradía, recibido: {target}"
+                )
+        
+        tolerance = int(round(late_tolerance * 1e9))
+        shortest = min(target.duration_ns for target in targets)
+        if not 0 <= tolerance <= shortest:
+            raise MarketDataValidationError(
+                f"late_tolerance debe estar entre 0 y {shortest / 1e9:g}s, recibido: {late_tolerance}"
+            )
+        
+        self._tolerance = tolerance
+        self._capacity = max(1, capacity)
+        self._accumulators = [_Accumulators(target, self._capacity) for target in targets]
+        self._rows: Dict[str, int] = {}
+        self._symbols = np.empty(self._capacity, dtype=object)
+        self._watermark = int(_EMPTY)
+        self.stats = AggregatorStats(
+            late={target.name: 0 for target in targets},
+            bars={target.name: 0 for target in targets},
+        )
+    
+    @property
+    def timeframes(self) -> List[str]:
+        """Timeframes construidos."""
+        return [acc.timeframe.name for acc in self._accumulators]
+    
+    @property
+    def symbols(self) -> List[str]:
+        """Símbolos vistos, en orden de aparición."""
+        return list(self._rows)
+    
+    @property
+    def watermark(self) -> Optional[pd.Timestamp]:
+        """Tiempo del stream: el mayor timestamp visto (o pasado a ``advance``)."""
+        if self._watermark == _EMPTY:
+            return None
+        return pd.Timestamp(self._watermark, unit='ns', tz='UTC')
+    
+    def update(self, symbols: Sequence[str], prices, sizes, timestamps) -> Dict[str, BarBatch]:
+        """
+        Procesa un lote de trades.
+        
+        Args:
+            symbols: Símbolo de cada trade (ya validado)
+            prices: Precios
+            sizes: Cantidades
+            timestamps: Timestamps en ns desde epoch (UTC), datetime64 o
+                DatetimeIndex; no hace falta que estén ordenados
+        
+        Returns:
+            Diccionario timeframe -> barras cerradas por este lote (solo los
+            timeframes con alguna barra cerrada)
+        
+        Raises:
+            MarketDataValidationError: Si los arrays tienen longitudes distintas
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        sizes = np.asarray(sizes, dtype=np.float64)
+        timestamps = _as_ns(timestamps)
+        n = len(prices)
+        
+        if not len(symbols) == len(sizes) == len(timestamps) == n:
+            raise MarketDataValidationError(
+                "symbols, prices, sizes y timestamps deben tener la misma longitud"
+            )
+        if not n:
+            return {}
+        
+        rows = self._lookup(symbols, n)
+        if n <= SMALL_BATCH:
+            return self._update_small(rows.tolist(), prices.tolist(), sizes.tolist(), timestamps.tolist())
+        
+        # Comparaciones falsas con NaN: solo pasan precios y cantidades positivos y finitos
+        valid = (prices > 0) & (prices < np.inf) & (sizes > 0) & (sizes < np.inf)
+        accepted = int(np.count_nonzero(valid))
+        self.stats.trades += accepted
+        self.stats.rejected += n - accepted
+        
+        # Tiempo del stream antes de cada trade (para decidir si llega tarde)
+        running = np.maximum.accumulate(np.where(valid, timestamps, _EMPTY))
+        before = np.empty(n, dtype=np.int64)
+        before[0] = self._watermark
+        np.maximum(running[:-1], self._watermark, out=before[1:])
+        self._watermark = max(self._watermark, int(running[-1]))
+        
+        closed = {}
+        for acc in self._accumulators:
+            groups = self._accumulate(acc, rows, prices, sizes, timestamps, valid, before, accepted)
+            batch = self._close(acc, groups)
+            if batch is not None:
+                closed[acc.timeframe.name] = batch
+        return closed
+    
+    def update_trades(self, trades: Iterable) -> Dict[str, BarBatch]:
+        """
+        Procesa un lote de eventos ``Trade`` de ``src.data.stream``.
+        
+        Args:
+            trades: Objetos con symbol, price, size y timestamp (ns)
+        
+        Returns:
+            Igual que ``update``
+        """
+        trades = list(trades)
+        return self.update(
+            [t.symbol for t in trades],
+            [t.price for t in trades],
+            [t.size for t in trades],
+            np.fromiter((t.timestamp for t in trades), dtype=np.int64, count=len(trades)),
+        )
+    
+    def advance(self, now) -> Dict[str, BarBatch]:
+        """
+        Avanza el tiempo del stream sin trades (ej. con el reloj) y cierra barras.
+        
+        Args:
+            now: Instante (ns, Timestamp o datetime)
+        
+        Returns:
+            Diccionario timeframe -> barras cerradas
+        """
+        now = now if isinstance(now, (int, np.integer)) else pd.Timestamp(now).as_unit('ns').value
+        self._watermark = max(self._watermark, int(now))
+        
+        closed = {}
+        for acc in self._accumulators:
+            batch = self._close(acc, None)
+            if batch is not None:
+                closed[acc.timeframe.name] = batch
+        return closed
+    
+    def flush(self) -> Dict[str, BarBatch]:
+        """
+        Cierra todas las barras en formación (ej. al final de la sesión).
+        
+        Returns:
+            Diccionario timeframe -> barras cerradas
+        """
+        closed = {}
+        for acc in self._accumulators:
+            batch = self._close(acc, None, everything=True)
+            if batch is not None:
+                closed[acc.timeframe.name] = batch
+        return closed
+    
+    def partial(self, timeframe: str) -> pd.DataFrame:
+        """
+        Obtiene las barras en formación de un timeframe.
+        
+        Args:
+            timeframe: Timeframe construido
+        
+        Returns:
+            DataFrame como ``BarBatch.to_frame`` (vacío si no hay ninguna)
+        
+        Raises:
+            MarketDataValidationError: Si el agregador no construye ese timeframe
+        """
+        target = parse_timeframe(timeframe)
+        for acc in self._accumulators:
+            if acc.timeframe == target:
+                slots, rows = np.nonzero(acc.start[:, :len(self._rows)] != _EMPTY)
+                return self._batch(acc, rows, acc.start[slots, rows], acc.values[:, slots, rows]).to_frame()
+        
+        raise MarketDataValidationError(f"El agregador no construye barras {target}")
+    
+    # ========================================================================
+    # Internos
+    # ========================================================================
+    
+    def _lookup(self, symbols: Sequence[str], n: int) -> np.ndarray:
+        """Fila de cada símbolo (los nuevos se registran y amplían los arrays)."""
+        rows = self._rows
+        try:
+            return np.fromiter(map(rows.__getitem__, symbols), dtype=np.intp, count=n)
+        except KeyError:
+            pass
+        
+        for symbol in dict.fromkeys(symbols):
+            if symbol not in rows:
+                self._register(symbol)
+        return np.fromiter(map(rows.__getitem__, symbols), dtype=np.intp, count=n)
+    
+    def _register(self, symbol: str) -> None:
+        """Asigna una fila a un símbolo nuevo."""
+        row = len(self._rows)
+        if row == self._capacity:
+            self._capacity *= 2
+            for acc in self._accumulators:
+                acc.grow(self._capacity)
+            symbols = np.empty(self._capacity, dtype=object)
+            symbols[:row] = self._symbols
+            self._symbols = symbols
+        
+        self._rows[symbol] = row
+        self._symbols[row] = symbol
+    
+    def _update_small(
+        self,
+        rows: List[int],
+        prices: List[float],
+        sizes: List[float],
+        timestamps: List[int]
+    ) -> Dict[str, BarBatch]:
+        """
+        Procesa un lote pequeño trade a trade, con el mismo resultado que ``update``.
+        
+        Cada trade se combina directamente con su ranura. Si la ranura aún
+        guarda la barra de dos barras atrás (solo pasa cuando el lote cruza
+        varias barras), esa barra ya está vencida y se cierra con el lote.
+        """
+        tolerance = self._tolerance
+        watermark = self._watermark
+        stats = self.stats
+        evicted: List[list] = [[] for _ in self._accumulators]
+        targets = [
+            (acc.step, acc.start, acc.values, acc.timeframe.name, pending)
+            for acc, pending in zip(self._accumulators, evicted)
+        ]
+        
+        for row, price, size, ts in zip(rows, prices, sizes, timestamps):
+            # Comparaciones falsas con NaN, igual que en la ruta vectorizada
+            if not (0 < price < np.inf and 0 < size < np.inf):
+                stats.rejected += 1
+                continue
+            stats.trades += 1
+            
+            before = watermark
+            if ts > watermark:
+                watermark = ts
+            
+            for step, start, values, name, pending in targets:
+                bucket = ts - ts % step
+                if bucket + step + tolerance <= before:
+                    stats.late[name] += 1
+                    continue
+                
+                slot = (bucket // step) & 1
+                current = start[slot, row]
+                if current == bucket:
+                    if price > values[HIGH, slot, row]:
+                        values[HIGH, slot, row] = price
+                    elif price < values[LOW, slot, row]:
+                        values[LOW, slot, row] = price
+                    values[CLOSE, slot, row] = price
+                    values[VOLUME, slot, row] += size
+                    continue
+                
+                if current != _EMPTY:
+                    pending.append((row, int(current), values[:, slot, row].copy()))
+                start[slot, row] = bucket
+                values[:, slot, row] = (price, price, price, price, size)
+        
+        self._watermark = watermark
+        
+        closed = {}
+        for acc, pending in zip(self._accumulators, evicted):
+            groups = None
+            if pending:
+                g_rows, g_start, g_values = zip(*pending)
+                groups = (
+                    np.array(g_rows, dtype=np.intp),
+                    np.array(g_start, dtype=np.int64),
+                    np.column_stack(g_values),
+                )
+            batch = self._close(acc, groups)
+            if batch is not None:
+                closed[acc.timeframe.name] = batch
+        return closed
+    
+    def _accumulate(
+        self,
+        acc: _Accumulators,
+        rows: np.ndarray,
+        prices: np.ndarray,
+        sizes: np.ndarray,
+        timestamps: np.ndarray,
+        valid: np.ndarray,
+        before: np.ndarray,
+        accepted: int
+    ) -> Optional[Groups]:
+        """Agrupa los trades aceptados y los combina con las barras en formación."""
+        step = acc.step
+        buckets = timestamps - timestamps % step
+        
+        # Tarde: su barra ya estaba cerrada cuando llegó el trade
+        on_time = valid & (buckets + (step + self._tolerance) > before)
+        idx = np.flatnonzero(on_time)
+        self.stats.late[acc.timeframe.name] += accepted - len(idx)
+        
+        if not len(idx):
+            return None
+        
+        g_rows, g_start, g_values = _group(rows[idx], buckets[idx], prices[idx], sizes[idx], step)
+        
+        # Grupos que continúan una barra en formación
+        slots = (g_start // step) & 1
+        match = acc.start[slots, g_rows] == g_start
+        if match.any():
+            m_slots, m_rows = slots[match], g_rows[match]
+            pending = acc.values[:, m_slots, m_rows]
+            g_values[OPEN, match] = pending[OPEN]
+            g_values[HIGH, match] = np.maximum(pending[HIGH], g_values[HIGH, match])
+            g_values[LOW, match] = np.minimum(pending[LOW], g_values[LOW, match])
+            g_values[VOLUME, match] += pending[VOLUME]
+            acc.start[m_slots, m_rows] = _EMPTY
+        
+        return g_rows, g_start, g_values
+    
+    def _close(self, acc: _Accumulators, groups: Optional[Groups], everything: bool = False) -> Optional[BarBatch]:
+        """Cierra las barras vencidas y guarda en las ranuras las que siguen abiertas."""
+        if self._watermark == _EMPTY:
+            return None
+        
+        step = acc.step
+        # Cerrada si inicio + duración + tolerancia <= tiempo del stream
+        if everything:
+            limit = np.iinfo(np.int64).max
+        else:
+            limit = self._watermark - step - self._tolerance
+            limit -= limit % step
+        
+        closed_rows, closed_start, closed_values = [], [], []
+        if everything or limit > acc.closed_through:
+            # Solo se recorren las ranuras cuando el límite cruza un inicio de barra
+            starts = acc.start[:, :len(self._rows)]
+            slots, rows = np.nonzero((starts != _EMPTY) & (starts <= limit))
+            closed_rows.append(rows)
+            closed_start.append(starts[slots, rows])
+            closed_values.append(acc.values[:, slots, rows])
+            acc.start[slots, rows] = _EMPTY
+            acc.closed_through = max(acc.closed_through, limit)
+        
+        if groups is not None:
+            g_rows, g_start, g_values = groups
+            done = g_start <= limit
+            closed_rows.append(g_rows[done])
+            closed_start.append(g_start[done])
+            closed_values.append(g_values[:, done])
+            
+            # Las que siguen abiertas ocupan su ranura (la anterior ya se cerró)
+            keep = ~done
+            k_slots, k_rows = (g_start[keep] // step) & 1, g_rows[keep]
+            acc.start[k_slots, k_rows] = g_start[keep]
+            acc.values[:, k_slots, k_rows] = g_values[:, keep]
+        
+        if not closed_rows:
+            return None
+        
+        rows = np.concatenate(closed_rows)
+        if not len(rows):
+            return None
+        
+        start = np.concatenate(closed_start)
+        order = np.lexsort((rows, start))
+        self.stats.bars[acc.timeframe.name] += len(rows)
+        return self._batch(acc, rows[order], start[order], np.concatenate(closed_values, axis=1)[:, order])
+    
+    def _batch(self, acc: _Accumulators, rows: np.ndarray, start: np.ndarray, values: np.ndarray) -> BarBatch:
+        """Construye el resultado de un timeframe."""
+        return BarBatch(acc.timeframe.name, self._symbols[rows], start, values)
+    
+    def __repr__(self) -> str:
+        timeframes = ', '.join(self.timeframes)
+        return f"TickAggregator(timeframes=[{timeframes}], symbols={len(self._rows)})"
+
+
+# Exportar para uso externo
+__all__ = [
+    'TickAggregator',
+    'BarBatch',
+    'AggregatorStats',
+    'DEFAULT_TIMEFRAMES',
+    'SMALL_BATCH',
+]
@@ -0,0 +1,620 @@
+"""
+Cache por niveles de datos de mercado (barras y cotizaciones).
+
+Los datos se guardan por segmentos: cada segmento es el resultado de una
+descarga para (tipo, símbolo, timeframe, rango). Una petición se sirve
+combinando los segmentos que la cubren, aunque vengan de peticiones
+distintas y solapadas; solo los huecos sin cubrir se piden a la fuente.
+
+Niveles:
+
+1. Memoria: LRU de segmentos con presupuesto de bytes y TTL
+   (``DataConfig.cache_ttl``)
+2. Disco: un Parquet por segmento bajo
+   ``<storage_path>/cache/<tipo>/<símbolo>/<timeframe>/``, con su propio
+   TTL por fecha de modificación; al leerse se promueve a memoria
+
+Las descargas de ``get_or_fetch`` pasan por un ``SingleFlight``: si varios
+hilos piden el mismo hueco a la vez (por ejemplo, al caducar un segmento),
+solo uno llama a la fuente y el resto recibe su resultado.
+
+Los rangos son semiabiertos ``[inicio, fin)`` en UTC. Con strings
+"AAAA-MM-DD" se valida con ``validate_date_range`` y el fin es inclusivo
+(se cubre el día completo).
+
+Example:
+    >>> cache = MarketDataCache.from_config()
+    >>> bars = cache.get_or_fetch(
+    ...     "AAPL", "1Min", "2024-03-04", "2024-03-08",
+    ...     fetch=lambda start, end: client.get_bars("AAPL", "1Min", start, end)
+    ... )
+    >>> cache.stats.hit_ratio
+"""
+
+import itertools
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+import pandas as pd
+
+from ..utils.validators import (
+    MarketDataValidationError,
+    validate_symbol,
+    validate_timeframe,
+)
+from .singleflight import SingleFlight
+from .timeutils import TimeBound, from_ns, normalize_frame, normalize_range, slice_ns, to_ns
+
+
+# Tipos de datos cacheables
+CACHE_KINDS = ('bars', 'quotes')
+
+# Subdirectorio del nivel de disco dentro de DataConfig.storage_path
+CACHE_DIR_NAME = 'cache'
+
+# (tipo, símbolo, timeframe)
+SeriesKey = Tuple[str, str, str]
+
+# Función que descarga un rango [inicio, fin) que no está en cache
+FetchFunction = Callable[[pd.Timestamp, pd.Timestamp], pd.DataFrame]
+
+
+@dataclass
+class CacheStats:
+    """
+    Estadísticas del cache.
+    
+    Attributes:
+        hits: Peticiones servidas por completo desde cache
+        partial_hits: Peticiones con parte del rango en cache
+        misses: Peticiones sin ningún dato en cache
+        memory_hits: Segmentos leídos de memoria
+        disk_hits: Segmentos leídos de disco (y promovidos a memoria)
+        fetches: Huecos descargados de la fuente
+        coalesced: Huecos servidos por la descarga en vuelo de otro llamador
+        ttl_evictions: Segmentos descartados por TTL
+        memory_evictions: Segmentos descartados por el presupuesto de memoria
+    """
+    
+    hits: int = 0
+    partial_hits: int = 0
+    misses: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    fetches: int = 0
+    coalesced: int = 0
+    ttl_evictions: int = 0
+    memory_evictions: int = 0
+    
+    @property
+    def requests(self) -> int:
+        """Total de peticiones."""
+        return self.hits + self.partial_hits + self.misses
+    
+    @property
+    def hit_ratio(self) -> float:
+        """Fracción de peticiones servidas por completo desde cache."""
+        return self.hits / self.requests if self.requests else 0.0
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Convierte las estadísticas a diccionario (para logs)."""
+        return {
+            'hits': self.hits,
+            'partial_hits': self.partial_hits,
+            'misses': self.misses,
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'fetches': self.fetches,
+            'coalesced': self.coalesced,
+            'ttl_evictions': self.ttl_evictions,
+            'memory_evictions': self.memory_evictions,
+            'hit_ratio': round(self.hit_ratio, 4),
+        }
+
+
+@dataclass
+class _Segment:
+    """Datos de un rango [start, end) en ns, con su caducidad (epoch)."""
+    
+    key: SeriesKey
+    start: int
+    end: int
+    frame: pd.DataFrame
+    expires: float
+    nbytes: int = 0
+    id: int = field(default=0, compare=False)
+
+
+@dataclass
+class CacheLookup:
+    """
+    Resultado de consultar un rango en el cache.
+    
+    Attributes:
+        frame: Filas en cache dentro del rango (puede estar vacío)
+        missing: Huecos [inicio, fin) sin cubrir
+        covered: True si algún segmento cubre parte del rango (aunque sin filas)
+    """
+    
+    frame: pd.DataFrame
+    missing: List[Tuple[pd.Timestamp, pd.Timestamp]]
+    covered: bool = False
+    
+    @property
+    def complete(self) -> bool:
+        """True si el rango está cubierto por completo."""
+        return not self.missing
+
+
+class MarketDataCache:
+    """
+    Cache de dos niveles (memoria LRU + Parquet en disco) para barras y cotizaciones.
+    
+    Example:
+        >>> cache = MarketDataCache("data/", ttl=300, memory_mb=256)
+        >>> lookup = cache.lookup("AAPL", "1Min", "2024-03-04", "2024-03-08")
+        >>> lookup.missing  # Huecos a descargar
+    """
+    
+    def __init__(
+        self,
+        storage_path: Union[str, Path, None] = None,
+        ttl: float = 300,
+        memory_mb: float = 256,
+        disk_ttl: Optional[float] = None,
+    ):
+        """
+        Inicializa el cache.
+        
+        Args:
+            storage_path: Directorio de datos (None = sin nivel de disco)
+            ttl: Segundos de vida de un segmento en memoria (0 = no cachear)
+            memory_mb: Presupuesto de memoria en MB
+            disk_ttl: Segundos de vida en disco (None = igual que ``ttl``)
+        """
+        self.ttl = ttl
+        self.disk_ttl = ttl if disk_ttl is None else disk_ttl
+        self.memory_budget = int(memory_mb * 1024 * 1024)
+        self.disk_path = Path(storage_path) / CACHE_DIR_NAME if storage_path is not None else None
+        self.stats = CacheStats()
+        
+        self._series: Dict[SeriesKey, List[_Segment]] = {}
+        self._lru: 'OrderedDict[int, _Segment]' = OrderedDict()
+        self._memory_used = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._flights = SingleFlight()
+    
+    @classmethod
+    def from_config(cls, config=None) -> 'MarketDataCache':
+        """
+        Crea el cache con ``DataConfig`` (storage_path, cache_ttl, ...).
+        
+        Args:
+            config: Configuración (None = ``get_config()``)
+        
+        Returns:
+            Cache configurado
+        """
+        if config is None:
+            from ..utils.config import get_config
+            config = get_config()
+        
+        data = config.data
+        return cls(
+            storage_path=data.storage_path,
+            ttl=data.cache_ttl,
+            memory_mb=data.cache_memory_mb,
+            disk_ttl=data.cache_disk_ttl,
+        )
+    
+    @property
+    def memory_used(self) -> int:
+        """Bytes ocupados por los segmentos en memoria."""
+        return self._memory_used
+    
+    # ========================================================================
+    # API pública
+    # ========================================================================
+    
+    def lookup(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: TimeBound,
+        end: TimeBound,
+        kind: str = 'bars'
+    ) -> CacheLookup:
+        """
+        Consulta un rango sin descargar nada.
+        
+        Args:
+            symbol: Símbolo (se valida con ``validate_symbol``)
+            timeframe: Timeframe (se valida con ``validate_timeframe``)
+            start: Inicio del rango
+            end: Fin del rango
+            kind: 'bars' o 'quotes'
+        
+        Returns:
+            Filas en cache y huecos sin cubrir
+        """
+        key = self._series_key(kind, symbol, timeframe)
+        start_ns, end_ns = normalize_range(start, end)
+        return self._lookup(key, start_ns, end_ns)
+    
+    def get(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: TimeBound,
+        end: TimeBound,
+        kind: str = 'bars'
+    ) -> Optional[pd.DataFrame]:
+        """
+        Devuelve el rango si está cubierto por completo.
+        
+        Returns:
+            DataFrame del rango, o None si falta algún tramo
+        """
+        lookup = self.lookup(symbol, timeframe, start, end, kind)
+        self._count(lookup)
+        return lookup.frame if lookup.complete else None
+    
+    def put(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: TimeBound,
+        end: TimeBound,
+        frame: pd.DataFrame,
+        kind: str = 'bars'
+    ) -> None:
+        """
+        Guarda los datos de un rango completo (aunque esté vacío).
+        
+        Un rango sin filas (fin de semana, festivo) también se cachea para
+        no volver a pedirlo.
+        
+        Args:
+            symbol: Símbolo
+            timeframe: Timeframe
+            start: Inicio del rango
+            end: Fin del rango
+            frame: Datos del rango con DatetimeIndex
+            kind: 'bars' o 'quotes'
+        """
+        key = self._series_key(kind, symbol, timeframe)
+        start_ns, end_ns = normalize_range(start, end)
+        self._store(key, start_ns, end_ns, normalize_frame(frame, start_ns, end_ns))
+    
+    def get_or_fetch(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: TimeBound,
+        end: TimeBound,
+        fetch: FetchFunction,
+        kind: str = 'bars'
+    ) -> pd.DataFrame:
+        """
+        Devuelve el rango descargando solo los huecos que no están en cache.
+        
+        Args:
+            symbol: Símbolo
+            timeframe: Timeframe
+            start: Inicio del rango
+            end: Fin del rango
+            fetch: Función ``fetch(inicio, fin)`` que descarga un hueco
+                [inicio, fin) como DataFrame con DatetimeIndex
+            kind: 'bars' o 'quotes'
+        
+        Returns:
+            DataFrame del rango ordenado por tiempo
+        """
+        key = self._series_key(kind, symbol, timeframe)
+        start_ns, end_ns = normalize_range(start, end)
+        
+        lookup = self._lookup(key, start_ns, end_ns)
+        self._count(lookup)
+        if lookup.complete:
+            return lookup.frame
+        
+        parts = [lookup.frame]
+        for gap_start, gap_end in lookup.missing:
+            gap = to_ns(gap_start), to_ns(gap_end)
+            # Llamadores concurrentes con el mismo hueco comparten una descarga
+            fetched, shared = self._flights.do_shared((key, *gap), self._fetch_gap, key, gap, fetch)
+            if shared:
+                with self._lock:
+                    self.stats.coalesced += 1
+            parts.append(fetched)
+        
+        parts = [part for part in parts if len(part)]
+        if not parts:
+            return lookup.frame
+        return pd.concat(parts).sort_index()
+    
+    def invalidate(self, symbol: Optional[str] = None, kind: Optional[str] = None) -> int:
+        """
+        Elimina segmentos de memoria y disco.
+        
+        Args:
+            symbol: Solo este símbolo (None = todos)
+            kind: Solo este tipo (None = todos)
+        
+        Returns:
+            Segmentos de memoria eliminados
+        """
+        symbol = validate_symbol(symbol) if symbol is not None else None
+        removed = 0
+        
+        with self._lock:
+            for key in list(self._series):
+                if (kind is None or key[0] == kind) and (symbol is None or key[1] == symbol):
+                    for segment in self._series.pop(key):
+                        self._drop(segment)
+                        removed += 1
+        
+        if self.disk_path is not None:
+            for kind_dir in self.disk_path.glob(kind or '*'):
+                for path in kind_dir.glob(f"{symbol or '*'}/*/*.parquet"):
+                    path.unlink(missing_ok=True)
+        return removed
+    
+    def clear(self) -> None:
+        """Vacía el nivel de memoria (el disco se conserva)."""
+        with self._lock:
+            self._series.clear()
+            self._lru.clear()
+            self._memory_used = 0
+    
+    # ========================================================================
+    # Implementación
+    # ========================================================================
+    
+    def _series_key(self, kind: str, symbol: str, timeframe: str) -> SeriesKey:
+        """Valida y normaliza la clave de una serie."""
+        if kind not in CACHE_KINDS:
+            raise MarketDataValidationError(f"Tipo de datos inválido: '{kind}'. Válidos: {CACHE_KINDS}")
+        return kind, validate_symbol(symbol), validate_timeframe(timeframe)
+    
+    def _count(self, lookup: CacheLookup) -> None:
+        """Actualiza hits / parciales / misses."""
+        with self._lock:
+            if lookup.complete:
+                self.stats.hits += 1
+            elif lookup.covered:
+                self.stats.partial_hits += 1
+            else:
+                self.stats.misses += 1
+    
+    def _lookup(self, key: SeriesKey, start: int, end: int) -> CacheLookup:
+        """
+        Combina los segmentos que cubren [start, end).
+        
+        Los Parquet del nivel de disco se leen sin el lock, para que una
+        lectura lenta no bloquee al resto de series; el lock solo se toma
+        para consultar la memoria y para promover lo leído.
+        """
+        now = time.time()
+        with self._lock:
+            segments = [
+                segment for segment in self._live_segments(key, now)
+                if segment.start < end and segment.end > start
+            ]
+            for segment in segments:
+                self._lru.move_to_end(segment.id)
+            self.stats.memory_hits += len(segments)
+            in_memory = {(s.start, s.end) for s in self._series.get(key, ())}
+        
+        # Huecos que la memoria no cubre: se buscan en disco
+        missing = self._gaps(segments, start, end)
+        if missing and self.disk_path is not None:
+            loaded = self._load_from_disk(key, missing, in_memory, now)
+            if loaded:
+                self._promote(key, loaded)
+                segments.extend(loaded)
+                missing = self._gaps(segments, start, end)
+        
+        # Segmentos más recientes al final: ganan en las filas duplicadas
+        parts = [
+            slice_ns(segment.frame, start, end)
+            for segment in sorted(segments, key=lambda s: s.expires)
+        ]
+        parts = [part for part in parts if len(part)]
+        
+        if not parts:
+            frame = pd.DataFrame(index=pd.DatetimeIndex([], tz='UTC'))
+        elif len(parts) == 1:
+            frame = parts[0]
+        else:
+            frame = pd.concat(parts)
+            frame = frame[~frame.index.duplicated(keep='last')].sort_index()
+        
+        return CacheLookup(
+            frame,
+            [(from_ns(s), from_ns(e)) for s, e in missing],
+            covered=bool(segments)
+        )
+    
+    def _live_segments(self, key: SeriesKey, now: float) -> List[_Segment]:
+        """Segmentos en memoria de una serie, descartando los caducados."""
+        segments = self._series.get(key)
+        if not segments:
+            return []
+        
+        live = [segment for segment in segments if segment.expires > now]
+        if len(live) != len(segments):
+            for segment in segments:
+                if segment.expires <= now:
+                    self._drop(segment)
+                    self.stats.ttl_evictions += 1
+            self._series[key] = live
+        return live
+    
+    @staticmethod
+    def _gaps(segments: List[_Segment], start: int, end: int) -> List[Tuple[int, int]]:
+        """Tramos de [start, end) que no cubre ningún segmento."""
+        gaps = []
+        cursor = start
+        for segment in sorted(segments, key=lambda s: s.start):
+            if segment.start > cursor:
+                gaps.append((cursor, min(segment.start, end)))
+            cursor = max(cursor, segment.end)
+            if cursor >= end:
+                break
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+    
+    def _fetch_gap(self, key: SeriesKey, gap: Tuple[int, int], fetch: FetchFunction) -> pd.DataFrame:
+        """Descarga y guarda un hueco (una sola vez entre llamadores concurrentes)."""
+        # Otro llamador pudo terminar la misma descarga justo antes de entrar aquí
+        lookup = self._lookup(key, *gap)
+        if lookup.complete:
+            return lookup.frame
+        
+        fetched = normalize_frame(fetch(from_ns(gap[0]), from_ns(gap[1])), *gap)
+        with self._lock:
+            self.stats.fetches += 1
+        self._store(key, *gap, fetched)
+        return fetched
+    
+    def _store(self, key: SeriesKey, start: int, end: int, frame: pd.DataFrame) -> None:
+        """Guarda un segmento (ya normalizado) en memoria y en disco."""
+        if self.ttl <= 0:
+            return
+        
+        segment = _Segment(key, start, end, frame, time.time() + self.ttl)
+        with self._lock:
+            self._insert(segment)
+        
+        if self.disk_path is not None and self.disk_ttl > 0:
+            self._write_to_disk(segment)
+    
+    def _insert(self, segment: _Segment) -> None:
+        """Añade un segmento al LRU y aplica el presupuesto de memoria."""
+        segment.id = next(self._ids)
+        segment.nbytes = int(segment.frame.memory_usage(index=True).sum())
+        
+        # Un segmento nuevo sustituye a los que cubre por completo
+        segments = self._series.setdefault(segment.key, [])
+        for old in [s for s in segments if segment.start <= s.start and s.end <= segment.end]:
+            segments.remove(old)
+            self._drop(old)
+        segments.append(segment)
+        
+        self._lru[segment.id] = segment
+        self._memory_used += segment.nbytes
+        
+        while self._memory_used > self.memory_budget and len(self._lru) > 1:
+            _, oldest = self._lru.popitem(last=False)
+            self._memory_used -= oldest.nbytes
+            self._series[oldest.key].remove(oldest)
+            self.stats.memory_evictions += 1
+    
+    def _drop(self, segment: _Segment) -> None:
+        """Quita un segmento del LRU."""
+        if self._lru.pop(segment.id, None) is not None:
+            self._memory_used -= segment.nbytes
+    
+    def _series_dir(self, key: SeriesKey) -> Path:
+        """Directorio en disco de una serie."""
+        kind, symbol, timeframe = key
+        return self.disk_path / kind / symbol / timeframe
+    
+    def _write_to_disk(self, segment: _Segment) -> None:
+        """Escribe un segmento como Parquet (escritura atómica)."""
+        directory = self._series_dir(segment.key)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{segment.start}_{segment.end}.parquet"
+        
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        os.close(fd)
+        try:
+            segment.frame.to_parquet(tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    def _load_from_disk(
+        self,
+        key: SeriesKey,
+        missing: List[Tuple[int, int]],
+        in_memory: Set[Tuple[int, int]],
+        now: float
+    ) -> List[_Segment]:
+        """
+        Lee los segmentos de disco que tocan los huecos (sin el lock).
+        
+        Args:
+            key: Serie
+            missing: Huecos [inicio, fin) en ns
+            in_memory: Rangos (inicio, fin) que ya están en memoria
+            now: Instante de la consulta (epoch)
+        
+        Returns:
+            Segmentos leídos, aún sin promover a memoria
+        """
+        directory = self._series_dir(key)
+        if not directory.is_dir():
+            return []
+        
+        loaded = []
+        expired = 0
+        
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.parquet'):
+                    continue
+                try:
+                    start, end = (int(part) for part in entry.name[:-8].split('_'))
+                except ValueError:
+                    continue
+                if (start, end) in in_memory or not any(start < e and end > s for s, e in missing):
+                    continue
+                
+                try:
+                    mtime = entry.stat().st_mtime
+                    if now - mtime >= self.disk_ttl:
+                        os.unlink(entry.path)
+                        expired += 1
+                        continue
+                    frame = pd.read_parquet(entry.path)
+                except FileNotFoundError:
+                    continue  # Eliminado por otro llamador (caducado o invalidado)
+                
+                # En memoria vive lo que le quede de TTL en disco, sin pasar de ttl
+                loaded.append(_Segment(key, start, end, frame, min(mtime + self.disk_ttl, now + self.ttl)))
+        
+        if expired:
+            with self._lock:
+                self.stats.ttl_evictions += expired
+        return loaded
+    
+    def _promote(self, key: SeriesKey, loaded: List[_Segment]) -> None:
+        """Inserta en memoria los segmentos leídos de disco (con el lock)."""
+        with self._lock:
+            # Mientras se leía, otro llamador pudo guardar una versión más reciente
+            in_memory = {(s.start, s.end) for s in self._series.get(key, ())}
+            for segment in loaded:
+                if (segment.start, segment.end) not in in_memory:
+                    self._insert(segment)
+                self.stats.disk_hits += 1
+
+
+# Exportar para uso externo
+__all__ = [
+    'MarketDataCache',
+    'CacheStats',
+    'CacheLookup',
+    'normalize_range',
+    'CACHE_KINDS',
+]
@@ -0,0 +1,510 @@
+"""
+Cliente HTTP de datos de mercado (barras) con pool de conexiones y límite de tasa.
+
+- Una ``requests.Session`` keep-alive por URL base, compartida por todos
+  los clientes del proceso: las conexiones TCP/TLS se reutilizan entre
+  peticiones en lugar de abrirse una por llamada.
+- Un ``TokenBucket`` por URL base, también compartido, limita el total de
+  peticiones del proceso al límite del broker (200/min en Alpaca).
+- Las peticiones multi-símbolo se agrupan en lotes (``/v2/stocks/bars``
+  con ``symbols=AAPL,MSFT,...``) que se ejecutan en paralelo.
+- ``RequestStats`` registra el retardo de cola de cada petición: el tiempo
+  entre que se pide y que sale a la red (espera en el pool y en el
+  limitador).
+
+Example:
+    >>> client = MarketDataClient.from_config()
+    >>> bars = client.get_multi_bars(["AAPL", "MSFT"], "1Min", start, end)
+    >>> client.stats.to_dict()["queue_delay_max_ms"]
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..utils.log_context import submit_with_context
+from ..utils.validators import validate_symbol, validate_symbols_list, validate_timeframe
+
+
+# Límite de Alpaca para el plan básico
+DEFAULT_RATE_LIMIT = 200
+
+# Máximo de símbolos por petición multi-símbolo
+DEFAULT_BATCH_SIZE = 100
+
+# Barras por página (máximo de la API)
+PAGE_LIMIT = 10000
+
+# Campos de la API -> columnas del DataFrame
+_BAR_FIELDS = {
+    'o': 'open',
+    'h': 'high',
+    'l': 'low',
+    'c': 'close',
+    'v': 'volume',
+    'n': 'trade_count',
+    'vw': 'vwap',
+}
+
+TimeBound = Union[str, datetime, pd.Timestamp]
+
+
+class MarketDataRequestError(Exception):
+    """Error de una petición a la API de datos."""
+    
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+# ============================================================================
+# Limitador de tasa
+# ============================================================================
+
+class TokenBucket:
+    """
+    Limitador de tasa por cubo de tokens, seguro entre hilos.
+    
+    Los tokens se reservan en orden de llegada: si no hay, el saldo queda
+    negativo y cada hilo duerme (sin tener el lock) hasta que le toca.
+    
+    La reposición descuenta la ráfaga (``rate_per_minute - burst`` por
+    minuto): un cubo lleno más lo repuesto en 60 s nunca supera
+    ``rate_per_minute``, así que ninguna ventana de un minuto excede el
+    límite del broker, tampoco tras un periodo sin peticiones.
+    
+    Example:
+        >>> bucket = TokenBucket(rate_per_minute=200)
+        >>> waited = bucket.acquire()  # Segundos esperados
+    """
+    
+    def __init__(self, rate_per_minute: float = DEFAULT_RATE_LIMIT, burst: Optional[int] = None):
+        """
+        Inicializa el limitador.
+        
+        Args:
+            rate_per_minute: Máximo de tokens en cualquier ventana de 60 s
+            burst: Capacidad del cubo (None = una décima parte del minuto, mínimo 1)
+        
+        Raises:
+            ValueError: Si la tasa no es positiva o la capacidad no está en
+                [1, rate_per_minute)
+        """
+        if rate_per_minute <= 0:
+            raise ValueError(f"La tasa debe ser positiva, recibido: {rate_per_minute}")
+        
+        self.capacity = burst if burst is not None else max(1, int(rate_per_minute // 10))
+        if not 1 <= self.capacity < rate_per_minute:
+            raise ValueError(
+                f"La capacidad debe estar entre 1 y la tasa por minuto ({rate_per_minute}), recibido: {burst}"
+            )
+        self.rate = (rate_per_minute - self.capacity) / 60.0
+        
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """
+        Toma un token, esperando si hace falta.
+        
+        Returns:
+            Segundos esperados
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+# ============================================================================
+# Sesiones y limitadores compartidos por URL base
+# ============================================================================
+
+_sessions: Dict[str, requests.Session] = {}
+_limiters: Dict[str, TokenBucket] = {}
+_shared_lock = threading.Lock()
+
+
+def get_session(base_url: str, pool_size: int = 10) -> requests.Session:
+    """
+    Devuelve la sesión keep-alive compartida de una URL base.
+    
+    Args:
+        base_url: URL base de la API
+        pool_size: Conexiones máximas a mantener abiertas (al crear la sesión)
+    
+    Returns:
+        Sesión con pool de conexiones
+    """
+    base_url = base_url.rstrip('/')
+    with _shared_lock:
+        session = _sessions.get(base_url)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _sessions[base_url] = session
+        return session
+
+
+def get_rate_limiter(
+    base_url: str,
+    rate_per_minute: float = DEFAULT_RATE_LIMIT,
+    burst: Optional[int] = None
+) -> TokenBucket:
+    """
+    Devuelve el limitador compartido de una URL base.
+    
+    El límite del broker es por cuenta, así que todos los clientes del
+    proceso comparten el mismo cubo; la tasa se fija al crearlo.
+    
+    Args:
+        base_url: URL base de la API
+        rate_per_minute: Peticiones por minuto (al crear el limitador)
+        burst: Capacidad del cubo (al crear el limitador)
+    
+    Returns:
+        Limitador de la URL
+    """
+    base_url = base_url.rstrip('/')
+    with _shared_lock:
+        limiter = _limiters.get(base_url)
+        if limiter is None:
+            limiter = _limiters[base_url] = TokenBucket(rate_per_minute, burst)
+        return limiter
+
+
+def close_sessions() -> None:
+    """Cierra las sesiones compartidas y olvida los limitadores."""
+    with _shared_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _limiters.clear()
+
+
+# ============================================================================
+# Cliente
+# ============================================================================
+
+@dataclass
+class RequestStats:
+    """
+    Estadísticas de las peticiones de un cliente.
+    
+    Attributes:
+        requests: Peticiones enviadas (incluye reintentos)
+        errors: Peticiones fallidas
+        rate_limited: Respuestas 429 recibidas
+        queue_delay_total: Segundos acumulados en cola (pool + limitador)
+        queue_delay_max: Mayor retardo de cola
+        limiter_wait_total: Parte del retardo esperando al limitador
+    """
+    
+    requests: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    queue_delay_total: float = 0.0
+    queue_delay_max: float = 0.0
+    limiter_wait_total: float = 0.0
+    
+    @property
+    def queue_delay_mean(self) -> float:
+        """Retardo de cola medio por petición."""
+        return self.queue_delay_total / self.requests if self.requests else 0.0
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Convierte las estadísticas a diccionario (para logs)."""
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'rate_limited': self.rate_limited,
+            'queue_delay_mean_ms': round(self.queue_delay_mean * 1000, 3),
+            'queue_delay_max_ms': round(self.queue_delay_max * 1000, 3),
+            'limiter_wait_total_ms': round(self.limiter_wait_total * 1000, 3),
+        }
+
+
+class MarketDataClient:
+    """
+    Cliente de barras históricas de la API de datos de Alpaca.
+    
+    Example:
+        >>> client = MarketDataClient("https://data.alpaca.markets", key, secret)
+        >>> client.get_bars("AAPL", "1Day", "2024-01-02", "2024-03-28")
+    """
+    
+    def __init__(
+        self,
+        base_url: str,
+        api_key_id: str,
+        api_secret_key: str,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        burst: Optional[int] = None,
+        max_workers: int = 8,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        timeout: float = 10.0,
+        max_retries: int = 3
+    ):
+        """
+        Inicializa el cliente.
+        
+        Args:
+            base_url: URL base de la API de datos
+            api_key_id: API Key ID
+            api_secret_key: API Secret Key
+            rate_limit: Peticiones por minuto (compartido por URL base)
+            burst: Ráfaga máxima del limitador (None = una décima parte del minuto)
+            max_workers: Peticiones simultáneas
+            batch_size: Símbolos por petición multi-símbolo
+            timeout: Timeout de cada petición en segundos
+            max_retries: Reintentos ante 429 y errores 5xx
+        """
+        self.base_url = base_url.rstrip('/')
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.stats = RequestStats()
+        
+        self._session = get_session(self.base_url, pool_size=max_workers)
+        self._limiter = get_rate_limiter(self.base_url, rate_limit, burst)
+        self._headers = {
+            'APCA-API-KEY-ID': api_key_id,
+            'APCA-API-SECRET-KEY': api_secret_key,
+        }
+        self._stats_lock = threading.Lock()
+    
+    @classmethod
+    def from_config(cls, config=None, **kwargs: Any) -> 'MarketDataClient':
+        """
+        Crea el cliente con ``BrokerConfig`` (data_url, claves y límite de tasa).
+        
+        Args:
+            config: Configuración (None = ``get_config()``)
+            **kwargs: Parámetros adicionales del constructor
+        
+        Returns:
+            Cliente configurado
+        """
+        if config is None:
+            from ..utils.config import get_config
+            config = get_config()
+        
+        broker = config.broker
+        return cls(
+            broker.data_url,
+            broker.api_key_id,
+            broker.api_secret_key,
+            rate_limit=broker.rate_limit_per_minute,
+            **kwargs,
+        )
+    
+    # ========================================================================
+    # API pública
+    # ========================================================================
+    
+    def get_bars(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: TimeBound,
+        end: TimeBound
+    ) -> pd.DataFrame:
+        """
+        Descarga las barras de un símbolo (todas las páginas).
+        
+        Compatible con ``HistorySync`` como función de descarga.
+        
+        Args:
+            symbol: Símbolo
+            timeframe: Timeframe ("1Min", "1Day", ...)
+            start: Inicio del rango
+            end: Fin del rango
+        
+        Returns:
+            DataFrame con índice UTC y columnas open, high, low, close, volume, ...
+        
+        Raises:
+            MarketDataRequestError: Si la API responde con error
+        """
+        symbol = validate_symbol(symbol)
+        params = self._range_params(timeframe, start, end)
+        rows = []
+        for payload in self._pages(f"/v2/stocks/{symbol}/bars", params, time.monotonic()):
+            rows.extend(payload.get('bars') or ())
+        return _to_frame(rows)
+    
+    def get_multi_bars(
+        self,
+        symbols: Sequence[str],
+        timeframe: str,
+        start: TimeBound,
+        end: TimeBound
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Descarga las barras de varios símbolos en lotes paralelos.
+        
+        Args:
+            symbols: Símbolos (se validan y deduplican)
+            timeframe: Timeframe
+            start: Inicio del rango
+            end: Fin del rango
+        
+        Returns:
+            Diccionario símbolo -> DataFrame (vacío si no hubo barras)
+        
+        Raises:
+            MarketDataRequestError: Si algún lote falla
+        """
+        symbols = validate_symbols_list(list(symbols))
+        params = self._range_params(timeframe, start, end)
+        batches = [symbols[i:i + self.batch_size] for i in range(0, len(symbols), self.batch_size)]
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='market-data') as pool:
+            futures = [
+                submit_with_context(pool, self._fetch_batch, batch, params, time.monotonic())
+                for batch in batches
+            ]
+            rows: Dict[str, List[dict]] = {}
+            for future in futures:
+                for symbol, bars in future.result().items():
+                    rows.setdefault(symbol, []).extend(bars)
+        
+        return {symbol: _to_frame(rows.get(symbol, ())) for symbol in symbols}
+    
+    # ========================================================================
+    # Métodos internos
+    # ========================================================================
+    
+    @staticmethod
+    def _range_params(timeframe: str, start: TimeBound, end: TimeBound) -> Dict[str, str]:
+        """Parámetros comunes de una petición de barras."""
+        return {
+            'timeframe': validate_timeframe(timeframe),
+            'start': _rfc3339(start),
+            'end': _rfc3339(end),
+            'limit': str(PAGE_LIMIT),
+        }
+    
+    def _fetch_batch(self, symbols: List[str], params: Dict[str, str], queued_at: float) -> Dict[str, List[dict]]:
+        """Descarga un lote multi-símbolo (todas las páginas)."""
+        params = {**params, 'symbols': ','.join(symbols)}
+        rows: Dict[str, List[dict]] = {}
+        for payload in self._pages("/v2/stocks/bars", params, queued_at):
+            for symbol, bars in (payload.get('bars') or {}).items():
+                rows.setdefault(symbol, []).extend(bars)
+        return rows
+    
+    def _pages(self, path: str, params: Dict[str, str], queued_at: float):
+        """Recorre las páginas de una petición siguiendo ``next_page_token``."""
+        token = None
+        while True:
+            page_params = {**params, 'page_token': token} if token else params
+            payload = self._request(path, page_params, queued_at)
+            yield payload
+            token = payload.get('next_page_token')
+            if not token:
+                return
+            # Las páginas siguientes solo esperan al limitador
+            queued_at = time.monotonic()
+    
+    def _request(self, path: str, params: Dict[str, str], queued_at: float) -> dict:
+        """Envía una petición GET respetando el limitador y reintentando 429/5xx."""
+        for attempt in range(self.max_retries + 1):
+            waited = self._limiter.acquire()
+            delay = time.monotonic() - queued_at
+            
+            try:
+                response = self._session.get(
+                    self.base_url + path, params=params, headers=self._headers, timeout=self.timeout
+                )
+            except requests.RequestException as e:
+                self._record(delay, waited, error=True)
+                if attempt == self.max_retries:
+                    raise MarketDataRequestError(f"Error de conexión con {self.base_url}: {e}") from e
+                queued_at = time.monotonic()
+                continue
+            
+            status = response.status_code
+            self._record(delay, waited, error=status >= 400, rate_limited=status == 429)
+            
+            if status == 200:
+                return response.json()
+            if (status == 429 or status >= 500) and attempt < self.max_retries:
+                time.sleep(_retry_after(response, attempt))
+                queued_at = time.monotonic()
+                continue
+            raise MarketDataRequestError(f"HTTP {status} en {path}: {response.text[:200]}", status)
+        
+        raise MarketDataRequestError(f"Reintentos agotados en {path}")
+    
+    def _record(self, delay: float, waited: float, error: bool = False, rate_limited: bool = False) -> None:
+        """Acumula las estadísticas de una petición."""
+        with self._stats_lock:
+            stats = self.stats
+            stats.requests += 1
+            stats.errors += error
+            stats.rate_limited += rate_limited
+            stats.queue_delay_total += delay
+            stats.queue_delay_max = max(stats.queue_delay_max, delay)
+            stats.limiter_wait_total += waited
+
+
+def _rfc3339(value: TimeBound) -> str:
+    """Convierte un instante o fecha a RFC 3339 en UTC."""
+    ts = pd.Timestamp(value)
+    ts = ts.tz_localize('UTC') if ts.tzinfo is None else ts.tz_convert('UTC')
+    return ts.strftime('%Y-%m-%dT%H:%M:%SZ') if not ts.nanosecond and not ts.microsecond else ts.isoformat()
+
+
+def _retry_after(response: requests.Response, attempt: int) -> float:
+    """Espera antes de reintentar: ``Retry-After`` o backoff exponencial."""
+    try:
+        return max(0.0, float(response.headers['Retry-After']))
+    except (KeyError, ValueError):
+        return min(2.0 ** attempt * 0.5, 30.0)
+
+
+def _to_frame(rows: Sequence[dict]) -> pd.DataFrame:
+    """Convierte barras de la API a DataFrame con índice UTC."""
+    if not rows:
+        return pd.DataFrame(
+            columns=list(_BAR_FIELDS.values())[:5],
+            index=pd.DatetimeIndex([], tz='UTC', name='timestamp'),
+            dtype='float64',
+        )
+    
+    frame = pd.DataFrame.from_records(rows)
+    index = pd.DatetimeIndex(pd.to_datetime(frame.pop('t'), utc=True), name='timestamp')
+    frame = frame.rename(columns=_BAR_FIELDS)
+    frame.index = index
+    return frame[[column for column in _BAR_FIELDS.values() if column in frame.columns]]
+
+
+# Exportar para uso externo
+__all__ = [
+    'MarketDataClient',
+    'MarketDataRequestError',
+    'RequestStats',
+    'TokenBucket',
+    'get_session',
+    'get_rate_limiter',
+    'close_sessions',
+    'DEFAULT_RATE_LIMIT',
+]
@@ -0,0 +1,436 @@
+"""
+Sincronización incremental del histórico de barras.
+
+Cada serie (símbolo, timeframe) tiene un mapa de cobertura con los rangos
+ya descargados, guardado en ``<storage_path>/history/<símbolo>/<tf>.json``.
+Una petición (validada con ``validate_date_range``) se compara con el mapa
+y solo se descargan los huecos: en trozos de ``chunk_days`` días, en
+paralelo, y combinados en el ``BarStore`` bajo ``DataConfig.storage_path``.
+
+Un rango sin barras (fines de semana, festivos) también queda cubierto, y
+la cobertura nunca pasa del inicio del día actual (UTC): las barras de hoy,
+incluida la que está en curso y las que la fuente publique con retraso, se
+descargan pero se vuelven a pedir (y se sustituyen) en la siguiente
+sincronización.
+
+Example:
+    >>> sync = HistorySync.from_config(fetch=client.get_bars)
+    >>> report = sync.sync("AAPL", "1Min", "2023-01-01", "2024-12-31")
+    >>> report.missing   # Huecos descargados en esta llamada
+    >>> sync.store.read("AAPL", "1Min", "2023-01-01", "2024-12-31")
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+import pandas as pd
+
+from ..utils.log_context import submit_with_context
+from ..utils.validators import validate_symbol, validate_timeframe
+from .store import BarStore
+from .timeutils import from_ns, normalize_frame, normalize_range
+
+
+# Subdirectorio de los mapas de cobertura dentro de DataConfig.storage_path
+HISTORY_DIR_NAME = 'history'
+
+# Nanosegundos de un día
+DAY_NS = 86_400_000_000_000
+
+# Descarga las barras de [inicio, fin): (símbolo, timeframe, inicio, fin)
+BarsFetcher = Callable[[str, str, pd.Timestamp, pd.Timestamp], pd.DataFrame]
+
+Interval = Tuple[int, int]
+
+
+class CoverageMap:
+    """
+    Intervalos ``[inicio, fin)`` en ns ya guardados (disjuntos y ordenados).
+    
+    Example:
+        >>> coverage = CoverageMap()
+        >>> coverage.add(0, 10)
+        >>> coverage.add(20, 30)
+        >>> coverage.missing(5, 25)
+        [(10, 20)]
+    """
+    
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        """
+        Inicializa el mapa.
+        
+        Args:
+            intervals: Intervalos iniciales (se ordenan y fusionan)
+        """
+        self._intervals: List[Interval] = []
+        for start, end in intervals:
+            self.add(start, end)
+    
+    @property
+    def intervals(self) -> List[Interval]:
+        """Copia de los intervalos cubiertos."""
+        return list(self._intervals)
+    
+    def add(self, start: int, end: int) -> None:
+        """Marca un intervalo como cubierto (fusiona los contiguos y solapados)."""
+        if start >= end:
+            return
+        
+        merged = []
+        for current in self._intervals:
+            if current[1] < start or current[0] > end:
+                merged.append(current)
+            else:
+                start, end = min(start, current[0]), max(end, current[1])
+        merged.append((start, end))
+        merged.sort()
+        self._intervals = merged
+    
+    def missing(self, start: int, end: int) -> List[Interval]:
+        """
+        Huecos sin cubrir dentro de un intervalo.
+        
+        Returns:
+            Intervalos ``[inicio, fin)`` ordenados
+        """
+        gaps = []
+        cursor = start
+        for covered_start, covered_end in self._intervals:
+            if covered_end <= cursor:
+                continue
+            if covered_start >= end:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+    
+    def covers(self, start: int, end: int) -> bool:
+        """True si el intervalo está cubierto por completo."""
+        return not self.missing(start, end)
+    
+    @classmethod
+    def load(cls, path: Path) -> 'CoverageMap':
+        """Carga el mapa de un JSON (vacío si no existe)."""
+        try:
+            data = json.loads(Path(path).read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return cls()
+        return cls((int(start), int(end)) for start, end in data['intervals'])
+    
+    def save(self, path: Path) -> None:
+        """Guarda el mapa en JSON (escritura atómica)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps({'intervals': self._intervals}), encoding='utf-8')
+        os.replace(tmp_path, path)
+    
+    def __repr__(self) -> str:
+        ranges = ', '.join(f"{from_ns(s)} -> {from_ns(e)}" for s, e in self._intervals)
+        return f"CoverageMap([{ranges}])"
+
+
+@dataclass
+class SyncReport:
+    """
+    Resultado de sincronizar una serie.
+    
+    Attributes:
+        symbol: Símbolo
+        timeframe: Timeframe
+        start: Inicio del rango pedido
+        end: Fin exclusivo del rango pedido (como mucho, el instante actual)
+        missing: Huecos que había que descargar
+        chunks: Trozos descargados con éxito
+        bars_added: Barras nuevas guardadas
+        failed: Trozos fallidos (inicio, fin, error); siguen sin cubrir
+    """
+    
+    symbol: str
+    timeframe: str
+    start: pd.Timestamp
+    end: pd.Timestamp
+    missing: List[Tuple[pd.Timestamp, pd.Timestamp]] = field(default_factory=list)
+    chunks: int = 0
+    bars_added: int = 0
+    failed: List[Tuple[pd.Timestamp, pd.Timestamp, str]] = field(default_factory=list)
+    
+    @property
+    def complete(self) -> bool:
+        """True si el rango pedido quedó cubierto."""
+        return not self.failed
+
+
+class HistorySync:
+    """
+    Descarga solo los huecos del histórico y los combina en el almacén.
+    
+    Example:
+        >>> sync = HistorySync(BarStore("data/"), fetch=client.get_bars, max_workers=8)
+        >>> reports = sync.sync_many(["AAPL", "MSFT"], "1Min", "2024-01-02", "2024-06-28")
+    """
+    
+    def __init__(
+        self,
+        store: BarStore,
+        fetch: BarsFetcher,
+        chunk_days: int = 7,
+        max_workers: int = 4
+    ):
+        """
+        Inicializa el sincronizador.
+        
+        Args:
+            store: Almacén de barras (los mapas se guardan junto a él)
+            fetch: Función que descarga un rango ``[inicio, fin)``
+            chunk_days: Días por petición a la fuente
+            max_workers: Descargas simultáneas
+        
+        Raises:
+            ValueError: Si chunk_days o max_workers no son positivos
+        """
+        if chunk_days < 1 or max_workers < 1:
+            raise ValueError(
+                f"chunk_days y max_workers deben ser positivos, recibido: {chunk_days}, {max_workers}"
+            )
+        
+        self.store = store
+        self.fetch = fetch
+        self.chunk_ns = int(timedelta(days=chunk_days).total_seconds() * 1e9)
+        self.max_workers = max_workers
+        self.path = store.path.parent / HISTORY_DIR_NAME
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+    
+    @classmethod
+    def from_config(cls, fetch: BarsFetcher, config=None) -> 'HistorySync':
+        """
+        Crea el sincronizador con ``DataConfig`` (storage_path, history_*).
+        
+        Args:
+            fetch: Función que descarga un rango
+            config: Configuración (None = ``get_config()``)
+        
+        Returns:
+            Sincronizador configurado
+        """
+        if config is None:
+            from ..utils.config import get_config
+            config = get_config()
+        
+        data = config.data
+        return cls(
+            BarStore(data.storage_path),
+            fetch,
+            chunk_days=data.history_chunk_days,
+            max_workers=data.history_workers,
+        )
+    
+    # ========================================================================
+    # API pública
+    # ========================================================================
+    
+    def coverage(self, symbol: str, timeframe: str) -> CoverageMap:
+        """Mapa de cobertura guardado de una serie."""
+        return CoverageMap.load(self._coverage_path(self._key(symbol, timeframe)))
+    
+    def missing(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: str,
+        end_date: str
+    ) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        Huecos sin descargar de un rango de fechas (sin descargar nada).
+        
+        Args:
+            symbol: Símbolo
+            timeframe: Timeframe
+            start_date: Fecha inicial "AAAA-MM-DD"
+            end_date: Fecha final "AAAA-MM-DD" (inclusiva)
+        
+        Returns:
+            Huecos ``[inicio, fin)``
+        
+        Raises:
+            DateValidationError: Si el rango no es válido
+        """
+        key = self._key(symbol, timeframe)
+        start, end = self._requested_range(start_date, end_date)
+        gaps = self.coverage(*key).missing(start, end)
+        return [(from_ns(s), from_ns(e)) for s, e in gaps]
+    
+    def sync(self, symbol: str, timeframe: str, start_date: str, end_date: str) -> SyncReport:
+        """
+        Descarga los huecos de un rango y los guarda.
+        
+        Args:
+            symbol: Símbolo
+            timeframe: Timeframe
+            start_date: Fecha inicial "AAAA-MM-DD"
+            end_date: Fecha final "AAAA-MM-DD" (inclusiva)
+        
+        Returns:
+            Informe de la sincronización
+        
+        Raises:
+            DateValidationError: Si el rango no es válido
+        """
+        return self.sync_many([symbol], timeframe, start_date, end_date)[validate_symbol(symbol)]
+    
+    def sync_many(
+        self,
+        symbols: Sequence[str],
+        timeframe: str,
+        start_date: str,
+        end_date: str
+    ) -> Dict[str, SyncReport]:
+        """
+        Sincroniza varios símbolos compartiendo el pool de descargas.
+        
+        Los trozos de todos los símbolos se descargan en paralelo; cada
+        hueco se combina en el almacén (y se marca como cubierto) en cuanto
+        terminan sus trozos.
+        
+        Returns:
+            Diccionario símbolo -> informe
+        
+        Raises:
+            DateValidationError: Si el rango no es válido
+        """
+        keys = list(dict.fromkeys(self._key(symbol, timeframe) for symbol in symbols))
+        start, end = self._requested_range(start_date, end_date)
+        settled = self._settled_until()
+        
+        reports: Dict[str, SyncReport] = {}
+        # Orden fijo para no bloquearse con otra sincronización concurrente
+        locks = [self._series_lock(key) for key in sorted(keys)]
+        for lock in locks:
+            lock.acquire()
+        
+        try:
+            plans = []
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='history-sync') as pool:
+                for key in keys:
+                    coverage = self.coverage(*key)
+                    gaps = coverage.missing(start, end)
+                    reports[key[0]] = SyncReport(
+                        key[0], key[1], from_ns(start), from_ns(end),
+                        missing=[(from_ns(s), from_ns(e)) for s, e in gaps]
+                    )
+                    chunks = [[(s, e, self._submit(pool, key, s, e)) for s, e in self._split(gap)] for gap in gaps]
+                    plans.append((key, coverage, chunks))
+                
+                # Por orden cronológico: los huecos al final de la serie se añaden sin reescribirla
+                for key, coverage, chunks in plans:
+                    for gap_chunks in chunks:
+                        self._collect(key, coverage, gap_chunks, reports[key[0]], settled)
+        finally:
+            for lock in locks:
+                lock.release()
+        
+        return reports
+    
+    def reset(self, symbol: str, timeframe: str) -> None:
+        """Borra la serie y su mapa de cobertura."""
+        key = self._key(symbol, timeframe)
+        with self._series_lock(key):
+            self.store.delete(*key)
+            self._coverage_path(key).unlink(missing_ok=True)
+    
+    # ========================================================================
+    # Métodos internos
+    # ========================================================================
+    
+    def _key(self, symbol: str, timeframe: str) -> Tuple[str, str]:
+        """Valida y normaliza la clave de una serie."""
+        return validate_symbol(symbol), validate_timeframe(timeframe)
+    
+    def _coverage_path(self, key: Tuple[str, str]) -> Path:
+        """Archivo del mapa de cobertura de una serie."""
+        return self.path / key[0] / f"{key[1]}.json"
+    
+    def _series_lock(self, key: Tuple[str, str]) -> threading.Lock:
+        """Lock de una serie (evita descargar dos veces el mismo hueco)."""
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+    
+    @staticmethod
+    def _requested_range(start_date: str, end_date: str) -> Interval:
+        """Rango pedido en ns, sin pasar del instante actual."""
+        start, end = normalize_range(start_date, end_date)
+        return start, max(start, min(end, time.time_ns()))
+    
+    @staticmethod
+    def _settled_until() -> int:
+        """Inicio del día actual (UTC) en ns: las barras anteriores ya no cambian."""
+        now = time.time_ns()
+        return now - now % DAY_NS
+    
+    def _split(self, gap: Interval) -> List[Interval]:
+        """Divide un hueco en trozos de ``chunk_days``."""
+        start, end = gap
+        return [(s, min(s + self.chunk_ns, end)) for s in range(start, end, self.chunk_ns)]
+    
+    def _submit(self, pool: ThreadPoolExecutor, key: Tuple[str, str], start: int, end: int) -> Future:
+        """Encarga la descarga de un trozo (con el contexto de logging actual)."""
+        return submit_with_context(pool, self.fetch, key[0], key[1], from_ns(start), from_ns(end))
+    
+    def _collect(
+        self,
+        key: Tuple[str, str],
+        coverage: CoverageMap,
+        chunks: List[Tuple[int, int, Future]],
+        report: SyncReport,
+        settled: int
+    ) -> None:
+        """
+        Combina los trozos descargados de un hueco y actualiza la cobertura.
+        
+        Solo se cubre hasta ``settled``: el resto (la barra en curso y las
+        barras de hoy aún sin publicar) se vuelve a pedir la próxima vez.
+        """
+        frames = []
+        done = []
+        for start, end, future in chunks:
+            try:
+                frame = future.result()
+            except Exception as e:
+                report.failed.append((from_ns(start), from_ns(end), f"{type(e).__name__}: {e}"))
+                continue
+            if frame is not None and len(frame):
+                frames.append(normalize_frame(frame, start, end))
+            done.append((start, end))
+        
+        if frames:
+            report.bars_added += self.store.merge(*key, pd.concat(frames) if len(frames) > 1 else frames[0])
+        
+        # La cobertura se guarda después de los datos: si se interrumpe, solo se repite la descarga
+        settled_chunks = [(start, min(end, settled)) for start, end in done if start < settled]
+        for start, end in settled_chunks:
+            coverage.add(start, end)
+        if settled_chunks:
+            coverage.save(self._coverage_path(key))
+        report.chunks += len(done)
+
+
+# Exportar para uso externo
+__all__ = [
+    'HistorySync',
+    'SyncReport',
+    'CoverageMap',
+    'BarsFetcher',
+    'HISTORY_DIR_NAME',
+    'DAY_NS',
+]
@@ -0,0 +1,490 @@
+"""
+Motor de resampling incremental para el Trading Bot.
+
+Construye barras de timeframes mayores (5Min, 15Min, 1Hour, 1Day, ...)
+a partir de barras base (1Min) de forma incremental: en cada ciclo solo
+se agregan las barras nuevas y se combinan con el agregado parcial de
+la barra en formación, en lugar de volver a resamplear todo el
+histórico.
+
+La agregación es columnar (NumPy ``reduceat``):
+- open: primera barra del grupo
+- high / low: máximo / mínimo del grupo
+- close: última barra del grupo
+- volume: suma del grupo
+
+Example:
+    >>> from src.data.resampler import IncrementalResampler
+    >>> resampler = IncrementalResampler(targets=("5Min", "1Hour"))
+    >>> completed = resampler.update(new_minute_bars)
+    >>> completed["5Min"]           # Barras de 5 minutos cerradas en este ciclo
+    >>> resampler.partial("1Hour")  # Barra horaria en formación
+    >>> resampler.bars("5Min")      # Histórico de barras cerradas
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..utils.ohlcv_validators import OHLCV_COLUMNS, resolve_ohlcv_columns
+from ..utils.timeframes import Timeframe, TimeframeUnit, parse_timeframe
+from ..utils.validators import MarketDataValidationError
+
+
+# Timeframes construidos por defecto a partir de barras de 1 minuto
+DEFAULT_TARGETS = ('5Min', '15Min', '1Hour', '1Day')
+
+# Índice de columnas compartido por todos los DataFrames generados
+_COLUMNS = pd.Index(OHLCV_COLUMNS)
+
+# Barras agregadas: (inicio de cada barra en ns, columnas OHLCV)
+Groups = Tuple[np.ndarray, Dict[str, np.ndarray]]
+
+
+@dataclass
+class PartialBar:
+    """
+    Agregado parcial de una barra en formación.
+    
+    Los límites se guardan como enteros (ns desde epoch, UTC) para no
+    crear objetos ``Timestamp`` en cada ciclo.
+    
+    Attributes:
+        start: Inicio de la barra (ns)
+        end: Fin exclusivo de la barra (ns)
+        open: Precio de apertura
+        high: Precio máximo
+        low: Precio mínimo
+        close: Último precio de cierre
+        volume: Volumen acumulado
+    """
+    
+    start: int
+    end: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    
+    def merge(self, high: float, low: float, close: float, volume: float) -> None:
+        """Incorpora el agregado de nuevas barras de la misma ventana."""
+        if high > self.high:
+            self.high = high
+        if low < self.low:
+            self.low = low
+        self.close = close
+        self.volume += volume
+    
+    def to_groups(self) -> Groups:
+        """Convierte el parcial en un grupo de una sola barra."""
+        return np.array([self.start], dtype=np.int64), {
+            'open': np.array([self.open]),
+            'high': np.array([self.high]),
+            'low': np.array([self.low]),
+            'close': np.array([self.close]),
+            'volume': np.array([self.volume]),
+        }
+
+
+# ============================================================================
+# Agregación columnar
+# ============================================================================
+
+def _to_frame(groups: Optional[Groups], tz) -> pd.DataFrame:
+    """Construye el DataFrame OHLCV de un conjunto de barras agregadas."""
+    if groups is None:
+        keys, values = np.empty(0, dtype=np.int64), {c: np.empty(0) for c in OHLCV_COLUMNS}
+    else:
+        keys, values = groups
+    
+    index = pd.DatetimeIndex(keys.view('datetime64[ns]'))
+    if tz is not None:
+        index = index.tz_localize('UTC').tz_convert(tz)
+    
+    # Un único bloque 2D es mucho más barato de construir que un dict de columnas
+    block = np.column_stack([values[column] for column in OHLCV_COLUMNS])
+    return pd.DataFrame(block, index=index, columns=_COLUMNS, copy=False)
+
+
+def _concat_groups(chunks: List[Groups]) -> Optional[Groups]:
+    """Concatena grupos de barras (None si no hay ninguna)."""
+    chunks = [chunk for chunk in chunks if len(chunk[0])]
+    
+    if not chunks:
+        return None
+    if len(chunks) == 1:
+        return chunks[0]
+    
+    return np.concatenate([keys for keys, _ in chunks]), {
+        column: np.concatenate([values[column] for _, values in chunks])
+        for column in OHLCV_COLUMNS
+    }
+
+
+def _slice_groups(groups: Groups, start: int, stop: Optional[int] = None) -> Groups:
+    """Selecciona un rango de barras agregadas."""
+    keys, values = groups
+    return keys[start:stop], {column: array[start:stop] for column, array in values.items()}
+
+
+def _extract(frame: pd.DataFrame) -> Tuple[pd.DatetimeIndex, Dict[str, np.ndarray]]:
+    """Obtiene el índice en ns y las columnas OHLCV como arrays float64."""
+    columns = resolve_ohlcv_columns(frame)
+    index = frame.index
+    if index.unit != 'ns':
+        index = index.as_unit('ns')
+    
+    return index, {
+        column: frame[source].to_numpy(dtype=np.float64)
+        for column, source in columns.items()
+    }
+
+
+def _bucket_keys(timeframe: Timeframe, index: pd.DatetimeIndex) -> np.ndarray:
+    """Inicio de barra (ns desde epoch) de cada timestamp del índice (en ns)."""
+    if timeframe.unit in (TimeframeUnit.MINUTE, TimeframeUnit.HOUR) and (
+        index.tz is None or str(index.tz) == 'UTC'
+    ):
+        # Sin zona horaria local el inicio de barra es aritmética entera
+        values = index.asi8
+        return values - values % timeframe.duration_ns
+    
+    return timeframe.floor_index(index).asi8
+
+
+def _aggregate(
+    timeframe: Timeframe,
+    index: pd.DatetimeIndex,
+    values: Dict[str, np.ndarray]
+) -> Groups:
+    """
+    Agrega barras ordenadas por tiempo al timeframe indicado.
+    
+    Args:
+        timeframe: Timeframe de destino
+        index: Timestamps de las barras base (ordenados, en ns)
+        values: Columnas OHLCV de las barras base
+    
+    Returns:
+        Tupla (inicio de cada barra en ns, columnas OHLCV agregadas)
+    """
+    keys = _bucket_keys(timeframe, index)
+    boundaries = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+    first = np.concatenate(([0], boundaries))
+    last = np.concatenate((boundaries - 1, [len(keys) - 1]))
+    
+    return keys[first], {
+        'open': values['open'][first],
+        'high': np.maximum.reduceat(values['high'], first),
+        'low': np.minimum.reduceat(values['low'], first),
+        'close': values['close'][last],
+        'volume': np.add.reduceat(values['volume'], first),
+    }
+
+
+def resample_bars(frame: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """
+    Resamplea un histórico completo de barras a un timeframe mayor.
+    
+    Args:
+        frame: DataFrame OHLCV con DatetimeIndex ordenado
+        timeframe: Timeframe de destino (ej. '15Min')
+    
+    Returns:
+        DataFrame OHLCV indexado por el inicio de cada barra (la última
+        barra puede estar incompleta)
+    
+    Raises:
+        MarketDataValidationError: Si el DataFrame no tiene columnas OHLCV
+            o DatetimeIndex
+        DateValidationError: Si el timeframe es inválido
+    
+    Example:
+        >>> hourly = resample_bars(minute_bars, "1Hour")
+    """
+    if not isinstance(frame.index, pd.DatetimeIndex):
+        raise MarketDataValidationError("Las barras deben tener DatetimeIndex")
+    
+    target = parse_timeframe(timeframe)
+    
+    if frame.empty:
+        return _to_frame(None, frame.index.tz)
+    
+    index, values = _extract(frame)
+    return _to_frame(_aggregate(target, index, values), index.tz)
+
+
+# ============================================================================
+# Resampler incremental
+# ============================================================================
+
+class IncrementalResampler:
+    """
+    Resampler que mantiene agregados parciales entre ciclos.
+    
+    Cada llamada a ``update`` procesa solo las barras base posteriores a
+    la última vista. Una barra de destino se cierra cuando llega la
+    barra base que completa su ventana o cualquier barra posterior a
+    ella; ``flush`` cierra las barras en formación (ej. al final de la
+    sesión, para las barras diarias).
+    
+    Example:
+        >>> resampler = IncrementalResampler(targets=("5Min", "15Min"))
+        >>> for chunk in stream:
+        ...     completed = resampler.update(chunk)
+        ...     if not completed["15Min"].empty:
+        ...         strategy.on_bars(completed["15Min"])
+    """
+    
+    def __init__(
+        self,
+        targets: Sequence[str] = DEFAULT_TARGETS,
+        base: str = '1Min'
+    ):
+        """
+        Inicializa el resampler.
+        
+        Args:
+            targets: Timeframes a construir
+            base: Timeframe de las barras de entrada
+        
+        Raises:
+            DateValidationError: Si algún timeframe es inválido
+            MarketDataValidationError: Si algún destino no es múltiplo
+                del timeframe base
+        """
+        self._base = parse_timeframe(base)
+        self._targets: List[Timeframe] = [parse_timeframe(t) for t in dict.fromkeys(targets)]
+        
+        if not self._base.is_fixed:
+            raise MarketDataValidationError(
+                f"El timeframe base debe tener duración fija: {self._base}"
+            )
+        
+        for target in self._targets:
+            if target == self._base or not self._base.divides(target):
+                raise MarketDataValidationError(
+                    f"No se puede construir {target} a partir de barras {self._base}"
+                )
+        
+        self.reset()
+    
+    @property
+    def base(self) -> Timeframe:
+        """Timeframe de las barras de entrada."""
+        return self._base
+    
+    @property
+    def targets(self) -> List[Timeframe]:
+        """Timeframes construidos."""
+        return list(self._targets)
+    
+    @property
+    def last_timestamp(self) -> Optional[pd.Timestamp]:
+        """Timestamp de la última barra base procesada."""
+        if self._last_key is None:
+            return None
+        return self._timestamp(self._last_key)
+    
+    def reset(self) -> None:
+        """Descarta parciales e histórico."""
+        self._partials: Dict[Timeframe, Optional[PartialBar]] = {t: None for t in self._targets}
+        self._history: Dict[Timeframe, List[Groups]] = {t: [] for t in self._targets}
+        self._last_key: Optional[int] = None
+        self._tz = None
+    
+    def update(self, bars: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        Procesa nuevas barras base.
+        
+        Las barras con timestamp anterior o igual al último procesado se
+        ignoran, de modo que se pueden pasar ventanas solapadas.
+        
+        Args:
+            bars: DataFrame OHLCV con DatetimeIndex
+        
+        Returns:
+            Diccionario timeframe -> barras cerradas en este ciclo
+        
+        Raises:
+            MarketDataValidationError: Si las barras no tienen DatetimeIndex,
+                columnas OHLCV o están desordenadas
+        """
+        if not isinstance(bars.index, pd.DatetimeIndex):
+            raise MarketDataValidationError("Las barras deben tener DatetimeIndex")
+        
+        index, values = _extract(bars)
+        
+        if len(index) and not index.is_monotonic_increasing:
+            raise MarketDataValidationError("Las barras deben estar ordenadas por tiempo")
+        
+        if self._last_key is not None and len(index):
+            # Descartar barras ya procesadas (ventanas solapadas)
+            skip = int(np.searchsorted(index.asi8, self._last_key, side='right'))
+            if skip:
+                index = index[skip:]
+                values = {column: array[skip:] for column, array in values.items()}
+        
+        if not len(index):
+            return {t.name: _to_frame(None, self._tz) for t in self._targets}
+        
+        self._tz = index.tz
+        self._last_key = int(index.asi8[-1])
+        
+        # Fin de la ventana cubierta por la última barra base
+        covered_until = self._last_key + self._base.duration_ns
+        
+        completed = {}
+        for target in self._targets:
+            closed = self._advance(target, _aggregate(target, index, values), covered_until)
+            completed[target.name] = _to_frame(closed, self._tz)
+        
+        return completed
+    
+    def _advance(
+        self,
+        target: Timeframe,
+        groups: Groups,
+        covered_until: int
+    ) -> Optional[Groups]:
+        """Combina los grupos nuevos con el parcial y cierra las barras completas."""
+        partial = self._partials[target]
+        closed: List[Groups] = []
+        
+        if partial is not None:
+            keys, values = groups
+            
+            if keys[0] == partial.start:
+                # La primera ventana continúa la barra en formación
+                partial.merge(
+                    values['high'][0], values['low'][0],
+                    values['close'][0], values['volume'][0]
+                )
+                groups = _slice_groups(groups, 1)
+                
+                if not len(groups[0]) and partial.end > covered_until:
+                    return None
+            
+            closed.append(partial.to_groups())
+            self._partials[target] = None
+        
+        keys, values = groups
+        
+        if len(keys):
+            last_start = int(keys[-1])
+            last_end = self._boundary_after(target, last_start)
+            
+            if last_end > covered_until:
+                self._partials[target] = PartialBar(
+                    start=last_start,
+                    end=last_end,
+                    open=values['open'][-1],
+                    high=values['high'][-1],
+                    low=values['low'][-1],
+                    close=values['close'][-1],
+                    volume=values['volume'][-1],
+                )
+                groups = _slice_groups(groups, 0, -1)
+            
+            closed.append(groups)
+        
+        return self._record(target, closed)
+    
+    def _boundary_after(self, target: Timeframe, start: int) -> int:
+        """Fin exclusivo (ns) de la barra que empieza en ``start``."""
+        if target.unit in (TimeframeUnit.MINUTE, TimeframeUnit.HOUR):
+            return start + target.duration_ns
+        
+        return target.next_boundary(self._timestamp(start)).value
+    
+    def _timestamp(self, key: int) -> pd.Timestamp:
+        """Convierte una clave en ns a Timestamp en la zona horaria de las barras."""
+        if self._tz is None:
+            return pd.Timestamp(key, unit='ns')
+        return pd.Timestamp(key, unit='ns', tz='UTC').tz_convert(self._tz)
+    
+    def _record(self, target: Timeframe, closed: List[Groups]) -> Optional[Groups]:
+        """Guarda las barras cerradas en el histórico y las devuelve."""
+        groups = _concat_groups(closed)
+        
+        if groups is not None:
+            self._history[target].append(groups)
+        
+        return groups
+    
+    def flush(self) -> Dict[str, pd.DataFrame]:
+        """
+        Cierra todas las barras en formación.
+        
+        Returns:
+            Diccionario timeframe -> barra cerrada (o DataFrame vacío)
+        """
+        completed = {}
+        for target in self._targets:
+            partial = self._partials[target]
+            self._partials[target] = None
+            closed = self._record(target, [partial.to_groups()] if partial is not None else [])
+            completed[target.name] = _to_frame(closed, self._tz)
+        return completed
+    
+    def partial(self, timeframe: str) -> Optional[pd.Series]:
+        """
+        Obtiene la barra en formación de un timeframe.
+        
+        Args:
+            timeframe: Timeframe construido
+        
+        Returns:
+            Fila OHLCV de la barra en formación o None
+        """
+        partial = self._partials[self._target(timeframe)]
+        
+        if partial is None:
+            return None
+        
+        return _to_frame(partial.to_groups(), self._tz).iloc[0]
+    
+    def bars(self, timeframe: str) -> pd.DataFrame:
+        """
+        Obtiene el histórico de barras cerradas de un timeframe.
+        
+        Args:
+            timeframe: Timeframe construido
+        
+        Returns:
+            DataFrame OHLCV con todas las barras cerradas
+        """
+        chunks = self._history[self._target(timeframe)]
+        
+        if len(chunks) > 1:
+            # Compactar para no concatenar de nuevo en la próxima consulta
+            chunks[:] = [_concat_groups(chunks)]
+        
+        return _to_frame(chunks[0] if chunks else None, self._tz)
+    
+    def _target(self, timeframe: str) -> Timeframe:
+        """Resuelve un timeframe construido por el resampler."""
+        target = parse_timeframe(timeframe)
+        
+        if target not in self._partials:
+            raise MarketDataValidationError(
+                f"El resampler no construye barras {target}"
+            )
+        
+        return target
+    
+    def __repr__(self) -> str:
+        targets = ', '.join(t.name for t in self._targets)
+        return f"IncrementalResampler(base={self._base}, targets=[{targets}])"
+
+
+# Exportar para uso externo
+__all__ = [
+    'DEFAULT_TARGETS',
+    'IncrementalResampler',
+    'PartialBar',
+    'resample_bars',
+]
@@ -0,0 +1,230 @@
+"""
+Coalescencia de peticiones idénticas en vuelo (single-flight).
+
+Cuando varias estrategias piden el mismo símbolo y timeframe en el mismo
+ciclo, solo la primera llamada ejecuta la descarga; las que llegan
+mientras está en vuelo esperan y reciben el mismo resultado (o la misma
+excepción). Al terminar, la clave se libera: la siguiente llamada vuelve a
+ejecutar.
+
+- ``SingleFlight``: para hilos (``threading``)
+- ``AsyncSingleFlight``: para corrutinas de un mismo event loop
+
+``MarketDataCache.get_or_fetch`` lo usa por hueco, de modo que al caducar
+un segmento por ``cache_ttl`` solo un llamador vuelve a descargarlo.
+
+Example:
+    >>> flights = SingleFlight()
+    >>> fetch = flights.wrap(client.get_bars)
+    >>> # Llamadas concurrentes con los mismos argumentos -> una petición
+    >>> bars = fetch("AAPL", "1Min", start, end)
+"""
+
+import asyncio
+import functools
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+
+T = TypeVar('T')
+
+# Calcula la clave de coalescencia a partir de los argumentos
+KeyFunction = Callable[..., Hashable]
+
+
+def default_key(*args: Any, **kwargs: Any) -> Hashable:
+    """Clave por defecto: los argumentos (deben ser hashables)."""
+    return args, tuple(sorted(kwargs.items())) if kwargs else ()
+
+
+class _Call:
+    """Llamada en vuelo: la espera y su resultado."""
+    
+    __slots__ = ('done', 'result', 'error')
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Ejecuta una sola vez las llamadas concurrentes con la misma clave (hilos).
+    
+    Example:
+        >>> flights = SingleFlight()
+        >>> flights.do(("AAPL", "1Min"), fetch_bars, "AAPL", "1Min")
+    """
+    
+    def __init__(self):
+        """Inicializa el grupo de llamadas."""
+        self.executions = 0
+        self.coalesced = 0
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+    
+    def do(self, key: Hashable, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Ejecuta ``fn`` o espera a la ejecución en vuelo con la misma clave.
+        
+        Args:
+            key: Clave de la petición
+            fn: Función a ejecutar
+            *args: Argumentos posicionales
+            **kwargs: Argumentos por nombre
+        
+        Returns:
+            Resultado de la ejecución (compartido entre los llamadores)
+        
+        Raises:
+            Exception: La excepción de la ejecución, en todos los llamadores
+        """
+        return self.do_shared(key, fn, *args, **kwargs)[0]
+    
+    def do_shared(self, key: Hashable, fn: Callable[..., T], *args: Any, **kwargs: Any) -> Tuple[T, bool]:
+        """
+        Igual que ``do``, indicando si el resultado vino de otra llamada.
+        
+        Returns:
+            Tupla (resultado, compartido)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                self.coalesced += 1
+        
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.result, False
+    
+    def wrap(self, fn: Callable[..., T], key: KeyFunction = default_key) -> Callable[..., T]:
+        """
+        Envuelve una función para coalescer las llamadas con argumentos iguales.
+        
+        Args:
+            fn: Función a envolver (por ejemplo ``client.get_bars``)
+            key: Función que calcula la clave a partir de los argumentos
+        
+        Returns:
+            Función con la misma firma
+        """
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            return self.do(key(*args, **kwargs), fn, *args, **kwargs)
+        return wrapper
+    
+    def in_flight(self, key: Hashable) -> bool:
+        """True si hay una ejecución en curso con esa clave."""
+        with self._lock:
+            return key in self._calls
+    
+    def forget(self, key: Hashable) -> None:
+        """Libera la clave: la siguiente llamada ejecuta aunque haya una en vuelo."""
+        with self._lock:
+            self._calls.pop(key, None)
+
+
+class AsyncSingleFlight:
+    """
+    Ejecuta una sola vez las corrutinas concurrentes con la misma clave.
+    
+    La ejecución es una tarea independiente: cancelar a un llamador no la
+    cancela para los demás. Usar un grupo por event loop.
+    
+    Example:
+        >>> flights = AsyncSingleFlight()
+        >>> bars = await flights.do(("AAPL", "1Min"), fetch_bars_async, "AAPL", "1Min")
+    """
+    
+    def __init__(self):
+        """Inicializa el grupo de llamadas."""
+        self.executions = 0
+        self.coalesced = 0
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+    
+    async def do(self, key: Hashable, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """
+        Ejecuta la corrutina o espera a la que está en vuelo con la misma clave.
+        
+        Args:
+            key: Clave de la petición
+            fn: Función asíncrona a ejecutar
+            *args: Argumentos posicionales
+            **kwargs: Argumentos por nombre
+        
+        Returns:
+            Resultado de la ejecución (compartido entre los llamadores)
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            self._tasks[key] = task
+            task.add_done_callback(functools.partial(self._release, key))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+        
+        return await asyncio.shield(task)
+    
+    def wrap(
+        self,
+        fn: Callable[..., Awaitable[T]],
+        key: KeyFunction = default_key
+    ) -> Callable[..., Awaitable[T]]:
+        """
+        Envuelve una función asíncrona para coalescer llamadas con argumentos iguales.
+        
+        Args:
+            fn: Función asíncrona a envolver
+            key: Función que calcula la clave a partir de los argumentos
+        
+        Returns:
+            Función asíncrona con la misma firma
+        """
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            return await self.do(key(*args, **kwargs), fn, *args, **kwargs)
+        return wrapper
+    
+    def in_flight(self, key: Hashable) -> bool:
+        """True si hay una ejecución en curso con esa clave."""
+        return key in self._tasks
+    
+    def forget(self, key: Hashable) -> None:
+        """Libera la clave: la siguiente llamada ejecuta aunque haya una en vuelo."""
+        self._tasks.pop(key, None)
+    
+    def _release(self, key: Hashable, task: asyncio.Task) -> None:
+        """Libera la clave al terminar y marca la excepción como recuperada."""
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # Si todos los llamadores se cancelaron, nadie lee la excepción
+        if not task.cancelled():
+            task.exception()
+
+
+# Exportar para uso externo
+__all__ = [
+    'SingleFlight',
+    'AsyncSingleFlight',
+    'default_key',
+]
@@ -0,0 +1,564 @@
+"""
+Almacén columnar de barras OHLCV en archivos mapeados en memoria.
+
+Cada serie (símbolo, timeframe) es un directorio con un archivo binario
+por columna y un ``meta.json``::
+
+    <storage_path>/bars/AAPL/1Min/
+        timestamp.i8    # ns desde epoch (UTC), ordenados: índice temporal
+        open.f8
+        high.f8
+        ...
+        meta.json       # filas confirmadas y columnas
+
+Las columnas se leen con ``np.memmap``: una lectura es una búsqueda
+binaria sobre ``timestamp`` y devuelve vistas de las columnas, sin copiar
+datos. El sistema operativo carga bajo demanda las páginas que se tocan,
+así que un backtest sobre cientos de símbolos no lleva todo el histórico
+a RAM.
+
+La escritura solo añade al final: las filas con timestamp igual o anterior
+al último guardado se descartan. El número de filas confirmadas se guarda
+en ``meta.json`` (escritura atómica) después de escribir las columnas, por
+lo que una escritura interrumpida deja bytes sobrantes que se ignoran y
+se truncan en la siguiente escritura. ``merge`` inserta barras en cualquier
+posición (relleno de huecos del histórico) reescribiendo la serie en un
+directorio temporal que sustituye al actual.
+
+Example:
+    >>> store = BarStore.from_config()
+    >>> store.append("AAPL", "1Min", bars)
+    >>> view = store.read("AAPL", "1Min", "2024-03-04", "2024-03-08")
+    >>> view["close"].mean()  # Vista del memmap, sin copia
+"""
+
+import json
+import os
+import shutil
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..utils.ohlcv_validators import OHLCV_COLUMNS
+from ..utils.validators import MarketDataValidationError, validate_symbol, validate_timeframe
+from .timeutils import TimeBound, from_ns, index_ns, normalize_range, to_ns
+
+
+# Subdirectorio del almacén dentro de DataConfig.storage_path
+STORE_DIR_NAME = 'bars'
+
+# Columna del índice temporal (int64, ns UTC)
+TIMESTAMP_FIELD = 'timestamp'
+
+_TIMESTAMP_DTYPE = np.dtype('<i8')
+_VALUE_DTYPE = np.dtype('<f8')
+
+_META_FILE = 'meta.json'
+
+# Directorios de una reescritura (``merge``) en curso
+_STAGING_SUFFIX = '.tmp'
+_RETIRED_SUFFIX = '.old'
+
+
+@dataclass(frozen=True)
+class BarView:
+    """
+    Rango de una serie como vistas sobre los archivos mapeados.
+    
+    Los arrays son de solo lectura y comparten memoria con el memmap: no
+    ocupan RAM propia hasta que se tocan sus páginas.
+    
+    Attributes:
+        symbol: Símbolo
+        timeframe: Timeframe
+        timestamps: Timestamps en ns desde epoch (UTC)
+        columns: Arrays por columna ('open', 'high', ...)
+    """
+    
+    symbol: str
+    timeframe: str
+    timestamps: np.ndarray
+    columns: Dict[str, np.ndarray]
+    
+    def __len__(self) -> int:
+        """Número de barras."""
+        return len(self.timestamps)
+    
+    def __getitem__(self, field: str) -> np.ndarray:
+        """Array de una columna."""
+        return self.columns[field]
+    
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        """Timestamps como ``DatetimeIndex`` UTC."""
+        return pd.DatetimeIndex(self.timestamps.view('datetime64[ns]'), tz='UTC', copy=False)
+    
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Convierte la vista a DataFrame.
+        
+        pandas consolida las columnas en un bloque propio, así que esto
+        copia los datos: usar los arrays directamente para no copiar.
+        
+        Returns:
+            DataFrame con índice UTC
+        """
+        return pd.DataFrame(dict(self.columns), index=self.index)
+
+
+class _Series:
+    """Estado abierto de una serie: memmaps y filas confirmadas."""
+    
+    def __init__(self, directory: Path, fields: Tuple[str, ...], length: int, meta_version: Tuple[int, int]):
+        self.directory = directory
+        self.fields = fields
+        self.length = length
+        self.meta_version = meta_version
+        self._maps: Dict[str, np.ndarray] = {}
+        self._mapped_length = -1
+    
+    def column_path(self, field: str) -> Path:
+        """Archivo de una columna."""
+        suffix = 'i8' if field == TIMESTAMP_FIELD else 'f8'
+        return self.directory / f"{field}.{suffix}"
+    
+    def maps(self) -> Dict[str, np.ndarray]:
+        """Memmaps de solo lectura de las filas confirmadas (se remapean al crecer)."""
+        if self._mapped_length != self.length:
+            maps = {}
+            for field in (TIMESTAMP_FIELD,) + self.fields:
+                dtype = _TIMESTAMP_DTYPE if field == TIMESTAMP_FIELD else _VALUE_DTYPE
+                if self.length:
+                    maps[field] = np.memmap(self.column_path(field), dtype=dtype, mode='r', shape=(self.length,))
+                else:
+                    maps[field] = np.empty(0, dtype=dtype)
+            # Las vistas ya entregadas siguen apuntando al mapeo anterior
+            self._maps = maps
+            self._mapped_length = self.length
+        return self._maps
+
+
+class BarStore:
+    """
+    Almacén append-only de barras, una serie por (símbolo, timeframe).
+    
+    Pensado para un único proceso escritor; los lectores (en este u otros
+    procesos) ven las filas nuevas al confirmarse ``meta.json``.
+    
+    Example:
+        >>> store = BarStore("data/")
+        >>> store.append("AAPL", "1Min", bars)
+        >>> views = store.read_many(["AAPL", "MSFT"], "1Min", "2024-01-02", "2024-12-31")
+    """
+    
+    def __init__(self, storage_path: Union[str, Path], fields: Sequence[str] = OHLCV_COLUMNS):
+        """
+        Inicializa el almacén.
+        
+        Args:
+            storage_path: Directorio de datos (se usa ``<storage_path>/bars``)
+            fields: Columnas de las series nuevas (las existentes conservan las suyas)
+        
+        Raises:
+            ValueError: Si no hay columnas o alguna se llama 'timestamp'
+        """
+        fields = tuple(str(field).lower() for field in fields)
+        if not fields or TIMESTAMP_FIELD in fields:
+            raise ValueError(f"Columnas inválidas para el almacén: {fields}")
+        
+        self.path = Path(storage_path) / STORE_DIR_NAME
+        self.fields = fields
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self._lock = threading.RLock()
+    
+    @classmethod
+    def from_config(cls, config=None) -> 'BarStore':
+        """
+        Crea el almacén bajo ``DataConfig.storage_path``.
+        
+        Args:
+            config: Configuración (None = ``get_config()``)
+        
+        Returns:
+            Almacén configurado
+        """
+        if config is None:
+            from ..utils.config import get_config
+            config = get_config()
+        
+        return cls(config.data.storage_path)
+    
+    # ========================================================================
+    # Escritura
+    # ========================================================================
+    
+    def append(self, symbol: str, timeframe: str, bars: pd.DataFrame) -> int:
+        """
+        Añade barras al final de una serie (la crea si no existe).
+        
+        Las barras se ordenan por timestamp; con timestamps repetidos se
+        conserva la última, y las anteriores o iguales a la última guardada
+        se descartan.
+        
+        Args:
+            symbol: Símbolo (se valida con ``validate_symbol``)
+            timeframe: Timeframe (se valida con ``validate_timeframe``)
+            bars: DataFrame con ``DatetimeIndex`` y las columnas de la serie
+        
+        Returns:
+            Número de barras añadidas
+        
+        Raises:
+            MarketDataValidationError: Si faltan columnas o el índice no es temporal
+        """
+        key = self._key(symbol, timeframe)
+        if not len(bars):
+            return 0
+        
+        with self._lock:
+            series = self._open(key, create=True)
+            arrays = _to_arrays(bars, series.fields)
+            timestamps = arrays[TIMESTAMP_FIELD]
+            
+            first_new = 0
+            if series.length:
+                last = series.maps()[TIMESTAMP_FIELD][-1]
+                first_new = int(np.searchsorted(timestamps, last, side='right'))
+            
+            if first_new == len(timestamps):
+                return 0
+            
+            self._write(series, {field: values[first_new:] for field, values in arrays.items()})
+            return len(timestamps) - first_new
+    
+    def merge(self, symbol: str, timeframe: str, bars: pd.DataFrame) -> int:
+        """
+        Combina barras en cualquier posición de la serie (relleno de huecos).
+        
+        Si todas las barras son posteriores a la última guardada equivale a
+        ``append``. Si no, la serie se reescribe en un directorio temporal
+        que sustituye al actual: las vistas ya entregadas siguen apuntando a
+        los archivos anteriores. Con timestamps ya guardados ganan las
+        barras nuevas.
+        
+        Args:
+            symbol: Símbolo
+            timeframe: Timeframe
+            bars: DataFrame con ``DatetimeIndex`` y las columnas de la serie
+        
+        Returns:
+            Número de barras nuevas (timestamps que no estaban guardados)
+        
+        Raises:
+            MarketDataValidationError: Si faltan columnas o el índice no es temporal
+        """
+        key = self._key(symbol, timeframe)
+        if not len(bars):
+            return 0
+        
+        with self._lock:
+            series = self._open(key, create=True)
+            arrays = _to_arrays(bars, series.fields)
+            
+            maps = series.maps()
+            stored = maps[TIMESTAMP_FIELD]
+            if not series.length or arrays[TIMESTAMP_FIELD][0] > stored[-1]:
+                self._write(series, arrays)
+                return len(arrays[TIMESTAMP_FIELD])
+            
+            timestamps = np.concatenate([stored, arrays[TIMESTAMP_FIELD]])
+            order = np.argsort(timestamps, kind='stable')
+            timestamps = timestamps[order]
+            # Las barras nuevas van detrás en el orden estable: gana la última
+            keep = np.append(timestamps[1:] != timestamps[:-1], True)
+            positions = order[keep]
+            
+            merged = {TIMESTAMP_FIELD: timestamps[keep]}
+            for field in series.fields:
+                merged[field] = np.concatenate([maps[field], arrays[field]])[positions]
+            
+            added = len(merged[TIMESTAMP_FIELD]) - series.length
+            self._rewrite(key, series, merged)
+            return added
+    
+    def delete(self, symbol: str, timeframe: str) -> bool:
+        """
+        Borra una serie.
+        
+        Returns:
+            True si existía
+        """
+        key = self._key(symbol, timeframe)
+        directory = self._directory(key)
+        
+        with self._lock:
+            self._series.pop(key, None)
+            if not directory.is_dir():
+                return False
+            for entry in directory.iterdir():
+                entry.unlink()
+            directory.rmdir()
+            return True
+    
+    # ========================================================================
+    # Lectura
+    # ========================================================================
+    
+    def read(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[TimeBound] = None,
+        end: Optional[TimeBound] = None
+    ) -> BarView:
+        """
+        Devuelve un rango de la serie como vistas, sin copiar datos.
+        
+        Args:
+            symbol: Símbolo
+            timeframe: Timeframe
+            start: Inicio (None = desde el principio)
+            end: Fin, inclusivo si es fecha "AAAA-MM-DD" y exclusivo si es
+                instante (None = hasta el final)
+        
+        Returns:
+            Vista de las barras en el rango (vacía si la serie no existe)
+        
+        Raises:
+            DateValidationError: Si el rango no es válido
+        """
+        key = self._key(symbol, timeframe)
+        
+        with self._lock:
+            series = self._open(key)
+            if series is None:
+                return BarView(key[0], key[1], np.empty(0, dtype=_TIMESTAMP_DTYPE),
+                               {field: np.empty(0, dtype=_VALUE_DTYPE) for field in self.fields})
+            maps = series.maps()
+        
+        rows = _search(maps[TIMESTAMP_FIELD], start, end)
+        return BarView(
+            symbol=key[0],
+            timeframe=key[1],
+            timestamps=maps[TIMESTAMP_FIELD][rows],
+            columns={field: maps[field][rows] for field in series.fields},
+        )
+    
+    def read_many(
+        self,
+        symbols: Iterable[str],
+        timeframe: str,
+        start: Optional[TimeBound] = None,
+        end: Optional[TimeBound] = None
+    ) -> Dict[str, BarView]:
+        """
+        Lee el mismo rango de varios símbolos (vistas, sin copiar).
+        
+        Returns:
+            Diccionario símbolo -> vista (omite las series vacías)
+        """
+        views = {}
+        for symbol in symbols:
+            view = self.read(symbol, timeframe, start, end)
+            if len(view):
+                views[view.symbol] = view
+        return views
+    
+    def bounds(self, symbol: str, timeframe: str) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        Primer y último timestamp guardados.
+        
+        Returns:
+            Tupla (primero, último) o None si la serie está vacía
+        """
+        key = self._key(symbol, timeframe)
+        with self._lock:
+            series = self._open(key)
+            if series is None or not series.length:
+                return None
+            timestamps = series.maps()[TIMESTAMP_FIELD]
+            return from_ns(int(timestamps[0])), from_ns(int(timestamps[-1]))
+    
+    def length(self, symbol: str, timeframe: str) -> int:
+        """Número de barras confirmadas de una serie."""
+        key = self._key(symbol, timeframe)
+        with self._lock:
+            series = self._open(key)
+            return series.length if series is not None else 0
+    
+    def symbols(self, timeframe: Optional[str] = None) -> List[str]:
+        """
+        Símbolos con alguna serie guardada.
+        
+        Args:
+            timeframe: Solo símbolos con serie en este timeframe
+        
+        Returns:
+            Símbolos ordenados
+        """
+        if not self.path.is_dir():
+            return []
+        if timeframe is not None:
+            timeframe = validate_timeframe(timeframe)
+        return sorted(
+            entry.name for entry in self.path.iterdir()
+            if entry.is_dir() and (timeframe is None or (entry / timeframe / _META_FILE).exists())
+        )
+    
+    # ========================================================================
+    # Métodos internos
+    # ========================================================================
+    
+    def _key(self, symbol: str, timeframe: str) -> Tuple[str, str]:
+        """Valida y normaliza la clave de una serie."""
+        return validate_symbol(symbol), validate_timeframe(timeframe)
+    
+    def _directory(self, key: Tuple[str, str]) -> Path:
+        """Directorio de una serie."""
+        return self.path / key[0] / key[1]
+    
+    def _open(self, key: Tuple[str, str], create: bool = False) -> Optional[_Series]:
+        """Devuelve la serie abierta, releyendo ``meta.json`` si cambió en disco."""
+        directory = self._directory(key)
+        meta_path = directory / _META_FILE
+        
+        try:
+            meta_version = _meta_version(meta_path)
+        except FileNotFoundError:
+            staged = directory.with_name(directory.name + _STAGING_SUFFIX)
+            if (staged / _META_FILE).exists():
+                # Reescritura interrumpida entre los dos renombrados
+                os.replace(staged, directory)
+                return self._open(key, create)
+            self._series.pop(key, None)
+            if not create:
+                return None
+            directory.mkdir(parents=True, exist_ok=True)
+            series = _Series(directory, self.fields, 0, (0, 0))
+            self._series[key] = series
+            return series
+        
+        series = self._series.get(key)
+        if series is None or series.meta_version != meta_version:
+            # Otro ``BarStore`` pudo reescribir la serie con la misma longitud
+            # (``merge``): se abre de nuevo para no servir el mapeo anterior
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+            series = _Series(directory, tuple(meta['fields']), meta['length'], meta_version)
+            self._series[key] = series
+        return series
+    
+    def _write(self, series: _Series, arrays: Dict[str, np.ndarray]) -> None:
+        """Añade las columnas y confirma la nueva longitud en ``meta.json``."""
+        for field, values in arrays.items():
+            path = series.column_path(field)
+            offset = series.length * values.itemsize
+            with open(path, 'ab') as f:
+                # Descarta bytes de una escritura interrumpida
+                if f.tell() != offset:
+                    f.truncate(offset)
+                values.tofile(f)
+        
+        length = series.length + len(arrays[TIMESTAMP_FIELD])
+        meta_path = series.directory / _META_FILE
+        tmp_path = meta_path.with_suffix('.tmp')
+        tmp_path.write_text(
+            json.dumps({'fields': list(series.fields), 'length': length}),
+            encoding='utf-8'
+        )
+        os.replace(tmp_path, meta_path)
+        
+        series.length = length
+        series.meta_version = _meta_version(meta_path)
+    
+    def _rewrite(self, key: Tuple[str, str], series: _Series, arrays: Dict[str, np.ndarray]) -> None:
+        """Escribe la serie completa en un directorio temporal y lo intercambia."""
+        directory = series.directory
+        staged = directory.with_name(directory.name + _STAGING_SUFFIX)
+        retired = directory.with_name(directory.name + _RETIRED_SUFFIX)
+        shutil.rmtree(staged, ignore_errors=True)
+        staged.mkdir(parents=True)
+        
+        replacement = _Series(staged, series.fields, 0, (0, 0))
+        self._write(replacement, arrays)
+        
+        shutil.rmtree(retired, ignore_errors=True)
+        os.replace(directory, retired)
+        os.replace(staged, directory)
+        shutil.rmtree(retired, ignore_errors=True)
+        
+        self._series[key] = _Series(
+            directory, series.fields, replacement.length, _meta_version(directory / _META_FILE)
+        )
+
+
+def _meta_version(meta_path: Path) -> Tuple[int, int]:
+    """Versión de ``meta.json``: (mtime en ns, inodo); cada escritura lo sustituye."""
+    stat = meta_path.stat()
+    return stat.st_mtime_ns, stat.st_ino
+
+
+def _to_arrays(bars: pd.DataFrame, fields: Tuple[str, ...]) -> Dict[str, np.ndarray]:
+    """Columnas de la serie ordenadas por timestamp (con repetidos, gana la última fila)."""
+    columns = _resolve_fields(bars, fields)
+    timestamps = index_ns(bars)
+    
+    positions = None
+    if not np.all(timestamps[1:] > timestamps[:-1]):
+        order = np.argsort(timestamps, kind='stable')
+        timestamps = timestamps[order]
+        keep = np.append(timestamps[1:] != timestamps[:-1], True)
+        positions = order[keep]
+        timestamps = timestamps[keep]
+    
+    arrays = {TIMESTAMP_FIELD: timestamps.astype(_TIMESTAMP_DTYPE, copy=False)}
+    for field in fields:
+        values = bars[columns[field]].to_numpy(dtype=_VALUE_DTYPE)
+        arrays[field] = values[positions] if positions is not None else values
+    return arrays
+
+
+def _resolve_fields(bars: pd.DataFrame, fields: Tuple[str, ...]) -> Dict[str, str]:
+    """Localiza las columnas de la serie sin distinguir mayúsculas."""
+    lookup = {str(c).lower(): c for c in bars.columns}
+    missing = [field for field in fields if field not in lookup]
+    if missing:
+        raise MarketDataValidationError(f"Faltan columnas: {', '.join(missing)}")
+    return {field: lookup[field] for field in fields}
+
+
+def _bound(value: TimeBound, is_end: bool) -> int:
+    """Convierte un extremo suelto a ns (una fecha final cubre el día completo)."""
+    if isinstance(value, str):
+        start_ns, end_ns = normalize_range(value, value)
+        return end_ns if is_end else start_ns
+    return to_ns(value)
+
+
+def _search(
+    timestamps: np.ndarray,
+    start: Optional[TimeBound],
+    end: Optional[TimeBound]
+) -> slice:
+    """Filas en [start, end) por búsqueda binaria sobre el índice temporal."""
+    if start is not None and end is not None:
+        start_ns, end_ns = normalize_range(start, end)
+    else:
+        start_ns = _bound(start, is_end=False) if start is not None else None
+        end_ns = _bound(end, is_end=True) if end is not None else None
+    
+    lo = int(np.searchsorted(timestamps, start_ns, side='left')) if start_ns is not None else 0
+    hi = int(np.searchsorted(timestamps, end_ns, side='left')) if end_ns is not None else len(timestamps)
+    return slice(lo, max(lo, hi))
+
+
+# Exportar para uso externo
+__all__ = [
+    'BarStore',
+    'BarView',
+    'STORE_DIR_NAME',
+    'TIMESTAMP_FIELD',
+]
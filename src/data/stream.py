@@ -0,0 +1,829 @@
+"""
+Pipeline asyncio de ingesta de datos de mercado en tiempo real.
+
+Sustituye el sondeo con ``time.sleep(cycle_interval)`` por un flujo de
+eventos desde el websocket del broker, en etapas conectadas por colas
+acotadas::
+
+    fuente -> decode -> validate -> aggregate -> fan-out -> consumidores
+
+- decode: JSON del websocket -> mensajes (trades ``"T": "t"`` y barras
+  ``"T": "b"`` con el formato de Alpaca)
+- validate: símbolo y precios con las mismas reglas que
+  ``validate_symbol``/``validate_price`` (sus variantes ``check_*`` sin
+  excepciones); los mensajes inválidos se cuentan y se descartan
+- aggregate: trades -> barras del timeframe (se cierran al llegar un trade
+  de la barra siguiente o ``close_after`` segundos después de su fin)
+- fan-out: cada consumidor tiene su propia cola con una política
+
+Contrapresión: las colas entre etapas son acotadas; si una se llena, la
+etapa anterior espera y, en último término, se deja de leer del socket.
+Las colas de los consumidores aplican su política al llenarse:
+
+- ``block``: el fan-out espera (contrapresión hacia toda la pipeline)
+- ``drop_newest``: se descarta el evento nuevo
+- ``drop_oldest``: se descarta el evento más antiguo de la cola
+- ``conflate``: se conserva solo el último evento por (tipo, símbolo)
+
+Example:
+    >>> pipeline = StreamPipeline(websocket_source(url, key, secret, trades=["AAPL"]))
+    >>> pipeline.subscribe("strategy", on_bar, kinds=("bar",))
+    >>> pipeline.subscribe("dashboard", on_event, maxsize=100, policy="conflate")
+    >>> await pipeline.run()
+"""
+
+import asyncio
+import itertools
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from ..utils.timeframes import parse_timeframe
+from ..utils.validators import (
+    MarketDataValidationError,
+    check_price,
+    check_symbol,
+    validate_symbol,
+    validate_timeframe,
+)
+from .resampler import PartialBar
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+# Websocket de datos de Alpaca (feed IEX)
+DEFAULT_STREAM_URL = 'wss://stream.data.alpaca.markets/v2/iex'
+
+# Las barras del feed de Alpaca son de 1 minuto
+FEED_BAR_TIMEFRAME = '1Min'
+
+# Políticas de las colas de consumidores
+QUEUE_POLICIES = ('block', 'drop_newest', 'drop_oldest', 'conflate')
+
+# Tipos de evento
+EVENT_KINDS = ('trade', 'bar')
+
+# Fin del flujo / cierre de barras por tiempo
+_END = object()
+_TICK = object()
+
+RawMessage = Union[str, bytes]
+
+
+# ============================================================================
+# Eventos
+# ============================================================================
+
+@dataclass(frozen=True)
+class Trade:
+    """
+    Trade validado.
+    
+    Attributes:
+        symbol: Símbolo
+        price: Precio
+        size: Cantidad
+        timestamp: Instante en ns desde epoch (UTC)
+    """
+    
+    kind: ClassVar[str] = 'trade'
+    
+    symbol: str
+    price: float
+    size: float
+    timestamp: int
+
+
+@dataclass(frozen=True)
+class Bar:
+    """
+    Barra OHLCV (del feed o agregada a partir de trades).
+    
+    Attributes:
+        symbol: Símbolo
+        timeframe: Timeframe
+        timestamp: Inicio de la barra en ns desde epoch (UTC)
+        open: Precio de apertura
+        high: Precio máximo
+        low: Precio mínimo
+        close: Precio de cierre
+        volume: Volumen
+    """
+    
+    kind: ClassVar[str] = 'bar'
+    
+    symbol: str
+    timeframe: str
+    timestamp: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+Event = Union[Trade, Bar]
+
+
+# ============================================================================
+# Colas de consumidores
+# ============================================================================
+
+@dataclass
+class ConsumerStats:
+    """
+    Estadísticas de un consumidor.
+    
+    Attributes:
+        delivered: Eventos entregados
+        dropped: Eventos descartados por la política
+        conflated: Eventos sustituidos por uno más reciente
+        max_depth: Mayor ocupación de la cola
+        blocked_seconds: Tiempo que el fan-out esperó por este consumidor
+        errors: Excepciones del handler
+    """
+    
+    delivered: int = 0
+    dropped: int = 0
+    conflated: int = 0
+    max_depth: int = 0
+    blocked_seconds: float = 0.0
+    errors: int = 0
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Convierte las estadísticas a diccionario (para logs)."""
+        return {
+            'delivered': self.delivered,
+            'dropped': self.dropped,
+            'conflated': self.conflated,
+            'max_depth': self.max_depth,
+            'blocked_ms': round(self.blocked_seconds * 1000, 3),
+            'errors': self.errors,
+        }
+
+
+class ConsumerQueue:
+    """
+    Cola acotada con política de desbordamiento.
+    
+    Example:
+        >>> queue = ConsumerQueue(maxsize=100, policy="conflate")
+        >>> await queue.put(bar)
+        >>> event = await queue.get()
+    """
+    
+    def __init__(self, maxsize: int = 1000, policy: str = 'block'):
+        """
+        Inicializa la cola.
+        
+        Args:
+            maxsize: Capacidad
+            policy: 'block', 'drop_newest', 'drop_oldest' o 'conflate'
+        
+        Raises:
+            ValueError: Si la política o la capacidad no son válidas
+        """
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Política inválida: '{policy}'. Válidas: {QUEUE_POLICIES}")
+        if maxsize < 1:
+            raise ValueError(f"La capacidad debe ser positiva, recibido: {maxsize}")
+        
+        self.maxsize = maxsize
+        self.policy = policy
+        self.stats = ConsumerStats()
+        self._items: 'OrderedDict[Any, Any]' = OrderedDict()
+        self._seq = itertools.count()
+        self._closed = False
+        self._changed = asyncio.Condition()
+    
+    def __len__(self) -> int:
+        """Eventos pendientes."""
+        return len(self._items)
+    
+    async def put(self, event: Any) -> None:
+        """Encola un evento aplicando la política si la cola está llena."""
+        async with self._changed:
+            if self.policy == 'conflate':
+                key = (event.kind, event.symbol)
+                if key in self._items:
+                    # Conserva la posición en la cola y sustituye el valor
+                    self._items[key] = event
+                    self.stats.conflated += 1
+                    return
+            else:
+                key = next(self._seq)
+            
+            if len(self._items) >= self.maxsize:
+                if self.policy == 'block':
+                    started = time.perf_counter()
+                    await self._changed.wait_for(lambda: len(self._items) < self.maxsize or self._closed)
+                    self.stats.blocked_seconds += time.perf_counter() - started
+                elif self.policy == 'drop_newest':
+                    self.stats.dropped += 1
+                    return
+                else:
+                    self._items.popitem(last=False)
+                    self.stats.dropped += 1
+            
+            self._items[key] = event
+            self.stats.max_depth = max(self.stats.max_depth, len(self._items))
+            self._changed.notify_all()
+    
+    async def get(self) -> Any:
+        """
+        Devuelve el siguiente evento (espera si la cola está vacía).
+        
+        Raises:
+            StopAsyncIteration: Si la cola se cerró y está vacía
+        """
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._items or self._closed)
+            if not self._items:
+                raise StopAsyncIteration
+            _, event = self._items.popitem(last=False)
+            self.stats.delivered += 1
+            self._changed.notify_all()
+            return event
+    
+    async def close(self) -> None:
+        """Cierra la cola: los eventos pendientes se siguen entregando."""
+        async with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+
+class Subscription:
+    """
+    Consumidor de la pipeline: cola propia y filtro por tipo y símbolo.
+    
+    Se consume con ``async for`` o mediante un handler gestionado por la
+    pipeline.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        queue: ConsumerQueue,
+        kinds: Sequence[str],
+        symbols: Optional[Iterable[str]],
+        handler: Optional[Callable[[Event], Awaitable[None]]]
+    ):
+        self.name = name
+        self.queue = queue
+        self.kinds = frozenset(kinds)
+        self.symbols = frozenset(symbols) if symbols is not None else None
+        self.handler = handler
+    
+    @property
+    def stats(self) -> ConsumerStats:
+        """Estadísticas de la cola del consumidor."""
+        return self.queue.stats
+    
+    def accepts(self, event: Event) -> bool:
+        """True si el evento pasa los filtros del consumidor."""
+        return event.kind in self.kinds and (self.symbols is None or event.symbol in self.symbols)
+    
+    def __aiter__(self) -> AsyncIterator[Event]:
+        return self
+    
+    async def __anext__(self) -> Event:
+        return await self.queue.get()
+
+
+# ============================================================================
+# Pipeline
+# ============================================================================
+
+@dataclass
+class StreamStats:
+    """
+    Estadísticas de la pipeline.
+    
+    Attributes:
+        messages: Frames recibidos de la fuente
+        decoded: Mensajes de datos decodificados
+        decode_errors: Frames que no son JSON válido
+        rejected: Mensajes descartados en la validación
+        late_trades: Trades de barras ya cerradas
+        trades: Trades validados
+        bars_built: Barras agregadas a partir de trades
+        feed_bars: Barras recibidas del feed
+        control: Mensajes de control (success, subscription, error)
+    """
+    
+    messages: int = 0
+    decoded: int = 0
+    decode_errors: int = 0
+    rejected: int = 0
+    late_trades: int = 0
+    trades: int = 0
+    bars_built: int = 0
+    feed_bars: int = 0
+    control: int = 0
+    consumers: Dict[str, ConsumerStats] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte las estadísticas a diccionario (para logs)."""
+        return {
+            'messages': self.messages,
+            'decoded': self.decoded,
+            'decode_errors': self.decode_errors,
+            'rejected': self.rejected,
+            'late_trades': self.late_trades,
+            'trades': self.trades,
+            'bars_built': self.bars_built,
+            'feed_bars': self.feed_bars,
+            'control': self.control,
+            'consumers': {name: stats.to_dict() for name, stats in self.consumers.items()},
+        }
+
+
+class StreamPipeline:
+    """
+    Pipeline decode -> validate -> aggregate -> fan-out sobre colas acotadas.
+    
+    Example:
+        >>> pipeline = StreamPipeline(replay_source(frames), timeframe="1Min", close_after=None)
+        >>> bars = pipeline.subscribe("collector", kinds=("bar",))
+        >>> task = asyncio.create_task(pipeline.run())
+        >>> async for bar in bars:
+        ...     print(bar)
+    """
+    
+    def __init__(
+        self,
+        source: AsyncIterable[RawMessage],
+        timeframe: str = '1Min',
+        queue_size: int = 1000,
+        min_price: float = 0.0001,
+        close_after: Optional[float] = 2.0
+    ):
+        """
+        Inicializa la pipeline.
+        
+        Args:
+            source: Frames del websocket (``websocket_source``, ``replay_source``)
+            timeframe: Timeframe intradía de las barras agregadas
+            queue_size: Capacidad de las colas entre etapas
+            min_price: Precio mínimo válido (``check_price``)
+            close_after: Segundos tras el fin de una barra para cerrarla sin
+                esperar al siguiente trade (None = solo por trades; para replays)
+        
+        Raises:
+            DateValidationError: Si el timeframe no es válido
+            MarketDataValidationError: Si el timeframe no es intradía
+        """
+        tf = parse_timeframe(validate_timeframe(timeframe))
+        if not tf.is_fixed or tf.duration_ns >= 86_400_000_000_000:
+            raise MarketDataValidationError(f"El timeframe del stream debe ser intradía, recibido: {timeframe}")
+        
+        self.source = source
+        self.timeframe = tf.name
+        self.queue_size = queue_size
+        self.min_price = min_price
+        self.close_after = close_after
+        self.stats = StreamStats()
+        
+        self._step = tf.duration_ns
+        self._subscriptions: List[Subscription] = []
+        self._partials: Dict[str, PartialBar] = {}
+        self._closed_until: Dict[str, int] = {}
+        self._stopping = False
+        self._reader: Optional[asyncio.Task] = None
+        self._awaiting_source = False
+        self._cancelled_by_stop = False
+    
+    def subscribe(
+        self,
+        name: str,
+        handler: Optional[Callable[[Event], Awaitable[None]]] = None,
+        maxsize: int = 1000,
+        policy: str = 'block',
+        kinds: Sequence[str] = EVENT_KINDS,
+        symbols: Optional[Iterable[str]] = None
+    ) -> Subscription:
+        """
+        Registra un consumidor (antes de ``run``).
+        
+        Args:
+            name: Nombre del consumidor (para estadísticas)
+            handler: Corrutina llamada con cada evento (None = consumir con ``async for``)
+            maxsize: Capacidad de su cola
+            policy: Política al llenarse la cola (ver ``QUEUE_POLICIES``)
+            kinds: Tipos de evento ('trade', 'bar')
+            symbols: Solo estos símbolos (None = todos)
+        
+        Returns:
+            Suscripción
+        
+        Raises:
+            ValueError: Si la política, el tipo o el nombre no son válidos
+            SymbolValidationError: Si algún símbolo es inválido
+        """
+        unknown = set(kinds) - set(EVENT_KINDS)
+        if unknown:
+            raise ValueError(f"Tipos de evento inválidos: {sorted(unknown)}. Válidos: {EVENT_KINDS}")
+        if name in self.stats.consumers:
+            raise ValueError(f"Ya existe un consumidor llamado '{name}'")
+        
+        if symbols is not None:
+            symbols = [validate_symbol(symbol) for symbol in symbols]
+        
+        subscription = Subscription(name, ConsumerQueue(maxsize, policy), kinds, symbols, handler)
+        self._subscriptions.append(subscription)
+        self.stats.consumers[name] = subscription.stats
+        return subscription
+    
+    def stop(self) -> None:
+        """
+        Deja de leer de la fuente; lo ya leído se procesa y se entrega.
+        
+        Si la lectura está esperando un frame (fuente sin actividad), se
+        cancela para que ``run`` termine sin esperar al siguiente mensaje.
+        """
+        self._stopping = True
+        if self._reader is not None and self._awaiting_source and not self._cancelled_by_stop:
+            self._cancelled_by_stop = True
+            self._reader.cancel()
+    
+    async def run(self) -> StreamStats:
+        """
+        Ejecuta la pipeline hasta agotar la fuente o llamar a ``stop``.
+        
+        Al terminar se cierran las barras en formación, se entregan los
+        eventos pendientes y se cierran las colas de los consumidores. Si una
+        etapa falla (o se cancela ``run``), se cancelan las demás y se
+        propaga el error.
+        
+        Returns:
+            Estadísticas finales
+        """
+        decoded_q, validated_q, aggregated_q = (asyncio.Queue(self.queue_size) for _ in range(3))
+        raw_q: asyncio.Queue = asyncio.Queue(self.queue_size)
+        
+        handlers = [
+            asyncio.create_task(self._consume(subscription), name=f"stream-consumer-{subscription.name}")
+            for subscription in self._subscriptions if subscription.handler is not None
+        ]
+        ticker = asyncio.create_task(self._tick(validated_q)) if self.close_after is not None else None
+        
+        self._reader = asyncio.create_task(self._read(raw_q), name="stream-read")
+        stages = [
+            self._reader,
+            asyncio.create_task(self._stage(raw_q, decoded_q, self._decode), name="stream-decode"),
+            asyncio.create_task(self._stage(decoded_q, validated_q, self._validate), name="stream-validate"),
+            asyncio.create_task(
+                self._stage(validated_q, aggregated_q, self._aggregate, flush=self._flush_all),
+                name="stream-aggregate"
+            ),
+            asyncio.create_task(self._fan_out(aggregated_q), name="stream-fan-out"),
+        ]
+        
+        try:
+            await asyncio.gather(*stages)
+        finally:
+            # Con un error en una etapa, gather no cancela las demás
+            pending = [task for task in stages if not task.done()]
+            if ticker is not None:
+                pending.append(ticker)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            self._reader = None
+            for subscription in self._subscriptions:
+                await subscription.queue.close()
+            await asyncio.gather(*handlers, return_exceptions=True)
+        
+        return self.stats
+    
+    # ========================================================================
+    # Etapas
+    # ========================================================================
+    
+    async def _read(self, out: asyncio.Queue) -> None:
+        """Lee frames de la fuente (espera si la etapa siguiente va atrasada)."""
+        messages = aiter(self.source)
+        try:
+            while not self._stopping:
+                # ``stop`` solo cancela la lectura mientras se espera a la fuente
+                self._awaiting_source = True
+                try:
+                    message = await anext(messages)
+                except StopAsyncIteration:
+                    break
+                except asyncio.CancelledError:
+                    if not self._cancelled_by_stop:
+                        raise
+                    _uncancel(asyncio.current_task())
+                    break
+                finally:
+                    self._awaiting_source = False
+                self.stats.messages += 1
+                await out.put(message)
+        finally:
+            close = getattr(self.source, 'aclose', None)
+            if close is not None:
+                await close()
+        # Si la fuente falla, ``run`` cancela el resto de etapas
+        await out.put(_END)
+    
+    async def _stage(
+        self,
+        inbox: asyncio.Queue,
+        out: asyncio.Queue,
+        process: Callable[[Any], List[Any]],
+        flush: Optional[Callable[[], List[Any]]] = None
+    ) -> None:
+        """Bucle de una etapa: procesa lotes y pasa el resultado a la siguiente."""
+        while True:
+            item = await inbox.get()
+            if item is _END:
+                if flush is not None:
+                    events = flush()
+                    if events:
+                        await out.put(events)
+                await out.put(_END)
+                return
+            result = process(item)
+            if result:
+                await out.put(result)
+    
+    def _decode(self, message: RawMessage) -> List[dict]:
+        """Frame -> mensajes de datos (los de control solo se cuentan)."""
+        try:
+            payload = _loads(message)
+        except ValueError:
+            self.stats.decode_errors += 1
+            return []
+        
+        messages = payload if isinstance(payload, list) else [payload]
+        data = []
+        for item in messages:
+            if not isinstance(item, dict):
+                self.stats.decode_errors += 1
+            elif item.get('T') in ('t', 'b'):
+                data.append(item)
+            else:
+                self.stats.control += 1
+        self.stats.decoded += len(data)
+        return data
+    
+    def _validate(self, messages: List[dict]) -> List[Event]:
+        """Mensajes -> eventos validados."""
+        events = []
+        min_price = self.min_price
+        for item in messages:
+            try:
+                symbol, code = check_symbol(item['S'])
+                if code:
+                    raise ValueError(symbol)
+                timestamp = parse_time_ns(item['t'])
+                
+                if item['T'] == 't':
+                    price, size = item['p'], item['s']
+                    if check_price(price, min_price)[1] or not size > 0:
+                        raise ValueError(price)
+                    events.append(Trade(symbol, float(price), float(size), timestamp))
+                else:
+                    prices = (item['o'], item['h'], item['l'], item['c'])
+                    if any(check_price(p, min_price)[1] for p in prices) or not item['v'] >= 0:
+                        raise ValueError(prices)
+                    if not (item['l'] <= min(item['o'], item['c']) and item['h'] >= max(item['o'], item['c'])):
+                        raise ValueError(prices)
+                    events.append(Bar(symbol, FEED_BAR_TIMEFRAME, timestamp, *map(float, prices), float(item['v'])))
+            except (AttributeError, KeyError, TypeError, ValueError):
+                self.stats.rejected += 1
+        return events
+    
+    def _aggregate(self, events: List[Any]) -> List[Event]:
+        """Pasa los eventos y añade las barras que cierran los trades (o el tick)."""
+        out: List[Event] = []
+        step = self._step
+        partials = self._partials
+        
+        for event in events:
+            if event is _TICK:
+                out.extend(self._flush_expired(time.time_ns() - int(self.close_after * 1e9)))
+                continue
+            
+            if event.kind == 'bar':
+                self.stats.feed_bars += 1
+                out.append(event)
+                continue
+            
+            symbol = event.symbol
+            start = event.timestamp - event.timestamp % step
+            if start < self._closed_until.get(symbol, start):
+                self.stats.late_trades += 1
+                continue
+            
+            self.stats.trades += 1
+            out.append(event)
+            partial = partials.get(symbol)
+            if partial is not None and start >= partial.end:
+                out.append(self._close(symbol, partial))
+                partial = None
+            if partial is None:
+                price = event.price
+                partials[symbol] = PartialBar(start, start + step, price, price, price, price, event.size)
+            else:
+                partial.merge(event.price, event.price, event.price, event.size)
+        return out
+    
+    async def _fan_out(self, inbox: asyncio.Queue) -> None:
+        """Entrega cada evento a las colas de los consumidores que lo aceptan."""
+        subscriptions = self._subscriptions
+        while True:
+            events = await inbox.get()
+            if events is _END:
+                return
+            for event in events:
+                for subscription in subscriptions:
+                    if subscription.accepts(event):
+                        await subscription.queue.put(event)
+    
+    async def _consume(self, subscription: Subscription) -> None:
+        """Llama al handler de un consumidor con cada evento de su cola."""
+        async for event in subscription:
+            try:
+                await subscription.handler(event)
+            except Exception:
+                subscription.stats.errors += 1
+    
+    async def _tick(self, out: asyncio.Queue) -> None:
+        """Pide periódicamente a la etapa de agregación que cierre barras vencidas."""
+        interval = max(0.05, min(self.close_after, self._step / 1e9) / 2)
+        while True:
+            await asyncio.sleep(interval)
+            await out.put([_TICK])
+    
+    # ========================================================================
+    # Barras en formación
+    # ========================================================================
+    
+    def _close(self, symbol: str, partial: PartialBar) -> Bar:
+        """Cierra una barra en formación."""
+        self._closed_until[symbol] = partial.end
+        self.stats.bars_built += 1
+        return Bar(symbol, self.timeframe, partial.start, partial.open, partial.high,
+                   partial.low, partial.close, partial.volume)
+    
+    def _flush_expired(self, cutoff: int) -> List[Bar]:
+        """Cierra las barras cuyo fin es anterior a ``cutoff`` (ns)."""
+        expired = [symbol for symbol, partial in self._partials.items() if partial.end <= cutoff]
+        return [self._close(symbol, self._partials.pop(symbol)) for symbol in expired]
+    
+    def _flush_all(self) -> List[Bar]:
+        """Cierra todas las barras en formación (fin del flujo)."""
+        bars = [self._close(symbol, partial) for symbol, partial in self._partials.items()]
+        self._partials.clear()
+        return bars
+
+
+def _uncancel(task: asyncio.Task) -> None:
+    """Descuenta una cancelación ya atendida (``Task.uncancel`` existe desde Python 3.11)."""
+    uncancel = getattr(task, 'uncancel', None)
+    if uncancel is not None:
+        uncancel()
+
+
+# ============================================================================
+# Fuentes
+# ============================================================================
+
+@lru_cache(maxsize=4096)
+def _epoch_seconds(prefix: str) -> int:
+    """Segundos desde epoch de 'AAAA-MM-DDTHH:MM:SS' (UTC)."""
+    return int(datetime.fromisoformat(prefix).replace(tzinfo=timezone.utc).timestamp())
+
+
+def parse_time_ns(value: Union[str, int]) -> int:
+    """
+    Convierte un timestamp RFC 3339 en UTC (con hasta 9 decimales) a ns.
+    
+    Args:
+        value: Texto como '2024-03-04T14:30:00.123456789Z' o ns enteros
+    
+    Returns:
+        ns desde epoch
+    
+    Raises:
+        ValueError: Si el formato no es válido
+    """
+    if isinstance(value, int):
+        return value
+    if not value.endswith('Z'):
+        # Offsets explícitos: ruta lenta pero general
+        parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo is None:
+            raise ValueError(f"Timestamp sin zona horaria: {value}")
+        return int(parsed.timestamp()) * 1_000_000_000 + parsed.microsecond * 1000
+    
+    seconds = _epoch_seconds(value[:19])
+    fraction = value[20:-1] if len(value) > 20 and value[19] == '.' else ''
+    nanos = int(fraction.ljust(9, '0')[:9]) if fraction else 0
+    return seconds * 1_000_000_000 + nanos
+
+
+async def replay_source(frames: Iterable[RawMessage], delay: float = 0.0) -> AsyncIterator[RawMessage]:
+    """
+    Reproduce frames grabados como si llegaran del websocket.
+    
+    Args:
+        frames: Frames JSON
+        delay: Segundos entre frames
+    
+    Yields:
+        Cada frame
+    """
+    for frame in frames:
+        yield frame
+        await asyncio.sleep(delay)
+
+
+async def websocket_source(
+    url: str = DEFAULT_STREAM_URL,
+    api_key_id: str = '',
+    api_secret_key: str = '',
+    trades: Sequence[str] = (),
+    bars: Sequence[str] = (),
+    reconnect_delay: Optional[float] = 1.0,
+    max_queue: int = 64
+) -> AsyncIterator[RawMessage]:
+    """
+    Lee frames del websocket de datos de Alpaca (autentica y se suscribe).
+    
+    Requiere ``websockets``. ``max_queue`` limita los frames que la
+    librería acumula sin leer: cuando la pipeline va atrasada se deja de
+    leer del socket y TCP frena al servidor.
+    
+    Args:
+        url: URL del stream
+        api_key_id: API Key ID
+        api_secret_key: API Secret Key
+        trades: Símbolos de los que recibir trades
+        bars: Símbolos de los que recibir barras de 1 minuto
+        reconnect_delay: Segundos antes de reconectar (None = no reconectar)
+        max_queue: Frames recibidos y no leídos como máximo
+    
+    Yields:
+        Frames JSON de datos y control
+    """
+    import websockets
+    
+    subscribe = {'action': 'subscribe'}
+    if trades:
+        subscribe['trades'] = [validate_symbol(symbol) for symbol in trades]
+    if bars:
+        subscribe['bars'] = [validate_symbol(symbol) for symbol in bars]
+    
+    while True:
+        try:
+            async with websockets.connect(url, max_queue=max_queue) as socket:
+                await socket.send(json.dumps({'action': 'auth', 'key': api_key_id, 'secret': api_secret_key}))
+                await socket.send(json.dumps(subscribe))
+                async for frame in socket:
+                    yield frame
+            return
+        except (OSError, websockets.ConnectionClosedError):
+            if reconnect_delay is None:
+                raise
+            await asyncio.sleep(reconnect_delay)
+
+
+# Exportar para uso externo
+__all__ = [
+    'StreamPipeline',
+    'StreamStats',
+    'Subscription',
+    'ConsumerQueue',
+    'ConsumerStats',
+    'Trade',
+    'Bar',
+    'replay_source',
+    'websocket_source',
+    'parse_time_ns',
+    'QUEUE_POLICIES',
+    'DEFAULT_STREAM_URL',
+]
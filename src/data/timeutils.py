@@ -0,0 +1,110 @@
+"""
+Utilidades de tiempo compartidas por el cache, el almacén y el histórico.
+
+Los instantes se manejan como enteros de nanosegundos desde epoch (UTC) y
+los rangos son semiabiertos ``[inicio, fin)``. Un instante sin zona se
+interpreta como UTC.
+
+Example:
+    >>> start, end = normalize_range("2024-03-04", "2024-03-08")
+    >>> from_ns(start)
+    Timestamp('2024-03-04 00:00:00+0000', tz='UTC')
+"""
+
+from datetime import datetime, timedelta
+from typing import Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..utils.validators import DateValidationError, MarketDataValidationError, validate_date_range
+
+
+TimeBound = Union[str, datetime, pd.Timestamp]
+
+
+def to_ns(value: Union[datetime, pd.Timestamp]) -> int:
+    """Convierte un instante a ns desde epoch (sin zona = UTC)."""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize('UTC')
+    return int(ts.as_unit('ns').value)
+
+
+def from_ns(value: int) -> pd.Timestamp:
+    """Convierte ns desde epoch a Timestamp UTC."""
+    return pd.Timestamp(value, unit='ns', tz='UTC')
+
+
+def normalize_range(start: TimeBound, end: TimeBound) -> Tuple[int, int]:
+    """
+    Convierte un rango a ns [inicio, fin).
+    
+    Args:
+        start: Fecha "AAAA-MM-DD" o instante inicial
+        end: Fecha "AAAA-MM-DD" (inclusiva) o instante final (exclusivo)
+    
+    Returns:
+        Tupla (inicio, fin) en ns desde epoch (UTC)
+    
+    Raises:
+        DateValidationError: Si las fechas o el rango no son válidos
+    """
+    if isinstance(start, str) and isinstance(end, str):
+        start_dt, end_dt = validate_date_range(start, end)
+        return to_ns(start_dt), to_ns(end_dt + timedelta(days=1))
+    
+    start_ns, end_ns = to_ns(start), to_ns(end)
+    if start_ns >= end_ns:
+        raise DateValidationError(f"El inicio ({start}) debe ser anterior al fin ({end})")
+    return start_ns, end_ns
+
+
+def index_ns(frame: pd.DataFrame) -> np.ndarray:
+    """
+    Timestamps del índice en ns (UTC).
+    
+    Raises:
+        MarketDataValidationError: Si el índice no es un DatetimeIndex
+    """
+    index = frame.index
+    if not isinstance(index, pd.DatetimeIndex):
+        raise MarketDataValidationError("Los datos deben tener DatetimeIndex")
+    if index.tz is None:
+        index = index.tz_localize('UTC')
+    return index.as_unit('ns').asi8
+
+
+def slice_ns(frame: pd.DataFrame, start: int, end: int) -> pd.DataFrame:
+    """Filas con timestamp en [start, end) (índice ordenado)."""
+    if not len(frame):
+        return frame
+    keys = index_ns(frame)
+    lo, hi = np.searchsorted(keys, [start, end], side='left')
+    return frame.iloc[lo:hi]
+
+
+def normalize_frame(frame: pd.DataFrame, start: int, end: int) -> pd.DataFrame:
+    """Ordena, pasa a UTC y recorta a [start, end) los datos descargados."""
+    if not len(frame):
+        return frame
+    index_ns(frame)
+    if frame.index.tz is None:
+        frame = frame.tz_localize('UTC')
+    elif str(frame.index.tz) != 'UTC':
+        frame = frame.tz_convert('UTC')
+    if not frame.index.is_monotonic_increasing:
+        frame = frame.sort_index()
+    return slice_ns(frame, start, end)
+
+
+# Exportar para uso externo
+__all__ = [
+    'TimeBound',
+    'to_ns',
+    'from_ns',
+    'normalize_range',
+    'index_ns',
+    'slice_ns',
+    'normalize_frame',
+]
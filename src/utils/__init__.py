@@ -1,51 +1,151 @@
-"""Módulo de utilidades del Trading Bot."""
+"""
+Módulo de utilidades del Trading Bot.
+
+Los submódulos se importan de forma diferida (PEP 562): ``from src.utils
+import validate_symbol`` solo carga ``validators``, sin arrastrar
+Pydantic, PyYAML, dotenv, numpy ni pandas. Cada nombre se importa la
+primera vez que se accede y queda cacheado en el paquete.
+"""
+
+import importlib
+
+# Nombre exportado -> submódulo que lo define
+_LAZY_IMPORTS = {
+    # config
+    'get_config': 'config',
+    'ConfigManager': 'config',
+    'ConfigWatcher': 'config',
+    'TradingBotConfig': 'config',
+    'AppConfig': 'config',
+    'DataConfig': 'config',
+    'BrokerConfig': 'config',
+    'TradingConfig': 'config',
+    'RiskConfig': 'config',
+    'LoggingConfig': 'config',
+    'DatabaseConfig': 'config',
+    'Environment': 'config',
+    # shared_config
+    'SharedConfigPublisher': 'shared_config',
+    'SharedConfigReader': 'shared_config',
+    'attach_shared_config': 'shared_config',
+    # logger
+    'get_logger': 'logger',
+    'StructuredLogger': 'logger',
+    'JsonFormatter': 'logger',
+    'FastJsonFormatter': 'logger',
+    'log_with_context': 'logger',
+    # async_logging
+    'OverflowPolicy': 'async_logging',
+    'AsyncLogQueue': 'async_logging',
+    'AsyncQueueHandler': 'async_logging',
+    'BatchQueueListener': 'async_logging',
+    # log_sampling
+    'SampleFilter': 'log_sampling',
+    'RateLimitFilter': 'log_sampling',
+    'FirstKFilter': 'log_sampling',
+    # log_context
+    'bind_context': 'log_context',
+    'unbind_context': 'log_context',
+    'clear_context': 'log_context',
+    'submit_with_context': 'log_context',
+    # log_ring
+    'RingBufferHandler': 'log_ring',
+    'install_crash_handlers': 'log_ring',
+    # log_rotation
+    'SessionRotatingFileHandler': 'log_rotation',
+    'RotatedLogMaintainer': 'log_rotation',
+    # log_query
+    'query_logs': 'log_query',
+    'build_index': 'log_query',
+    # event_sink
+    'ColumnarEventSink': 'event_sink',
+    'get_event_sink': 'event_sink',
+    'record_order': 'event_sink',
+    'read_events': 'event_sink',
+    # validators
+    'ValidationError': 'validators',
+    'SymbolValidationError': 'validators',
+    'OrderValidationError': 'validators',
+    'DateValidationError': 'validators',
+    'PercentageValidationError': 'validators',
+    'ConfigValidationError': 'validators',
+    'MarketDataValidationError': 'validators',
+    'OrderErrorCode': 'validators',
+    'SymbolErrorCode': 'validators',
+    'DateErrorCode': 'validators',
+    'PercentageErrorCode': 'validators',
+    'ConfigErrorCode': 'validators',
+    'ValueErrorCode': 'validators',
+    'OHLCVErrorCode': 'validators',
+    'raise_for_code': 'validators',
+    'collect_errors': 'validators',
+    'validate_symbol': 'validators',
+    'validate_symbols_list': 'validators',
+    'validate_order_side': 'validators',
+    'validate_quantity': 'validators',
+    'validate_price': 'validators',
+    'validate_order_type': 'validators',
+    'validate_date': 'validators',
+    'validate_date_range': 'validators',
+    'validate_timeframe': 'validators',
+    'validate_percentage': 'validators',
+    'validate_range': 'validators',
+    'validate_api_key': 'validators',
+    'validate_url': 'validators',
+    'validate_positive_integer': 'validators',
+    'check_symbol': 'validators',
+    'check_order_side': 'validators',
+    'check_quantity': 'validators',
+    'check_price': 'validators',
+    'check_order_type': 'validators',
+    'check_date': 'validators',
+    'check_date_range': 'validators',
+    'check_timeframe': 'validators',
+    'check_percentage': 'validators',
+    'check_range': 'validators',
+    'check_api_key': 'validators',
+    'check_url': 'validators',
+    'check_positive_integer': 'validators',
+    # symbols
+    'SymbolFormat': 'symbols',
+    'SymbolUniverse': 'symbols',
+    'validate_symbol_format': 'symbols',
+    # batch_validators
+    'BatchValidationResult': 'batch_validators',
+    'validate_orders_batch': 'batch_validators',
+    'validate_dates_bulk': 'batch_validators',
+    'validate_date_ranges_bulk': 'batch_validators',
+    # ohlcv_validators
+    'OHLCVValidationReport': 'ohlcv_validators',
+    'validate_ohlcv_frame': 'ohlcv_validators',
+    # timeframes
+    'Timeframe': 'timeframes',
+    'TimeframeUnit': 'timeframes',
+    'parse_timeframe': 'timeframes',
+}
+
+
+def __getattr__(name: str):
+    """Importa el submódulo que define ``name`` al primer acceso."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Incluye los nombres diferidos en ``dir()`` y el autocompletado."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-from .config import (
-    get_config,
-    ConfigManager,
-    TradingBotConfig,
-    AppConfig,
-    DataConfig,
-    BrokerConfig,
-    TradingConfig,
-    RiskConfig,
-    LoggingConfig,
-    DatabaseConfig,
-    Environment,
-)
-from .logger import (
-    get_logger,
-    StructuredLogger,
-    JsonFormatter,
-    log_with_context,
-)
-from .validators import (
-    ValidationError,
-    SymbolValidationError,
-    OrderValidationError,
-    DateValidationError,
-    PercentageValidationError,
-    ConfigValidationError,
-    validate_symbol,
-    validate_symbols_list,
-    validate_order_side,
-    validate_quantity,
-    validate_price,
-    validate_order_type,
-    validate_date,
-    validate_date_range,
-    validate_timeframe,
-    validate_percentage,
-    validate_range,
-    validate_api_key,
-    validate_url,
-    validate_positive_integer,
-)
 
 __all__ = [
     # Config
     'get_config',
     'ConfigManager',
+    'ConfigWatcher',
     'TradingBotConfig',
     'AppConfig',
     'DataConfig',
@@ -55,11 +155,37 @@ __all__ = [
     'LoggingConfig',
     'DatabaseConfig',
     'Environment',
+    'SharedConfigPublisher',
+    'SharedConfigReader',
+    'attach_shared_config',
     # Logger
     'get_logger',
     'StructuredLogger',
     'JsonFormatter',
+    'FastJsonFormatter',
     'log_with_context',
+    'OverflowPolicy',
+    'AsyncLogQueue',
+    'AsyncQueueHandler',
+    'BatchQueueListener',
+    'SampleFilter',
+    'RateLimitFilter',
+    'FirstKFilter',
+    'bind_context',
+    'unbind_context',
+    'clear_context',
+    'submit_with_context',
+    'RingBufferHandler',
+    'install_crash_handlers',
+    'SessionRotatingFileHandler',
+    'RotatedLogMaintainer',
+    'query_logs',
+    'build_index',
+    # Eventos
+    'ColumnarEventSink',
+    'get_event_sink',
+    'record_order',
+    'read_events',
     # Validators - Exceptions
     'ValidationError',
     'SymbolValidationError',
@@ -67,6 +193,14 @@ __all__ = [
     'DateValidationError',
     'PercentageValidationError',
     'ConfigValidationError',
+    'MarketDataValidationError',
+    'OrderErrorCode',
+    'SymbolErrorCode',
+    'DateErrorCode',
+    'PercentageErrorCode',
+    'ConfigErrorCode',
+    'ValueErrorCode',
+    'OHLCVErrorCode',
     # Validators - Functions
     'validate_symbol',
     'validate_symbols_list',
@@ -82,4 +216,35 @@ __all__ = [
     'validate_api_key',
     'validate_url',
     'validate_positive_integer',
+    # Validators - Sin excepciones
+    'raise_for_code',
+    'collect_errors',
+    'check_symbol',
+    'check_order_side',
+    'check_quantity',
+    'check_price',
+    'check_order_type',
+    'check_date',
+    'check_date_range',
+    'check_timeframe',
+    'check_percentage',
+    'check_range',
+    'check_api_key',
+    'check_url',
+    'check_positive_integer',
+    # Validators - Symbol universe
+    'SymbolFormat',
+    'SymbolUniverse',
+    'validate_symbol_format',
+    # Validators - Batch
+    'BatchValidationResult',
+    'validate_orders_batch',
+    'validate_dates_bulk',
+    'validate_date_ranges_bulk',
+    'OHLCVValidationReport',
+    'validate_ohlcv_frame',
+    # Timeframes
+    'Timeframe',
+    'TimeframeUnit',
+    'parse_timeframe',
 ]
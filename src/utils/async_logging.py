@@ -0,0 +1,381 @@
+"""
+Logging asíncrono por cola para el Trading Bot.
+
+En modo asíncrono los loggers solo encolan el ``LogRecord`` (sin
+formatear) en una cola acotada; un hilo de fondo formatea los registros y
+los escribe por lotes, con un único ``write``/``flush`` por handler y lote.
+Así el bucle de trading no espera por el JSON, el disco ni la rotación.
+
+Cuando la cola está llena se aplica una política de desbordamiento:
+
+- ``block``: el llamador espera a que haya hueco (no se pierde nada)
+- ``drop-debug``: se descartan los registros DEBUG; el resto espera
+- ``drop-oldest``: se descarta el registro más antiguo de la cola
+
+Los descartes se cuentan y se notifican con un WARNING en el siguiente lote.
+
+Example:
+    >>> queue = AsyncLogQueue(maxsize=10000, overflow_policy='drop-oldest')
+    >>> listener = BatchQueueListener(queue)
+    >>> listener.start()
+    >>> logger.addHandler(AsyncQueueHandler(queue, [logging.StreamHandler()]))
+    >>> listener.stop()  # Vacía la cola y hace flush
+"""
+
+import logging
+import logging.handlers
+import threading
+from collections import deque
+from enum import Enum
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+
+class OverflowPolicy(str, Enum):
+    """Políticas de desbordamiento de la cola de logs."""
+    BLOCK = "block"
+    DROP_DEBUG = "drop-debug"
+    DROP_OLDEST = "drop-oldest"
+
+
+# Métodos emit() que se pueden sustituir por una escritura por lotes
+_BATCHABLE_EMITS = (
+    logging.StreamHandler.emit,
+    logging.FileHandler.emit,
+    logging.handlers.BaseRotatingHandler.emit,
+)
+
+
+class AsyncLogQueue:
+    """
+    Cola acotada de registros con política de desbordamiento.
+    
+    Example:
+        >>> queue = AsyncLogQueue(maxsize=1000, overflow_policy='drop-debug')
+        >>> queue.put(handler, record)
+    """
+    
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        overflow_policy: Union[OverflowPolicy, str] = OverflowPolicy.BLOCK
+    ):
+        """
+        Inicializa la cola.
+        
+        Args:
+            maxsize: Número máximo de registros encolados
+            overflow_policy: Política al llenarse la cola
+        
+        Raises:
+            ValueError: Si el tamaño no es positivo o la política es inválida
+        """
+        if maxsize < 1:
+            raise ValueError(f"El tamaño de la cola debe ser positivo, recibido: {maxsize}")
+        
+        self.maxsize = maxsize
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.dropped = 0
+        self._items: deque = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._closed = False
+    
+    def put(self, handler: 'AsyncQueueHandler', record: logging.LogRecord) -> bool:
+        """
+        Encola un registro aplicando la política de desbordamiento.
+        
+        Args:
+            handler: Handler que emite el registro (define los destinos)
+            record: Registro sin formatear
+        
+        Returns:
+            True si el registro se encoló
+        """
+        with self._lock:
+            while len(self._items) >= self.maxsize and not self._closed:
+                if self.overflow_policy is OverflowPolicy.DROP_OLDEST:
+                    self._items.popleft()
+                    self.dropped += 1
+                    break
+                if self.overflow_policy is OverflowPolicy.DROP_DEBUG and record.levelno < logging.INFO:
+                    self.dropped += 1
+                    return False
+                self._not_full.wait()
+            
+            if self._closed:
+                return False
+            
+            self._items.append((handler, record))
+            self._not_empty.notify()
+            return True
+    
+    def get_batch(
+        self,
+        max_items: int,
+        timeout: Optional[float] = None
+    ) -> List[Tuple['AsyncQueueHandler', logging.LogRecord]]:
+        """
+        Extrae hasta ``max_items`` registros, esperando si la cola está vacía.
+        
+        Args:
+            max_items: Tamaño máximo del lote
+            timeout: Segundos máximos de espera (None = sin límite)
+        
+        Returns:
+            Lote de pares (handler, registro), vacío si se agotó la espera
+            o la cola está cerrada y vacía
+        """
+        with self._lock:
+            if not self._items and not self._closed:
+                self._not_empty.wait(timeout)
+            
+            count = min(max_items, len(self._items))
+            batch = [self._items.popleft() for _ in range(count)]
+            if batch:
+                self._not_full.notify_all()
+            return batch
+    
+    def take_dropped(self) -> int:
+        """Devuelve y reinicia el contador de registros descartados."""
+        with self._lock:
+            dropped, self.dropped = self.dropped, 0
+            return dropped
+    
+    def close(self) -> None:
+        """Cierra la cola: despierta a los que esperan y rechaza nuevos registros."""
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+    
+    @property
+    def closed(self) -> bool:
+        """True si la cola está cerrada."""
+        return self._closed
+    
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class AsyncQueueHandler(logging.Handler):
+    """
+    Handler que encola los registros para un ``BatchQueueListener``.
+    
+    Los ``targets`` (consola, archivo...) son los handlers que escriben
+    realmente; el listener los usa en su hilo. El registro se encola sin
+    formatear, así que sus ``args`` no deben modificarse tras el log.
+    """
+    
+    def __init__(self, queue: AsyncLogQueue, targets: Sequence[logging.Handler]):
+        """
+        Inicializa el handler.
+        
+        Args:
+            queue: Cola compartida con el listener
+            targets: Handlers de destino
+        """
+        super().__init__()
+        self.queue = queue
+        self.targets = tuple(targets)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Encola el registro (sin formatear) en la cola."""
+        try:
+            self.queue.put(self, record)
+        except Exception:
+            self.handleError(record)
+    
+    def close(self) -> None:
+        """Cierra los handlers de destino."""
+        for target in self.targets:
+            target.close()
+        super().close()
+
+
+class BatchQueueListener:
+    """
+    Hilo de fondo que vacía una ``AsyncLogQueue`` y escribe por lotes.
+    
+    Example:
+        >>> listener = BatchQueueListener(queue, batch_size=256)
+        >>> listener.start()
+        >>> listener.stop()
+    """
+    
+    def __init__(
+        self,
+        queue: AsyncLogQueue,
+        batch_size: int = 256,
+        flush_interval: float = 0.5
+    ):
+        """
+        Inicializa el listener.
+        
+        Args:
+            queue: Cola a consumir
+            batch_size: Máximo de registros por lote
+            flush_interval: Segundos máximos de espera por nuevos registros
+        """
+        self.queue = queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def is_running(self) -> bool:
+        """True si el hilo del listener está activo."""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """Inicia el hilo del listener (daemon)."""
+        if self.is_running:
+            return
+        
+        self._thread = threading.Thread(
+            target=self._run,
+            name='AsyncLogListener',
+            daemon=True
+        )
+        self._thread.start()
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Cierra la cola, escribe los registros pendientes y detiene el hilo.
+        
+        Args:
+            timeout: Segundos máximos de espera (None = sin límite)
+        """
+        self.queue.close()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                return
+            self._thread = None
+        # Si el hilo no llegó a arrancar, se vacía aquí
+        self._drain()
+    
+    def _run(self) -> None:
+        """Bucle principal del listener."""
+        while not self.queue.closed:
+            self._process(self.queue.get_batch(self.batch_size, self.flush_interval))
+        self._drain()
+    
+    def _drain(self) -> None:
+        """Escribe todos los registros que queden en la cola."""
+        while True:
+            batch = self.queue.get_batch(self.batch_size, timeout=0)
+            if not batch:
+                break
+            self._process(batch)
+    
+    def _process(self, batch: List[Tuple[AsyncQueueHandler, logging.LogRecord]]) -> None:
+        """
+        Escribe un lote agrupando los registros por destino.
+        
+        Args:
+            batch: Pares (handler, registro) en orden de llegada
+        """
+        if not batch:
+            return
+        
+        groups: Dict[AsyncQueueHandler, List[logging.LogRecord]] = {}
+        for handler, record in batch:
+            groups.setdefault(handler, []).append(record)
+        
+        # El aviso de descartes va con el primer destino del lote
+        dropped = self.queue.take_dropped()
+        if dropped:
+            records = next(iter(groups.values()))
+            records.append(_dropped_record(dropped, records[0].name))
+        
+        for handler, records in groups.items():
+            for target in handler.targets:
+                emit_batch(target, records)
+
+
+def _dropped_record(dropped: int, name: str) -> logging.LogRecord:
+    """Crea el aviso de registros descartados por desbordamiento."""
+    return logging.LogRecord(
+        name=name,
+        level=logging.WARNING,
+        pathname=__file__,
+        lineno=0,
+        msg="Cola de logs llena: se descartaron %d registros",
+        args=(dropped,),
+        exc_info=None
+    )
+
+
+def emit_batch(handler: logging.Handler, records: Sequence[logging.LogRecord]) -> None:
+    """
+    Escribe un lote de registros en un handler.
+    
+    Para los handlers de stream y archivo estándar (incluida la rotación por
+    tamaño) formatea todo el lote y hace un solo ``flush``; el resto de
+    handlers recibe los registros uno a uno con ``handle()``.
+    
+    Args:
+        handler: Handler de destino
+        records: Registros a escribir
+    """
+    if type(handler).emit not in _BATCHABLE_EMITS:
+        for record in records:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return
+    
+    size_limited = (
+        isinstance(handler, logging.handlers.RotatingFileHandler) and handler.maxBytes > 0
+    )
+    rotating = isinstance(handler, logging.handlers.BaseRotatingHandler)
+    
+    handler.acquire()
+    try:
+        stream = _open_stream(handler)
+        if stream is None:
+            return
+        position = stream.tell() if size_limited else 0
+        
+        for record in records:
+            if record.levelno < handler.level or not handler.filter(record):
+                continue
+            try:
+                msg = handler.format(record) + handler.terminator
+                
+                if size_limited:
+                    # Igual que shouldRollover() pero sin formatear dos veces
+                    if position and position + len(msg) >= handler.maxBytes:
+                        handler.doRollover()
+                        stream = _open_stream(handler)
+                        position = 0
+                    position += len(msg)
+                elif rotating and handler.shouldRollover(record):
+                    handler.doRollover()
+                    stream = _open_stream(handler)
+                
+                stream.write(msg)
+            except Exception:
+                handler.handleError(record)
+        
+        handler.flush()
+    finally:
+        handler.release()
+
+
+def _open_stream(handler: logging.StreamHandler):
+    """Devuelve el stream del handler, abriéndolo si es un archivo diferido."""
+    if isinstance(handler, logging.FileHandler) and handler.stream is None:
+        if handler.mode != 'w' or not handler._closed:
+            handler.stream = handler._open()
+    return handler.stream
+
+
+# Exportar para uso externo
+__all__ = [
+    'OverflowPolicy',
+    'AsyncLogQueue',
+    'AsyncQueueHandler',
+    'BatchQueueListener',
+    'emit_batch',
+]
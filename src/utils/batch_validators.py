@@ -0,0 +1,502 @@
+"""
+Validadores vectorizados por lotes para el Trading Bot.
+
+Este módulo valida columnas completas (NumPy/pandas) en una sola pasada,
+sin lanzar excepciones por cada fila inválida. Cada fila recibe una
+máscara de bits con los códigos de error (ver ``OrderErrorCode`` y
+``DateErrorCode``), de modo que un rebalanceo de miles de órdenes o
+millones de fechas de un histórico se validan en milisegundos.
+
+Las reglas son las mismas que aplican los validadores escalares de
+``src.utils.validators`` (que siguen siendo la API para valores sueltos),
+salvo que en una columna de cantidades un float finito sin decimales
+cuenta como entero: pandas convierte a float64 la columna entera en
+cuanto falta un valor.
+
+Example:
+    >>> import pandas as pd
+    >>> from src.utils.batch_validators import validate_orders_batch
+    >>> orders = pd.DataFrame({
+    ...     'side': ['BUY', 'sell', 'hold'],
+    ...     'qty': [100, 0, 10],
+    ...     'price': [150.5, 20.0, 10.0],
+    ... })
+    >>> result = validate_orders_batch(orders)
+    >>> result.valid.tolist()
+    [True, False, False]
+"""
+
+from dataclasses import dataclass
+from enum import IntFlag
+from typing import Any, List, Mapping, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+import pandas as pd
+
+from .validators import (
+    DateErrorCode,
+    OrderErrorCode,
+    VALID_ORDER_SIDES,
+    VALID_ORDER_TYPES,
+)
+
+
+OrdersInput = Union[pd.DataFrame, Mapping[str, Any]]
+DatesInput = Union[Sequence[Any], np.ndarray, pd.Series, pd.Index]
+
+# Columnas reconocidas en un lote de órdenes
+ORDER_COLUMNS = ('side', 'qty', 'price', 'order_type')
+
+# dtype de la máscara de errores (suficiente para todos los códigos)
+ERROR_MASK_DTYPE = np.uint16
+
+# Formato especial: detectar ISO-8601 (fechas, fecha-hora y offsets)
+ISO8601 = 'ISO8601'
+
+# Formatos ISO-8601 de ancho fijo parseables con numpy.datetime64: unidad
+ISO_FIXED_FORMATS = {
+    '%Y-%m-%d': 'D',
+    '%Y-%m-%dT%H:%M:%S': 's',
+    '%Y-%m-%d %H:%M:%S': 's',
+    '%Y-%m-%dT%H:%M:%SZ': 's',
+}
+
+# Primera fecha válida para ``datetime`` (numpy y pandas aceptan el año 0)
+_MIN_DATE_US = np.datetime64('0001-01-01', 'us').astype(np.int64)
+
+
+@dataclass(frozen=True)
+class BatchValidationResult:
+    """
+    Resultado de validar un lote (órdenes o fechas).
+    
+    Attributes:
+        codes: Máscara de errores por fila (códigos de ``code_type`` combinados)
+        normalized: Valores normalizados (órdenes con side/order_type en
+            minúsculas y precio redondeado; fechas parseadas)
+        code_type: Familia de códigos de error de la máscara
+    """
+    
+    codes: np.ndarray
+    normalized: pd.DataFrame
+    code_type: Type[IntFlag] = OrderErrorCode
+    
+    @property
+    def valid(self) -> np.ndarray:
+        """Máscara booleana de filas válidas."""
+        return self.codes == 0
+    
+    @property
+    def invalid_count(self) -> int:
+        """Número de filas con al menos un error."""
+        return int(np.count_nonzero(self.codes))
+    
+    @property
+    def all_valid(self) -> bool:
+        """True si todas las filas son válidas."""
+        return not self.codes.any()
+    
+    def reasons(self, row: int) -> List[str]:
+        """
+        Decodifica los errores de una fila.
+        
+        Args:
+            row: Posición de la fila
+        
+        Returns:
+            Nombres de los códigos de error activos
+        """
+        return decode_error_mask(int(self.codes[row]), self.code_type)
+    
+    def errors(self) -> pd.DataFrame:
+        """
+        Obtiene las filas inválidas con su código y motivos.
+        
+        Returns:
+            DataFrame con las órdenes inválidas y columnas
+            ``error_code`` y ``reasons``
+        """
+        mask = self.codes != 0
+        invalid = self.normalized.loc[mask].copy()
+        invalid_codes = self.codes[mask]
+        invalid['error_code'] = invalid_codes
+        invalid['reasons'] = [decode_error_mask(int(c), self.code_type) for c in invalid_codes]
+        return invalid
+
+
+def decode_error_mask(mask: int, code_type: Type[IntFlag] = OrderErrorCode) -> List[str]:
+    """
+    Convierte una máscara de bits en nombres de códigos de error.
+    
+    Args:
+        mask: Máscara de códigos de error
+        code_type: Familia de códigos (OrderErrorCode por defecto)
+    
+    Returns:
+        Lista de nombres (vacía si la máscara es 0)
+    
+    Example:
+        >>> decode_error_mask(OrderErrorCode.EMPTY_SIDE | OrderErrorCode.QTY_BELOW_MIN)
+        ['EMPTY_SIDE', 'QTY_BELOW_MIN']
+    """
+    return [code.name for code in code_type if code and mask & code]
+
+
+# ============================================================================
+# Reglas vectorizadas por columna
+# ============================================================================
+
+def _check_choice_column(
+    values: pd.Series,
+    choices: Sequence[str],
+    empty_code: OrderErrorCode,
+    invalid_code: OrderErrorCode,
+) -> Tuple[np.ndarray, pd.Series]:
+    """Valida una columna de texto contra un conjunto de opciones."""
+    values = values.astype(object)
+    empty = (values.isna() | (values == '')).to_numpy()
+    normalized = values.str.strip().str.lower()
+    invalid = ~empty & ~normalized.isin(choices).to_numpy()
+    
+    codes = np.zeros(len(values), dtype=ERROR_MASK_DTYPE)
+    codes[empty] |= ERROR_MASK_DTYPE(empty_code)
+    codes[invalid] |= ERROR_MASK_DTYPE(invalid_code)
+    return codes, normalized.where(~empty, values)
+
+
+def _numeric_type_mask(values: np.ndarray, kinds: str, types: tuple) -> np.ndarray:
+    """Máscara de elementos con tipo numérico aceptado."""
+    if values.dtype.kind in kinds:
+        return np.ones(len(values), dtype=bool)
+    if values.dtype.kind == 'O':
+        return np.fromiter(
+            (isinstance(v, types) for v in values),
+            dtype=bool,
+            count=len(values)
+        )
+    return np.zeros(len(values), dtype=bool)
+
+
+def _is_integral(value: Any) -> bool:
+    """True si el valor es un entero o un float finito sin decimales."""
+    if isinstance(value, (int, np.integer)):
+        return True
+    return isinstance(value, (float, np.floating)) and float(value).is_integer()
+
+
+def _integral_mask(values: np.ndarray) -> np.ndarray:
+    """
+    Máscara de elementos enteros.
+    
+    Un solo valor ausente convierte la columna a float64 (o a object con
+    ``None``): los floats finitos sin decimales se aceptan como enteros,
+    elemento a elemento.
+    """
+    kind = values.dtype.kind
+    if kind in 'iub':
+        return np.ones(len(values), dtype=bool)
+    if kind == 'f':
+        with np.errstate(invalid='ignore'):
+            return np.isfinite(values) & (values == np.trunc(values))
+    if kind == 'O':
+        return np.fromiter((_is_integral(v) for v in values), dtype=bool, count=len(values))
+    return np.zeros(len(values), dtype=bool)
+
+
+def _check_quantity_column(values: pd.Series, min_qty: int) -> np.ndarray:
+    """Valida una columna de cantidades (enteros >= min_qty; NaN/None -> MISSING_QTY)."""
+    raw = values.to_numpy()
+    missing = np.asarray(pd.isna(raw), dtype=bool)
+    type_ok = _integral_mask(raw) & ~missing
+    numeric = np.where(type_ok, raw, min_qty).astype(np.int64)
+    
+    codes = np.zeros(len(raw), dtype=ERROR_MASK_DTYPE)
+    codes[missing] |= ERROR_MASK_DTYPE(OrderErrorCode.MISSING_QTY)
+    codes[~type_ok & ~missing] |= ERROR_MASK_DTYPE(OrderErrorCode.INVALID_QTY_TYPE)
+    codes[type_ok & (numeric < min_qty)] |= ERROR_MASK_DTYPE(OrderErrorCode.QTY_BELOW_MIN)
+    return codes
+
+
+def _check_price_column(
+    values: pd.Series,
+    min_price: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Valida una columna de precios (numéricos >= min_price; NaN/None -> MISSING_PRICE)."""
+    raw = values.to_numpy()
+    missing = np.asarray(pd.isna(raw), dtype=bool)
+    type_ok = _numeric_type_mask(raw, 'iufb', (int, float, np.number)) & ~missing
+    numeric = np.where(type_ok, raw, min_price).astype(np.float64)
+    
+    codes = np.zeros(len(raw), dtype=ERROR_MASK_DTYPE)
+    codes[missing] |= ERROR_MASK_DTYPE(OrderErrorCode.MISSING_PRICE)
+    codes[~type_ok & ~missing] |= ERROR_MASK_DTYPE(OrderErrorCode.INVALID_PRICE_TYPE)
+    codes[type_ok & (numeric < min_price)] |= ERROR_MASK_DTYPE(OrderErrorCode.PRICE_BELOW_MIN)
+    return codes, np.round(numeric, 2)
+
+
+def _iso_layout(date_format: str) -> str:
+    """Plantilla de caracteres de un formato fijo (ej. '0000-00-00T00:00:00Z')."""
+    for directive, digits in (('%Y', '0000'), ('%m', '00'), ('%d', '00'),
+                              ('%H', '00'), ('%M', '00'), ('%S', '00')):
+        date_format = date_format.replace(directive, digits)
+    return date_format
+
+
+def _parse_iso_fixed(uniques: np.ndarray, date_format: str) -> Optional[np.ndarray]:
+    """
+    Ruta rápida ISO-8601: parsea strings de ancho fijo con ``numpy.datetime64``.
+    
+    Devuelve los timestamps en µs (int64) o None si algún valor no encaja
+    exactamente en el formato, en cuyo caso se usa el parser de pandas.
+    """
+    text = uniques.astype('U')
+    width = text.dtype.itemsize // 4
+    
+    if date_format == ISO8601:
+        # Detectar el formato por el ancho (todas las fechas iguales)
+        candidates = [f for f in ISO_FIXED_FORMATS if len(_iso_layout(f)) == width]
+    else:
+        candidates = [date_format] if date_format in ISO_FIXED_FORMATS else []
+    
+    if not candidates or not len(text) or (np.char.str_len(text) != width).any():
+        return None
+    
+    chars = text.view(np.uint32).reshape(len(text), width)
+    
+    for candidate in candidates:
+        layout = _iso_layout(candidate)
+        literals = [(i, ord(c)) for i, c in enumerate(layout) if c != '0']
+        if not all((chars[:, i] == c).all() for i, c in literals):
+            continue
+        
+        # numpy valida dígitos y rangos (mes 13, 30 de febrero, ...)
+        core = len(layout.rstrip('Z'))
+        try:
+            parsed = np.ascontiguousarray(chars[:, :core]).view(f'U{core}').ravel().astype(
+                f'datetime64[{ISO_FIXED_FORMATS[candidate]}]'
+            )
+        except ValueError:
+            return None
+        
+        return parsed.astype('datetime64[us]').view(np.int64)
+    
+    return None
+
+
+def _parse_date_column(
+    values: DatesInput,
+    date_format: str
+) -> Tuple[np.ndarray, pd.DatetimeIndex]:
+    """
+    Parsea una columna de fechas en string de forma vectorizada.
+    
+    Cada fecha distinta se parsea una sola vez (``pd.factorize``), con
+    ``numpy.datetime64`` si todas encajan en un formato ISO-8601 de ancho
+    fijo o con el parser en C de pandas en otro caso, y el resultado se
+    expande a todas las filas. Solo se aceptan strings, igual que
+    ``validate_date``.
+    """
+    raw = np.asarray(values, dtype=object).ravel()
+    positions, uniques = pd.factorize(raw, use_na_sentinel=True)
+    uniques = np.asarray(uniques, dtype=object)
+    
+    # Tipo y vacíos se evalúan sobre los valores únicos (memoización)
+    if pd.api.types.infer_dtype(uniques, skipna=False) in ('string', 'empty'):
+        is_empty = uniques == ''
+        parseable = ~is_empty
+    else:
+        is_string = np.fromiter((isinstance(v, str) for v in uniques), dtype=bool, count=len(uniques))
+        is_empty = np.fromiter((not v for v in uniques), dtype=bool, count=len(uniques))
+        parseable = is_string & ~is_empty
+    
+    candidates = uniques[parseable]
+    parsed_us = _parse_iso_fixed(candidates, date_format)
+    
+    if parsed_us is None:
+        parsed_us = pd.to_datetime(
+            pd.Index(candidates, dtype=object),
+            format=date_format,
+            errors='coerce',
+            utc=date_format == ISO8601
+        ).as_unit('us').asi8
+    
+    # Microsegundos: mismo rango (años 1-9999) y resolución que datetime
+    nat = np.iinfo(np.int64).min
+    unique_us = np.full(len(uniques), nat, dtype=np.int64)
+    unique_us[parseable] = parsed_us
+    unique_us[unique_us < _MIN_DATE_US] = nat
+    
+    unique_codes = np.zeros(len(uniques), dtype=ERROR_MASK_DTYPE)
+    unique_codes[is_empty] = ERROR_MASK_DTYPE(DateErrorCode.EMPTY_DATE)
+    unique_codes[~is_empty & (unique_us == nat)] = ERROR_MASK_DTYPE(DateErrorCode.INVALID_DATE)
+    
+    # Expandir a todas las filas: None/NaN (posición -1) toma el último
+    # elemento, un centinela vacío
+    unique_codes = np.append(unique_codes, ERROR_MASK_DTYPE(DateErrorCode.EMPTY_DATE))
+    unique_us = np.append(unique_us, nat)
+    
+    dates = pd.DatetimeIndex(unique_us[positions].view('datetime64[us]'))
+    if date_format == ISO8601:
+        dates = dates.tz_localize('UTC')
+    return unique_codes[positions], dates
+
+
+# ============================================================================
+# API pública
+# ============================================================================
+
+def validate_orders_batch(
+    orders: OrdersInput,
+    min_qty: int = 1,
+    min_price: float = 0.01
+) -> BatchValidationResult:
+    """
+    Valida un lote de órdenes de forma vectorizada.
+    
+    Acepta un DataFrame o un mapping de columnas (listas o arrays) con
+    cualquiera de las columnas ``side``, ``qty``, ``price`` y
+    ``order_type``. Las columnas ausentes no se validan (por ejemplo,
+    ``price`` en órdenes a mercado). Nunca lanza excepciones por filas
+    inválidas: los errores se reportan en la máscara ``codes``.
+    
+    Args:
+        orders: Órdenes a validar
+        min_qty: Cantidad mínima permitida
+        min_price: Precio mínimo permitido
+    
+    Returns:
+        BatchValidationResult con la máscara de errores por fila
+    
+    Example:
+        >>> result = validate_orders_batch({'qty': [10, -1], 'side': ['buy', '']})
+        >>> result.reasons(1)
+        ['EMPTY_SIDE', 'QTY_BELOW_MIN']
+    """
+    frame = orders if isinstance(orders, pd.DataFrame) else pd.DataFrame(orders)
+    normalized = frame.copy()
+    codes = np.zeros(len(frame), dtype=ERROR_MASK_DTYPE)
+    
+    if 'side' in frame:
+        side_codes, normalized['side'] = _check_choice_column(
+            frame['side'],
+            VALID_ORDER_SIDES,
+            OrderErrorCode.EMPTY_SIDE,
+            OrderErrorCode.INVALID_SIDE
+        )
+        codes |= side_codes
+    
+    if 'qty' in frame:
+        codes |= _check_quantity_column(frame['qty'], min_qty)
+    
+    if 'price' in frame:
+        price_codes, rounded = _check_price_column(frame['price'], min_price)
+        codes |= price_codes
+        normalized['price'] = np.where(price_codes == 0, rounded, frame['price'])
+    
+    if 'order_type' in frame:
+        type_codes, normalized['order_type'] = _check_choice_column(
+            frame['order_type'],
+            VALID_ORDER_TYPES,
+            OrderErrorCode.EMPTY_ORDER_TYPE,
+            OrderErrorCode.INVALID_ORDER_TYPE
+        )
+        codes |= type_codes
+    
+    return BatchValidationResult(codes=codes, normalized=normalized)
+
+
+def validate_dates_bulk(
+    dates: DatesInput,
+    date_format: Optional[str] = "%Y-%m-%d"
+) -> BatchValidationResult:
+    """
+    Valida y convierte millones de fechas en string de forma vectorizada.
+    
+    Equivalente a aplicar ``validate_date`` a cada elemento, pero sin
+    ``strptime`` por fila ni excepciones: las fechas repetidas se parsean
+    una sola vez y los errores se reportan en la máscara ``codes``
+    (``DateErrorCode``).
+    
+    Args:
+        dates: Secuencia, array o Series de fechas en string
+        date_format: Formato ``strptime`` de las fechas, o ``None``/``'ISO8601'``
+            para detectar ISO-8601 (fecha, fecha-hora y offsets). Con
+            ISO-8601 las fechas se devuelven en UTC; las que no tienen
+            offset se interpretan como UTC.
+    
+    Returns:
+        BatchValidationResult con la columna ``date`` (NaT si es inválida)
+    
+    Example:
+        >>> result = validate_dates_bulk(["2024-01-02", "2024-13-01", ""])
+        >>> [result.reasons(i) for i in range(3)]
+        [[], ['INVALID_DATE'], ['EMPTY_DATE']]
+    """
+    date_format = date_format or ISO8601
+    codes, parsed = _parse_date_column(dates, date_format)
+    
+    return BatchValidationResult(
+        codes=codes,
+        normalized=pd.DataFrame({'date': parsed}),
+        code_type=DateErrorCode
+    )
+
+
+def validate_date_ranges_bulk(
+    start_dates: DatesInput,
+    end_dates: DatesInput,
+    date_format: Optional[str] = "%Y-%m-%d"
+) -> BatchValidationResult:
+    """
+    Valida pares de fechas (inicio, fin) de forma vectorizada.
+    
+    Aplica las mismas reglas que ``validate_date_range`` a cada fila:
+    ambas fechas deben ser válidas y el inicio no puede ser posterior
+    al fin (``INVERTED_RANGE``).
+    
+    Args:
+        start_dates: Fechas de inicio
+        end_dates: Fechas de fin (misma longitud)
+        date_format: Formato de las fechas (ver ``validate_dates_bulk``)
+    
+    Returns:
+        BatchValidationResult con las columnas ``start`` y ``end``
+    
+    Raises:
+        ValueError: Si las secuencias tienen longitudes distintas
+    
+    Example:
+        >>> result = validate_date_ranges_bulk(["2024-01-01", "2024-06-01"], ["2024-12-31", "2024-01-01"])
+        >>> result.reasons(1)
+        ['INVERTED_RANGE']
+    """
+    date_format = date_format or ISO8601
+    start_codes, starts = _parse_date_column(start_dates, date_format)
+    end_codes, ends = _parse_date_column(end_dates, date_format)
+    
+    if len(starts) != len(ends):
+        raise ValueError(
+            f"Longitudes distintas: {len(starts)} inicios y {len(ends)} fines"
+        )
+    
+    codes = start_codes | end_codes
+    # NaT compara como False, así que solo se marcan pares válidos
+    codes[(codes == 0) & (starts > ends)] = ERROR_MASK_DTYPE(DateErrorCode.INVERTED_RANGE)
+    
+    return BatchValidationResult(
+        codes=codes,
+        normalized=pd.DataFrame({'start': starts, 'end': ends}),
+        code_type=DateErrorCode
+    )
+
+
+# Exportar para uso externo
+__all__ = [
+    'BatchValidationResult',
+    'ISO8601',
+    'ORDER_COLUMNS',
+    'decode_error_mask',
+    'validate_date_ranges_bulk',
+    'validate_dates_bulk',
+    'validate_orders_batch',
+]
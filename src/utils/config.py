@@ -6,6 +6,8 @@ Este módulo proporciona un sistema robusto de configuración que:
 - Carga desde múltiples fuentes (.env, YAML, variables de entorno)
 - Implementa Singleton pattern para acceso global
 - Proporciona type hints completos
+- Guarda un snapshot validado para arranques rápidos de procesos
+- Recarga en caliente sin locks en lectura (ver ``ConfigWatcher``)
 
 Example:
     >>> from src.utils.config import get_config
@@ -14,14 +16,47 @@ Example:
     'Trading Bot Híbrido'
 """
 
+import hashlib
+import logging
 import os
+import pickle
+import tempfile
+import threading
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, FrozenSet, Iterable, Optional, List, Tuple
 from enum import Enum
 
-import yaml
+import pydantic
 from pydantic import BaseModel, Field, validator, ValidationError
-from dotenv import load_dotenv
+from dotenv import dotenv_values
+
+from .async_logging import OverflowPolicy
+
+
+# Directorio de configuración del proyecto
+CONFIG_DIR = Path(__file__).parent.parent.parent / 'configs'
+
+# Snapshot serializado de la configuración ya validada
+CONFIG_SNAPSHOT_PATH = CONFIG_DIR / '.cache' / 'config_snapshot.pkl'
+
+# Variables de entorno que se combinan con el YAML (ver _merge_config)
+CONFIG_ENV_VARS = (
+    'ALPACA_API_KEY_ID',
+    'ALPACA_API_SECRET_KEY',
+    'ALPACA_BASE_URL',
+    'ALPACA_DATA_URL',
+    'DB_HOST',
+    'DB_PORT',
+    'DB_USER',
+    'DB_PASS',
+    'DB_NAME',
+)
+
+# TRADING_CONFIG_SNAPSHOT=0 desactiva el snapshot
+SNAPSHOT_ENV_VAR = 'TRADING_CONFIG_SNAPSHOT'
+
+# Logger estándar: src.utils.logger depende de este módulo
+_logger = logging.getLogger(__name__)
 
 
 class Environment(str, Enum):
@@ -31,7 +66,19 @@ class Environment(str, Enum):
     PRODUCTION = "production"
 
 
-class AppConfig(BaseModel):
+class FrozenModel(BaseModel):
+    """
+    Modelo base inmutable.
+    
+    Las configuraciones publicadas se comparten entre hilos sin locks,
+    por lo que no se pueden modificar una vez validadas.
+    """
+    
+    class Config:
+        frozen = True
+
+
+class AppConfig(FrozenModel):
     """Configuración general de la aplicación."""
     
     name: str = Field(default="Trading Bot Híbrido", description="Nombre de la aplicación")
@@ -43,12 +90,20 @@ class AppConfig(BaseModel):
         use_enum_values = True
 
 
-class DataConfig(BaseModel):
+class DataConfig(FrozenModel):
     """Configuración de almacenamiento de datos."""
     
     storage_path: Path = Field(default=Path("data/"), description="Ruta de almacenamiento")
     log_path: Path = Field(default=Path("logs/"), description="Ruta de logs")
     cache_ttl: int = Field(default=300, ge=0, description="TTL del cache en segundos")
+    cache_memory_mb: float = Field(default=256, gt=0, description="Presupuesto de memoria del cache en MB")
+    cache_disk_ttl: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="TTL del cache en disco en segundos (None = cache_ttl)"
+    )
+    history_chunk_days: int = Field(default=7, ge=1, description="Días por petición al sincronizar el histórico")
+    history_workers: int = Field(default=4, ge=1, le=32, description="Descargas simultáneas del histórico")
     
     @validator('storage_path', 'log_path')
     def create_directories(cls, v: Path) -> Path:
@@ -57,7 +112,7 @@ class DataConfig(BaseModel):
         return v
 
 
-class BrokerConfig(BaseModel):
+class BrokerConfig(FrozenModel):
     """Configuración del broker (Alpaca)."""
     
     provider: str = Field(default="alpaca", description="Proveedor del broker")
@@ -69,6 +124,12 @@ class BrokerConfig(BaseModel):
         description="URL base de la API",
         env="ALPACA_BASE_URL"
     )
+    data_url: str = Field(
+        default="https://data.alpaca.markets",
+        description="URL base de la API de datos de mercado",
+        env="ALPACA_DATA_URL"
+    )
+    rate_limit_per_minute: int = Field(default=200, ge=1, description="Peticiones por minuto permitidas por el broker")
     
     @validator('api_key_id', 'api_secret_key')
     def validate_not_empty(cls, v: str) -> str:
@@ -77,7 +138,7 @@ class BrokerConfig(BaseModel):
             raise ValueError("API key no configurada. Revisa tu archivo .env")
         return v
     
-    @validator('base_url')
+    @validator('base_url', 'data_url')
     def validate_url(cls, v: str) -> str:
         """Valida que la URL use HTTPS."""
         if not v.startswith('https://'):
@@ -85,7 +146,7 @@ class BrokerConfig(BaseModel):
         return v
 
 
-class TradingConfig(BaseModel):
+class TradingConfig(FrozenModel):
     """Configuración de trading."""
     
     max_positions: int = Field(default=5, ge=1, le=20, description="Máximo de posiciones concurrentes")
@@ -113,7 +174,7 @@ class TradingConfig(BaseModel):
         return v
 
 
-class RiskConfig(BaseModel):
+class RiskConfig(FrozenModel):
     """Configuración de gestión de riesgo."""
     
     max_daily_loss_pct: float = Field(
@@ -136,7 +197,7 @@ class RiskConfig(BaseModel):
     )
 
 
-class LoggingConfig(BaseModel):
+class LoggingConfig(FrozenModel):
     """Configuración de logging."""
     
     level: str = Field(default="INFO", description="Nivel de logging")
@@ -148,6 +209,65 @@ class LoggingConfig(BaseModel):
     console_enabled: bool = Field(default=True, description="Habilitar logs a consola")
     rotation_size_mb: int = Field(default=10, ge=1, description="Tamaño de rotación en MB")
     backup_count: int = Field(default=5, ge=1, description="Número de backups")
+    index_enabled: bool = Field(
+        default=True,
+        description="Indexar los logs al rotar para consultas rápidas (ver log_query)"
+    )
+    sample_rate: int = Field(
+        default=1,
+        ge=1,
+        description="Registrar 1 de cada N mensajes repetidos (1 = todos)"
+    )
+    rate_limit_per_sec: float = Field(
+        default=0.0,
+        ge=0,
+        description="Mensajes/s por plantilla de mensaje (0 = sin límite)"
+    )
+    rate_limit_burst: int = Field(default=10, ge=1, description="Ráfaga del límite de mensajes")
+    first_k: int = Field(
+        default=0,
+        ge=0,
+        description="Registrar solo las primeras K repeticiones por ventana (0 = todas)"
+    )
+    first_k_window_sec: float = Field(default=60.0, gt=0, description="Ventana de first_k en segundos")
+    fast_json_enabled: bool = Field(
+        default=False,
+        description="Usar FastJsonFormatter (campos precodificados, orjson si está instalado)"
+    )
+    async_enabled: bool = Field(
+        default=False,
+        description="Encolar los logs y escribirlos en un hilo de fondo"
+    )
+    queue_size: int = Field(default=10000, ge=1, description="Capacidad de la cola asíncrona")
+    batch_size: int = Field(default=256, ge=1, description="Registros por lote de escritura")
+    overflow_policy: OverflowPolicy = Field(
+        default=OverflowPolicy.BLOCK,
+        description="Política con la cola llena (block, drop-debug, drop-oldest)"
+    )
+    rotation_compression: str = Field(
+        default="none",
+        description="Compresión en fondo de los logs rotados (none, gzip, zstd)"
+    )
+    rotate_at: Optional[str] = Field(
+        default=None,
+        description="Hora diaria de rotación HH:MM en días laborables (ej. apertura 09:30)"
+    )
+    rotation_timezone: str = Field(default="America/New_York", description="Zona horaria de rotate_at")
+    retention_max_mb: float = Field(
+        default=0,
+        ge=0,
+        description="Tamaño máximo de los logs rotados por logger en MB (0 = sin límite)"
+    )
+    retention_max_days: float = Field(
+        default=0,
+        ge=0,
+        description="Antigüedad máxima de los logs rotados en días (0 = sin límite)"
+    )
+    ring_buffer_size: int = Field(
+        default=0,
+        ge=0,
+        description="Registros DEBUG recientes en memoria para volcados de crash (0 = desactivado)"
+    )
     
     @validator('level')
     def validate_level(cls, v: str) -> str:
@@ -157,9 +277,48 @@ class LoggingConfig(BaseModel):
         if v_upper not in valid_levels:
             raise ValueError(f"Nivel debe ser uno de: {valid_levels}")
         return v_upper
+    
+    @validator('rotation_compression')
+    def validate_rotation_compression(cls, v: str) -> str:
+        """Valida la compresión de los logs rotados."""
+        valid = ['none', 'gzip', 'zstd']
+        v_lower = v.lower()
+        if v_lower not in valid:
+            raise ValueError(f"Compresión debe ser una de: {valid}")
+        return v_lower
+    
+    @validator('rotate_at')
+    def validate_rotate_at(cls, v: Optional[str]) -> Optional[str]:
+        """Valida la hora de rotación (HH:MM)."""
+        if v is None:
+            return v
+        hour, _, minute = v.partition(':')
+        if not (hour.isdigit() and minute.isdigit() and int(hour) < 24 and int(minute) < 60):
+            raise ValueError(f"Hora de rotación inválida: '{v}'. Formato esperado: HH:MM")
+        return f"{int(hour):02d}:{int(minute):02d}"
+    
+    @validator('rotation_timezone')
+    def validate_rotation_timezone(cls, v: str) -> str:
+        """Valida que la zona horaria exista."""
+        from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+        try:
+            ZoneInfo(v)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Zona horaria desconocida: '{v}'")
+        return v
+    
+    @property
+    def rotation_policy_enabled(self) -> bool:
+        """True si se usa la rotación con mantenimiento en fondo (log_rotation)."""
+        return (
+            self.rotation_compression != 'none'
+            or self.rotate_at is not None
+            or self.retention_max_mb > 0
+            or self.retention_max_days > 0
+        )
 
 
-class DatabaseConfig(BaseModel):
+class DatabaseConfig(FrozenModel):
     """Configuración de base de datos."""
     
     enabled: bool = Field(default=False, description="Habilitar base de datos")
@@ -175,7 +334,7 @@ class DatabaseConfig(BaseModel):
         return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
 
 
-class TradingBotConfig(BaseModel):
+class TradingBotConfig(FrozenModel):
     """Configuración principal del Trading Bot."""
     
     app: AppConfig = Field(default_factory=AppConfig)
@@ -201,10 +360,24 @@ class ConfigManager:
     3. Archivo config.yaml
     4. Valores por defecto
     
+    La configuración validada se guarda en un snapshot
+    (``CONFIG_SNAPSHOT_PATH``) asociado a un hash del YAML, de las
+    variables de entorno relevantes y del esquema. Mientras nada cambie,
+    los procesos siguientes cargan el snapshot sin parsear el YAML ni
+    volver a validar.
+    
+    Recarga en caliente: ``reload()`` (o un ``ConfigWatcher``) valida la
+    nueva configuración fuera del camino de lectura y la publica con una
+    única asignación de referencia. Los modelos son inmutables, así que
+    los lectores nunca ven una recarga a medias ni necesitan locks; los
+    suscriptores solo reciben las secciones que cambiaron.
+    
     Example:
         >>> config = ConfigManager.get_instance()
         >>> print(config.app.name)
         'Trading Bot Híbrido'
+        >>> config.subscribe(on_risk_change, sections=['risk'])
+        >>> config.start_watching(interval=1.0)
     """
     
     _instance: Optional['ConfigManager'] = None
@@ -213,12 +386,24 @@ class ConfigManager:
     def __new__(cls) -> 'ConfigManager':
         """Implementa Singleton pattern."""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            instance = super().__new__(cls)
+            # Serializa solo a los escritores (recargas); lectura sin lock
+            instance._reload_lock = threading.RLock()
+            # Tupla copy-on-write: se notifica sin bloquear las suscripciones
+            instance._subscribers = ()
+            instance._env_file_values = {}
+            instance._generation = 0
+            instance._loaded_signature = None
+            instance._watcher = None
+            # Lector de configuración compartida (ver shared_config)
+            instance._shared = None
+            cls._instance = instance
         return cls._instance
     
     def __init__(self):
         """Inicializa el gestor de configuración."""
         if self._config is None:
+            self._loaded_signature = self._source_signature()
             self._config = self._load_config()
     
     @classmethod
@@ -244,9 +429,13 @@ class ConfigManager:
             ValidationError: Si la configuración es inválida
         """
         # 1. Cargar variables de entorno desde .env
-        env_path = Path(__file__).parent.parent.parent / 'configs' / '.env'
-        if env_path.exists():
-            load_dotenv(env_path)
+        self._load_env_file()
+        
+        # Snapshot válido: sin parsear YAML ni validar de nuevo
+        snapshot_key = self._snapshot_key()
+        config = self._load_snapshot(snapshot_key)
+        if config is not None:
+            return config
         
         # 2. Cargar configuración desde YAML
         yaml_config = self._load_yaml_config()
@@ -257,11 +446,141 @@ class ConfigManager:
         # 4. Validar y crear configuración
         try:
             config = TradingBotConfig(**config_dict)
-            return config
         except ValidationError as e:
             print(f"❌ Error de validación en configuración:")
             print(e)
             raise
+        
+        self._save_snapshot(snapshot_key, config)
+        return config
+    
+    def _load_env_file(self) -> None:
+        """
+        Carga el archivo .env en las variables de entorno.
+        
+        Igual que ``load_dotenv``, no pisa variables definidas por el
+        entorno real; las que vinieron del .env sí se actualizan (o
+        eliminan) en cada recarga, para que editar el .env tenga efecto.
+        """
+        env_path = CONFIG_DIR / '.env'
+        values = dotenv_values(env_path) if env_path.exists() else {}
+        previous = self._env_file_values
+        loaded = {}
+        
+        for name, value in previous.items():
+            if name not in values and os.environ.get(name) == value:
+                del os.environ[name]
+        
+        for name, value in values.items():
+            if value is None:
+                continue
+            if name not in os.environ or os.environ[name] == previous.get(name):
+                os.environ[name] = value
+                loaded[name] = value
+        
+        self._env_file_values = loaded
+    
+    @staticmethod
+    def _source_signature() -> Tuple[Optional[Tuple[int, int, int]], ...]:
+        """
+        Firma barata de los archivos fuente (config.yaml y .env).
+        
+        Returns:
+            Tupla con (mtime_ns, tamaño, inodo) de cada archivo, o None si
+            no existe. El inodo detecta reemplazos atómicos (``os.replace``).
+        """
+        signature = []
+        for path in (CONFIG_DIR / 'config.yaml', CONFIG_DIR / '.env'):
+            try:
+                stat = path.stat()
+            except OSError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_mtime_ns, stat.st_size, stat.st_ino))
+        return tuple(signature)
+    
+    def _snapshot_key(self) -> Optional[str]:
+        """
+        Calcula la clave del snapshot a partir de las fuentes.
+        
+        Returns:
+            Hash SHA-256 del YAML, las variables de entorno relevantes y el
+            esquema, o None si el snapshot está desactivado
+        """
+        if os.getenv(SNAPSHOT_ENV_VAR, '1').lower() in ('0', 'false', 'no'):
+            return None
+        
+        digest = hashlib.sha256()
+        digest.update(pydantic.VERSION.encode())
+        # El esquema forma parte de la clave: cambiar este módulo invalida el snapshot
+        digest.update(Path(__file__).read_bytes())
+        
+        yaml_path = CONFIG_DIR / 'config.yaml'
+        digest.update(yaml_path.read_bytes() if yaml_path.exists() else b'')
+        
+        for name in CONFIG_ENV_VARS:
+            value = os.getenv(name)
+            digest.update(f"\0{name}={value!r}".encode())
+        
+        return digest.hexdigest()
+    
+    def _load_snapshot(self, key: Optional[str]) -> Optional[TradingBotConfig]:
+        """
+        Carga la configuración desde el snapshot si su clave coincide.
+        
+        Args:
+            key: Clave esperada (None si el snapshot está desactivado)
+        
+        Returns:
+            Configuración del snapshot o None si no existe o no coincide
+        """
+        if key is None or not CONFIG_SNAPSHOT_PATH.exists():
+            return None
+        
+        try:
+            with open(CONFIG_SNAPSHOT_PATH, 'rb') as f:
+                stored_key, config = pickle.load(f)
+        except Exception:
+            # Snapshot corrupto o de otra versión: se regenera
+            return None
+        
+        if stored_key != key or not isinstance(config, TradingBotConfig):
+            return None
+        
+        # El validador de DataConfig crea los directorios; sin validación
+        # hay que garantizarlos aquí
+        for path in (config.data.storage_path, config.data.log_path):
+            path.mkdir(parents=True, exist_ok=True)
+        
+        return config
+    
+    def _save_snapshot(self, key: Optional[str], config: TradingBotConfig) -> None:
+        """
+        Guarda la configuración validada en el snapshot (escritura atómica).
+        
+        El archivo contiene las credenciales del broker, por lo que se
+        crea con permisos 0600 junto al ``.env``.
+        
+        Args:
+            key: Clave del snapshot (None si está desactivado)
+            config: Configuración validada
+        """
+        if key is None:
+            return
+        
+        try:
+            CONFIG_SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=CONFIG_SNAPSHOT_PATH.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump((key, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, CONFIG_SNAPSHOT_PATH)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, pickle.PicklingError):
+            # Sin permisos de escritura: se sigue sin snapshot
+            pass
     
     def _load_yaml_config(self) -> dict:
         """
@@ -270,11 +589,14 @@ class ConfigManager:
         Returns:
             Diccionario con configuración del YAML
         """
-        yaml_path = Path(__file__).parent.parent.parent / 'configs' / 'config.yaml'
+        yaml_path = CONFIG_DIR / 'config.yaml'
         
         if not yaml_path.exists():
             return {}
         
+        # Import diferido: con snapshot válido no se necesita PyYAML
+        import yaml
+        
         with open(yaml_path, 'r', encoding='utf-8') as f:
             return yaml.safe_load(f) or {}
     
@@ -300,6 +622,10 @@ class ConfigManager:
             'ALPACA_BASE_URL',
             'https://paper-api.alpaca.markets'
         )
+        config['broker']['data_url'] = os.getenv(
+            'ALPACA_DATA_URL',
+            'https://data.alpaca.markets'
+        )
         
         # Añadir configuración de base de datos desde env
         if 'database' not in config:
@@ -321,19 +647,266 @@ class ConfigManager:
         Returns:
             Configuración validada
         """
-        if self._config is None:
-            self._config = self._load_config()
-        return self._config
+        shared = self._shared
+        if shared is not None:
+            return shared.config
+        
+        config = self._config
+        if config is None:
+            with self._reload_lock:
+                if self._config is None:
+                    self._loaded_signature = self._source_signature()
+                    self._config = self._load_config()
+                config = self._config
+        return config
+    
+    @property
+    def generation(self) -> int:
+        """Número de recargas publicadas (0 = configuración inicial)."""
+        return self._generation
+    
+    def reload(self) -> bool:
+        """
+        Recarga la configuración desde las fuentes y la publica.
+        
+        La nueva configuración se valida completa antes de publicarse; si
+        la validación falla, la configuración actual sigue vigente. Si las
+        fuentes no cambiaron se reutiliza el snapshot.
+        
+        Returns:
+            True si se publicó una configuración distinta
+        
+        Raises:
+            ValidationError: Si la nueva configuración es inválida
+        """
+        with self._reload_lock:
+            signature = self._source_signature()
+            new = self._load_config()
+            self._loaded_signature = signature
+            return self._publish(new)
+    
+    def _publish(self, new: TradingBotConfig) -> bool:
+        """
+        Publica una configuración validada y notifica a los suscriptores.
+        
+        Debe llamarse con ``_reload_lock`` adquirido.
+        
+        Args:
+            new: Configuración validada
+        
+        Returns:
+            True si alguna sección cambió
+        """
+        old = self._config
+        
+        if old is None:
+            self._config = new
+            return True
+        
+        changed = frozenset(
+            section for section in TradingBotConfig.model_fields
+            if getattr(old, section) != getattr(new, section)
+        )
+        if not changed:
+            return False
+        
+        # Única asignación de referencia: los lectores ven old o new, nunca una mezcla
+        self._config = new
+        self._generation += 1
+        
+        for callback, sections in self._subscribers:
+            if sections is not None and not sections & changed:
+                continue
+            try:
+                callback(old, new, changed)
+            except Exception:
+                _logger.exception("Error en suscriptor de configuración %r", callback)
+        
+        return True
     
-    def reload(self) -> None:
-        """Recarga la configuración desde las fuentes."""
-        self._config = self._load_config()
+    def subscribe(
+        self,
+        callback: Callable[[TradingBotConfig, TradingBotConfig, FrozenSet[str]], None],
+        sections: Optional[Iterable[str]] = None
+    ) -> Callable[[], None]:
+        """
+        Registra un callback que se ejecuta al publicar una nueva configuración.
+        
+        El callback recibe ``(anterior, nueva, secciones_cambiadas)`` y se
+        ejecuta en el hilo que hizo la recarga (el del watcher).
+        
+        Args:
+            callback: Función a notificar
+            sections: Secciones de interés (ej. ['risk', 'trading']);
+                None para cualquier cambio
+        
+        Returns:
+            Función que cancela la suscripción
+        
+        Raises:
+            ValueError: Si alguna sección no existe
+        
+        Example:
+            >>> def on_risk(old, new, changed):
+            ...     strategy.set_limits(new.risk)
+            >>> unsubscribe = manager.subscribe(on_risk, sections=['risk'])
+        """
+        if sections is not None:
+            sections = frozenset(sections)
+            unknown = sections - TradingBotConfig.model_fields.keys()
+            if unknown:
+                raise ValueError(f"Secciones de configuración desconocidas: {sorted(unknown)}")
+        
+        entry = (callback, sections)
+        with self._reload_lock:
+            self._subscribers = self._subscribers + (entry,)
+        
+        def unsubscribe() -> None:
+            with self._reload_lock:
+                self._subscribers = tuple(s for s in self._subscribers if s is not entry)
+        
+        return unsubscribe
+    
+    def start_watching(self, interval: float = 1.0) -> 'ConfigWatcher':
+        """
+        Inicia (si no lo está ya) el watcher de archivos de configuración.
+        
+        Args:
+            interval: Segundos entre comprobaciones
+        
+        Returns:
+            Watcher en ejecución
+        """
+        with self._reload_lock:
+            if self._watcher is None or not self._watcher.is_running:
+                self._watcher = ConfigWatcher(self, interval=interval)
+                self._watcher.start()
+            return self._watcher
+    
+    def stop_watching(self) -> None:
+        """Detiene el watcher de archivos de configuración si está activo."""
+        watcher = self._watcher
+        if watcher is not None:
+            watcher.stop()
+    
+    @staticmethod
+    def clear_snapshot() -> None:
+        """Elimina el snapshot de configuración (el próximo arranque valida todo)."""
+        try:
+            CONFIG_SNAPSHOT_PATH.unlink()
+        except FileNotFoundError:
+            pass
     
     def __repr__(self) -> str:
         """Representación string del ConfigManager."""
         return f"ConfigManager(app={self.config.app.name}, env={self.config.app.environment})"
 
 
+class ConfigWatcher:
+    """
+    Vigila ``config.yaml`` y ``.env`` por polling de mtime y recarga al cambiar.
+    
+    Cada comprobación es un ``stat()`` por archivo; el YAML solo se lee y
+    valida cuando la firma cambia, en el hilo del watcher. Una
+    configuración inválida se registra en el log y se ignora hasta que el
+    archivo vuelva a cambiar, manteniendo la configuración vigente.
+    
+    Example:
+        >>> watcher = ConfigWatcher(ConfigManager.get_instance(), interval=2.0)
+        >>> watcher.start()
+        >>> watcher.stop()
+    """
+    
+    def __init__(self, manager: ConfigManager, interval: float = 1.0):
+        """
+        Inicializa el watcher.
+        
+        Args:
+            manager: ConfigManager a recargar
+            interval: Segundos entre comprobaciones
+        
+        Raises:
+            ValueError: Si el intervalo no es positivo
+        """
+        if interval <= 0:
+            raise ValueError(f"El intervalo debe ser positivo, recibido: {interval}")
+        
+        self.manager = manager
+        self.interval = interval
+        self.last_error: Optional[Exception] = None
+        self._failed_signature = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def is_running(self) -> bool:
+        """True si el hilo del watcher está activo."""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def check(self) -> bool:
+        """
+        Comprueba los archivos una vez y recarga si cambiaron.
+        
+        Returns:
+            True si se publicó una nueva configuración
+        """
+        manager = self.manager
+        manager.config  # Garantiza una configuración inicial con su firma
+        signature = manager._source_signature()
+        
+        if signature == manager._loaded_signature or signature == self._failed_signature:
+            return False
+        
+        try:
+            published = manager.reload()
+        except Exception as e:
+            # Se mantiene la configuración actual hasta el próximo cambio
+            self.last_error = e
+            self._failed_signature = signature
+            _logger.error("Configuración inválida, se mantiene la anterior: %s", e)
+            return False
+        
+        self.last_error = None
+        self._failed_signature = None
+        return published
+    
+    def start(self) -> None:
+        """Inicia el hilo del watcher (daemon)."""
+        if self.is_running:
+            return
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name='ConfigWatcher',
+            daemon=True
+        )
+        self._thread.start()
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Detiene el hilo del watcher.
+        
+        Args:
+            timeout: Segundos máximos de espera (None = sin límite)
+        """
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+    
+    def _run(self) -> None:
+        """Bucle de polling."""
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                _logger.exception("Error en el watcher de configuración")
+    
+    def __repr__(self) -> str:
+        """Representación string del watcher."""
+        return f"ConfigWatcher(interval={self.interval}, running={self.is_running})"
+
+
 def get_config() -> TradingBotConfig:
     """
     Función helper para obtener la configuración.
@@ -360,6 +933,9 @@ __all__ = [
     'LoggingConfig',
     'DatabaseConfig',
     'ConfigManager',
+    'ConfigWatcher',
     'get_config',
     'Environment',
+    'CONFIG_DIR',
+    'CONFIG_SNAPSHOT_PATH',
 ]
@@ -0,0 +1,412 @@
+"""
+Sink columnar de eventos de trading (Parquet / Arrow IPC).
+
+``log_with_context`` deja las órdenes ejecutadas como líneas JSON de texto
+libre que luego hay que re-parsear. Este módulo guarda eventos tipados en
+buffers por columna y los escribe por lotes en archivos columnares bajo
+``DataConfig.storage_path``, particionados por día::
+
+    <storage_path>/events/<nombre>/date=2024-03-08/part-<ts>-<id>-<n>.parquet
+
+``<ts>`` es la hora UTC de la escritura, ``<id>`` identifica al sink (único
+por proceso e instancia) y ``<n>`` es su secuencia: dos procesos que
+escriben el mismo día y segundo no se sobrescriben.
+
+Los análisis post-trade cargan las columnas directamente con
+``read_events`` (pyarrow.dataset), filtrando particiones por fecha.
+
+Example:
+    >>> from src.utils.event_sink import record_order, read_events
+    >>> record_order("AAPL", "buy", qty=10, price=150.5, order_id="abc")
+    >>> get_event_sink("orders").flush()
+    >>> read_events("orders", start=date(2024, 3, 8))
+"""
+
+import atexit
+import itertools
+import logging
+import threading
+import time
+import uuid
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.ipc
+import pyarrow.parquet as pq
+
+
+# Subdirectorio de eventos dentro de DataConfig.storage_path
+EVENTS_DIR_NAME = 'events'
+
+# Formatos soportados y su extensión
+EVENT_FORMATS = {
+    'parquet': '.parquet',
+    'arrow': '.arrow',
+}
+
+# Esquema de órdenes ejecutadas
+ORDER_EVENT_SCHEMA = pa.schema([
+    ('timestamp', pa.timestamp('us', tz='UTC')),
+    ('symbol', pa.string()),
+    ('side', pa.string()),
+    ('qty', pa.float64()),
+    ('price', pa.float64()),
+    ('order_id', pa.string()),
+    ('strategy', pa.string()),
+])
+
+_US_PER_DAY = 86_400_000_000
+_PARTITIONING = ds.partitioning(pa.schema([('date', pa.string())]), flavor='hive')
+
+# Errores de conversión de un valor al tipo de su campo
+_CONVERSION_ERRORS = (pa.ArrowException, TypeError, ValueError, OverflowError)
+
+_logger = logging.getLogger(__name__)
+
+
+def _events_root(base_path: Union[str, Path, None]) -> Path:
+    """Directorio raíz de eventos (por defecto, bajo ``data.storage_path``)."""
+    if base_path is None:
+        from .config import get_config
+        base_path = get_config().data.storage_path
+    return Path(base_path) / EVENTS_DIR_NAME
+
+
+class ColumnarEventSink:
+    """
+    Buffer de eventos tipados que se escribe en lotes columnares.
+    
+    Los eventos se acumulan por columna (sin crear objetos por fila) y se
+    escriben al llegar a ``batch_size`` filas, al pasar ``flush_interval``
+    segundos desde la última escritura (comprobado al añadir), con
+    ``flush()`` o al cerrar el proceso.
+    
+    Los valores se convierten al escribir el lote: si alguno no es válido
+    para su campo (p. ej. ``qty='ten'``), su fila se descarta (se cuenta en
+    ``rows_dropped`` y se avisa en el log) y el resto del lote se escribe.
+    
+    Example:
+        >>> sink = ColumnarEventSink("orders", ORDER_EVENT_SCHEMA)
+        >>> sink.append(timestamp=None, symbol="AAPL", side="buy", qty=10, price=150.5)
+        >>> sink.flush()
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        schema: pa.Schema,
+        base_path: Union[str, Path, None] = None,
+        batch_size: int = 10000,
+        flush_interval: float = 60.0,
+        format: str = 'parquet',
+        compression: str = 'zstd'
+    ):
+        """
+        Inicializa el sink.
+        
+        Args:
+            name: Nombre del flujo de eventos (subdirectorio)
+            schema: Esquema Arrow; debe incluir ``timestamp`` (timestamp UTC)
+            base_path: Directorio de datos (por defecto, ``data.storage_path``)
+            batch_size: Filas por lote
+            flush_interval: Segundos máximos entre escrituras
+            format: 'parquet' o 'arrow' (Arrow IPC)
+            compression: Códec de compresión
+        
+        Raises:
+            ValueError: Si el formato o el esquema no son válidos
+        """
+        if format not in EVENT_FORMATS:
+            raise ValueError(f"Formato inválido: '{format}'. Válidos: {list(EVENT_FORMATS)}")
+        
+        if schema.get_field_index('timestamp') < 0 or not pa.types.is_timestamp(schema.field('timestamp').type):
+            raise ValueError("El esquema debe tener un campo 'timestamp' de tipo timestamp")
+        
+        self.name = name
+        self.schema = schema
+        self.path = _events_root(base_path) / name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.format = format
+        self.compression = compression
+        self.rows_written = 0
+        self.rows_dropped = 0
+        
+        self._fields = frozenset(schema.names)
+        self._columns: Dict[str, List[Any]] = {field: [] for field in schema.names}
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._sequence = itertools.count()
+        self._id = uuid.uuid4().hex[:12]
+        self._lock = threading.Lock()
+        
+        atexit.register(self.flush)
+    
+    def append(self, **event: Any) -> None:
+        """
+        Añade un evento.
+        
+        Los campos ausentes se guardan como nulos; ``timestamp=None`` usa la
+        hora actual (UTC). Los datetimes sin zona se interpretan como UTC.
+        
+        Args:
+            **event: Valores por nombre de campo
+        
+        Raises:
+            ValueError: Si hay campos que no están en el esquema
+        """
+        unknown = event.keys() - self._fields
+        if unknown:
+            raise ValueError(f"Campos desconocidos para '{self.name}': {sorted(unknown)}")
+        
+        if event.get('timestamp') is None:
+            event['timestamp'] = datetime.now(timezone.utc)
+        
+        with self._lock:
+            for field, column in self._columns.items():
+                column.append(event.get(field))
+            self._pending += 1
+            
+            if (
+                self._pending >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._flush_locked()
+    
+    def flush(self) -> int:
+        """
+        Escribe los eventos pendientes.
+        
+        Returns:
+            Número de filas escritas
+        """
+        with self._lock:
+            return self._flush_locked()
+    
+    def _flush_locked(self) -> int:
+        """Escribe el buffer (con el lock adquirido), un archivo por día."""
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return 0
+        
+        # El buffer se vacía antes de convertir: un lote inválido no bloquea los siguientes
+        columns, pending = self._columns, self._pending
+        self._columns = {field: [] for field in self.schema.names}
+        self._pending = 0
+        
+        try:
+            table = self._to_table(columns)
+        except _CONVERSION_ERRORS:
+            columns = self._drop_invalid(columns, pending)
+            table = self._to_table(columns)
+            if not table.num_rows:
+                return 0
+        
+        # Día (UTC) de cada fila a partir de los microsegundos desde epoch
+        micros = pc.cast(table.column('timestamp').cast(pa.timestamp('us', tz='UTC')), pa.int64())
+        days = pc.floor(pc.divide(pc.cast(micros, pa.float64()), _US_PER_DAY)).cast(pa.int64())
+        
+        stamp = time.strftime('%Y%m%dT%H%M%S', time.gmtime())
+        for day in pc.unique(days).to_pylist():
+            part = table.filter(pc.equal(days, day))
+            partition = date.fromordinal(date(1970, 1, 1).toordinal() + day).isoformat()
+            directory = self.path / f"date={partition}"
+            directory.mkdir(parents=True, exist_ok=True)
+            name = f"part-{stamp}-{self._id}-{next(self._sequence):06d}{EVENT_FORMATS[self.format]}"
+            self._write(part, directory / name)
+        
+        self.rows_written += table.num_rows
+        return table.num_rows
+    
+    def _to_table(self, columns: Dict[str, List[Any]]) -> pa.Table:
+        """Convierte las columnas del buffer a una tabla con el esquema."""
+        return pa.table(
+            [pa.array(columns[field.name], type=field.type) for field in self.schema],
+            schema=self.schema
+        )
+    
+    def _drop_invalid(self, columns: Dict[str, List[Any]], pending: int) -> Dict[str, List[Any]]:
+        """Quita las filas con algún valor no convertible a su campo."""
+        valid = []
+        for row in range(pending):
+            try:
+                for field in self.schema:
+                    pa.scalar(columns[field.name][row], type=field.type)
+            except _CONVERSION_ERRORS as e:
+                self.rows_dropped += 1
+                _logger.warning("Evento de '%s' descartado (%s): %s", self.name, type(e).__name__, e)
+                continue
+            valid.append(row)
+        
+        return {field: [values[row] for row in valid] for field, values in columns.items()}
+    
+    def _write(self, table: pa.Table, path: Path) -> None:
+        """Escribe una tabla (primero a un temporal para no dejar archivos a medias)."""
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        
+        if self.format == 'parquet':
+            pq.write_table(table, tmp_path, compression=self.compression)
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=self.compression)
+            with pa.OSFile(str(tmp_path), 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+                    writer.write_table(table)
+        
+        tmp_path.replace(path)
+    
+    def close(self) -> None:
+        """Escribe lo pendiente y deja de escuchar el cierre del proceso."""
+        self.flush()
+        atexit.unregister(self.flush)
+    
+    def __len__(self) -> int:
+        """Eventos pendientes de escribir."""
+        return self._pending
+    
+    def __repr__(self) -> str:
+        """Representación string del sink."""
+        return f"ColumnarEventSink(name={self.name!r}, format={self.format!r}, pending={self._pending})"
+
+
+def read_events(
+    name: str,
+    start: Union[date, datetime, None] = None,
+    end: Union[date, datetime, None] = None,
+    base_path: Union[str, Path, None] = None,
+    format: str = 'parquet',
+    columns: Optional[List[str]] = None
+):
+    """
+    Carga eventos como DataFrame de pandas.
+    
+    Las particiones de día fuera de [start, end] no se leen; con datetimes
+    se filtra además por ``timestamp`` (sin zona = UTC).
+    
+    Args:
+        name: Nombre del flujo de eventos
+        start: Fecha u hora inicial (inclusive)
+        end: Fecha u hora final (inclusive)
+        base_path: Directorio de datos (por defecto, ``data.storage_path``)
+        format: Formato con el que se escribió ('parquet' o 'arrow')
+        columns: Columnas a cargar (None = todas)
+    
+    Returns:
+        DataFrame ordenado por timestamp (vacío si no hay eventos)
+    """
+    path = _events_root(base_path) / name
+    if not path.exists():
+        import pandas as pd
+        return pd.DataFrame(columns=columns)
+    
+    dataset = ds.dataset(
+        path,
+        format='ipc' if format == 'arrow' else format,
+        partitioning=_PARTITIONING,
+        exclude_invalid_files=True
+    )
+    
+    condition = None
+    for bound, op in ((start, 'ge'), (end, 'le')):
+        if bound is None:
+            continue
+        day = (bound.date() if isinstance(bound, datetime) else bound).isoformat()
+        terms = [getattr(ds.field('date'), f'__{op}__')(day)]
+        if isinstance(bound, datetime):
+            if bound.tzinfo is None:
+                bound = bound.replace(tzinfo=timezone.utc)
+            terms.append(getattr(ds.field('timestamp'), f'__{op}__')(pa.scalar(bound, pa.timestamp('us', tz='UTC'))))
+        for term in terms:
+            condition = term if condition is None else condition & term
+    
+    selected = None if columns is None else list(dict.fromkeys(['timestamp', *columns]))
+    table = dataset.to_table(columns=selected, filter=condition)
+    if 'date' in table.column_names:
+        table = table.drop_columns(['date'])
+    
+    frame = table.sort_by('timestamp').to_pandas()
+    return frame if columns is None else frame[columns]
+
+
+# Sinks por nombre del proceso (ver get_event_sink)
+_sinks: Dict[str, ColumnarEventSink] = {}
+_sinks_lock = threading.Lock()
+
+
+def get_event_sink(
+    name: str,
+    schema: Optional[pa.Schema] = None,
+    **kwargs: Any
+) -> ColumnarEventSink:
+    """
+    Obtiene (o crea) el sink compartido de un flujo de eventos.
+    
+    Args:
+        name: Nombre del flujo
+        schema: Esquema (obligatorio la primera vez, salvo para 'orders')
+        **kwargs: Opciones de ``ColumnarEventSink`` al crearlo
+    
+    Returns:
+        Sink del flujo
+    
+    Raises:
+        ValueError: Si el flujo no existe y no se indica esquema
+    """
+    with _sinks_lock:
+        sink = _sinks.get(name)
+        if sink is None:
+            if schema is None:
+                if name != 'orders':
+                    raise ValueError(f"Falta el esquema del flujo de eventos '{name}'")
+                schema = ORDER_EVENT_SCHEMA
+            sink = _sinks[name] = ColumnarEventSink(name, schema, **kwargs)
+        return sink
+
+
+def record_order(
+    symbol: str,
+    side: str,
+    qty: float,
+    price: float,
+    order_id: Optional[str] = None,
+    strategy: Optional[str] = None,
+    timestamp: Optional[datetime] = None
+) -> None:
+    """
+    Registra una orden ejecutada en el flujo 'orders'.
+    
+    Args:
+        symbol: Símbolo
+        side: 'buy' o 'sell'
+        qty: Cantidad ejecutada
+        price: Precio de ejecución
+        order_id: ID de la orden en el broker
+        strategy: Estrategia que la generó
+        timestamp: Hora de ejecución (None = ahora)
+    
+    Example:
+        >>> record_order("AAPL", "buy", qty=10, price=150.5, strategy="momentum")
+    """
+    get_event_sink('orders').append(
+        timestamp=timestamp,
+        symbol=symbol,
+        side=side,
+        qty=qty,
+        price=price,
+        order_id=order_id,
+        strategy=strategy,
+    )
+
+
+# Exportar para uso externo
+__all__ = [
+    'ColumnarEventSink',
+    'ORDER_EVENT_SCHEMA',
+    'EVENT_FORMATS',
+    'get_event_sink',
+    'read_events',
+    'record_order',
+]
@@ -0,0 +1,198 @@
+"""
+Contexto de logging ligado a la tarea o hilo actual (``contextvars``).
+
+En lugar de pasar ``symbol``, ``strategy`` o ``cycle_id`` en cada llamada a
+``log_with_context``, se ligan una vez por ciclo, tarea asyncio o hilo::
+
+    with log_context(cycle_id=42, strategy="momentum"):
+        logger.info("Señal generada")  # incluye cycle_id y strategy
+
+El contexto es un diccionario que nunca se modifica, guardado en una
+``ContextVar``: ligar campos crea uno nuevo (una vez por ciclo) y cada
+registro solo guarda una referencia, sin copias por llamada.
+``ContextFilter`` captura esa referencia en los handlers, es decir, solo
+para los registros que pasan el filtro de nivel, y en el hilo que hace el
+log (también en modo asíncrono). ``JsonFormatter`` la combina con los
+``extra_fields`` al formatear.
+
+Cada tarea asyncio hereda una copia del contexto al crearse, así que lo
+que liga una tarea no afecta a las demás. Los pools de hilos no copian el
+contexto: usar ``submit_with_context`` (o ``asyncio.to_thread``), que con
+un pool de procesos envía los campos y los vuelve a ligar en el proceso hijo.
+
+Example:
+    >>> bind_context(strategy="momentum")
+    >>> async def process(symbol):
+    ...     with log_context(symbol=symbol):
+    ...         logger.info("Procesando")
+    >>> await asyncio.gather(*(process(s) for s in ["AAPL", "MSFT"]))
+"""
+
+import contextvars
+import logging
+import sys
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, Mapping
+
+
+# Los diccionarios del contexto no se modifican nunca: se reemplazan
+_EMPTY: Dict[str, Any] = {}
+
+_log_context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar(
+    'log_context', default=_EMPTY
+)
+
+
+def get_context() -> Mapping[str, Any]:
+    """
+    Devuelve el contexto ligado en la tarea o hilo actual.
+    
+    Returns:
+        Mapeo de solo lectura (vacío si no hay contexto)
+    """
+    return MappingProxyType(_log_context.get())
+
+
+def bind_context(**fields: Any) -> contextvars.Token:
+    """
+    Liga campos al contexto actual (se suman a los ya ligados).
+    
+    Args:
+        **fields: Campos a incluir en los logs
+    
+    Returns:
+        Token para restaurar el contexto anterior con ``reset_context``
+    
+    Example:
+        >>> token = bind_context(cycle_id=42)
+        >>> reset_context(token)
+    """
+    return _log_context.set({**_log_context.get(), **fields})
+
+
+def unbind_context(*keys: str) -> contextvars.Token:
+    """
+    Quita campos del contexto actual.
+    
+    Args:
+        *keys: Campos a quitar
+    
+    Returns:
+        Token para restaurar el contexto anterior
+    """
+    current = _log_context.get()
+    return _log_context.set({key: value for key, value in current.items() if key not in keys})
+
+
+def reset_context(token: contextvars.Token) -> None:
+    """
+    Restaura el contexto anterior a un ``bind_context``/``unbind_context``.
+    
+    Args:
+        token: Token devuelto por la llamada a deshacer
+    """
+    _log_context.reset(token)
+
+
+def clear_context() -> None:
+    """Vacía el contexto de la tarea o hilo actual."""
+    _log_context.set(_EMPTY)
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[Mapping[str, Any]]:
+    """
+    Liga campos durante un bloque ``with`` y restaura el contexto al salir.
+    
+    Args:
+        **fields: Campos a incluir en los logs del bloque
+    
+    Yields:
+        Contexto resultante
+    
+    Example:
+        >>> with log_context(symbol="AAPL"):
+        ...     logger.info("Orden enviada")
+    """
+    token = _log_context.set(fields)
+    try:
+        yield get_context()
+    finally:
+        _log_context.reset(token)
+
+
+def submit_with_context(executor: Executor, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """
+    Envía una función a un executor con una copia del contexto actual.
+    
+    Con un pool de hilos la función se ejecuta en una copia de los
+    ``contextvars``. Un ``Context`` no se puede serializar, así que con un
+    ``ProcessPoolExecutor`` se envían los campos ligados (deben poder
+    serializarse con pickle, igual que ``fn`` y sus argumentos) y se ligan
+    en el proceso hijo durante la llamada.
+    
+    Args:
+        executor: Pool de hilos o procesos
+        fn: Función a ejecutar
+        *args: Argumentos posicionales
+        **kwargs: Argumentos por nombre
+    
+    Returns:
+        Future de la ejecución
+    
+    Example:
+        >>> with ThreadPoolExecutor() as pool, log_context(cycle_id=7):
+        ...     futures = [submit_with_context(pool, fetch, s) for s in symbols]
+    """
+    # Sin importar multiprocessing: si su módulo no está cargado, no hay pools de procesos
+    process = sys.modules.get('concurrent.futures.process')
+    if process is not None and isinstance(executor, process.ProcessPoolExecutor):
+        return executor.submit(_run_with_fields, dict(_log_context.get()), fn, *args, **kwargs)
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def _run_with_fields(fields: Dict[str, Any], fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Ejecuta ``fn`` en el proceso hijo con los campos del contexto ligados."""
+    token = _log_context.set(fields)
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _log_context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """
+    Captura en el registro una referencia al contexto ligado.
+    
+    Se instala en los handlers, no en el logger, para que solo actúe sobre
+    los registros que pasan el nivel del handler. No sobrescribe un contexto
+    ya capturado (el listener asíncrono vuelve a filtrar en otro hilo).
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Añade ``record.log_context`` si hay contexto ligado.
+        
+        Returns:
+            Siempre True
+        """
+        if 'log_context' not in record.__dict__:
+            context = _log_context.get()
+            if context:
+                record.log_context = context
+        return True
+
+
+# Exportar para uso externo
+__all__ = [
+    'bind_context',
+    'unbind_context',
+    'reset_context',
+    'clear_context',
+    'get_context',
+    'log_context',
+    'submit_with_context',
+    'ContextFilter',
+]
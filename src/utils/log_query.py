@@ -0,0 +1,588 @@
+"""
+Consultas indexadas sobre los logs JSON rotados.
+
+``StructuredLogger`` escribe un objeto JSON por línea en
+``logs/<logger>.log`` y sus rotaciones (``.log.1``, ``.log.2``...). Este
+módulo mantiene un índice sidecar por archivo, dividido en bloques de
+~256 KB alineados a líneas, con:
+
+- rango de timestamps de cada bloque
+- postings por nivel (``level``) y por ``symbol`` (de ``extra_fields``)
+
+Las consultas solo leen, vía ``mmap``, los bloques candidatos. Los índices
+se guardan en ``<log_dir>/.index/<inodo>.json``: el inodo no cambia al
+rotar (la rotación renombra), así que el índice sigue al archivo. El
+archivo activo se indexa de forma incremental (solo lo añadido).
+
+Los archivos rotados comprimidos (``.gz``, ``.zst``; ver ``log_rotation``)
+se descomprimen en memoria para consultarlos; sus offsets se refieren al
+contenido descomprimido y el índice se traslada al comprimir
+(``adopt_index``), así que no se reconstruye.
+
+Los timestamps se comparan en UTC como en los logs (ISO 8601 sin zona).
+
+Example:
+    >>> from datetime import datetime
+    >>> from src.utils.log_query import query_logs
+    >>> for record in query_logs(
+    ...     "trading_engine", level="ERROR", symbol="AAPL",
+    ...     start=datetime(2024, 3, 8, 14, 30), end=datetime(2024, 3, 8, 14, 35)
+    ... ):
+    ...     print(record["timestamp"], record["message"])
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import mmap
+import os
+import re
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+if TYPE_CHECKING:
+    from .log_rotation import RotatedLogMaintainer
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+INDEX_VERSION = 1
+
+# Tamaño objetivo de un bloque indexado (se extiende hasta el fin de línea)
+INDEX_BLOCK_SIZE = 256 * 1024
+
+# Subdirectorio de los índices dentro del directorio de logs
+INDEX_DIR_NAME = '.index'
+
+# Extracción sin parsear el JSON (los índices admiten falsos positivos)
+_TIMESTAMP_RE = re.compile(rb'"timestamp": ?"([^"]+)"')
+_LEVEL_RE = re.compile(rb'"level": ?"([A-Z]+)"')
+_SYMBOL_RE = re.compile(rb'"symbol": ?"([^"\\]+)"')
+
+# Extensiones de los archivos rotados comprimidos
+COMPRESSED_SUFFIXES = ('.gz', '.zst')
+
+# Sufijo de rotación: número (.log.3) o fecha UTC (.log.20240308T143000[-1])
+_ROTATION_SUFFIX_RE = re.compile(r'^(?:(\d+)|(\d{8}T\d{6}(?:-\d+)?))$')
+
+TimeBound = Union[datetime, str, None]
+
+# Mantenedor compartido de ``indexing_rotator`` (se crea en el primer uso)
+_index_maintainer: Optional['RotatedLogMaintainer'] = None
+_index_maintainer_lock = threading.Lock()
+
+
+def _normalize_timestamp(value: str) -> str:
+    """Normaliza un timestamp ISO a microsegundos para compararlo como string."""
+    return value if len(value) != 19 else value + '.000000'
+
+
+def _to_bound(value: TimeBound) -> Optional[str]:
+    """Convierte un límite de consulta a timestamp ISO (UTC, sin zona)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(timespec='microseconds')
+
+
+def _fingerprint(mm: Union[mmap.mmap, bytes]) -> Optional[str]:
+    """Huella de la primera línea (detecta inodos reutilizados)."""
+    end = mm.find(b'\n')
+    if end < 0:
+        return None
+    return hashlib.sha1(mm[:end]).hexdigest()
+
+
+@dataclass
+class LogIndex:
+    """
+    Índice sidecar de un archivo de log.
+    
+    Attributes:
+        fingerprint: Huella de la primera línea del archivo
+        size: Bytes indexados (siempre hasta un fin de línea)
+        blocks: Bloques [offset, longitud, ts_min, ts_max]
+        levels: Nivel -> ids de bloque
+        symbols: Símbolo -> ids de bloque
+    """
+    
+    fingerprint: str
+    size: int = 0
+    blocks: List[list] = field(default_factory=list)
+    levels: Dict[str, List[int]] = field(default_factory=dict)
+    symbols: Dict[str, List[int]] = field(default_factory=dict)
+    
+    def extend(self, mm: Union[mmap.mmap, bytes], block_size: int = INDEX_BLOCK_SIZE) -> bool:
+        """
+        Indexa las líneas completas añadidas desde la última vez.
+        
+        Args:
+            mm: Archivo mapeado en memoria (o descomprimido)
+            block_size: Tamaño objetivo de bloque
+        
+        Returns:
+            True si se añadieron bloques
+        """
+        end_of_data = mm.rfind(b'\n') + 1
+        position = self.size
+        added = False
+        
+        while position < end_of_data:
+            end = mm.find(b'\n', min(position + block_size, end_of_data) - 1) + 1
+            if end <= 0 or end > end_of_data:
+                end = end_of_data
+            self._add_block(position, mm[position:end])
+            position = end
+            added = True
+        
+        self.size = position
+        return added
+    
+    def _add_block(self, offset: int, data: bytes) -> None:
+        """Añade un bloque con sus rangos y postings."""
+        timestamps = [
+            _normalize_timestamp(ts.decode('ascii', 'replace'))
+            for ts in _TIMESTAMP_RE.findall(data)
+        ]
+        block_id = len(self.blocks)
+        self.blocks.append([
+            offset,
+            len(data),
+            min(timestamps) if timestamps else None,
+            max(timestamps) if timestamps else None,
+        ])
+        
+        for level in set(_LEVEL_RE.findall(data)):
+            self.levels.setdefault(level.decode('ascii'), []).append(block_id)
+        for symbol in set(_SYMBOL_RE.findall(data)):
+            self.symbols.setdefault(symbol.decode('utf-8', 'replace'), []).append(block_id)
+    
+    def candidate_blocks(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        levels: Optional[Set[str]] = None,
+        symbol: Optional[str] = None
+    ) -> List[list]:
+        """
+        Selecciona los bloques que pueden contener registros de la consulta.
+        
+        Args:
+            start: Timestamp mínimo (ISO normalizado)
+            end: Timestamp máximo (ISO normalizado)
+            levels: Niveles aceptados
+            symbol: Símbolo buscado
+        
+        Returns:
+            Bloques candidatos en orden de archivo
+        """
+        candidates = set(range(len(self.blocks)))
+        
+        if levels is not None:
+            candidates &= {b for level in levels for b in self.levels.get(level, ())}
+        if symbol is not None:
+            candidates &= set(self.symbols.get(symbol, ()))
+        
+        selected = []
+        for block_id in sorted(candidates):
+            block = self.blocks[block_id]
+            ts_min, ts_max = block[2], block[3]
+            if ts_min is not None:
+                if start is not None and ts_max < start:
+                    continue
+                if end is not None and ts_min > end:
+                    continue
+            selected.append(block)
+        return selected
+    
+    def to_dict(self) -> dict:
+        """Serializa el índice."""
+        return {
+            'version': INDEX_VERSION,
+            'fingerprint': self.fingerprint,
+            'size': self.size,
+            'blocks': self.blocks,
+            'levels': self.levels,
+            'symbols': self.symbols,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> Optional['LogIndex']:
+        """Deserializa un índice (None si es de otra versión)."""
+        if data.get('version') != INDEX_VERSION:
+            return None
+        return cls(
+            fingerprint=data['fingerprint'],
+            size=data['size'],
+            blocks=data['blocks'],
+            levels=data['levels'],
+            symbols=data['symbols'],
+        )
+
+
+def _index_path(log_file: Path, stat: os.stat_result) -> Path:
+    """Ruta del índice sidecar de un archivo (por inodo)."""
+    return log_file.parent / INDEX_DIR_NAME / f"{stat.st_dev}_{stat.st_ino}.json"
+
+
+def _load_index(path: Path) -> Optional[LogIndex]:
+    """Carga un índice sidecar (None si no existe o está corrupto)."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return LogIndex.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _save_index(path: Path, index: LogIndex) -> None:
+    """Guarda un índice sidecar con escritura atómica."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(index.to_dict(), f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # Directorio de logs de solo lectura: se consulta sin persistir
+        pass
+
+
+def _open_index(log_file: Path, mm: Union[mmap.mmap, bytes], stat: os.stat_result) -> LogIndex:
+    """Carga el índice de un archivo leído y lo actualiza con lo añadido."""
+    fingerprint = _fingerprint(mm)
+    path = _index_path(log_file, stat)
+    index = _load_index(path)
+    
+    if index is None or index.fingerprint != fingerprint or index.size > len(mm):
+        index = LogIndex(fingerprint=fingerprint)
+    
+    if index.extend(mm) or not path.exists():
+        _save_index(path, index)
+    return index
+
+
+def _decompress(log_file: Path) -> bytes:
+    """Lee y descomprime un archivo rotado comprimido."""
+    if log_file.suffix == '.gz':
+        with gzip.open(log_file, 'rb') as f:
+            return f.read()
+    
+    if zstandard is None:
+        raise ImportError(f"zstandard es necesario para leer {log_file.name} (pip install zstandard)")
+    out = io.BytesIO()
+    with open(log_file, 'rb') as f:
+        zstandard.ZstdDecompressor().copy_stream(f, out)
+    return out.getvalue()
+
+
+@contextmanager
+def _open_log(log_file: Path) -> Iterator[Tuple[Optional[Union[mmap.mmap, bytes]], Optional[os.stat_result]]]:
+    """
+    Abre un archivo de log para leerlo entero.
+    
+    Yields:
+        (contenido, stat): ``mmap`` para archivos planos, ``bytes`` para
+        comprimidos; (None, None) si no existe, está vacío o no tiene
+        ninguna línea completa
+    """
+    try:
+        f = open(log_file, 'rb')
+    except FileNotFoundError:
+        yield None, None
+        return
+    
+    with f:
+        stat = os.fstat(f.fileno())
+        if stat.st_size == 0:
+            yield None, None
+        elif log_file.suffix in COMPRESSED_SUFFIXES:
+            data = _decompress(log_file)
+            yield (data if _fingerprint(data) is not None else None), stat
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield (mm if _fingerprint(mm) is not None else None), stat
+
+
+def build_index(log_file: Union[str, Path]) -> Optional[LogIndex]:
+    """
+    Crea o actualiza el índice sidecar de un archivo de log.
+    
+    Args:
+        log_file: Archivo de log JSON
+    
+    Returns:
+        Índice actualizado, o None si el archivo no existe o no tiene
+        ninguna línea completa
+    """
+    log_file = Path(log_file)
+    with _open_log(log_file) as (data, stat):
+        if data is None:
+            return None
+        return _open_index(log_file, data, stat)
+
+
+def adopt_index(source: Union[str, Path], dest: Union[str, Path]) -> bool:
+    """
+    Copia el índice de un archivo a otro con el mismo contenido.
+    
+    Se usa al comprimir un archivo rotado: el comprimido tiene otro inodo
+    pero los mismos offsets una vez descomprimido.
+    
+    Args:
+        source: Archivo original (debe existir todavía)
+        dest: Archivo nuevo
+    
+    Returns:
+        True si había índice y se copió
+    """
+    source, dest = Path(source), Path(dest)
+    try:
+        index = _load_index(_index_path(source, source.stat()))
+        dest_stat = dest.stat()
+    except OSError:
+        return False
+    
+    if index is None:
+        return False
+    _save_index(_index_path(dest, dest_stat), index)
+    return True
+
+
+def log_files(logger_name: str, log_dir: Union[str, Path]) -> List[Path]:
+    """
+    Archivos de un logger, del más antiguo al más reciente.
+    
+    Args:
+        logger_name: Nombre del logger (los puntos se sustituyen por '_')
+        log_dir: Directorio de logs
+    
+    Returns:
+        Rotaciones (``.log.N`` ... ``.log.1``, luego las fechadas de
+        ``log_rotation`` por fecha, comprimidas o no) seguidas del archivo
+        activo
+    """
+    base = Path(log_dir) / f"{logger_name.replace('.', '_')}.log"
+    files = rotated_files(base)
+    if base.exists():
+        files.append(base)
+    return files
+
+
+def rotated_files(base: Path) -> List[Path]:
+    """
+    Rotaciones de un archivo de log, de la más antigua a la más reciente.
+    
+    Args:
+        base: Archivo activo (``logs/<logger>.log``)
+    
+    Returns:
+        Archivos rotados (sin el activo)
+    """
+    rotated = []
+    for path in base.parent.glob(base.name + '.*'):
+        suffix = path.name[len(base.name) + 1:]
+        for compressed in COMPRESSED_SUFFIXES:
+            if suffix.endswith(compressed):
+                suffix = suffix[:-len(compressed)]
+                break
+    
+        match = _ROTATION_SUFFIX_RE.match(suffix)
+        if match is None:
+            continue
+        number, stamp = match.groups()
+        if number is not None:
+            rotated.append(((0, -int(number), ''), path))
+        else:
+            stamp, _, count = stamp.partition('-')
+            rotated.append(((1, int(count or 0), stamp), path))
+    
+    rotated.sort(key=lambda item: (item[0][0], item[0][2], item[0][1]))
+    return [path for _, path in rotated]
+
+
+def query_logs(
+    logger_name: str,
+    start: TimeBound = None,
+    end: TimeBound = None,
+    level: Union[str, Iterable[str], None] = None,
+    symbol: Optional[str] = None,
+    log_dir: Union[str, Path, None] = None
+) -> Iterator[dict]:
+    """
+    Consulta los registros de un logger usando los índices sidecar.
+    
+    Args:
+        logger_name: Nombre del logger
+        start: Inicio (inclusive, UTC si no tiene zona)
+        end: Fin (inclusive, UTC si no tiene zona)
+        level: Nivel o niveles exactos (ej. 'ERROR' o ['ERROR', 'CRITICAL'])
+        symbol: Valor de ``symbol`` en ``extra_fields``
+        log_dir: Directorio de logs (por defecto, ``data.log_path`` de la configuración)
+    
+    Yields:
+        Registros (dict) en orden cronológico de archivo
+    
+    Example:
+        >>> errors = list(query_logs("engine", level="ERROR", symbol="AAPL"))
+    """
+    if log_dir is None:
+        from .config import get_config
+        log_dir = get_config().data.log_path
+    
+    start, end = _to_bound(start), _to_bound(end)
+    levels = {level.upper()} if isinstance(level, str) else (
+        {lvl.upper() for lvl in level} if level is not None else None
+    )
+    symbol_bytes = json.dumps(symbol, ensure_ascii=False).encode('utf-8') if symbol else None
+    
+    for log_file in log_files(logger_name, log_dir):
+        yield from _query_file(log_file, start, end, levels, symbol, symbol_bytes)
+
+
+def _query_file(
+    log_file: Path,
+    start: Optional[str],
+    end: Optional[str],
+    levels: Optional[Set[str]],
+    symbol: Optional[str],
+    symbol_bytes: Optional[bytes]
+) -> Iterator[dict]:
+    """Consulta un archivo leyendo solo sus bloques candidatos."""
+    with _open_log(log_file) as (data, stat):
+        if data is None:
+            return
+        index = _open_index(log_file, data, stat)
+    
+        for offset, length, _, _ in index.candidate_blocks(start, end, levels, symbol):
+            for line in data[offset:offset + length].splitlines():
+                # Prefiltro por bytes antes de parsear el JSON
+                if symbol_bytes is not None and symbol_bytes not in line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if _matches(record, start, end, levels, symbol):
+                    yield record
+
+
+def _matches(
+    record: dict,
+    start: Optional[str],
+    end: Optional[str],
+    levels: Optional[Set[str]],
+    symbol: Optional[str]
+) -> bool:
+    """Aplica los filtros exactos a un registro."""
+    if levels is not None and record.get('level') not in levels:
+        return False
+    if symbol is not None and record.get('symbol') != symbol:
+        return False
+    if start is not None or end is not None:
+        timestamp = record.get('timestamp')
+        if not isinstance(timestamp, str):
+            return False
+        timestamp = _normalize_timestamp(timestamp)
+        if start is not None and timestamp < start:
+            return False
+        if end is not None and timestamp > end:
+            return False
+    return True
+
+
+def prune_indexes(log_dir: Union[str, Path]) -> int:
+    """
+    Elimina índices cuyo archivo de log ya no existe.
+    
+    Args:
+        log_dir: Directorio de logs
+    
+    Returns:
+        Número de índices eliminados
+    """
+    log_dir = Path(log_dir)
+    index_dir = log_dir / INDEX_DIR_NAME
+    if not index_dir.exists():
+        return 0
+    
+    live = set()
+    for path in log_dir.glob('*.log*'):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        live.add(f"{stat.st_dev}_{stat.st_ino}.json")
+    
+    removed = 0
+    for index_file in index_dir.glob('*.json'):
+        if index_file.name not in live:
+            index_file.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
+def index_maintainer() -> 'RotatedLogMaintainer':
+    """
+    Mantenedor compartido que indexa los archivos rotados por ``indexing_rotator``.
+    
+    Se crea en el primer uso, sin compresión ni retención: un único hilo
+    atiende todas las rotaciones en orden.
+    
+    Returns:
+        Mantenedor de ``log_rotation``
+    """
+    global _index_maintainer
+    
+    with _index_maintainer_lock:
+        if _index_maintainer is None:
+            # Import diferido: log_rotation importa este módulo
+            from .log_rotation import RotatedLogMaintainer
+            _index_maintainer = RotatedLogMaintainer(compression='none', index=True)
+        return _index_maintainer
+
+
+def indexing_rotator(source: str, dest: str) -> None:
+    """
+    Rotador para ``RotatingFileHandler`` que indexa el archivo rotado.
+    
+    Renombra como el rotador por defecto y encola el indexado en
+    ``index_maintainer()``, para no bloquear al handler.
+    
+    Example:
+        >>> handler.rotator = indexing_rotator
+    """
+    if os.path.exists(source):
+        os.rename(source, dest)
+    
+    index_maintainer().submit(source)
+
+
+# Exportar para uso externo
+__all__ = [
+    'LogIndex',
+    'build_index',
+    'query_logs',
+    'log_files',
+    'rotated_files',
+    'adopt_index',
+    'prune_indexes',
+    'indexing_rotator',
+    'index_maintainer',
+    'INDEX_BLOCK_SIZE',
+    'COMPRESSED_SUFFIXES',
+]
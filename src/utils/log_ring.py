@@ -0,0 +1,247 @@
+"""
+Buffer circular en memoria de los registros recientes (volcados de crash).
+
+``RingBufferHandler`` guarda los últimos N ``LogRecord`` sin formatear en
+una lista preasignada: emitir un registro es una asignación por índice,
+sin formateo, E/S ni lock. Se instala en los loggers a nivel DEBUG aunque
+los handlers de consola y archivo filtren a INFO, y solo se formatea (en
+JSON) y se escribe a disco cuando se pide:
+
+- Explícitamente con ``dump()``
+- Ante una excepción no capturada (hilo principal u otros hilos)
+- Ante una señal (SIGUSR1 vuelca y sigue; SIGTERM vuelca y termina)
+
+Example:
+    >>> ring = RingBufferHandler(capacity=5000)
+    >>> logger.addHandler(ring)
+    >>> uninstall = install_crash_handlers(ring, Path("logs/crash"))
+    >>> ring.dump(Path("logs/crash"), reason="manual")
+"""
+
+import itertools
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+
+# Señales que provocan un volcado (las que existan en la plataforma)
+DEFAULT_DUMP_SIGNALS = tuple(
+    sig for sig in (getattr(signal, 'SIGUSR1', None), signal.SIGTERM) if sig is not None
+)
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Handler que conserva los últimos ``capacity`` registros sin formatear.
+    
+    Los registros se guardan tal cual: sus ``args`` se interpolan al volcar,
+    así que objetos mutables pasados como argumentos muestran su valor en
+    ese momento.
+    
+    Example:
+        >>> ring = RingBufferHandler(capacity=2000)
+        >>> logger.addHandler(ring)
+        >>> ring.records()[-1].getMessage()
+    """
+    
+    def __init__(self, capacity: int = 5000, level: int = logging.DEBUG):
+        """
+        Inicializa el buffer.
+        
+        Args:
+            capacity: Número de registros conservados
+            level: Nivel mínimo de los registros guardados
+        
+        Raises:
+            ValueError: Si la capacidad no es positiva
+        """
+        if capacity < 1:
+            raise ValueError(f"La capacidad debe ser positiva, recibido: {capacity}")
+        
+        super().__init__(level)
+        self.capacity = capacity
+        self._buffer: List[Optional[logging.LogRecord]] = [None] * capacity
+        self._counter = itertools.count()
+        self._written = 0
+        self._dump_lock = threading.Lock()
+    
+    def handle(self, record: logging.LogRecord) -> bool:
+        """
+        Guarda el registro si pasa los filtros (sin tomar el lock del handler).
+        
+        Returns:
+            True si el registro se guardó
+        """
+        if not self.filter(record):
+            return False
+        self.emit(record)
+        return True
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Guarda el registro en la siguiente posición del buffer."""
+        # next() sobre itertools.count es atómico: cada hilo obtiene su posición
+        index = next(self._counter)
+        self._buffer[index % self.capacity] = record
+        self._written = index + 1
+    
+    def records(self) -> List[logging.LogRecord]:
+        """
+        Devuelve los registros guardados, del más antiguo al más reciente.
+        
+        Returns:
+            Copia del contenido del buffer
+        """
+        written = self._written
+        snapshot = self._buffer[:]
+        if written <= self.capacity:
+            return [record for record in snapshot[:written] if record is not None]
+        
+        start = written % self.capacity
+        return [record for record in snapshot[start:] + snapshot[:start] if record is not None]
+    
+    def clear(self) -> None:
+        """Vacía el buffer."""
+        self._buffer = [None] * self.capacity
+        self._counter = itertools.count()
+        self._written = 0
+    
+    def dump(
+        self,
+        directory: Path,
+        reason: str = "manual",
+        formatter: Optional[logging.Formatter] = None
+    ) -> Optional[Path]:
+        """
+        Escribe los registros guardados en un archivo JSON (uno por línea).
+        
+        El archivo se llama ``crash-<fecha>-<pid>-<motivo>.log``. Por
+        defecto se formatea con ``FastJsonFormatter`` (mismos campos que
+        ``JsonFormatter``, con el timestamp original de cada registro).
+        
+        Args:
+            directory: Directorio de destino (se crea si no existe)
+            reason: Motivo del volcado (se incluye en el nombre)
+            formatter: Formateador alternativo
+        
+        Returns:
+            Ruta del archivo, o None si el buffer está vacío
+        """
+        records = self.records()
+        if not records:
+            return None
+        
+        if formatter is None:
+            # Import diferido: logger importa este módulo
+            from .logger import FastJsonFormatter
+            formatter = FastJsonFormatter()
+        
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime('%Y%m%dT%H%M%S')
+        path = directory / f"crash-{stamp}-{os.getpid()}-{reason}.log"
+        
+        lines = []
+        for record in records:
+            try:
+                lines.append(formatter.format(record))
+            except Exception as e:
+                lines.append(f'{{"level":"ERROR","message":"Registro no formateable: {type(e).__name__}"}}')
+        
+        with self._dump_lock:
+            tmp_path = path.with_suffix('.tmp')
+            tmp_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+            tmp_path.replace(path)
+        
+        return path
+    
+    def __len__(self) -> int:
+        """Registros guardados."""
+        return min(self._written, self.capacity)
+
+
+def install_crash_handlers(
+    ring: RingBufferHandler,
+    directory: Path,
+    signals: Sequence[int] = DEFAULT_DUMP_SIGNALS
+) -> Callable[[], None]:
+    """
+    Vuelca el buffer ante excepciones no capturadas y señales.
+    
+    Encadena ``sys.excepthook`` y ``threading.excepthook`` con los hooks
+    previos. Las señales solo se instalan desde el hilo principal; tras el
+    volcado se llama al handler previo de la señal (el de SIGTERM por
+    defecto termina el proceso), salvo para SIGUSR1, que solo vuelca.
+    
+    Args:
+        ring: Buffer a volcar
+        directory: Directorio de los volcados
+        signals: Señales que provocan un volcado
+    
+    Returns:
+        Función que restaura los hooks y handlers de señal previos
+    """
+    previous_excepthook = sys.excepthook
+    previous_thread_hook = threading.excepthook
+    previous_signals = {}
+    
+    def excepthook(exc_type, exc_value, exc_traceback):
+        _safe_dump(ring, directory, "exception")
+        previous_excepthook(exc_type, exc_value, exc_traceback)
+    
+    def thread_excepthook(args):
+        if args.exc_type is not SystemExit:
+            _safe_dump(ring, directory, "thread-exception")
+        previous_thread_hook(args)
+    
+    def signal_handler(signum, frame):
+        _safe_dump(ring, directory, signal.Signals(signum).name.lower())
+        previous = previous_signals.get(signum)
+        if signum == getattr(signal, 'SIGUSR1', None):
+            return
+        if callable(previous):
+            previous(signum, frame)
+        elif previous == signal.SIG_DFL:
+            signal.signal(signum, signal.SIG_DFL)
+            signal.raise_signal(signum)
+    
+    sys.excepthook = excepthook
+    threading.excepthook = thread_excepthook
+    
+    if threading.current_thread() is threading.main_thread():
+        for signum in signals:
+            previous_signals[signum] = signal.signal(signum, signal_handler)
+    
+    def uninstall() -> None:
+        if sys.excepthook is excepthook:
+            sys.excepthook = previous_excepthook
+        if threading.excepthook is thread_excepthook:
+            threading.excepthook = previous_thread_hook
+        if threading.current_thread() is threading.main_thread():
+            for signum, previous in previous_signals.items():
+                if signal.getsignal(signum) is signal_handler:
+                    signal.signal(signum, previous)
+    
+    return uninstall
+
+
+def _safe_dump(ring: RingBufferHandler, directory: Path, reason: str) -> None:
+    """Vuelca el buffer sin propagar errores (se llama durante un crash)."""
+    try:
+        path = ring.dump(directory, reason)
+        if path is not None:
+            print(f"Volcado de logs recientes: {path}", file=sys.stderr)
+    except Exception as e:
+        print(f"No se pudo volcar el buffer de logs: {e}", file=sys.stderr)
+
+
+# Exportar para uso externo
+__all__ = [
+    'RingBufferHandler',
+    'install_crash_handlers',
+    'DEFAULT_DUMP_SIGNALS',
+]
@@ -0,0 +1,428 @@
+"""
+Rotación de logs por sesión de mercado con compresión y retención en fondo.
+
+``RotatingFileHandler`` rota en el hilo que hace el log: renombra en
+cascada todos los backups (``.log.1`` -> ``.log.2``...) y los deja sin
+comprimir. ``SessionRotatingFileHandler`` rota con un único ``rename`` a un
+nombre fechado (``<logger>.log.20240308T133000``) y entrega el archivo a un
+``RotatedLogMaintainer``, cuyo hilo de fondo:
+
+1. Indexa el archivo para ``log_query`` (si está activado)
+2. Lo comprime (gzip, o zstd si ``zstandard`` está instalado)
+3. Aplica la retención: número de archivos, tamaño total y antigüedad
+
+El hilo que hace el log nunca espera por la compresión ni por la retención.
+
+La rotación puede ser por tamaño y/o diaria a una hora de la sesión (por
+ejemplo, la apertura a las 09:30 de Nueva York), solo en días laborables:
+los logs del fin de semana quedan en el archivo del viernes.
+
+Example:
+    >>> maintainer = RotatedLogMaintainer(compression='gzip', max_files=30, max_total_mb=500)
+    >>> handler = SessionRotatingFileHandler(
+    ...     "logs/engine.log", max_bytes=10 * 1024 * 1024,
+    ...     rotate_at="09:30", timezone="America/New_York", maintainer=maintainer
+    ... )
+"""
+
+import gzip
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import threading
+import time
+from datetime import datetime, time as dt_time, timedelta
+from pathlib import Path
+from typing import List, Optional, Union
+from zoneinfo import ZoneInfo
+
+from .log_query import COMPRESSED_SUFFIXES, adopt_index, build_index, prune_indexes, rotated_files
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Compresiones soportadas y su extensión
+COMPRESSION_SUFFIXES = {
+    'none': '',
+    'gzip': '.gz',
+    'zstd': '.zst',
+}
+
+_logger = logging.getLogger(__name__)
+
+
+def parse_session_time(value: str) -> dt_time:
+    """
+    Convierte una hora "HH:MM" en ``datetime.time``.
+    
+    Args:
+        value: Hora en formato 24h
+    
+    Returns:
+        Hora del día
+    
+    Raises:
+        ValueError: Si el formato no es válido
+    """
+    try:
+        hour, minute = (int(part) for part in value.split(':'))
+        return dt_time(hour, minute)
+    except (TypeError, ValueError):
+        raise ValueError(f"Hora de rotación inválida: '{value}'. Formato esperado: HH:MM") from None
+
+
+def resolve_compression(compression: str) -> str:
+    """
+    Valida la compresión y sustituye zstd por gzip si no está disponible.
+    
+    Args:
+        compression: 'none', 'gzip' o 'zstd'
+    
+    Returns:
+        Compresión efectiva
+    
+    Raises:
+        ValueError: Si la compresión no es válida
+    """
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Compresión inválida: '{compression}'. Válidas: {list(COMPRESSION_SUFFIXES)}")
+    
+    if compression == 'zstd' and zstandard is None:
+        _logger.warning("zstandard no está instalado; los logs rotados se comprimen con gzip")
+        return 'gzip'
+    return compression
+
+
+def compress_file(path: Union[str, Path], compression: str = 'gzip') -> Path:
+    """
+    Comprime un archivo rotado y elimina el original.
+    
+    El comprimido conserva la fecha de modificación y hereda el índice de
+    ``log_query`` del original.
+    
+    Args:
+        path: Archivo a comprimir
+        compression: 'gzip' o 'zstd'
+    
+    Returns:
+        Ruta del archivo comprimido
+    """
+    path = Path(path)
+    dest = path.with_name(path.name + COMPRESSION_SUFFIXES[compression])
+    tmp_path = dest.with_name(dest.name + '.tmp')
+    stat = path.stat()
+    
+    try:
+        with open(path, 'rb') as src, open(tmp_path, 'wb') as raw:
+            if compression == 'gzip':
+                with gzip.GzipFile(filename='', mode='wb', fileobj=raw, compresslevel=6, mtime=0) as out:
+                    shutil.copyfileobj(src, out, 1024 * 1024)
+            else:
+                zstandard.ZstdCompressor(level=3).copy_stream(src, raw)
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(tmp_path, dest)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    
+    adopt_index(path, dest)
+    path.unlink()
+    return dest
+
+
+class RotatedLogMaintainer:
+    """
+    Hilo de fondo que comprime los logs rotados y aplica la retención.
+    
+    Un único mantenedor puede atender a todos los handlers: las peticiones
+    se encolan sin límite (``submit`` nunca bloquea) y se procesan en orden.
+    
+    Example:
+        >>> maintainer = RotatedLogMaintainer(compression='gzip', max_age_days=30)
+        >>> maintainer.submit(Path("logs/engine.log"))
+        >>> maintainer.stop()
+    """
+    
+    def __init__(
+        self,
+        compression: str = 'gzip',
+        max_files: int = 0,
+        max_total_mb: float = 0,
+        max_age_days: float = 0,
+        index: bool = True
+    ):
+        """
+        Inicializa el mantenedor.
+        
+        Args:
+            compression: 'none', 'gzip' o 'zstd' (gzip si falta zstandard)
+            max_files: Máximo de archivos rotados por log (0 = sin límite)
+            max_total_mb: Tamaño máximo de los rotados por log en MB (0 = sin límite)
+            max_age_days: Antigüedad máxima en días (0 = sin límite)
+            index: Indexar los archivos rotados para ``log_query``
+        """
+        self.compression = resolve_compression(compression)
+        self.max_files = max_files
+        self.max_total_bytes = int(max_total_mb * 1024 * 1024)
+        self.max_age_seconds = max_age_days * 86400
+        self.index = index
+        self.last_error: Optional[Exception] = None
+        self._queue: 'queue.Queue[Optional[Path]]' = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def is_running(self) -> bool:
+        """True si el hilo del mantenedor está activo."""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def submit(self, base: Union[str, Path]) -> None:
+        """
+        Programa el mantenimiento de los rotados de un log (no bloquea).
+        
+        Args:
+            base: Archivo activo del log (``logs/<logger>.log``)
+        """
+        self._queue.put(Path(base))
+        
+        if not self.is_running:
+            with self._lock:
+                if not self.is_running:
+                    self._thread = threading.Thread(
+                        target=self._run,
+                        name='LogMaintainer',
+                        daemon=True
+                    )
+                    self._thread.start()
+    
+    def wait(self) -> None:
+        """Espera a que se procesen todas las peticiones encoladas."""
+        self._queue.join()
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Procesa lo pendiente y detiene el hilo.
+        
+        Args:
+            timeout: Segundos máximos de espera (None = sin límite); lo que
+                quede sin comprimir se procesa en el siguiente ``submit``
+        """
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self._thread = None
+    
+    def _run(self) -> None:
+        """Bucle del hilo: procesa peticiones hasta recibir None."""
+        while True:
+            base = self._queue.get()
+            try:
+                if base is None:
+                    return
+                self.process(base)
+            except Exception as e:
+                self.last_error = e
+                _logger.warning("Error manteniendo los logs rotados de %s: %s", base, e)
+            finally:
+                self._queue.task_done()
+    
+    def process(self, base: Union[str, Path]) -> List[Path]:
+        """
+        Indexa y comprime los rotados pendientes de un log y aplica la retención.
+        
+        Args:
+            base: Archivo activo del log
+        
+        Returns:
+            Archivos eliminados por la retención
+        """
+        base = Path(base)
+        
+        for path in rotated_files(base):
+            if path.suffix in COMPRESSED_SUFFIXES:
+                continue
+            # Un rotado puede desaparecer mientras tanto (p. ej. en la cascada
+            # de ``RotatingFileHandler``): se registra y se sigue con el resto
+            try:
+                if self.index:
+                    build_index(path)
+                if self.compression != 'none':
+                    compress_file(path, self.compression)
+            except OSError as e:
+                self.last_error = e
+                _logger.warning("Error procesando el log rotado %s: %s", path, e)
+        
+        removed = self.enforce_retention(base)
+        if self.index:
+            prune_indexes(base.parent)
+        return removed
+    
+    def enforce_retention(self, base: Path) -> List[Path]:
+        """
+        Elimina los rotados más antiguos que exceden el presupuesto.
+        
+        Args:
+            base: Archivo activo del log
+        
+        Returns:
+            Archivos eliminados
+        """
+        now = time.time()
+        kept = 0
+        total = 0
+        removed = []
+        
+        for path in reversed(rotated_files(base)):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            
+            kept += 1
+            total += stat.st_size
+            if (
+                (self.max_files and kept > self.max_files)
+                or (self.max_total_bytes and total > self.max_total_bytes)
+                or (self.max_age_seconds and now - stat.st_mtime > self.max_age_seconds)
+            ):
+                path.unlink(missing_ok=True)
+                removed.append(path)
+        
+        return removed
+
+
+class SessionRotatingFileHandler(logging.handlers.BaseRotatingHandler):
+    """
+    Handler de archivo que rota por tamaño y/o a una hora de sesión.
+    
+    La rotación es un único ``rename`` a ``<archivo>.<AAAAMMDDTHHMMSS>``
+    (UTC); indexado, compresión y retención los hace el ``maintainer`` en
+    su hilo. El tamaño se comprueba tras cada escritura, así que un archivo
+    puede superar ``max_bytes`` en un registro.
+    
+    Example:
+        >>> handler = SessionRotatingFileHandler(
+        ...     "logs/engine.log", rotate_at="09:30", maintainer=RotatedLogMaintainer()
+        ... )
+    """
+    
+    def __init__(
+        self,
+        filename: Union[str, Path],
+        max_bytes: int = 0,
+        rotate_at: Optional[str] = None,
+        timezone: str = "America/New_York",
+        maintainer: Optional[RotatedLogMaintainer] = None,
+        encoding: Optional[str] = 'utf-8',
+        delay: bool = False
+    ):
+        """
+        Inicializa el handler.
+        
+        Args:
+            filename: Archivo de log activo
+            max_bytes: Tamaño de rotación (0 = sin rotación por tamaño)
+            rotate_at: Hora de rotación diaria "HH:MM" (None = sin rotación por hora)
+            timezone: Zona horaria de ``rotate_at``
+            maintainer: Mantenedor de los archivos rotados (None = solo rotar)
+            encoding: Codificación del archivo
+            delay: Abrir el archivo en la primera escritura
+        """
+        super().__init__(filename, 'a', encoding=encoding, delay=delay)
+        self.max_bytes = max_bytes
+        self.rotate_at = parse_session_time(rotate_at) if rotate_at else None
+        self.timezone = ZoneInfo(timezone)
+        self.maintainer = maintainer
+        
+        # Un archivo de una sesión anterior rota con el primer registro
+        try:
+            reference = os.stat(self.baseFilename).st_mtime
+        except FileNotFoundError:
+            reference = time.time()
+        self.rollover_at = self.next_rollover(reference)
+        
+        # Rotados que quedaron pendientes (p. ej. al cerrar sin terminar)
+        if maintainer is not None and rotated_files(Path(self.baseFilename)):
+            maintainer.submit(self.baseFilename)
+    
+    def next_rollover(self, now: float) -> float:
+        """
+        Calcula la siguiente rotación por hora tras ``now``.
+        
+        Args:
+            now: Timestamp de referencia (epoch)
+        
+        Returns:
+            Timestamp de la siguiente rotación (infinito si no hay hora)
+        """
+        if self.rotate_at is None:
+            return float('inf')
+        
+        current = datetime.fromtimestamp(now, self.timezone)
+        candidate = datetime.combine(current.date(), self.rotate_at, tzinfo=self.timezone)
+        if candidate <= current:
+            candidate += timedelta(days=1)
+        while candidate.weekday() >= 5:
+            candidate += timedelta(days=1)
+        return candidate.timestamp()
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """
+        Indica si hay que rotar antes de escribir el registro.
+        
+        Args:
+            record: Registro a escribir
+        
+        Returns:
+            True si se alcanzó la hora de rotación o el tamaño máximo
+        """
+        if record.created >= self.rollover_at:
+            return True
+        if self.max_bytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+            return self.stream.tell() >= self.max_bytes
+        return False
+    
+    def doRollover(self) -> None:
+        """Renombra el archivo activo y lo entrega al mantenedor."""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        
+        if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+            self.rotate(self.baseFilename, self._rotated_name())
+            if self.maintainer is not None:
+                self.maintainer.submit(self.baseFilename)
+        
+        self.rollover_at = self.next_rollover(time.time())
+        if not self.delay:
+            self.stream = self._open()
+    
+    def _rotated_name(self) -> str:
+        """Nombre fechado (UTC) y libre para el archivo rotado."""
+        stem = f"{self.baseFilename}.{time.strftime('%Y%m%dT%H%M%S', time.gmtime())}"
+        name = stem
+        count = 0
+        while any(os.path.exists(name + suffix) for suffix in ('', *COMPRESSED_SUFFIXES)):
+            count += 1
+            name = f"{stem}-{count}"
+        return self.rotation_filename(name)
+
+
+# Exportar para uso externo
+__all__ = [
+    'SessionRotatingFileHandler',
+    'RotatedLogMaintainer',
+    'compress_file',
+    'parse_session_time',
+    'resolve_compression',
+    'COMPRESSION_SUFFIXES',
+]
@@ -0,0 +1,273 @@
+"""
+Muestreo y limitación de logs repetitivos para bucles calientes.
+
+Filtros de ``logging`` que deciden por (logger, plantilla del mensaje)
+antes de formatear nada: usan ``record.msg`` (sin interpolar), así que un
+registro descartado solo cuesta la creación del ``LogRecord`` y una
+consulta a un diccionario. Se instalan en el logger (no en los handlers)
+para que el descarte ocurra antes de cualquier handler o cola asíncrona.
+
+- ``SampleFilter``: registra 1 de cada N repeticiones
+- ``RateLimitFilter``: token bucket (mensajes/s con ráfaga)
+- ``FirstKFilter``: las primeras K repeticiones por ventana de tiempo
+
+Los registros de nivel ``exempt_level`` (WARNING por defecto) o superior
+nunca se descartan. Cuando un mensaje vuelve a pasar tras descartes, se
+anota con el número de repeticiones suprimidas (``record.suppressed``, que
+los formateadores JSON emiten como campo ``suppressed``); ``record.msg`` no
+se modifica, así que los filtros apilados comparten la misma clave.
+
+Example:
+    >>> logger.addFilter(RateLimitFilter(rate=5, burst=10))
+    >>> for symbol in universe:
+    ...     logger.info("Tick procesado %s", symbol)  # ≤ 5/s por plantilla
+"""
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+import time
+from typing import Any, Dict, Hashable, List, Tuple
+
+
+# Máximo de plantillas con estado por filtro (los f-strings crean una por llamada)
+MAX_TRACKED_KEYS = 10000
+
+
+class _SuppressingFilter(logging.Filter, ABC):
+    """
+    Base de los filtros: estado y conteo de descartes por (logger, plantilla).
+    
+    Las subclases implementan ``_allow(key, now)``.
+    """
+    
+    def __init__(self, exempt_level: int = logging.WARNING, max_keys: int = MAX_TRACKED_KEYS):
+        """
+        Inicializa el filtro.
+        
+        Args:
+            exempt_level: Nivel a partir del cual nunca se descarta
+            max_keys: Máximo de plantillas con estado (al superarlo se reinicia)
+        """
+        super().__init__()
+        self.exempt_level = exempt_level
+        self.max_keys = max_keys
+        self._state: Dict[Hashable, Any] = {}
+        self._suppressed: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Decide si el registro se emite.
+        
+        Args:
+            record: Registro sin formatear
+        
+        Returns:
+            True si el registro debe emitirse
+        """
+        if record.levelno >= self.exempt_level:
+            return True
+        
+        key = _template_key(record)
+        
+        with self._lock:
+            if len(self._state) >= self.max_keys and key not in self._state:
+                self._state.clear()
+            
+            if not self._allow(key, time.monotonic()):
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                return False
+            
+            suppressed = self._suppressed.pop(key, 0) if self._suppressed else 0
+        
+        if suppressed:
+            _annotate(record, suppressed)
+        return True
+    
+    @abstractmethod
+    def _allow(self, key: Hashable, now: float) -> bool:
+        """
+        Decide si una repetición de la plantilla pasa (se llama con el lock tomado).
+        
+        Args:
+            key: (logger, plantilla)
+            now: ``time.monotonic()`` del registro
+        
+        Returns:
+            True si el registro debe emitirse
+        """
+    
+    def suppressed_counts(self) -> Dict[Hashable, int]:
+        """
+        Descartes pendientes de reportar por (logger, plantilla).
+        
+        Returns:
+            Copia del conteo de registros suprimidos
+        """
+        with self._lock:
+            return dict(self._suppressed)
+
+
+class SampleFilter(_SuppressingFilter):
+    """
+    Registra 1 de cada N repeticiones de cada plantilla (la primera siempre).
+    
+    Example:
+        >>> logger.addFilter(SampleFilter(100))
+    """
+    
+    def __init__(self, rate: int, **kwargs):
+        """
+        Args:
+            rate: N (1 = registrar todo)
+        
+        Raises:
+            ValueError: Si rate < 1
+        """
+        if rate < 1:
+            raise ValueError(f"La tasa de muestreo debe ser >= 1, recibido: {rate}")
+        super().__init__(**kwargs)
+        self.rate = rate
+    
+    def _allow(self, key: Hashable, now: float) -> bool:
+        count = self._state.get(key, 0)
+        self._state[key] = count + 1
+        return count % self.rate == 0
+
+
+class RateLimitFilter(_SuppressingFilter):
+    """
+    Token bucket por plantilla: ``rate`` mensajes/s con ráfagas de ``burst``.
+    
+    Example:
+        >>> logger.addFilter(RateLimitFilter(rate=1.0, burst=5))
+    """
+    
+    def __init__(self, rate: float, burst: int = 10, **kwargs):
+        """
+        Args:
+            rate: Tokens repuestos por segundo
+            burst: Capacidad del bucket
+        
+        Raises:
+            ValueError: Si rate <= 0 o burst < 1
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"Límite inválido: rate={rate}, burst={burst}")
+        super().__init__(**kwargs)
+        self.rate = rate
+        self.burst = burst
+    
+    def _allow(self, key: Hashable, now: float) -> bool:
+        tokens, last = self._state.get(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+        
+        if tokens >= 1:
+            self._state[key] = (tokens - 1, now)
+            return True
+        
+        self._state[key] = (tokens, now)
+        return False
+
+
+class FirstKFilter(_SuppressingFilter):
+    """
+    Registra las primeras K repeticiones de cada plantilla por ventana.
+    
+    El primer registro de la ventana siguiente lleva el resumen de los
+    suprimidos en la anterior.
+    
+    Example:
+        >>> logger.addFilter(FirstKFilter(k=3, window=60))
+    """
+    
+    def __init__(self, k: int, window: float = 60.0, **kwargs):
+        """
+        Args:
+            k: Repeticiones registradas por ventana
+            window: Duración de la ventana en segundos
+        
+        Raises:
+            ValueError: Si k < 1 o window <= 0
+        """
+        if k < 1 or window <= 0:
+            raise ValueError(f"Parámetros inválidos: k={k}, window={window}")
+        super().__init__(**kwargs)
+        self.k = k
+        self.window = window
+    
+    def _allow(self, key: Hashable, now: float) -> bool:
+        start, count = self._state.get(key, (now, 0))
+        if now - start >= self.window:
+            start, count = now, 0
+        self._state[key] = (start, count + 1)
+        return count < self.k
+
+
+def _template_key(record: logging.LogRecord) -> Tuple[str, Hashable]:
+    """
+    Clave (logger, plantilla); usa la línea si el mensaje no es hashable.
+    
+    Se calcula una vez y se guarda en el registro para que todos los filtros
+    apilados usen la misma.
+    """
+    key = getattr(record, '_sampling_key', None)
+    if key is not None:
+        return key
+    
+    msg = record.msg
+    try:
+        hash(msg)
+        key = record.name, msg
+    except TypeError:
+        key = record.name, record.lineno
+    record._sampling_key = key
+    return key
+
+
+def _annotate(record: logging.LogRecord, suppressed: int) -> None:
+    """Anota en el registro las repeticiones suprimidas desde el último emitido."""
+    record.suppressed = getattr(record, 'suppressed', 0) + suppressed
+
+
+def create_sampling_filters(
+    sample_rate: int = 1,
+    rate_limit_per_sec: float = 0.0,
+    rate_limit_burst: int = 10,
+    first_k: int = 0,
+    first_k_window_sec: float = 60.0
+) -> List[logging.Filter]:
+    """
+    Crea los filtros activos según la configuración.
+    
+    Args:
+        sample_rate: 1 de cada N (1 = desactivado)
+        rate_limit_per_sec: Mensajes/s por plantilla (0 = desactivado)
+        rate_limit_burst: Ráfaga del token bucket
+        first_k: Repeticiones por ventana (0 = desactivado)
+        first_k_window_sec: Ventana de ``first_k`` en segundos
+    
+    Returns:
+        Lista de filtros (vacía si no hay ninguno activo)
+    """
+    filters: List[logging.Filter] = []
+    
+    if sample_rate > 1:
+        filters.append(SampleFilter(sample_rate))
+    if rate_limit_per_sec > 0:
+        filters.append(RateLimitFilter(rate_limit_per_sec, rate_limit_burst))
+    if first_k > 0:
+        filters.append(FirstKFilter(first_k, first_k_window_sec))
+    
+    return filters
+
+
+# Exportar para uso externo
+__all__ = [
+    'SampleFilter',
+    'RateLimitFilter',
+    'FirstKFilter',
+    'create_sampling_filters',
+    'MAX_TRACKED_KEYS',
+]
@@ -4,9 +4,14 @@ Sistema de logging estructurado para el Trading Bot.
 Este módulo proporciona un logger configurable que:
 - Soporta múltiples niveles de logging
 - Formatea logs en JSON para fácil parsing
-- Rota archivos automáticamente
+- Rota archivos automáticamente (opcionalmente por sesión, con compresión
+  y retención en un hilo de fondo; ver ``log_rotation``)
 - Integra con ConfigManager
 - Soporta logging a consola y archivo simultáneamente
+- Modo asíncrono: encola los registros y los escribe en un hilo de fondo
+- Muestreo y limitación de mensajes repetitivos
+- Buffer circular de registros DEBUG recientes para volcados de crash
+- Contexto ligado por tarea/hilo (``log_context``) incluido en el JSON
 
 Example:
     >>> from src.utils.logger import get_logger
@@ -14,15 +19,73 @@ Example:
     >>> logger.info("Bot iniciado", extra={"version": "0.1.0"})
 """
 
+import atexit
 import logging
 import logging.handlers
 import sys
 import json
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, List, Tuple, Type
 from datetime import datetime
 
-from .config import get_config
+from .async_logging import AsyncLogQueue, AsyncQueueHandler, BatchQueueListener
+from .log_context import ContextFilter
+from .log_ring import RingBufferHandler, install_crash_handlers
+from .log_sampling import create_sampling_filters
+
+if TYPE_CHECKING:
+    from .log_rotation import RotatedLogMaintainer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Backend JSON de FastJsonFormatter: orjson si está instalado
+if orjson is not None:
+    JSON_BACKEND = 'orjson'
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+    
+    def _dumps(obj: Any) -> bytes:
+        """Serializa a JSON compacto en UTF-8."""
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS)
+else:
+    JSON_BACKEND = 'json'
+    _ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=str)
+    
+    def _dumps(obj: Any) -> bytes:
+        """Serializa a JSON compacto en UTF-8."""
+        return _ENCODER.encode(obj).encode('utf-8')
+
+# Campos base del JSON (los extra_fields que coinciden los sobrescriben)
+_BASE_FIELDS = frozenset(
+    ('timestamp', 'level', 'logger', 'message', 'module', 'function', 'line', 'exception')
+)
+
+# Máximo de combinaciones (nivel, logger, módulo, función, línea) cacheadas
+STATIC_FIELDS_CACHE_SIZE = 4096
+
+
+def _extra_fields(record: logging.LogRecord) -> Optional[Dict[str, Any]]:
+    """
+    Contexto ligado (``log_context``) más ``extra_fields``, que tienen prioridad.
+    
+    Incluye ``suppressed`` si los filtros de ``log_sampling`` descartaron
+    repeticiones del mensaje antes de este registro.
+    """
+    context = getattr(record, 'log_context', None)
+    extra = getattr(record, 'extra_fields', None)
+    suppressed = getattr(record, 'suppressed', 0)
+    if suppressed:
+        context = {**context, 'suppressed': suppressed} if context else {'suppressed': suppressed}
+    if not context:
+        return extra
+    if not extra:
+        return context
+    return {**context, **extra}
 
 
 class JsonFormatter(logging.Formatter):
@@ -57,13 +120,123 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             log_data['exception'] = self.formatException(record.exc_info)
         
-        # Añadir campos extra si existen
-        if hasattr(record, 'extra_fields'):
-            log_data.update(record.extra_fields)
+        # Añadir contexto ligado y campos extra si existen
+        extra = _extra_fields(record)
+        if extra:
+            log_data.update(extra)
         
         return json.dumps(log_data, ensure_ascii=False)
 
 
+class FastJsonFormatter(JsonFormatter):
+    """
+    Versión optimizada de ``JsonFormatter`` para alto volumen de logs.
+    
+    Produce los mismos campos que ``JsonFormatter`` en JSON compacto:
+    
+    - Los campos estáticos de cada punto de log (nivel, logger, módulo,
+      función, línea) se codifican una vez y se cachean
+    - El timestamp sale de ``record.created`` y su parte de fecha/hora se
+      cachea por segundo
+    - La salida se escribe en un buffer reutilizable (uno por hilo)
+    - Usa orjson si está instalado (ver ``JSON_BACKEND``)
+    
+    Example:
+        >>> handler.setFormatter(FastJsonFormatter())
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._static: Dict[Tuple[str, str, str, str, int], Tuple[bytes, bytes]] = {}
+        self._second: Tuple[Optional[int], bytes] = (None, b'')
+        self._local = threading.local()
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Formatea un registro de log como JSON.
+        
+        Args:
+            record: Registro de log a formatear
+        
+        Returns:
+            String JSON con el log formateado
+        """
+        extra = _extra_fields(record)
+        if extra and not _BASE_FIELDS.isdisjoint(extra):
+            # Campos extra que sobrescriben campos base: ruta general
+            return super().format(record)
+        
+        head, tail = self._static_fields(record)
+        
+        buf = getattr(self._local, 'buffer', None)
+        if buf is None:
+            buf = self._local.buffer = bytearray()
+        else:
+            del buf[:]
+        
+        buf += b'{"timestamp":"'
+        buf += self._timestamp(record.created)
+        buf += head
+        buf += _dumps(record.getMessage())
+        buf += tail
+        
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            buf += b',"exception":'
+            buf += _dumps(record.exc_text)
+        
+        if extra:
+            buf += b','
+            buf += _dumps(extra)[1:]
+        else:
+            buf += b'}'
+        
+        return buf.decode('utf-8')
+    
+    def _static_fields(self, record: logging.LogRecord) -> Tuple[bytes, bytes]:
+        """
+        Obtiene los fragmentos JSON precodificados de un punto de log.
+        
+        Returns:
+            Tupla (campos antes del mensaje, campos después del mensaje)
+        """
+        key = (record.levelname, record.name, record.module, record.funcName, record.lineno)
+        fragments = self._static.get(key)
+        
+        if fragments is None:
+            if len(self._static) >= STATIC_FIELDS_CACHE_SIZE:
+                self._static.clear()
+            head = (
+                b'","level":' + _dumps(record.levelname)
+                + b',"logger":' + _dumps(record.name)
+                + b',"message":'
+            )
+            tail = (
+                b',"module":' + _dumps(record.module)
+                + b',"function":' + _dumps(record.funcName)
+                + b',"line":' + _dumps(record.lineno)
+            )
+            fragments = self._static[key] = (head, tail)
+        
+        return fragments
+    
+    def _timestamp(self, created: float) -> bytes:
+        """
+        Formatea ``record.created`` en ISO 8601 (UTC) con microsegundos.
+        
+        La parte hasta los segundos se reutiliza mientras no cambie el segundo.
+        """
+        second = int(created)
+        cached_second, prefix = self._second
+        
+        if cached_second != second:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second)).encode()
+            self._second = (second, prefix)
+        
+        return b'%s.%06d' % (prefix, int((created - second) * 1e6))
+
+
 class StructuredLogger:
     """
     Logger estructurado con soporte para JSON y rotación de archivos.
@@ -73,6 +246,10 @@ class StructuredLogger:
     - Formato legible para consola
     - Rotación automática de archivos
     - Múltiples niveles de logging
+    - Modo asíncrono opcional (``logging.async_enabled``): los loggers solo
+      encolan y un ``BatchQueueListener`` escribe por lotes
+    - Buffer circular opcional (``logging.ring_buffer_size``) con los
+      últimos registros a nivel DEBUG, volcado solo ante crash o petición
     
     Example:
         >>> logger = StructuredLogger.get_logger("trading_bot")
@@ -81,6 +258,18 @@ class StructuredLogger:
     
     _loggers: Dict[str, logging.Logger] = {}
     _initialized: bool = False
+    _queue: Optional[AsyncLogQueue] = None
+    _listener: Optional[BatchQueueListener] = None
+    _atexit_registered: bool = False
+    _json_formatter: Type[JsonFormatter] = JsonFormatter
+    _filters: List[logging.Filter] = []
+    _index_logs: bool = False
+    _ring: Optional[RingBufferHandler] = None
+    _context_filter: ContextFilter = ContextFilter()
+    _uninstall_crash_handlers: Optional[Callable[[], None]] = None
+    _maintainer: Optional['RotatedLogMaintainer'] = None
+    _rotate_at: Optional[str] = None
+    _rotation_timezone: str = "America/New_York"
     
     @classmethod
     def initialize(cls) -> None:
@@ -92,6 +281,9 @@ class StructuredLogger:
         if cls._initialized:
             return
         
+        # Import diferido: importar el logger no carga Pydantic ni el YAML
+        from .config import get_config
+        
         config = get_config()
         log_config = config.logging
         
@@ -102,6 +294,51 @@ class StructuredLogger:
         # Configurar nivel de logging raíz
         logging.root.setLevel(getattr(logging, log_config.level))
         
+        # Muestreo: filtros compartidos, la clave incluye el nombre del logger
+        cls._filters = create_sampling_filters(
+            sample_rate=log_config.sample_rate,
+            rate_limit_per_sec=log_config.rate_limit_per_sec,
+            rate_limit_burst=log_config.rate_limit_burst,
+            first_k=log_config.first_k,
+            first_k_window_sec=log_config.first_k_window_sec
+        )
+        
+        # Índice sidecar de los archivos rotados (consultas con log_query)
+        cls._index_logs = log_config.index_enabled
+        
+        # Rotación por sesión: compresión y retención en un hilo compartido
+        if log_config.rotation_policy_enabled:
+            from .log_rotation import RotatedLogMaintainer
+            cls._maintainer = RotatedLogMaintainer(
+                compression=log_config.rotation_compression,
+                max_files=log_config.backup_count,
+                max_total_mb=log_config.retention_max_mb,
+                max_age_days=log_config.retention_max_days,
+                index=log_config.index_enabled
+            )
+            cls._rotate_at = log_config.rotate_at
+            cls._rotation_timezone = log_config.rotation_timezone
+        
+        # Buffer circular compartido: se vuelca a <log_path>/crash
+        if log_config.ring_buffer_size > 0:
+            cls._ring = RingBufferHandler(log_config.ring_buffer_size)
+            cls._ring.addFilter(cls._context_filter)
+            cls._uninstall_crash_handlers = install_crash_handlers(cls._ring, log_path / 'crash')
+        
+        # Formateador JSON para archivos (y consola en modo JSON)
+        cls._json_formatter = FastJsonFormatter if log_config.fast_json_enabled else JsonFormatter
+        
+        # Modo asíncrono: una cola y un hilo escritor para todos los loggers
+        if log_config.async_enabled:
+            cls._queue = AsyncLogQueue(log_config.queue_size, log_config.overflow_policy)
+            cls._listener = BatchQueueListener(cls._queue, batch_size=log_config.batch_size)
+            cls._listener.start()
+            
+            # Vaciar la cola al salir (antes del logging.shutdown estándar)
+            if not cls._atexit_registered:
+                atexit.register(cls.shutdown)
+                cls._atexit_registered = True
+        
         cls._initialized = True
     
     @classmethod
@@ -142,17 +379,24 @@ class StructuredLogger:
         # Limpiar handlers existentes
         logger.handlers.clear()
         
+        # Filtros de muestreo en el logger: descartan antes de cualquier handler
+        for sampling_filter in cls._filters:
+            logger.addFilter(sampling_filter)
+        
         # Obtener configuración
+        from .config import get_config
         config = get_config()
         log_config = config.logging
         
+        handlers = []
+        
         # Handler de consola
         if log_config.console_enabled:
             console_handler = cls._create_console_handler(
                 log_config.level,
                 enable_json
             )
-            logger.addHandler(console_handler)
+            handlers.append(console_handler)
         
         # Handler de archivo
         if log_config.file_enabled:
@@ -163,7 +407,23 @@ class StructuredLogger:
                 log_config.rotation_size_mb,
                 log_config.backup_count
             )
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
+        
+        if cls._queue is not None:
+            # El logger solo encola; el listener escribe en los handlers
+            queue_handler = AsyncQueueHandler(cls._queue, handlers)
+            queue_handler.setLevel(getattr(logging, log_config.level))
+            # El contexto se captura al encolar, en el hilo que hace el log
+            queue_handler.addFilter(cls._context_filter)
+            logger.addHandler(queue_handler)
+        else:
+            for handler in handlers:
+                handler.addFilter(cls._context_filter)
+                logger.addHandler(handler)
+        
+        # El buffer circular recibe DEBUG directamente (también en modo asíncrono)
+        if cls._ring is not None:
+            logger.addHandler(cls._ring)
         
         # Guardar logger
         cls._loggers[name] = logger
@@ -190,7 +450,7 @@ class StructuredLogger:
         handler.setLevel(getattr(logging, level))
         
         if use_json:
-            formatter = JsonFormatter()
+            formatter = cls._json_formatter()
         else:
             # Formato legible para consola
             formatter = logging.Formatter(
@@ -226,6 +486,20 @@ class StructuredLogger:
         # Nombre de archivo basado en el logger
         log_file = log_path / f"{logger_name.replace('.', '_')}.log"
         
+        if cls._maintainer is not None:
+            # Rotación con un rename; el resto lo hace el mantenedor en fondo
+            from .log_rotation import SessionRotatingFileHandler
+            handler = SessionRotatingFileHandler(
+                filename=log_file,
+                max_bytes=max_size_mb * 1024 * 1024,
+                rotate_at=cls._rotate_at,
+                timezone=cls._rotation_timezone,
+                maintainer=cls._maintainer
+            )
+            handler.setLevel(getattr(logging, level))
+            handler.setFormatter(cls._json_formatter())
+            return handler
+        
         # Handler con rotación por tamaño
         handler = logging.handlers.RotatingFileHandler(
             filename=log_file,
@@ -234,26 +508,71 @@ class StructuredLogger:
             encoding='utf-8'
         )
         
+        if cls._index_logs:
+            # Import diferido: log_query solo hace falta con archivos
+            from .log_query import indexing_rotator
+            handler.rotator = indexing_rotator
+        
         handler.setLevel(getattr(logging, level))
         
         # Usar JSON para archivos
-        formatter = JsonFormatter()
+        formatter = cls._json_formatter()
         handler.setFormatter(formatter)
         
         return handler
     
+    @classmethod
+    def dump_recent(cls, reason: str = "manual") -> Optional[Path]:
+        """
+        Vuelca a disco los registros recientes del buffer circular.
+        
+        Args:
+            reason: Motivo del volcado (se incluye en el nombre del archivo)
+        
+        Returns:
+            Ruta del volcado, o None si el buffer está desactivado o vacío
+        
+        Example:
+            >>> StructuredLogger.dump_recent("reconciliacion-fallida")
+        """
+        if cls._ring is None:
+            return None
+        
+        from .config import get_config
+        return cls._ring.dump(get_config().data.log_path / 'crash', reason)
+    
     @classmethod
     def shutdown(cls) -> None:
         """
         Cierra todos los handlers y limpia recursos.
         
-        Debe llamarse al finalizar la aplicación.
+        Debe llamarse al finalizar la aplicación. En modo asíncrono
+        primero escribe todos los registros encolados.
         """
+        # Vaciar la cola antes de cerrar los handlers de destino
+        if cls._listener is not None:
+            cls._listener.stop()
+            cls._listener = None
+            cls._queue = None
+        
         for logger in cls._loggers.values():
             for handler in logger.handlers[:]:
                 handler.close()
                 logger.removeHandler(handler)
+            for sampling_filter in cls._filters:
+                logger.removeFilter(sampling_filter)
+        
+        # Los rotados pendientes se terminan de comprimir (o en el próximo inicio)
+        if cls._maintainer is not None:
+            cls._maintainer.stop(timeout=5.0)
+            cls._maintainer = None
         
+        if cls._uninstall_crash_handlers is not None:
+            cls._uninstall_crash_handlers()
+            cls._uninstall_crash_handlers = None
+        cls._ring = None
+        
+        cls._filters = []
         cls._loggers.clear()
         cls._initialized = False
 
@@ -290,6 +609,11 @@ def log_with_context(
     """
     Registra un mensaje con contexto adicional.
     
+    Para eventos que se analizan después (órdenes ejecutadas), usar además
+    ``event_sink.record_order``, que los guarda tipados en Parquet. Los
+    campos comunes a muchos logs (``cycle_id``, ``strategy``...) se ligan
+    una vez con ``log_context.bind_context``; ``context`` tiene prioridad.
+    
     Args:
         logger: Logger a usar
         level: Nivel de logging (INFO, ERROR, etc.)
@@ -314,6 +638,8 @@ def log_with_context(
 __all__ = [
     'StructuredLogger',
     'JsonFormatter',
+    'FastJsonFormatter',
+    'JSON_BACKEND',
     'get_logger',
     'log_with_context',
 ]
@@ -0,0 +1,356 @@
+"""
+Validador vectorizado de DataFrames OHLCV para el Trading Bot.
+
+Este módulo valida históricos de barras completos en una sola pasada
+columnar (NumPy), en lugar de revisar fila por fila con
+``validate_price`` y ``validate_date``. Verifica:
+- Timestamps monótonos, sin duplicados y alineados al timeframe
+- Coherencia de precios: high >= max(open, close), low <= min(open, close)
+- Precios y volumen positivos, sin valores faltantes
+- Huecos (barras faltantes) y rango de fechas
+
+Cada fila recibe una máscara de bits ``OHLCVErrorCode``.
+
+Example:
+    >>> from src.utils.ohlcv_validators import validate_ohlcv_frame
+    >>> report = validate_ohlcv_frame(bars, timeframe="1Min")
+    >>> report.all_valid
+    True
+    >>> report.gaps  # Huecos detectados
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .batch_validators import ERROR_MASK_DTYPE, decode_error_mask
+from .timeframes import parse_timeframe
+from .validators import (
+    VALID_TIMEFRAMES,
+    MarketDataValidationError,
+    OHLCVErrorCode,
+    validate_date,
+    validate_date_range,
+    validate_timeframe,
+)
+
+
+# Columnas requeridas (se buscan sin distinguir mayúsculas)
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# Columnas aceptadas como timestamp si el índice no es DatetimeIndex
+TIMESTAMP_COLUMNS = ('timestamp', 'time', 'date', 't')
+
+# Duración en nanosegundos de los timeframes de paso fijo
+TIMEFRAME_STEP_NS: Dict[str, int] = {
+    timeframe: parse_timeframe(timeframe).duration_ns
+    for timeframe in VALID_TIMEFRAMES
+    if parse_timeframe(timeframe).is_fixed
+}
+
+
+@dataclass(frozen=True)
+class OHLCVValidationReport:
+    """
+    Resultado de validar un DataFrame OHLCV.
+    
+    Attributes:
+        codes: Máscara de errores por fila (``OHLCVErrorCode`` combinados)
+        gaps: Huecos detectados (columnas start, end, missing_bars)
+        timeframe: Timeframe validado
+        frame: DataFrame validado (sin copiar)
+    """
+    
+    codes: np.ndarray
+    gaps: pd.DataFrame
+    timeframe: str
+    frame: pd.DataFrame
+    
+    @property
+    def valid(self) -> np.ndarray:
+        """Máscara booleana de filas válidas."""
+        return self.codes == 0
+    
+    @property
+    def invalid_count(self) -> int:
+        """Número de filas con al menos un error."""
+        return int(np.count_nonzero(self.codes))
+    
+    @property
+    def all_valid(self) -> bool:
+        """True si todas las filas son válidas."""
+        return not self.codes.any()
+    
+    def counts(self) -> Dict[str, int]:
+        """
+        Cuenta las filas afectadas por cada código de error.
+        
+        Returns:
+            Diccionario {nombre_código: filas}, solo códigos presentes
+        """
+        counts = {}
+        for code in OHLCVErrorCode:
+            if code:
+                n = int(np.count_nonzero(self.codes & ERROR_MASK_DTYPE(code)))
+                if n:
+                    counts[code.name] = n
+        return counts
+    
+    def reasons(self, row: int) -> List[str]:
+        """
+        Decodifica los errores de una fila.
+        
+        Args:
+            row: Posición de la fila
+        
+        Returns:
+            Nombres de los códigos de error activos
+        """
+        return decode_error_mask(int(self.codes[row]), OHLCVErrorCode)
+    
+    def errors(self) -> pd.DataFrame:
+        """
+        Obtiene las filas inválidas con su código de error.
+        
+        Returns:
+            DataFrame con las barras inválidas y columna ``error_code``
+        """
+        mask = self.codes != 0
+        invalid = self.frame.loc[mask].copy()
+        invalid['error_code'] = self.codes[mask]
+        return invalid
+    
+    def raise_for_errors(self) -> None:
+        """
+        Lanza una excepción si alguna fila es inválida.
+        
+        Raises:
+            MarketDataValidationError: Con el resumen de errores
+        """
+        if not self.all_valid:
+            summary = ', '.join(f"{name}={n}" for name, n in self.counts().items())
+            raise MarketDataValidationError(
+                f"{self.invalid_count} barras inválidas ({self.timeframe}): {summary}"
+            )
+
+
+# ============================================================================
+# Helpers internos
+# ============================================================================
+
+def resolve_ohlcv_columns(frame: pd.DataFrame) -> Dict[str, str]:
+    """Localiza las columnas OHLCV sin distinguir mayúsculas."""
+    lookup = {str(c).lower(): c for c in frame.columns}
+    missing = [c for c in OHLCV_COLUMNS if c not in lookup]
+    
+    if missing:
+        raise MarketDataValidationError(
+            f"Faltan columnas OHLCV: {', '.join(missing)}"
+        )
+    
+    return {c: lookup[c] for c in OHLCV_COLUMNS}
+
+
+def _resolve_timestamps(
+    frame: pd.DataFrame,
+    timestamp_column: Optional[str]
+) -> pd.DatetimeIndex:
+    """Obtiene los timestamps desde el índice o una columna."""
+    if timestamp_column is None and isinstance(frame.index, pd.DatetimeIndex):
+        return frame.index
+    
+    if timestamp_column is None:
+        lookup = {str(c).lower(): c for c in frame.columns}
+        timestamp_column = next(
+            (lookup[c] for c in TIMESTAMP_COLUMNS if c in lookup), None
+        )
+    
+    if timestamp_column is None:
+        raise MarketDataValidationError(
+            "El DataFrame no tiene DatetimeIndex ni columna de timestamp"
+        )
+    
+    return pd.DatetimeIndex(frame[timestamp_column])
+
+
+def _tick_ns(timestamps: pd.DatetimeIndex) -> int:
+    """
+    Nanosegundos por unidad del índice.
+    
+    Se trabaja en la unidad nativa (s/ms/us/ns) para no convertir
+    millones de timestamps con ``as_unit``.
+    """
+    return int(np.timedelta64(1, timestamps.unit) / np.timedelta64(1, 'ns'))
+
+
+def _wall_clock(timestamps: pd.DatetimeIndex) -> np.ndarray:
+    """Timestamps (unidad nativa) según la hora local de su zona horaria."""
+    if timestamps.tz is not None:
+        timestamps = timestamps.tz_localize(None)
+    return timestamps.asi8
+
+
+def _misaligned_mask(timestamps: pd.DatetimeIndex, timeframe: str) -> np.ndarray:
+    """Filas cuyo timestamp no cae en un límite de barra del timeframe."""
+    tick = _tick_ns(timestamps)
+    
+    if timeframe in ('1Min', '5Min', '15Min', '30Min', '1Hour', '4Hour'):
+        return timestamps.asi8 % (TIMEFRAME_STEP_NS[timeframe] // tick) != 0
+    
+    # Barras diarias o mayores: medianoche en la hora local del índice
+    day = TIMEFRAME_STEP_NS['1Day'] // tick
+    wall = _wall_clock(timestamps)
+    misaligned = wall % day != 0
+    
+    if timeframe == '1Week':
+        # 1970-01-01 fue jueves: (días + 3) % 7 == 0 para los lunes
+        misaligned |= (wall // day + 3) % 7 != 0
+    elif timeframe == '1Month':
+        misaligned |= timestamps.day.to_numpy() != 1
+    
+    return misaligned
+
+
+# ============================================================================
+# API pública
+# ============================================================================
+
+def validate_ohlcv_frame(
+    frame: pd.DataFrame,
+    timeframe: str = '1Min',
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    date_format: str = "%Y-%m-%d",
+    timestamp_column: Optional[str] = None,
+    max_gap: Optional[pd.Timedelta] = None
+) -> OHLCVValidationReport:
+    """
+    Valida un DataFrame OHLCV de forma vectorizada.
+    
+    Los timestamps se toman del DatetimeIndex o de una columna
+    (``timestamp``, ``time``, ``date`` o ``t``). Los huecos mayores que un
+    paso del timeframe se reportan siempre en ``report.gaps``; solo se
+    marcan como error (``GAP_BEFORE``) los mayores que ``max_gap``, ya que
+    los cierres nocturnos y fines de semana son huecos normales.
+    
+    Args:
+        frame: Barras OHLCV
+        timeframe: Timeframe esperado (ver ``validate_timeframe``)
+        start_date: Inicio del rango permitido (opcional)
+        end_date: Fin del rango permitido, inclusive (opcional)
+        date_format: Formato de start_date/end_date
+        timestamp_column: Columna de timestamps (autodetectada si es None)
+        max_gap: Hueco máximo tolerado antes de marcar error (opcional)
+    
+    Returns:
+        OHLCVValidationReport con la máscara de errores por fila
+    
+    Raises:
+        DateValidationError: Si el timeframe o el rango son inválidos
+        MarketDataValidationError: Si faltan columnas o timestamps
+    
+    Example:
+        >>> report = validate_ohlcv_frame(bars, "5Min", "2024-01-01", "2024-01-31")
+        >>> report.counts()
+        {'HIGH_BELOW_OPEN_CLOSE': 2}
+    """
+    timeframe = validate_timeframe(timeframe)
+    columns = resolve_ohlcv_columns(frame)
+    timestamps = _resolve_timestamps(frame, timestamp_column)
+    
+    n = len(frame)
+    codes = np.zeros(n, dtype=ERROR_MASK_DTYPE)
+    
+    open_ = frame[columns['open']].to_numpy(dtype=np.float64, na_value=np.nan)
+    high = frame[columns['high']].to_numpy(dtype=np.float64, na_value=np.nan)
+    low = frame[columns['low']].to_numpy(dtype=np.float64, na_value=np.nan)
+    close = frame[columns['close']].to_numpy(dtype=np.float64, na_value=np.nan)
+    volume = frame[columns['volume']].to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    # Precios y volumen (NaN compara como False en todas las reglas)
+    missing = (
+        np.isnan(open_) | np.isnan(high) | np.isnan(low)
+        | np.isnan(close) | np.isnan(volume)
+    )
+    codes[missing] |= ERROR_MASK_DTYPE(OHLCVErrorCode.MISSING_VALUE)
+    
+    non_positive = (open_ <= 0) | (high <= 0) | (low <= 0) | (close <= 0)
+    codes[non_positive] |= ERROR_MASK_DTYPE(OHLCVErrorCode.NON_POSITIVE_PRICE)
+    
+    codes[high < np.maximum(open_, close)] |= ERROR_MASK_DTYPE(OHLCVErrorCode.HIGH_BELOW_OPEN_CLOSE)
+    codes[low > np.minimum(open_, close)] |= ERROR_MASK_DTYPE(OHLCVErrorCode.LOW_ABOVE_OPEN_CLOSE)
+    codes[volume <= 0] |= ERROR_MASK_DTYPE(OHLCVErrorCode.NON_POSITIVE_VOLUME)
+    
+    # Timestamps (unidad nativa del índice)
+    tick = _tick_ns(timestamps)
+    diffs = np.diff(timestamps.asi8)
+    
+    codes[1:][diffs == 0] |= ERROR_MASK_DTYPE(OHLCVErrorCode.DUPLICATE_TIMESTAMP)
+    codes[1:][diffs < 0] |= ERROR_MASK_DTYPE(OHLCVErrorCode.NON_MONOTONIC_TIMESTAMP)
+    codes[_misaligned_mask(timestamps, timeframe)] |= ERROR_MASK_DTYPE(OHLCVErrorCode.MISALIGNED_TIMESTAMP)
+    
+    # Rango de fechas (mismas reglas que validate_date_range)
+    if start_date is not None or end_date is not None:
+        if start_date is not None and end_date is not None:
+            start, end = validate_date_range(start_date, end_date, date_format)
+        else:
+            start = validate_date(start_date, date_format) if start_date is not None else None
+            end = validate_date(end_date, date_format) if end_date is not None else None
+        
+        # Los límites se interpretan en la zona horaria del índice
+        ts = timestamps.asi8
+        outside = np.zeros(n, dtype=bool)
+        
+        if start is not None:
+            start = pd.Timestamp(start, tz=timestamps.tz)
+            outside |= ts < start.value // tick
+        
+        if end is not None:
+            end = pd.Timestamp(end)
+            if end == end.normalize():
+                # Fecha sin hora: el día de fin es inclusive
+                end += pd.Timedelta(days=1) - pd.Timedelta(1, unit='ns')
+            end = pd.Timestamp(end, tz=timestamps.tz) if timestamps.tz is not None else end
+            outside |= ts > end.value // tick
+        
+        codes[outside] |= ERROR_MASK_DTYPE(OHLCVErrorCode.OUT_OF_RANGE)
+    
+    # Huecos: solo tienen sentido para timeframes de paso fijo
+    step = TIMEFRAME_STEP_NS.get(timeframe)
+    if step is not None and n > 1:
+        step //= tick
+        gap_positions = np.flatnonzero(diffs > step)
+        gaps = pd.DataFrame({
+            'start': timestamps[gap_positions],
+            'end': timestamps[gap_positions + 1],
+            'missing_bars': diffs[gap_positions] // step - 1,
+        })
+        
+        if max_gap is not None:
+            too_large = diffs[gap_positions] > pd.Timedelta(max_gap).value // tick
+            codes[gap_positions[too_large] + 1] |= ERROR_MASK_DTYPE(OHLCVErrorCode.GAP_BEFORE)
+    else:
+        gaps = pd.DataFrame({
+            'start': timestamps[:0],
+            'end': timestamps[:0],
+            'missing_bars': np.zeros(0, dtype=np.int64),
+        })
+    
+    return OHLCVValidationReport(
+        codes=codes,
+        gaps=gaps,
+        timeframe=timeframe,
+        frame=frame
+    )
+
+
+# Exportar para uso externo
+__all__ = [
+    'OHLCVValidationReport',
+    'OHLCV_COLUMNS',
+    'TIMEFRAME_STEP_NS',
+    'resolve_ohlcv_columns',
+    'validate_ohlcv_frame',
+]
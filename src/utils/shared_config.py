@@ -0,0 +1,324 @@
+"""
+Configuración compartida de solo lectura para procesos worker.
+
+El proceso padre valida la configuración una vez y la publica serializada
+en un segmento de memoria compartida; los workers del pool la leen desde
+ahí sin parsear el YAML ni volver a validar. Cada publicación incrementa
+un contador de generación en la cabecera del segmento, de modo que las
+recargas del padre llegan a todos los workers en su siguiente acceso.
+
+Con ``fork`` los hijos ya heredan el ``ConfigManager`` del padre, pero no
+sus recargas; el segmento cubre ambos casos y también ``spawn``.
+
+Formato del segmento::
+
+    [seq: uint64][longitud: uint64][pickle de TradingBotConfig]
+
+``seq`` es impar mientras se escribe (seqlock): los lectores no usan
+locks y reintentan si el contador cambió durante la lectura.
+
+Example:
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> from src.utils.shared_config import SharedConfigPublisher, attach_shared_config
+    >>> with SharedConfigPublisher() as publisher:
+    ...     with ProcessPoolExecutor(
+    ...         initializer=attach_shared_config,
+    ...         initargs=(publisher.name,)
+    ...     ) as pool:
+    ...         pool.submit(run_strategy, "AAPL")
+"""
+
+import os
+import pickle
+import struct
+import threading
+import time
+import multiprocessing
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional
+
+from .config import ConfigManager, TradingBotConfig
+
+
+# Variable de entorno con el nombre del segmento (heredada por los hijos)
+SHARED_CONFIG_ENV_VAR = 'TRADING_SHARED_CONFIG'
+
+# Tamaño por defecto del segmento (la configuración serializada ocupa ~2 KB)
+DEFAULT_SHARED_CONFIG_SIZE = 256 * 1024
+
+# Cabecera: contador de secuencia y longitud del payload
+_HEADER = struct.Struct('<QQ')
+
+# Segmentos creados por publicadores de este proceso
+_published_segments = set()
+
+
+class SharedConfigPublisher:
+    """
+    Publica la configuración del proceso padre en memoria compartida.
+    
+    Se suscribe al ``ConfigManager``, así que cada recarga publicada (por
+    ``reload()`` o por un ``ConfigWatcher``) se replica en el segmento.
+    Solo debe existir un publicador por segmento.
+    
+    Example:
+        >>> publisher = SharedConfigPublisher()
+        >>> publisher.name
+        'psm_3f2a...'
+        >>> publisher.close()
+    """
+    
+    def __init__(
+        self,
+        manager: Optional[ConfigManager] = None,
+        name: Optional[str] = None,
+        size: int = DEFAULT_SHARED_CONFIG_SIZE
+    ):
+        """
+        Crea el segmento y publica la configuración actual.
+        
+        Args:
+            manager: ConfigManager a replicar (por defecto, el singleton)
+            name: Nombre del segmento (None para uno aleatorio)
+            size: Tamaño del segmento en bytes
+        
+        Raises:
+            ValueError: Si la configuración no cabe en el segmento
+        """
+        self.manager = manager or ConfigManager.get_instance()
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._unsubscribe = None
+        
+        try:
+            self.publish(self.manager.config)
+        except BaseException:
+            self._shm.close()
+            self._shm.unlink()
+            raise
+        
+        _published_segments.add(self._shm._name)
+        self._unsubscribe = self.manager.subscribe(
+            lambda old, new, changed: self.publish(new)
+        )
+        # Los procesos hijos encuentran el segmento sin pasar el nombre
+        os.environ[SHARED_CONFIG_ENV_VAR] = self.name
+    
+    @property
+    def name(self) -> str:
+        """Nombre del segmento de memoria compartida."""
+        return self._shm.name
+    
+    @property
+    def generation(self) -> int:
+        """Número de publicaciones (1 = configuración inicial)."""
+        return self._seq // 2
+    
+    def publish(self, config: TradingBotConfig) -> int:
+        """
+        Publica una configuración validada en el segmento.
+        
+        Args:
+            config: Configuración a publicar
+        
+        Returns:
+            Generación publicada
+        
+        Raises:
+            ValueError: Si la configuración serializada no cabe en el segmento
+        """
+        payload = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+        capacity = self._shm.size - _HEADER.size
+        
+        if len(payload) > capacity:
+            raise ValueError(
+                f"La configuración ({len(payload)} bytes) no cabe en el segmento "
+                f"compartido ({capacity} bytes)"
+            )
+        
+        buf = self._shm.buf
+        with self._lock:
+            # seq impar: escritura en curso
+            _HEADER.pack_into(buf, 0, self._seq + 1, 0)
+            buf[_HEADER.size:_HEADER.size + len(payload)] = payload
+            self._seq += 2
+            _HEADER.pack_into(buf, 0, self._seq, len(payload))
+            return self._seq // 2
+    
+    def close(self) -> None:
+        """Deja de publicar y elimina el segmento."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        
+        if os.environ.get(SHARED_CONFIG_ENV_VAR) == self.name:
+            del os.environ[SHARED_CONFIG_ENV_VAR]
+        
+        _published_segments.discard(self._shm._name)
+        try:
+            self._shm.close()
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+    
+    def __enter__(self) -> 'SharedConfigPublisher':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def __repr__(self) -> str:
+        """Representación string del publicador."""
+        return f"SharedConfigPublisher(name={self.name!r}, generation={self.generation})"
+
+
+class SharedConfigReader:
+    """
+    Lee la configuración publicada por un ``SharedConfigPublisher``.
+    
+    Cada acceso a ``config`` compara solo la cabecera del segmento; la
+    configuración se deserializa de nuevo únicamente cuando cambia la
+    generación.
+    
+    Example:
+        >>> reader = SharedConfigReader(name)
+        >>> reader.config.risk.max_daily_loss_pct
+        0.05
+    """
+    
+    def __init__(self, name: Optional[str] = None):
+        """
+        Se conecta a un segmento existente.
+        
+        Args:
+            name: Nombre del segmento (por defecto, ``TRADING_SHARED_CONFIG``)
+        
+        Raises:
+            ValueError: Si no se indica nombre ni está la variable de entorno
+            FileNotFoundError: Si el segmento no existe
+        """
+        name = name or os.getenv(SHARED_CONFIG_ENV_VAR)
+        if not name:
+            raise ValueError(
+                f"Falta el nombre del segmento compartido ({SHARED_CONFIG_ENV_VAR})"
+            )
+        
+        self._shm = _attach_segment(name)
+        self._seq = -1
+        self._config: Optional[TradingBotConfig] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def name(self) -> str:
+        """Nombre del segmento de memoria compartida."""
+        return self._shm.name
+    
+    @property
+    def generation(self) -> int:
+        """Generación publicada actualmente en el segmento."""
+        seq, _ = _HEADER.unpack_from(self._shm.buf, 0)
+        return seq // 2
+    
+    @property
+    def config(self) -> TradingBotConfig:
+        """
+        Configuración vigente.
+        
+        Returns:
+            Última configuración publicada
+        """
+        seq, _ = _HEADER.unpack_from(self._shm.buf, 0)
+        if seq != self._seq:
+            self._refresh()
+        return self._config
+    
+    def _refresh(self) -> None:
+        """Deserializa la configuración publicada (seqlock de lectura)."""
+        buf = self._shm.buf
+        
+        with self._lock:
+            while True:
+                seq, length = _HEADER.unpack_from(buf, 0)
+                if seq == self._seq:
+                    return
+                if seq % 2:
+                    # Escritura en curso en el padre
+                    time.sleep(0)
+                    continue
+                
+                payload = bytes(buf[_HEADER.size:_HEADER.size + length])
+                if _HEADER.unpack_from(buf, 0)[0] != seq:
+                    continue
+                
+                self._config = pickle.loads(payload)
+                self._seq = seq
+                return
+    
+    def close(self) -> None:
+        """Se desconecta del segmento (sin eliminarlo)."""
+        self._shm.close()
+    
+    def __repr__(self) -> str:
+        """Representación string del lector."""
+        return f"SharedConfigReader(name={self.name!r}, generation={self.generation})"
+
+
+def _attach_segment(name: str) -> shared_memory.SharedMemory:
+    """
+    Se conecta a un segmento sin que el resource tracker lo elimine.
+    
+    Antes de Python 3.13 conectarse registra el segmento en el tracker. Los
+    hijos de ``multiprocessing`` y el propio proceso publicador comparten
+    el tracker del publicador (registrar de nuevo no tiene efecto), pero un
+    proceso independiente tiene el suyo propio, que eliminaría el segmento
+    del padre al terminar.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        shared_tracker = (
+            multiprocessing.parent_process() is not None
+            or shm._name in _published_segments
+        )
+        if not shared_tracker:
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+def attach_shared_config(name: Optional[str] = None) -> SharedConfigReader:
+    """
+    Conecta el ``ConfigManager`` de este proceso a la configuración compartida.
+    
+    Pensada como ``initializer`` de un pool: a partir de aquí ``get_config()``
+    devuelve la configuración publicada por el padre (y sus recargas) sin
+    leer el YAML ni validar.
+    
+    Args:
+        name: Nombre del segmento (por defecto, ``TRADING_SHARED_CONFIG``)
+    
+    Returns:
+        Lector conectado
+    
+    Example:
+        >>> Pool(initializer=attach_shared_config, initargs=(publisher.name,))
+    """
+    reader = SharedConfigReader(name)
+    manager = ConfigManager.__new__(ConfigManager)
+    
+    with manager._reload_lock:
+        manager._config = reader.config
+        manager._shared = reader
+    
+    return reader
+
+
+# Exportar para uso externo
+__all__ = [
+    'SharedConfigPublisher',
+    'SharedConfigReader',
+    'attach_shared_config',
+    'SHARED_CONFIG_ENV_VAR',
+    'DEFAULT_SHARED_CONFIG_SIZE',
+]
@@ -0,0 +1,329 @@
+"""
+Universo indexado de símbolos para el Trading Bot.
+
+Este módulo proporciona ``SymbolUniverse``, un índice inmutable de
+símbolos construido una sola vez (por ejemplo desde un archivo de
+listado) que ofrece:
+- Verificación de pertenencia O(1) (frozenset)
+- Búsqueda rápida por prefijo (trie)
+- Cache LRU de símbolos ya normalizados e internados
+- Formatos configurables: US, acciones de clase (``BRK.B``) y BVL
+
+Example:
+    >>> from src.utils.symbols import SymbolUniverse, SymbolFormat
+    >>> universe = SymbolUniverse(
+    ...     ["AAPL", "BRK.B", "ALICORC1"],
+    ...     formats=(SymbolFormat.US, SymbolFormat.CLASS_SHARE, SymbolFormat.BVL)
+    ... )
+    >>> "brk.b" in universe
+    True
+    >>> universe.with_prefix("AL")
+    ['ALICORC1']
+"""
+
+import csv
+import re
+import sys
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Pattern, Sequence, Tuple, Union
+
+from .validators import SYMBOL_PATTERN, SYMBOL_CACHE_SIZE, SymbolValidationError
+
+
+class SymbolFormat(str, Enum):
+    """Formatos de símbolo soportados."""
+    US = "us"
+    CLASS_SHARE = "class_share"
+    BVL = "bvl"
+
+
+# Patrones compilados por formato
+SYMBOL_FORMAT_PATTERNS: Dict[SymbolFormat, Pattern] = {
+    # AAPL, TSLA
+    SymbolFormat.US: SYMBOL_PATTERN,
+    # BRK.B, BF.A
+    SymbolFormat.CLASS_SHARE: re.compile(r'^[A-Z]{1,5}\.[A-Z]$'),
+    # Bolsa de Valores de Lima: ALICORC1, BACKUSI1, BVN, SCCO
+    SymbolFormat.BVL: re.compile(r'^[A-Z]{1,9}[0-9]?$'),
+}
+
+DEFAULT_FORMATS: Tuple[SymbolFormat, ...] = (SymbolFormat.US,)
+
+# Nombres de columna aceptados en archivos de listado delimitados
+LISTING_SYMBOL_COLUMNS = ('symbol', 'ticker', 'act symbol', 'nemonico')
+
+# Clave de fin de palabra en los nodos del trie
+_TERMINAL = ''
+
+
+@lru_cache(maxsize=SYMBOL_CACHE_SIZE)
+def _normalize_for_formats(
+    symbol: str,
+    formats: Tuple[SymbolFormat, ...]
+) -> Tuple[str, bool]:
+    """Normaliza un símbolo y verifica si cumple algún formato (cacheado)."""
+    symbol = symbol.strip().upper()
+    for symbol_format in formats:
+        if SYMBOL_FORMAT_PATTERNS[symbol_format].match(symbol) is not None:
+            return sys.intern(symbol), True
+    return symbol, False
+
+
+def validate_symbol_format(
+    symbol: str,
+    formats: Sequence[SymbolFormat] = DEFAULT_FORMATS
+) -> str:
+    """
+    Valida un símbolo contra uno o varios formatos.
+    
+    Args:
+        symbol: Símbolo a validar
+        formats: Formatos aceptados
+    
+    Returns:
+        Símbolo validado en mayúsculas (internado)
+    
+    Raises:
+        SymbolValidationError: Si el símbolo no cumple ningún formato
+    
+    Example:
+        >>> validate_symbol_format("brk.b", (SymbolFormat.CLASS_SHARE,))
+        'BRK.B'
+    """
+    if not symbol:
+        raise SymbolValidationError("El símbolo no puede estar vacío")
+    
+    formats = tuple(SymbolFormat(f) for f in formats)
+    normalized, is_valid = _normalize_for_formats(symbol, formats)
+    
+    if not is_valid:
+        raise SymbolValidationError(
+            f"Símbolo inválido: '{normalized}'. "
+            f"Formatos aceptados: {', '.join(f.value for f in formats)}"
+        )
+    
+    return normalized
+
+
+class SymbolUniverse:
+    """
+    Índice inmutable de símbolos con búsqueda O(1) y por prefijo.
+    
+    El universo se valida y se indexa una sola vez al construirse; las
+    consultas posteriores no vuelven a ejecutar expresiones regulares
+    para símbolos ya vistos gracias al cache de normalización.
+    
+    Example:
+        >>> universe = SymbolUniverse.from_file("data/listings/nasdaq.txt")
+        >>> "AAPL" in universe
+        True
+        >>> universe.validate_many(["aapl", "msft", "aapl"])
+        ['AAPL', 'MSFT']
+    """
+    
+    def __init__(
+        self,
+        symbols: Iterable[str],
+        formats: Sequence[SymbolFormat] = DEFAULT_FORMATS
+    ):
+        """
+        Construye el universo validando cada símbolo.
+        
+        Args:
+            symbols: Símbolos del universo
+            formats: Formatos aceptados
+        
+        Raises:
+            SymbolValidationError: Si algún símbolo es inválido
+        """
+        self._formats: Tuple[SymbolFormat, ...] = tuple(SymbolFormat(f) for f in formats)
+        
+        validated = {validate_symbol_format(s, self._formats) for s in symbols}
+        self._symbols: FrozenSet[str] = frozenset(validated)
+        self._trie: Dict[str, dict] = {}
+        
+        for symbol in self._symbols:
+            node = self._trie
+            for char in symbol:
+                node = node.setdefault(char, {})
+            node[_TERMINAL] = {}
+    
+    @classmethod
+    def from_file(
+        cls,
+        path: Union[str, Path],
+        formats: Sequence[SymbolFormat] = DEFAULT_FORMATS,
+        column: Optional[str] = None
+    ) -> 'SymbolUniverse':
+        """
+        Construye el universo desde un archivo de listado.
+        
+        Soporta archivos de texto con un símbolo por línea y archivos
+        delimitados (``,``, ``|`` o tabulador) con cabecera, como los
+        listados de NASDAQ o de la BVL.
+        
+        Args:
+            path: Ruta del archivo
+            formats: Formatos aceptados
+            column: Columna con el símbolo (autodetectada si es None)
+        
+        Returns:
+            Universo construido
+        
+        Raises:
+            SymbolValidationError: Si el archivo no tiene columna de símbolos
+                o contiene símbolos inválidos
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = [line for line in f.read().splitlines() if line.strip()]
+        
+        if not lines:
+            return cls([], formats)
+        
+        delimiter = next((d for d in (',', '|', '\t') if d in lines[0]), None)
+        if delimiter is None:
+            return cls(lines, formats)
+        
+        reader = csv.DictReader(lines, delimiter=delimiter)
+        fieldnames = {name.strip().lower(): name for name in reader.fieldnames or []}
+        candidates = (column.lower(),) if column else LISTING_SYMBOL_COLUMNS
+        key = next((fieldnames[c] for c in candidates if c in fieldnames), None)
+        
+        if key is None:
+            raise SymbolValidationError(
+                f"El archivo {path} no tiene columna de símbolos. "
+                f"Columnas: {', '.join(fieldnames.values())}"
+            )
+        
+        # Los listados de NASDAQ terminan con una línea "File Creation Time"
+        return cls(
+            (row[key] for row in reader if row.get(key) and 'File Creation Time' not in row[key]),
+            formats
+        )
+    
+    @property
+    def formats(self) -> Tuple[SymbolFormat, ...]:
+        """Formatos aceptados por el universo."""
+        return self._formats
+    
+    @property
+    def symbols(self) -> FrozenSet[str]:
+        """Conjunto inmutable de símbolos."""
+        return self._symbols
+    
+    def normalize(self, symbol: str) -> Optional[str]:
+        """
+        Normaliza un símbolo con los formatos del universo.
+        
+        Args:
+            symbol: Símbolo a normalizar
+        
+        Returns:
+            Símbolo normalizado o None si no cumple ningún formato
+        """
+        if not symbol:
+            return None
+        normalized, is_valid = _normalize_for_formats(symbol, self._formats)
+        return normalized if is_valid else None
+    
+    def __contains__(self, symbol: object) -> bool:
+        """Verificación de pertenencia O(1)."""
+        if not isinstance(symbol, str):
+            return False
+        if symbol in self._symbols:
+            return True
+        normalized = self.normalize(symbol)
+        return normalized is not None and normalized in self._symbols
+    
+    def __len__(self) -> int:
+        return len(self._symbols)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(self._symbols))
+    
+    def validate(self, symbol: str) -> str:
+        """
+        Valida que un símbolo pertenezca al universo.
+        
+        Args:
+            symbol: Símbolo a validar
+        
+        Returns:
+            Símbolo normalizado
+        
+        Raises:
+            SymbolValidationError: Si el símbolo es inválido o no pertenece
+                al universo
+        """
+        normalized = validate_symbol_format(symbol, self._formats)
+        
+        if normalized not in self._symbols:
+            raise SymbolValidationError(
+                f"Símbolo fuera del universo: '{normalized}'"
+            )
+        
+        return normalized
+    
+    def validate_many(self, symbols: Iterable[str]) -> List[str]:
+        """
+        Valida una lista de símbolos contra el universo.
+        
+        Args:
+            symbols: Símbolos a validar
+        
+        Returns:
+            Símbolos validados sin duplicados, en el orden original
+        
+        Raises:
+            SymbolValidationError: Si algún símbolo es inválido
+        """
+        return list(dict.fromkeys(self.validate(s) for s in symbols))
+    
+    def with_prefix(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Obtiene los símbolos que empiezan con un prefijo.
+        
+        Args:
+            prefix: Prefijo a buscar (se normaliza a mayúsculas)
+            limit: Máximo de resultados
+        
+        Returns:
+            Símbolos ordenados alfabéticamente
+        """
+        prefix = prefix.strip().upper()
+        node = self._trie
+        
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        
+        results: List[str] = []
+        stack: List[Tuple[str, dict]] = [(prefix, node)]
+        
+        while stack:
+            current, node = stack.pop()
+            if _TERMINAL in node:
+                results.append(current)
+            # Apilar en orden inverso para recorrer alfabéticamente
+            for char in sorted((c for c in node if c != _TERMINAL), reverse=True):
+                stack.append((current + char, node[char]))
+            if limit is not None and len(results) >= limit:
+                break
+        
+        return results
+    
+    def __repr__(self) -> str:
+        formats = ', '.join(f.value for f in self._formats)
+        return f"SymbolUniverse(size={len(self._symbols)}, formats=[{formats}])"
+
+
+# Exportar para uso externo
+__all__ = [
+    'SymbolFormat',
+    'SymbolUniverse',
+    'SYMBOL_FORMAT_PATTERNS',
+    'validate_symbol_format',
+]
@@ -0,0 +1,303 @@
+"""
+Álgebra de timeframes para el Trading Bot.
+
+Convierte los timeframes soportados por ``validate_timeframe`` ('1Min',
+'5Min', ..., '1Month') en objetos ``Timeframe`` inmutables y hashables
+con duración, alias de pandas y cálculo de límites de barra. El parseo
+se cachea por string.
+
+Example:
+    >>> from datetime import datetime
+    >>> from src.utils.timeframes import parse_timeframe
+    >>> tf = parse_timeframe("15Min")
+    >>> tf.duration
+    datetime.timedelta(seconds=900)
+    >>> tf.pandas_alias
+    '15min'
+    >>> tf.floor(datetime(2024, 1, 2, 14, 37))
+    datetime.datetime(2024, 1, 2, 14, 30)
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from .validators import DateValidationError, validate_timeframe
+
+
+class TimeframeUnit(str, Enum):
+    """Unidades de timeframe (sufijos de la API de Alpaca)."""
+    MINUTE = "Min"
+    HOUR = "Hour"
+    DAY = "Day"
+    WEEK = "Week"
+    MONTH = "Month"
+
+
+# Alias de pandas por unidad (las semanas empiezan en lunes)
+_PANDAS_ALIASES = {
+    TimeframeUnit.MINUTE: "min",
+    TimeframeUnit.HOUR: "h",
+    TimeframeUnit.DAY: "D",
+    TimeframeUnit.WEEK: "W-MON",
+    TimeframeUnit.MONTH: "MS",
+}
+
+# Duración de una unidad (None para meses, de duración variable)
+_UNIT_DURATIONS = {
+    TimeframeUnit.MINUTE: timedelta(minutes=1),
+    TimeframeUnit.HOUR: timedelta(hours=1),
+    TimeframeUnit.DAY: timedelta(days=1),
+    TimeframeUnit.WEEK: timedelta(weeks=1),
+    TimeframeUnit.MONTH: None,
+}
+
+_TIMEFRAME_PATTERN = re.compile(r'^(\d+)(Min|Hour|Day|Week|Month)$')
+
+
+@dataclass(frozen=True, order=True)
+class Timeframe:
+    """
+    Timeframe parseado, inmutable y hashable.
+    
+    Los límites de barra se calculan sobre la hora local del timestamp
+    (si tiene zona horaria), de modo que las barras diarias empiezan a
+    medianoche del mercado y las semanales el lunes.
+    
+    Attributes:
+        amount: Número de unidades (ej. 15 en '15Min')
+        unit: Unidad del timeframe
+    """
+    
+    amount: int
+    unit: TimeframeUnit
+    
+    @property
+    def name(self) -> str:
+        """Nombre canónico (ej. '15Min')."""
+        return f"{self.amount}{self.unit.value}"
+    
+    @property
+    def is_fixed(self) -> bool:
+        """True si la duración es fija (todas excepto meses)."""
+        return self.unit is not TimeframeUnit.MONTH
+    
+    @property
+    def duration(self) -> Optional[timedelta]:
+        """Duración de una barra (None para meses)."""
+        unit_duration = _UNIT_DURATIONS[self.unit]
+        return unit_duration * self.amount if unit_duration is not None else None
+    
+    @property
+    def duration_ns(self) -> Optional[int]:
+        """Duración de una barra en nanosegundos (None para meses)."""
+        duration = self.duration
+        return duration // timedelta(microseconds=1) * 1000 if duration is not None else None
+    
+    @property
+    def pandas_alias(self) -> str:
+        """Alias de frecuencia de pandas (ej. '15min', '1h', '1MS')."""
+        return f"{self.amount}{_PANDAS_ALIASES[self.unit]}"
+    
+    def divides(self, other: 'Timeframe') -> bool:
+        """
+        Indica si las barras de ``other`` se pueden construir con barras de este timeframe.
+        
+        Args:
+            other: Timeframe de destino
+        
+        Returns:
+            True si cada barra de ``other`` está compuesta por barras completas
+            de este timeframe
+        
+        Example:
+            >>> parse_timeframe("5Min").divides(parse_timeframe("1Hour"))
+            True
+        """
+        if self.unit is TimeframeUnit.MONTH:
+            return other.unit is TimeframeUnit.MONTH and other.amount % self.amount == 0
+        
+        if other.unit is TimeframeUnit.MONTH:
+            # Un mes siempre empieza a medianoche: basta con dividir un día
+            return timedelta(days=1) % self.duration == timedelta(0)
+        
+        return other.duration % self.duration == timedelta(0)
+    
+    def floor(self, ts: datetime) -> datetime:
+        """
+        Calcula el inicio de la barra que contiene un timestamp.
+        
+        Args:
+            ts: Timestamp (naive o con zona horaria)
+        
+        Returns:
+            Inicio de la barra, con la misma zona horaria
+        """
+        start = ts.replace(second=0, microsecond=0)
+        
+        if self.unit is TimeframeUnit.MINUTE:
+            minutes = start.hour * 60 + start.minute
+            minutes -= minutes % self.amount
+            return start.replace(hour=minutes // 60, minute=minutes % 60)
+        
+        if self.unit is TimeframeUnit.HOUR:
+            return start.replace(hour=start.hour - start.hour % self.amount, minute=0)
+        
+        start = start.replace(hour=0, minute=0)
+        
+        if self.unit is TimeframeUnit.DAY:
+            return start
+        
+        if self.unit is TimeframeUnit.WEEK:
+            return start - timedelta(days=start.weekday())
+        
+        months = start.year * 12 + start.month - 1
+        months -= months % self.amount
+        return start.replace(year=months // 12, month=months % 12 + 1, day=1)
+    
+    def next_boundary(self, ts: datetime) -> datetime:
+        """
+        Calcula el fin (exclusivo) de la barra que contiene un timestamp.
+        
+        Args:
+            ts: Timestamp (naive o con zona horaria)
+        
+        Returns:
+            Inicio de la barra siguiente
+        """
+        start = self.floor(ts)
+        
+        if self.unit in (TimeframeUnit.MINUTE, TimeframeUnit.HOUR):
+            return start + self.duration
+        
+        if self.is_fixed:
+            # Días y semanas: aritmética de calendario para respetar el DST
+            day = start.date() + self.duration
+            return start.replace(year=day.year, month=day.month, day=day.day)
+        
+        months = start.year * 12 + start.month - 1 + self.amount
+        return start.replace(year=months // 12, month=months % 12 + 1)
+    
+    def bar_bounds(self, ts: datetime) -> Tuple[datetime, datetime]:
+        """
+        Calcula los límites [inicio, fin) de la barra que contiene un timestamp.
+        
+        Args:
+            ts: Timestamp
+        
+        Returns:
+            Tupla (inicio, fin)
+        """
+        return self.floor(ts), self.next_boundary(ts)
+    
+    def floor_index(self, index):
+        """
+        Versión vectorizada de ``floor`` para un ``pandas.DatetimeIndex``.
+        
+        Args:
+            index: DatetimeIndex (naive o con zona horaria)
+        
+        Returns:
+            DatetimeIndex con el inicio de barra de cada timestamp
+        """
+        import numpy as np
+        import pandas as pd
+        
+        tz = index.tz
+        
+        if self.unit in (TimeframeUnit.MINUTE, TimeframeUnit.HOUR):
+            if tz is None:
+                return index.floor(self.pandas_alias)
+            return self._floor_index_fixed(index)
+        
+        # Aritmética de calendario sobre la hora local (evita saltos de DST)
+        local = index.tz_localize(None) if tz is not None else index
+        days = local.normalize()
+        
+        if self.unit is TimeframeUnit.DAY:
+            starts = days if self.amount == 1 else local.floor(self.pandas_alias)
+        elif self.unit is TimeframeUnit.WEEK:
+            starts = days - pd.to_timedelta(local.weekday, unit='D')
+        else:
+            months = local.year * 12 + local.month - 1
+            months -= months % self.amount
+            starts = pd.to_datetime({
+                'year': months // 12,
+                'month': months % 12 + 1,
+                'day': 1,
+            }).pipe(pd.DatetimeIndex).as_unit(local.unit)
+        
+        if tz is None:
+            return starts
+        return starts.tz_localize(tz, ambiguous=np.zeros(len(starts), dtype=bool), nonexistent='shift_forward')
+    
+    def _floor_index_fixed(self, index):
+        """
+        ``floor_index`` de minutos y horas para un índice con zona horaria.
+        
+        Las barras se alinean a la hora local, pero se calculan en ns UTC:
+        ``index.floor`` sobre la hora local falla en la hora repetida del
+        cambio de horario ("Cannot infer dst time"). Cada barra usa el
+        offset de su timestamp salvo que el cambio caiga dentro de la
+        barra (ej. 4Hour), en cuyo caso se localiza su inicio local.
+        """
+        import numpy as np
+        import pandas as pd
+        
+        step = self.duration_ns
+        utc = index.as_unit('ns').asi8
+        wall = index.as_unit('ns').tz_localize(None).asi8
+        floored = wall - wall % step
+        starts = utc - (wall - floored)
+        
+        # El inicio calculado con el offset del timestamp no es la hora local esperada
+        shifted = pd.DatetimeIndex(starts.view('datetime64[ns]')).tz_localize('UTC').tz_convert(index.tz)
+        moved = shifted.tz_localize(None).asi8 != floored
+        if moved.any():
+            local = pd.DatetimeIndex(floored[moved].view('datetime64[ns]'))
+            starts[moved] = local.tz_localize(
+                index.tz, ambiguous=np.zeros(len(local), dtype=bool), nonexistent='shift_forward'
+            ).asi8
+        
+        return pd.DatetimeIndex(starts.view('datetime64[ns]')).tz_localize('UTC').tz_convert(index.tz).as_unit(index.unit)
+    
+    def __str__(self) -> str:
+        return self.name
+
+
+@lru_cache(maxsize=None)
+def parse_timeframe(timeframe: str) -> Timeframe:
+    """
+    Parsea un timeframe soportado a un objeto ``Timeframe`` (cacheado).
+    
+    Args:
+        timeframe: Timeframe a parsear (ver ``validate_timeframe``)
+    
+    Returns:
+        Timeframe parseado
+    
+    Raises:
+        DateValidationError: Si el timeframe es inválido
+    
+    Example:
+        >>> parse_timeframe("1Hour") is parse_timeframe("1Hour")
+        True
+    """
+    timeframe = validate_timeframe(timeframe)
+    match = _TIMEFRAME_PATTERN.match(timeframe)
+    
+    if match is None:
+        raise DateValidationError(f"Timeframe inválido: '{timeframe}'")
+    
+    return Timeframe(int(match.group(1)), TimeframeUnit(match.group(2)))
+
+
+# Exportar para uso externo
+__all__ = [
+    'Timeframe',
+    'TimeframeUnit',
+    'parse_timeframe',
+]
@@ -15,11 +15,35 @@ Example:
 """
 
 import re
-from typing import List, Tuple, Optional
+import sys
+from enum import IntFlag
+from functools import lru_cache
+from typing import List, Tuple, Optional, Any, Callable, Dict, Iterable, Type
 from datetime import datetime, date
 from urllib.parse import urlparse
 
 
+# Formato de símbolo US: solo letras, 1-5 caracteres (compilado una vez)
+SYMBOL_PATTERN = re.compile(r'^[A-Z]{1,5}$')
+
+# Tamaño del cache de símbolos ya validados
+SYMBOL_CACHE_SIZE = 16384
+
+# Tamaño del cache de fechas ya parseadas (históricos repiten fechas)
+DATE_CACHE_SIZE = 65536
+
+# Valores permitidos para parámetros de órdenes
+VALID_ORDER_SIDES = ('buy', 'sell')
+VALID_ORDER_TYPES = ('market', 'limit', 'stop', 'stop_limit')
+
+# Timeframes soportados para datos de mercado
+VALID_TIMEFRAMES = (
+    '1Min', '5Min', '15Min', '30Min',
+    '1Hour', '4Hour',
+    '1Day', '1Week', '1Month'
+)
+
+
 class ValidationError(Exception):
     """Excepción base para errores de validación."""
     pass
@@ -50,10 +74,218 @@ class ConfigValidationError(ValidationError):
     pass
 
 
+class MarketDataValidationError(ValidationError):
+    """Error de validación de datos de mercado (barras OHLCV)."""
+    pass
+
+
+class OrderErrorCode(IntFlag):
+    """
+    Códigos de error de validación de órdenes.
+    
+    Son combinables como máscara de bits, de modo que una fila de un
+    lote de órdenes puede reportar varios errores a la vez.
+    
+    Example:
+        >>> code = OrderErrorCode.QTY_BELOW_MIN | OrderErrorCode.INVALID_SIDE
+        >>> OrderErrorCode.INVALID_SIDE in code
+        True
+    """
+    OK = 0
+    EMPTY_SIDE = 1 << 0
+    INVALID_SIDE = 1 << 1
+    INVALID_QTY_TYPE = 1 << 2
+    QTY_BELOW_MIN = 1 << 3
+    INVALID_PRICE_TYPE = 1 << 4
+    PRICE_BELOW_MIN = 1 << 5
+    EMPTY_ORDER_TYPE = 1 << 6
+    INVALID_ORDER_TYPE = 1 << 7
+    MISSING_QTY = 1 << 8
+    MISSING_PRICE = 1 << 9
+
+
+class SymbolErrorCode(IntFlag):
+    """Códigos de error de validación de símbolos."""
+    OK = 0
+    EMPTY_SYMBOL = 1 << 0
+    INVALID_SYMBOL = 1 << 1
+
+
+class DateErrorCode(IntFlag):
+    """Códigos de error de validación de fechas y timeframes."""
+    OK = 0
+    EMPTY_DATE = 1 << 0
+    INVALID_DATE = 1 << 1
+    INVERTED_RANGE = 1 << 2
+    EMPTY_TIMEFRAME = 1 << 3
+    INVALID_TIMEFRAME = 1 << 4
+
+
+class PercentageErrorCode(IntFlag):
+    """Códigos de error de validación de porcentajes."""
+    OK = 0
+    NOT_NUMERIC = 1 << 0
+    OUT_OF_RANGE = 1 << 1
+
+
+class ConfigErrorCode(IntFlag):
+    """Códigos de error de validación de configuración."""
+    OK = 0
+    EMPTY_API_KEY = 1 << 0
+    API_KEY_TOO_SHORT = 1 << 1
+    API_KEY_PLACEHOLDER = 1 << 2
+    EMPTY_URL = 1 << 3
+    INVALID_URL = 1 << 4
+    URL_NO_SCHEME = 1 << 5
+    URL_NO_DOMAIN = 1 << 6
+    URL_NOT_HTTPS = 1 << 7
+
+
+class ValueErrorCode(IntFlag):
+    """Códigos de error de validadores genéricos (rangos y enteros)."""
+    OK = 0
+    NOT_NUMERIC = 1 << 0
+    OUT_OF_RANGE = 1 << 1
+    NOT_INTEGER = 1 << 2
+    NOT_POSITIVE = 1 << 3
+
+
+class OHLCVErrorCode(IntFlag):
+    """Códigos de error por fila de un DataFrame OHLCV."""
+    OK = 0
+    MISSING_VALUE = 1 << 0
+    NON_POSITIVE_PRICE = 1 << 1
+    HIGH_BELOW_OPEN_CLOSE = 1 << 2
+    LOW_ABOVE_OPEN_CLOSE = 1 << 3
+    NON_POSITIVE_VOLUME = 1 << 4
+    DUPLICATE_TIMESTAMP = 1 << 5
+    NON_MONOTONIC_TIMESTAMP = 1 << 6
+    MISALIGNED_TIMESTAMP = 1 << 7
+    OUT_OF_RANGE = 1 << 8
+    GAP_BEFORE = 1 << 9
+
+
+# Excepción que corresponde a cada familia de códigos de error
+ERROR_CODE_EXCEPTIONS: Dict[Type[IntFlag], Type[ValidationError]] = {
+    SymbolErrorCode: SymbolValidationError,
+    OrderErrorCode: OrderValidationError,
+    DateErrorCode: DateValidationError,
+    PercentageErrorCode: PercentageValidationError,
+    ConfigErrorCode: ConfigValidationError,
+    ValueErrorCode: ValidationError,
+    OHLCVErrorCode: MarketDataValidationError,
+}
+
+
+# Resultado del modo sin excepciones: (valor normalizado, código de error)
+CheckResult = Tuple[Any, IntFlag]
+
+# Códigos OK precargados: en Python 3.11 acceder a un miembro de Enum
+# cuesta más que una variable global, y es el camino más frecuente
+_SYMBOL_OK = SymbolErrorCode.OK
+_ORDER_OK = OrderErrorCode.OK
+_DATE_OK = DateErrorCode.OK
+_PERCENTAGE_OK = PercentageErrorCode.OK
+_CONFIG_OK = ConfigErrorCode.OK
+_VALUE_OK = ValueErrorCode.OK
+
+
+def raise_for_code(code: IntFlag, value: Any = None, message: Optional[str] = None) -> Any:
+    """
+    Lanza la excepción asociada a un código de error, si lo hay.
+    
+    Permite volver al modo con excepciones a partir del resultado
+    de una función ``check_*``.
+    
+    Args:
+        code: Código de error devuelto por una función check_*
+        value: Valor validado
+        message: Mensaje de la excepción (opcional)
+        
+    Returns:
+        El valor si el código es OK
+        
+    Raises:
+        ValidationError: Subclase asociada a la familia del código
+        
+    Example:
+        >>> qty, code = check_quantity(0)
+        >>> raise_for_code(code, qty)  # Raises OrderValidationError
+    """
+    if not code:
+        return value
+    
+    exception_class = ERROR_CODE_EXCEPTIONS.get(type(code), ValidationError)
+    raise exception_class(message or f"Validación fallida ({code.name}): {value!r}")
+
+
+def collect_errors(
+    check: Callable[..., CheckResult],
+    values: Iterable[Any],
+    *args: Any,
+    **kwargs: Any
+) -> Dict[int, CheckResult]:
+    """
+    Aplica una función ``check_*`` a muchos valores y recoge los errores.
+    
+    Args:
+        check: Función de validación sin excepciones (ej. check_symbol)
+        values: Valores a validar
+        *args: Argumentos adicionales para ``check``
+        **kwargs: Argumentos con nombre para ``check``
+        
+    Returns:
+        Diccionario {posición: (valor, código)} solo con los valores inválidos
+        
+    Example:
+        >>> errors = collect_errors(check_symbol, ["AAPL", "123", "MSFT"])
+        >>> list(errors)
+        [1]
+    """
+    errors = {}
+    
+    for index, value in enumerate(values):
+        result = check(value, *args, **kwargs)
+        if result[1]:
+            errors[index] = result
+    
+    return errors
+
+
 # ============================================================================
 # Validadores de Símbolos
 # ============================================================================
 
+@lru_cache(maxsize=SYMBOL_CACHE_SIZE)
+def _normalize_symbol(symbol: str) -> Tuple[str, bool]:
+    """Normaliza un símbolo y verifica su formato (resultado cacheado)."""
+    symbol = symbol.strip().upper()
+    if SYMBOL_PATTERN.match(symbol) is None:
+        return symbol, False
+    return sys.intern(symbol), True
+
+
+def check_symbol(symbol: str) -> CheckResult:
+    """
+    Valida un símbolo sin lanzar excepciones.
+    
+    Args:
+        symbol: Símbolo a validar
+        
+    Returns:
+        Tupla (valor, código) con el símbolo en mayúsculas y un SymbolErrorCode
+    """
+    if not symbol:
+        return symbol, SymbolErrorCode.EMPTY_SYMBOL
+    
+    symbol, is_valid = _normalize_symbol(symbol)
+    
+    if not is_valid:
+        return symbol, SymbolErrorCode.INVALID_SYMBOL
+    
+    return symbol, _SYMBOL_OK
+
+
 def validate_symbol(symbol: str) -> str:
     """
     Valida un símbolo de acción.
@@ -73,14 +305,14 @@ def validate_symbol(symbol: str) -> str:
         >>> validate_symbol("TSLA")
         'TSLA'
     """
-    if not symbol:
-        raise SymbolValidationError("El símbolo no puede estar vacío")
-    
     # Convertir a mayúsculas y eliminar espacios
-    symbol = symbol.strip().upper()
+    symbol, code = check_symbol(symbol)
     
-    # Validar formato: solo letras, 1-5 caracteres
-    if not re.match(r'^[A-Z]{1,5}$', symbol):
+    if code:
+        if code == SymbolErrorCode.EMPTY_SYMBOL:
+            raise SymbolValidationError("El símbolo no puede estar vacío")
+        
+        # Validar formato: solo letras, 1-5 caracteres
         raise SymbolValidationError(
             f"Símbolo inválido: '{symbol}'. Debe contener solo letras (1-5 caracteres)"
         )
@@ -126,6 +358,27 @@ def validate_symbols_list(symbols: List[str]) -> List[str]:
 # Validadores de Órdenes
 # ============================================================================
 
+def check_order_side(side: str) -> CheckResult:
+    """
+    Valida el lado de una orden sin lanzar excepciones.
+    
+    Args:
+        side: Lado de la orden
+        
+    Returns:
+        Tupla (valor, código) con el lado en minúsculas y un OrderErrorCode
+    """
+    if not side:
+        return side, OrderErrorCode.EMPTY_SIDE
+    
+    side = side.strip().lower()
+    
+    if side not in VALID_ORDER_SIDES:
+        return side, OrderErrorCode.INVALID_SIDE
+    
+    return side, _ORDER_OK
+
+
 def validate_order_side(side: str) -> str:
     """
     Valida el lado de una orden (buy/sell).
@@ -145,12 +398,12 @@ def validate_order_side(side: str) -> str:
         >>> validate_order_side("sell")
         'sell'
     """
-    if not side:
-        raise OrderValidationError("El lado de la orden no puede estar vacío")
+    side, code = check_order_side(side)
     
-    side = side.strip().lower()
-    
-    if side not in ['buy', 'sell']:
+    if code:
+        if code == OrderErrorCode.EMPTY_SIDE:
+            raise OrderValidationError("El lado de la orden no puede estar vacío")
+        
         raise OrderValidationError(
             f"Lado de orden inválido: '{side}'. Debe ser 'buy' o 'sell'"
         )
@@ -158,6 +411,28 @@ def validate_order_side(side: str) -> str:
     return side
 
 
+def check_quantity(qty: int, min_qty: int = 1) -> CheckResult:
+    """
+    Valida la cantidad de una orden sin lanzar excepciones.
+    
+    Args:
+        qty: Cantidad a validar
+        min_qty: Cantidad mínima permitida
+        
+    Returns:
+        Tupla (valor, código) con la cantidad y un OrderErrorCode
+    """
+    if not isinstance(qty, int):
+        if qty is None or qty != qty:
+            return qty, OrderErrorCode.MISSING_QTY
+        return qty, OrderErrorCode.INVALID_QTY_TYPE
+    
+    if qty < min_qty:
+        return qty, OrderErrorCode.QTY_BELOW_MIN
+    
+    return qty, _ORDER_OK
+
+
 def validate_quantity(qty: int, min_qty: int = 1) -> int:
     """
     Valida la cantidad de una orden.
@@ -177,12 +452,17 @@ def validate_quantity(qty: int, min_qty: int = 1) -> int:
         100
         >>> validate_quantity(0)  # Raises error
     """
-    if not isinstance(qty, int):
-        raise OrderValidationError(
-            f"La cantidad debe ser un entero, recibido: {type(qty).__name__}"
-        )
+    qty, code = check_quantity(qty, min_qty)
     
-    if qty < min_qty:
+    if code:
+        if code == OrderErrorCode.MISSING_QTY:
+            raise OrderValidationError("La cantidad es obligatoria")
+        
+        if code == OrderErrorCode.INVALID_QTY_TYPE:
+            raise OrderValidationError(
+                f"La cantidad debe ser un entero, recibido: {type(qty).__name__}"
+            )
+        
         raise OrderValidationError(
             f"La cantidad debe ser >= {min_qty}, recibido: {qty}"
         )
@@ -190,6 +470,32 @@ def validate_quantity(qty: int, min_qty: int = 1) -> int:
     return qty
 
 
+def check_price(price: float, min_price: float = 0.01) -> CheckResult:
+    """
+    Valida el precio de una orden sin lanzar excepciones.
+    
+    Args:
+        price: Precio a validar
+        min_price: Precio mínimo permitido
+        
+    Returns:
+        Tupla (valor, código) con el precio redondeado a 2 decimales
+        y un OrderErrorCode
+    """
+    if not isinstance(price, (int, float)):
+        if price is None:
+            return price, OrderErrorCode.MISSING_PRICE
+        return price, OrderErrorCode.INVALID_PRICE_TYPE
+    
+    if price != price:
+        return price, OrderErrorCode.MISSING_PRICE
+    
+    if price < min_price:
+        return price, OrderErrorCode.PRICE_BELOW_MIN
+    
+    return round(float(price), 2), _ORDER_OK
+
+
 def validate_price(price: float, min_price: float = 0.01) -> float:
     """
     Valida el precio de una orden.
@@ -209,18 +515,44 @@ def validate_price(price: float, min_price: float = 0.01) -> float:
         150.5
         >>> validate_price(0.0)  # Raises error
     """
-    if not isinstance(price, (int, float)):
-        raise OrderValidationError(
-            f"El precio debe ser numérico, recibido: {type(price).__name__}"
-        )
+    rounded, code = check_price(price, min_price)
     
-    if price < min_price:
+    if code:
+        if code == OrderErrorCode.MISSING_PRICE:
+            raise OrderValidationError("El precio es obligatorio (recibido None o NaN)")
+        
+        if code == OrderErrorCode.INVALID_PRICE_TYPE:
+            raise OrderValidationError(
+                f"El precio debe ser numérico, recibido: {type(price).__name__}"
+            )
+        
         raise OrderValidationError(
             f"El precio debe ser >= {min_price}, recibido: {price}"
         )
     
-    # Redondear a 2 decimales
-    return round(float(price), 2)
+    # Redondeado a 2 decimales
+    return rounded
+
+
+def check_order_type(order_type: str) -> CheckResult:
+    """
+    Valida el tipo de orden sin lanzar excepciones.
+    
+    Args:
+        order_type: Tipo de orden
+        
+    Returns:
+        Tupla (valor, código) con el tipo en minúsculas y un OrderErrorCode
+    """
+    if not order_type:
+        return order_type, OrderErrorCode.EMPTY_ORDER_TYPE
+    
+    order_type = order_type.strip().lower()
+    
+    if order_type not in VALID_ORDER_TYPES:
+        return order_type, OrderErrorCode.INVALID_ORDER_TYPE
+    
+    return order_type, _ORDER_OK
 
 
 def validate_order_type(order_type: str) -> str:
@@ -242,17 +574,15 @@ def validate_order_type(order_type: str) -> str:
         >>> validate_order_type("limit")
         'limit'
     """
-    if not order_type:
-        raise OrderValidationError("El tipo de orden no puede estar vacío")
-    
-    order_type = order_type.strip().lower()
-    
-    valid_types = ['market', 'limit', 'stop', 'stop_limit']
+    order_type, code = check_order_type(order_type)
     
-    if order_type not in valid_types:
+    if code:
+        if code == OrderErrorCode.EMPTY_ORDER_TYPE:
+            raise OrderValidationError("El tipo de orden no puede estar vacío")
+        
         raise OrderValidationError(
             f"Tipo de orden inválido: '{order_type}'. "
-            f"Debe ser uno de: {', '.join(valid_types)}"
+            f"Debe ser uno de: {', '.join(VALID_ORDER_TYPES)}"
         )
     
     return order_type
@@ -262,6 +592,32 @@ def validate_order_type(order_type: str) -> str:
 # Validadores de Fechas y Tiempo
 # ============================================================================
 
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date(date_str: str, date_format: str) -> datetime:
+    """Parsea una fecha con ``strptime`` (resultado cacheado, datetime es inmutable)."""
+    return datetime.strptime(date_str, date_format)
+
+
+def check_date(date_str: str, date_format: str = "%Y-%m-%d") -> CheckResult:
+    """
+    Valida una fecha sin lanzar excepciones.
+    
+    Args:
+        date_str: Fecha en formato string
+        date_format: Formato esperado de la fecha
+        
+    Returns:
+        Tupla (valor, código) con el datetime y un DateErrorCode
+    """
+    if not date_str:
+        return date_str, DateErrorCode.EMPTY_DATE
+    
+    try:
+        return _parse_date(date_str, date_format), _DATE_OK
+    except (ValueError, TypeError):
+        return date_str, DateErrorCode.INVALID_DATE
+
+
 def validate_date(date_str: str, date_format: str = "%Y-%m-%d") -> datetime:
     """
     Valida y convierte una fecha en string a datetime.
@@ -280,16 +636,45 @@ def validate_date(date_str: str, date_format: str = "%Y-%m-%d") -> datetime:
         >>> validate_date("2024-12-07")
         datetime.datetime(2024, 12, 7, 0, 0)
     """
+    value, code = check_date(date_str, date_format)
+    
+    if code:
+        raise_for_code(code, date_str, _date_error_message(date_str, date_format))
+    
+    return value
+
+
+def _date_error_message(date_str: str, date_format: str) -> str:
+    """Mensaje de error de una fecha rechazada por ``check_date``."""
     if not date_str:
-        raise DateValidationError("La fecha no puede estar vacía")
+        return "La fecha no puede estar vacía"
+    return f"Formato de fecha inválido: '{date_str}'. Esperado: {date_format}"
+
+
+def check_date_range(
+    start_date: str,
+    end_date: str,
+    date_format: str = "%Y-%m-%d"
+) -> CheckResult:
+    """
+    Valida un rango de fechas sin lanzar excepciones.
     
-    try:
-        return datetime.strptime(date_str, date_format)
-    except ValueError as e:
-        raise DateValidationError(
-            f"Formato de fecha inválido: '{date_str}'. "
-            f"Esperado: {date_format}. Error: {e}"
-        )
+    Args:
+        start_date: Fecha de inicio
+        end_date: Fecha de fin
+        date_format: Formato de las fechas
+        
+    Returns:
+        Tupla (valor, código) con la tupla (inicio, fin) y un DateErrorCode
+    """
+    start, start_code = check_date(start_date, date_format)
+    end, end_code = check_date(end_date, date_format)
+    code = start_code | end_code
+    
+    if not code and start > end:
+        code = DateErrorCode.INVERTED_RANGE
+    
+    return (start, end), code
 
 
 def validate_date_range(
@@ -314,18 +699,41 @@ def validate_date_range(
     Example:
         >>> start, end = validate_date_range("2024-01-01", "2024-12-31")
     """
-    start = validate_date(start_date, date_format)
-    end = validate_date(end_date, date_format)
+    (start, end), code = check_date_range(start_date, end_date, date_format)
     
-    if start > end:
-        raise DateValidationError(
-            f"La fecha de inicio ({start_date}) debe ser anterior "
-            f"a la fecha de fin ({end_date})"
-        )
+    if code:
+        if code == DateErrorCode.INVERTED_RANGE:
+            message = (
+                f"La fecha de inicio ({start_date}) debe ser anterior "
+                f"a la fecha de fin ({end_date})"
+            )
+        else:
+            invalid = end_date if isinstance(start, datetime) else start_date
+            message = _date_error_message(invalid, date_format)
+        raise_for_code(code, (start_date, end_date), message)
     
     return start, end
 
 
+def check_timeframe(timeframe: str) -> CheckResult:
+    """
+    Valida un timeframe sin lanzar excepciones.
+    
+    Args:
+        timeframe: Timeframe a validar
+        
+    Returns:
+        Tupla (valor, código) con el timeframe y un DateErrorCode
+    """
+    if not timeframe:
+        return timeframe, DateErrorCode.EMPTY_TIMEFRAME
+    
+    if timeframe not in VALID_TIMEFRAMES:
+        return timeframe, DateErrorCode.INVALID_TIMEFRAME
+    
+    return timeframe, _DATE_OK
+
+
 def validate_timeframe(timeframe: str) -> str:
     """
     Valida un timeframe para datos de mercado.
@@ -345,19 +753,15 @@ def validate_timeframe(timeframe: str) -> str:
         >>> validate_timeframe("1Day")
         '1Day'
     """
-    if not timeframe:
-        raise DateValidationError("El timeframe no puede estar vacío")
+    timeframe, code = check_timeframe(timeframe)
     
-    valid_timeframes = [
-        '1Min', '5Min', '15Min', '30Min',
-        '1Hour', '4Hour',
-        '1Day', '1Week', '1Month'
-    ]
-    
-    if timeframe not in valid_timeframes:
+    if code:
+        if code == DateErrorCode.EMPTY_TIMEFRAME:
+            raise DateValidationError("El timeframe no puede estar vacío")
+        
         raise DateValidationError(
             f"Timeframe inválido: '{timeframe}'. "
-            f"Debe ser uno de: {', '.join(valid_timeframes)}"
+            f"Debe ser uno de: {', '.join(VALID_TIMEFRAMES)}"
         )
     
     return timeframe
@@ -367,6 +771,31 @@ def validate_timeframe(timeframe: str) -> str:
 # Validadores de Porcentajes y Rangos
 # ============================================================================
 
+def check_percentage(
+    value: float,
+    min_value: float = 0.0,
+    max_value: float = 1.0
+) -> CheckResult:
+    """
+    Valida un porcentaje sin lanzar excepciones.
+    
+    Args:
+        value: Valor a validar (0.0 - 1.0)
+        min_value: Valor mínimo permitido
+        max_value: Valor máximo permitido
+        
+    Returns:
+        Tupla (valor, código) con el valor y un PercentageErrorCode
+    """
+    if not isinstance(value, (int, float)):
+        return value, PercentageErrorCode.NOT_NUMERIC
+    
+    if value < min_value or value > max_value:
+        return value, PercentageErrorCode.OUT_OF_RANGE
+    
+    return float(value), _PERCENTAGE_OK
+
+
 def validate_percentage(
     value: float,
     min_value: float = 0.0,
@@ -393,18 +822,45 @@ def validate_percentage(
         0.05
         >>> validate_percentage(1.5)  # Raises error
     """
-    if not isinstance(value, (int, float)):
-        raise PercentageValidationError(
-            f"{name} debe ser numérico, recibido: {type(value).__name__}"
-        )
+    validated, code = check_percentage(value, min_value, max_value)
     
-    if value < min_value or value > max_value:
+    if code:
+        if code == PercentageErrorCode.NOT_NUMERIC:
+            raise PercentageValidationError(
+                f"{name} debe ser numérico, recibido: {type(value).__name__}"
+            )
+        
         raise PercentageValidationError(
             f"{name} debe estar entre {min_value*100}% y {max_value*100}%, "
             f"recibido: {value*100}%"
         )
     
-    return float(value)
+    return validated
+
+
+def check_range(
+    value: float,
+    min_value: float,
+    max_value: float
+) -> CheckResult:
+    """
+    Valida que un valor esté dentro de un rango sin lanzar excepciones.
+    
+    Args:
+        value: Valor a validar
+        min_value: Valor mínimo
+        max_value: Valor máximo
+        
+    Returns:
+        Tupla (valor, código) con el valor y un ValueErrorCode
+    """
+    if not isinstance(value, (int, float)):
+        return value, ValueErrorCode.NOT_NUMERIC
+    
+    if value < min_value or value > max_value:
+        return value, ValueErrorCode.OUT_OF_RANGE
+    
+    return float(value), _VALUE_OK
 
 
 def validate_range(
@@ -432,24 +888,52 @@ def validate_range(
         >>> validate_range(50, 0, 100, "temperatura")
         50.0
     """
-    if not isinstance(value, (int, float)):
-        raise ValidationError(
-            f"{name} debe ser numérico, recibido: {type(value).__name__}"
-        )
+    validated, code = check_range(value, min_value, max_value)
     
-    if value < min_value or value > max_value:
+    if code:
+        if code == ValueErrorCode.NOT_NUMERIC:
+            raise ValidationError(
+                f"{name} debe ser numérico, recibido: {type(value).__name__}"
+            )
+        
         raise ValidationError(
             f"{name} debe estar entre {min_value} y {max_value}, "
             f"recibido: {value}"
         )
     
-    return float(value)
+    return validated
 
 
 # ============================================================================
 # Validadores de Configuración
 # ============================================================================
 
+def check_api_key(api_key: str, min_length: int = 10) -> CheckResult:
+    """
+    Valida una API key sin lanzar excepciones.
+    
+    Args:
+        api_key: API key a validar
+        min_length: Longitud mínima requerida
+        
+    Returns:
+        Tupla (valor, código) con la API key y un ConfigErrorCode
+    """
+    if not api_key:
+        return api_key, ConfigErrorCode.EMPTY_API_KEY
+    
+    api_key = api_key.strip()
+    
+    if len(api_key) < min_length:
+        return api_key, ConfigErrorCode.API_KEY_TOO_SHORT
+    
+    # Verificar que no sea un placeholder
+    if api_key.startswith('tu_') or api_key.startswith('your_'):
+        return api_key, ConfigErrorCode.API_KEY_PLACEHOLDER
+    
+    return api_key, _CONFIG_OK
+
+
 def validate_api_key(api_key: str, min_length: int = 10) -> str:
     """
     Valida una API key.
@@ -468,19 +952,19 @@ def validate_api_key(api_key: str, min_length: int = 10) -> str:
         >>> validate_api_key("PK1234567890ABCDEF")
         'PK1234567890ABCDEF'
     """
-    if not api_key:
-        raise ConfigValidationError("La API key no puede estar vacía")
+    api_key, code = check_api_key(api_key, min_length)
     
-    api_key = api_key.strip()
+    if code == ConfigErrorCode.EMPTY_API_KEY:
+        raise ConfigValidationError("La API key no puede estar vacía")
     
-    if len(api_key) < min_length:
+    if code == ConfigErrorCode.API_KEY_TOO_SHORT:
         raise ConfigValidationError(
             f"La API key debe tener al menos {min_length} caracteres, "
             f"recibido: {len(api_key)}"
         )
     
     # Verificar que no sea un placeholder
-    if api_key.startswith('tu_') or api_key.startswith('your_'):
+    if code == ConfigErrorCode.API_KEY_PLACEHOLDER:
         raise ConfigValidationError(
             "La API key parece ser un placeholder. "
             "Por favor configura tu API key real."
@@ -489,6 +973,39 @@ def validate_api_key(api_key: str, min_length: int = 10) -> str:
     return api_key
 
 
+def check_url(url: str, require_https: bool = True) -> CheckResult:
+    """
+    Valida una URL sin lanzar excepciones.
+    
+    Args:
+        url: URL a validar
+        require_https: Si True, requiere protocolo HTTPS
+        
+    Returns:
+        Tupla (valor, código) con la URL y un ConfigErrorCode
+    """
+    if not url:
+        return url, ConfigErrorCode.EMPTY_URL
+    
+    url = url.strip()
+    
+    try:
+        parsed = urlparse(url)
+    except (ValueError, TypeError):
+        return url, ConfigErrorCode.INVALID_URL
+    
+    if not parsed.scheme:
+        return url, ConfigErrorCode.URL_NO_SCHEME
+    
+    if not parsed.netloc:
+        return url, ConfigErrorCode.URL_NO_DOMAIN
+    
+    if require_https and parsed.scheme != 'https':
+        return url, ConfigErrorCode.URL_NOT_HTTPS
+    
+    return url, _CONFIG_OK
+
+
 def validate_url(url: str, require_https: bool = True) -> str:
     """
     Valida una URL.
@@ -507,29 +1024,45 @@ def validate_url(url: str, require_https: bool = True) -> str:
         >>> validate_url("https://api.alpaca.markets")
         'https://api.alpaca.markets'
     """
-    if not url:
+    url, code = check_url(url, require_https)
+    
+    if code == ConfigErrorCode.EMPTY_URL:
         raise ConfigValidationError("La URL no puede estar vacía")
     
-    url = url.strip()
+    if code == ConfigErrorCode.URL_NO_SCHEME:
+        raise ConfigValidationError(f"URL sin protocolo: {url}")
     
-    try:
-        parsed = urlparse(url)
+    if code == ConfigErrorCode.URL_NO_DOMAIN:
+        raise ConfigValidationError(f"URL sin dominio: {url}")
         
-        if not parsed.scheme:
-            raise ConfigValidationError(f"URL sin protocolo: {url}")
-        
-        if not parsed.netloc:
-            raise ConfigValidationError(f"URL sin dominio: {url}")
+    if code == ConfigErrorCode.URL_NOT_HTTPS:
+        raise ConfigValidationError(
+            f"La URL debe usar HTTPS, recibido: {urlparse(url).scheme}"
+        )
         
-        if require_https and parsed.scheme != 'https':
-            raise ConfigValidationError(
-                f"La URL debe usar HTTPS, recibido: {parsed.scheme}"
-            )
+    if code:
+        raise ConfigValidationError(f"URL inválida: {url}")
         
-        return url
+    return url
+
+
+def check_positive_integer(value: int) -> CheckResult:
+    """
+    Valida que un valor sea un entero positivo sin lanzar excepciones.
+    
+    Args:
+        value: Valor a validar
         
-    except Exception as e:
-        raise ConfigValidationError(f"URL inválida: {url}. Error: {e}")
+    Returns:
+        Tupla (valor, código) con el valor y un ValueErrorCode
+    """
+    if not isinstance(value, int):
+        return value, ValueErrorCode.NOT_INTEGER
+    
+    if value <= 0:
+        return value, ValueErrorCode.NOT_POSITIVE
+    
+    return value, _VALUE_OK
 
 
 def validate_positive_integer(value: int, name: str = "valor") -> int:
@@ -550,12 +1083,14 @@ def validate_positive_integer(value: int, name: str = "valor") -> int:
         >>> validate_positive_integer(5, "max_positions")
         5
     """
-    if not isinstance(value, int):
-        raise ValidationError(
-            f"{name} debe ser un entero, recibido: {type(value).__name__}"
-        )
+    value, code = check_positive_integer(value)
     
-    if value <= 0:
+    if code:
+        if code == ValueErrorCode.NOT_INTEGER:
+            raise ValidationError(
+                f"{name} debe ser un entero, recibido: {type(value).__name__}"
+            )
+        
         raise ValidationError(
             f"{name} debe ser positivo, recibido: {value}"
         )
@@ -572,6 +1107,24 @@ __all__ = [
     'DateValidationError',
     'PercentageValidationError',
     'ConfigValidationError',
+    'MarketDataValidationError',
+    # Códigos de error y modo sin excepciones
+    'OrderErrorCode',
+    'SymbolErrorCode',
+    'DateErrorCode',
+    'PercentageErrorCode',
+    'ConfigErrorCode',
+    'ValueErrorCode',
+    'OHLCVErrorCode',
+    'ERROR_CODE_EXCEPTIONS',
+    'CheckResult',
+    'raise_for_code',
+    'collect_errors',
+    # Constantes
+    'VALID_ORDER_SIDES',
+    'VALID_ORDER_TYPES',
+    'VALID_TIMEFRAMES',
+    'SYMBOL_PATTERN',
     # Validadores de símbolos
     'validate_symbol',
     'validate_symbols_list',
@@ -591,4 +1144,18 @@ __all__ = [
     'validate_api_key',
     'validate_url',
     'validate_positive_integer',
+    # Validadores sin excepciones
+    'check_symbol',
+    'check_order_side',
+    'check_quantity',
+    'check_price',
+    'check_order_type',
+    'check_date',
+    'check_date_range',
+    'check_timeframe',
+    'check_percentage',
+    'check_range',
+    'check_api_key',
+    'check_url',
+    'check_positive_integer',
 ]